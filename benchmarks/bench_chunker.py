@@ -0,0 +1,269 @@
+"""Benchmark: CodeChunker throughput per language on large generated files.
+
+Generates one large source file per supported language (imports, classes with
+methods, nested helpers and top-level functions) and reports chunks/second and
+MB/second for ``CodeChunker.chunk_file``. Parsing is included, since it is
+part of every chunk_file call; run with ``--parse-only`` to see how much of
+the time is tree-sitter itself.
+
+Usage:
+    uv run python benchmarks/bench_chunker.py [--classes 200] [--methods 10]
+        [--repeat 3] [--languages python,go] [--parse-only]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from local_deepwiki.config import ChunkingConfig
+from local_deepwiki.core.chunker import CodeChunker
+from local_deepwiki.core.parser import CodeParser
+
+
+def _python(classes: int, methods: int) -> str:
+    parts = [f"import module_{i}\nfrom package_{i} import name_{i}" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f'''    def method_{m}(self, value: int, label: str = "x") -> dict[str, int]:
+        """Return a mapping for {m}."""
+        def helper(item):
+            return item * {m}
+        return {{label: helper(value)}}
+'''
+            for m in range(methods)
+        )
+        parts.append(f'class Service{c}(Base, Mixin):\n    """Service {c}."""\n\n{body}')
+        parts.append(f"def function_{c}(items: list[int]) -> int:\n    return sum(items) + {c}\n")
+    return "\n\n".join(parts)
+
+
+def _javascript(classes: int, methods: int) -> str:
+    parts = [f"import {{ name{i} }} from './module{i}';" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"  method{m}(value) {{\n    const helper = (x) => x * {m};\n"
+            f"    return helper(value);\n  }}"
+            for m in range(methods)
+        )
+        parts.append(f"class Service{c} extends Base {{\n{body}\n}}")
+        parts.append(f"function function{c}(items) {{\n  return items.length + {c};\n}}")
+    return "\n\n".join(parts)
+
+
+def _typescript(classes: int, methods: int) -> str:
+    parts = [f"import {{ Name{i} }} from './module{i}';" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"  method{m}(value: number): number {{\n"
+            f"    const helper = (x: number): number => x * {m};\n"
+            f"    return helper(value);\n  }}"
+            for m in range(methods)
+        )
+        parts.append(f"interface Shape{c} {{\n  size: number;\n}}")
+        parts.append(f"class Service{c} extends Base implements Shape{c} {{\n{body}\n}}")
+        parts.append(f"function function{c}(items: number[]): number {{\n  return {c};\n}}")
+    return "\n\n".join(parts)
+
+
+def _go(classes: int, methods: int) -> str:
+    parts = ["package main", 'import (\n\t"fmt"\n\t"strings"\n)']
+    for c in range(classes):
+        parts.append(f"type Service{c} struct {{\n\tName string\n\tCount int\n}}")
+        parts.extend(
+            f"func (s *Service{c}) Method{m}(value int) int {{\n"
+            f"\thelper := func(x int) int {{ return x * {m} }}\n\treturn helper(value)\n}}"
+            for m in range(methods)
+        )
+        parts.append(
+            f'func Function{c}(items []string) string {{\n\treturn fmt.Sprint(strings.Join(items, "{c}"))\n}}'
+        )
+    return "\n\n".join(parts)
+
+
+def _rust(classes: int, methods: int) -> str:
+    parts = [f"use crate::module_{i}::Name{i};" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    pub fn method_{m}(&self, value: i64) -> i64 {{\n"
+            f"        let helper = |x: i64| x * {m};\n        helper(value)\n    }}"
+            for m in range(methods)
+        )
+        parts.append(f"pub struct Service{c} {{\n    count: i64,\n}}")
+        parts.append(f"impl Service{c} {{\n{body}\n}}")
+        parts.append(
+            f"pub fn function_{c}(items: &[i64]) -> i64 {{\n    items.len() as i64 + {c}\n}}"
+        )
+    return "\n\n".join(parts)
+
+
+def _java(classes: int, methods: int) -> str:
+    parts = [f"import com.example.module{i}.Name{i};" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    public int method{m}(int value) {{\n        return value * {m};\n    }}"
+            for m in range(methods)
+        )
+        parts.append(
+            f"class Service{c} extends Base implements Runnable {{\n"
+            f"    public Service{c}() {{ }}\n{body}\n}}"
+        )
+    return "\n\n".join(parts)
+
+
+def _c(classes: int, methods: int) -> str:
+    parts = [f"#include <header{i}.h>" for i in range(10)]
+    for c in range(classes):
+        parts.append(f"struct service_{c} {{\n    int count;\n    char *name;\n}};")
+        parts.extend(
+            f"int service_{c}_method_{m}(struct service_{c} *s, int value) {{\n"
+            f"    return s->count + value * {m};\n}}"
+            for m in range(methods)
+        )
+    return "\n\n".join(parts)
+
+
+def _cpp(classes: int, methods: int) -> str:
+    parts = [f"#include <header{i}.h>" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    int method{m}(int value) {{\n        return value * {m};\n    }}"
+            for m in range(methods)
+        )
+        parts.append(f"class Service{c} : public Base {{\npublic:\n{body}\n}};")
+        parts.append(f"int function{c}(int value) {{\n    return value + {c};\n}}")
+    return "\n\n".join(parts)
+
+
+def _swift(classes: int, methods: int) -> str:
+    parts = [f"import Module{i}" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    func method{m}(value: Int) -> Int {{\n        return value * {m}\n    }}"
+            for m in range(methods)
+        )
+        parts.append(f"class Service{c}: Base, Codable {{\n    init() {{ }}\n{body}\n}}")
+        parts.append(f"func function{c}(items: [Int]) -> Int {{\n    return items.count + {c}\n}}")
+    return "\n\n".join(parts)
+
+
+def _ruby(classes: int, methods: int) -> str:
+    parts = [f"require 'module_{i}'" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"  def method_{m}(value)\n    puts value\n    value * {m}\n  end"
+            for m in range(methods)
+        )
+        parts.append(f"module Helpers{c}\nend")
+        parts.append(f"class Service{c} < Base\n{body}\nend")
+        parts.append(f"def function_{c}(items)\n  items.size + {c}\nend")
+    return "\n\n".join(parts)
+
+
+def _php(classes: int, methods: int) -> str:
+    parts = ["<?php"] + [f"use App\\Module{i}\\Name{i};" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    public function method{m}($value) {{\n        return $value * {m};\n    }}"
+            for m in range(methods)
+        )
+        parts.append(f"class Service{c} extends Base implements Countable {{\n{body}\n}}")
+        parts.append(f"function function{c}($items) {{\n    return count($items) + {c};\n}}")
+    return "\n\n".join(parts)
+
+
+def _kotlin(classes: int, methods: int) -> str:
+    parts = [f"import com.example.module{i}.Name{i}" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    fun method{m}(value: Int): Int {{\n        return value * {m}\n    }}"
+            for m in range(methods)
+        )
+        parts.append(f"class Service{c} : Base(), Runnable {{\n{body}\n}}")
+        parts.append(f"object Registry{c} {{\n    fun lookup(): Int = {c}\n}}")
+        parts.append(f"fun function{c}(items: List<Int>): Int {{\n    return items.size + {c}\n}}")
+    return "\n\n".join(parts)
+
+
+def _csharp(classes: int, methods: int) -> str:
+    parts = [f"using Example.Module{i};" for i in range(10)]
+    for c in range(classes):
+        body = "\n".join(
+            f"    public int Method{m}(int value) {{\n        return value * {m};\n    }}"
+            for m in range(methods)
+        )
+        parts.append(
+            f"public class Service{c} : Base, IDisposable {{\n    public Service{c}() {{ }}\n{body}\n}}"
+        )
+        parts.append(f"public interface IShape{c} {{\n    int Size();\n}}")
+    return "\n\n".join(parts)
+
+
+GENERATORS: dict[str, tuple[str, Callable[[int, int], str]]] = {
+    "python": (".py", _python),
+    "javascript": (".js", _javascript),
+    "typescript": (".ts", _typescript),
+    "go": (".go", _go),
+    "rust": (".rs", _rust),
+    "java": (".java", _java),
+    "c": (".c", _c),
+    "cpp": (".cpp", _cpp),
+    "swift": (".swift", _swift),
+    "ruby": (".rb", _ruby),
+    "php": (".php", _php),
+    "kotlin": (".kt", _kotlin),
+    "csharp": (".cs", _csharp),
+}
+
+
+def write_samples(root: Path, classes: int, methods: int, languages: list[str]) -> list[Path]:
+    """Write one generated source file per language and return their paths."""
+    paths = []
+    for language in languages:
+        suffix, generate = GENERATORS[language]
+        path = root / f"sample_{language}{suffix}"
+        path.write_text(generate(classes, methods))
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=200)
+    parser.add_argument("--methods", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--languages", default=",".join(GENERATORS))
+    parser.add_argument("--parse-only", action="store_true")
+    args = parser.parse_args()
+
+    languages = [name for name in args.languages.split(",") if name]
+    # A budget no generated chunk reaches, so only extraction is measured
+    chunker = CodeChunker(ChunkingConfig(max_chunk_tokens=1_000_000))
+    code_parser = CodeParser()
+
+    print(f"{'language':>11} {'KB':>7} {'chunks':>7} {'best ms':>8} {'chunks/s':>10} {'MB/s':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for path in write_samples(root, args.classes, args.methods, languages):
+            source = path.read_bytes()
+            chunk_count = 0
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                if args.parse_only:
+                    code_parser.parse_file(path, source)
+                else:
+                    chunk_count = sum(1 for _ in chunker.chunk_file(path, root, source=source))
+                best = min(best, time.perf_counter() - start)
+
+            language = path.stem.removeprefix("sample_")
+            print(
+                f"{language:>11} {len(source) / 1024:>7.0f} {chunk_count:>7} {best * 1000:>8.1f} "
+                f"{chunk_count / best:>10.0f} {len(source) / best / 1e6:>6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark: single-pass cross-linker versus per-entity substitution.
+
+Builds synthetic entity registries and wiki pages, then times
+``add_cross_links`` with the compiled ``EntityMatcher`` against the previous
+implementation, which ran one set of regex substitutions per entity and
+alias over every prose segment. Output differences between the two are
+counted so semantic drift is visible alongside the timings.
+
+Usage:
+    uv run python benchmarks/bench_crosslinks.py [--entities 250,1000,2500] [--pages 50]
+"""
+
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+
+from local_deepwiki.generators.crosslinks import CrossLinker, EntityRegistry, add_cross_links
+from local_deepwiki.models import ChunkType, WikiPage
+
+_WORDS = (
+    "Vector Store Wiki Generator Config Index Chunk Parser Cache Provider Search Status "
+    "Manager Builder Graph Page Entity Registry Embedding Token Server Handler Report"
+).split()
+
+
+class LegacyCrossLinker(CrossLinker):
+    """Cross-linker using the previous one-substitution-pass-per-name strategy."""
+
+    def _add_links_to_text(
+        self,
+        text: str,
+        current_page: str,
+        current_page_entities: set[str],
+    ) -> str:
+        entities = self.registry.get_all_entities()
+        aliases = self.registry.get_all_aliases()
+        if not entities and not aliases:
+            return text
+
+        for name in sorted(entities.keys(), key=len, reverse=True):
+            if name in current_page_entities:
+                continue
+            rel_path = self._relative_path(current_page, entities[name].wiki_path)
+            text = self._replace(text, name, f"[{name}]({rel_path})", rel_path)
+
+        for alias in sorted(aliases.keys(), key=len, reverse=True):
+            canonical_name = aliases[alias]
+            if canonical_name in current_page_entities:
+                continue
+            alias_entity = entities.get(canonical_name)
+            if not alias_entity:
+                continue
+            rel_path = self._relative_path(current_page, alias_entity.wiki_path)
+            text = self._replace(text, alias, f"[{alias}]({rel_path})", rel_path)
+
+        return text
+
+    def _replace(self, text: str, entity_name: str, link: str, rel_path: str) -> str:
+        protected: list[tuple[str, str]] = []
+
+        def protect(match: re.Match) -> str:
+            placeholder = f"\x00PROTECTED{len(protected)}\x00"
+            protected.append((placeholder, match.group(0)))
+            return placeholder
+
+        temp = re.sub(r"\[([^\]]+)\]\([^)]+\)", protect, text)
+        temp = re.sub(r"^(#{1,6}\s+.+)$", protect, temp, flags=re.MULTILINE)
+        temp = self._backticked(temp, entity_name, rel_path, protect)
+        temp = re.sub(r"`[^`]+`", protect, temp)
+        temp = re.sub(
+            rf"\*\*{re.escape(entity_name)}\*\*", f"**[{entity_name}]({rel_path})**", temp
+        )
+        temp = re.sub(r"\[([^\]]+)\]\([^)]+\)", protect, temp)
+        temp = re.sub(rf"\b{re.escape(entity_name)}\b", link, temp)
+        for placeholder, original in protected:
+            temp = temp.replace(placeholder, original)
+        return temp
+
+    def _backticked(
+        self,
+        text: str,
+        entity_name: str,
+        rel_path: str,
+        protect: Callable[[re.Match[str]], str],
+    ) -> str:
+        text = re.sub(rf"`{re.escape(entity_name)}`", f"[`{entity_name}`]({rel_path})", text)
+        text = re.sub(
+            rf"`([a-zA-Z_][a-zA-Z0-9_]*\.)+{re.escape(entity_name)}`",
+            lambda m: f"[`{m.group(0)[1:-1]}`]({rel_path})",
+            text,
+        )
+        return re.sub(r"\[`[^`]+`\]\([^)]+\)", protect, text)
+
+
+def _make_registry(entity_count: int, rng: random.Random) -> tuple[EntityRegistry, list[str]]:
+    """Create a registry of CamelCase classes and snake_case functions."""
+    registry = EntityRegistry()
+    names: list[str] = []
+    for i in range(entity_count):
+        wiki_path = f"files/pkg{i % 40}/module{i % 400}.md"
+        if i % 2:
+            name = "".join(rng.sample(_WORDS, 2)) + str(i)
+            entity_type = ChunkType.CLASS
+        else:
+            name = f"{rng.choice(_WORDS).lower()}_{rng.choice(_WORDS).lower()}_{i}"
+            entity_type = ChunkType.FUNCTION
+        registry.register_entity(name, entity_type, wiki_path, wiki_path[6:-3] + ".py")
+        names.append(name)
+    return registry, names
+
+
+def _make_page(index: int, names: list[str], rng: random.Random) -> WikiPage:
+    """Create a page mixing prose mentions, inline code, links and code blocks."""
+    paragraphs = [f"# Module {index}", ""]
+    for _ in range(12):
+        mentions = rng.sample(names, 6)
+        paragraphs.append(
+            f"The {mentions[0]} class works with `{mentions[1]}` and **{mentions[2]}**. "
+            f"See [{mentions[3]}](other.md) or `pkg.mod.{mentions[4]}` for details; "
+            f"{mentions[5]} is called by the search handler to rank results."
+        )
+        paragraphs.append("")
+    paragraphs.append(f"```python\n{names[index % len(names)]}()\n```")
+    return WikiPage(
+        path=f"files/pkg{index % 40}/module{index}.md",
+        title=f"Module {index}",
+        content="\n".join(paragraphs),
+        generated_at=0.0,
+    )
+
+
+def _time(func: Callable[[], list[WikiPage]]) -> tuple[float, list[WikiPage]]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Run the benchmark across the requested registry sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", default="250,1000,2500")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    header = ("entities", "pages", "legacy (s)", "matcher (s)", "speedup", "diffs")
+    print(" ".join(f"{name:>{width}}" for name, width in zip(header, (9, 6, 11, 12, 8, 6))))
+    for entity_count in [int(s) for s in args.entities.split(",") if s]:
+        rng = random.Random(args.seed)
+        registry, names = _make_registry(entity_count, rng)
+        pages = [_make_page(i, names, rng) for i in range(args.pages)]
+
+        legacy = LegacyCrossLinker(registry)
+        legacy_time, legacy_pages = _time(lambda: [legacy.add_links(p) for p in pages])
+        new_time, new_pages = _time(lambda: add_cross_links(pages, registry))
+
+        diffs = sum(a.content != b.content for a, b in zip(legacy_pages, new_pages))
+        print(
+            f"{entity_count:>9} {args.pages:>6} {legacy_time:>11.2f} {new_time:>12.3f} "
+            f"{legacy_time / new_time:>7.0f}x {diffs:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
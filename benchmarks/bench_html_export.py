@@ -0,0 +1,114 @@
+"""Benchmark: static HTML export of a large wiki, full and incremental.
+
+Generates a synthetic wiki (pages spread over section directories, a toc.json
+listing every page, and a few paragraphs, a table and a code block per page),
+then times HtmlExporter.export() for a full export into an empty directory, a
+re-export with nothing changed, and a re-export after editing a handful of
+pages.
+
+Usage:
+    uv run python benchmarks/bench_html_export.py [--pages 5000] [--sections 50]
+        [--changed 10] [--workers 4]
+"""
+
+import argparse
+import inspect
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from local_deepwiki.export.html import HtmlExporter
+
+PAGE_TEMPLATE = """# Page {n}
+
+Overview of component {n}. It talks to [page {m}](../section_0/page_{m}.md).
+
+## Details
+
+| Name | Type | Description |
+|------|------|-------------|
+| id | int | Identifier {n} |
+| name | str | Display name |
+
+```python
+def handler_{n}(request):
+    return respond(request, {n})
+```
+
+Further notes about component {n} and how it is used elsewhere.
+"""
+
+
+def build_wiki(root: Path, pages: int, sections: int) -> Path:
+    """Write a synthetic wiki and return its path."""
+    wiki_path = root / ".deepwiki"
+    wiki_path.mkdir()
+    (wiki_path / "index.md").write_text("# Overview\n\nWelcome.\n")
+
+    children: dict[int, list[dict]] = {s: [] for s in range(sections)}
+    for n in range(pages):
+        section = n % sections
+        page_dir = wiki_path / f"section_{section}"
+        page_dir.mkdir(exist_ok=True)
+        (page_dir / f"page_{n}.md").write_text(PAGE_TEMPLATE.format(n=n, m=(n + 1) % pages))
+        children[section].append(
+            {
+                "number": f"{section + 2}.{len(children[section]) + 1}",
+                "title": f"Page {n}",
+                "path": f"section_{section}/page_{n}.md",
+            }
+        )
+
+    entries = [{"number": "1", "title": "Overview", "path": "index.md"}]
+    entries += [
+        {"number": str(s + 2), "title": f"Section {s}", "path": "", "children": children[s]}
+        for s in range(sections)
+    ]
+    (wiki_path / "toc.json").write_text(json.dumps({"entries": entries}))
+    (wiki_path / "search.json").write_text("[]")
+    return wiki_path
+
+
+def timed_export(wiki_path: Path, output_path: Path, workers: int) -> tuple[float, int]:
+    """Run one export and return (seconds, pages exported)."""
+    # Older exporters take no worker count
+    if "workers" in inspect.signature(HtmlExporter).parameters:
+        exporter = HtmlExporter(wiki_path, output_path, workers=workers)
+    else:
+        exporter = HtmlExporter(wiki_path, output_path)
+    start = time.perf_counter()
+    count = exporter.export()
+    return time.perf_counter() - start, count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        wiki_path = build_wiki(root, args.pages, args.sections)
+        output_path = root / "html"
+        print(f"Wiki: {args.pages + 1} pages in {args.sections} sections")
+
+        seconds, count = timed_export(wiki_path, output_path, args.workers)
+        print(f"full export:       {seconds:8.2f}s  ({count} pages)")
+
+        seconds, _ = timed_export(wiki_path, output_path, args.workers)
+        print(f"unchanged re-export: {seconds:6.2f}s")
+
+        for n in range(args.changed):
+            page = wiki_path / f"section_{n % args.sections}" / f"page_{n}.md"
+            page.write_text(page.read_text() + "\nEdited.\n")
+        seconds, _ = timed_export(wiki_path, output_path, args.workers)
+        print(f"{args.changed} pages changed:  {seconds:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
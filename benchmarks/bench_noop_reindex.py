@@ -0,0 +1,92 @@
+"""Benchmark: no-op incremental reindex time versus repository size.
+
+Generates synthetic Python repositories of increasing size, runs a full index
+once, then times an incremental ``RepositoryIndexer.index()`` with no file
+changes. With the stat fast path and path map this should scale linearly with
+file count and never read file contents.
+
+The vector store is replaced with an in-memory stub so the numbers reflect
+change detection and bookkeeping only, not embedding or LanceDB writes.
+
+Usage:
+    uv run python benchmarks/bench_noop_reindex.py [--sizes 1000,5000,20000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from local_deepwiki.config import Config
+from local_deepwiki.core.indexer import RepositoryIndexer
+
+
+def _make_repo(root: Path, file_count: int) -> None:
+    """Create a synthetic repository with ``file_count`` small Python files."""
+    per_dir = 200
+    for i in range(file_count):
+        pkg = root / f"pkg{i // per_dir}"
+        pkg.mkdir(exist_ok=True)
+        (pkg / f"mod{i}.py").write_text(
+            f'"""Module {i}."""\n\n\ndef func_{i}(x):\n    return x + {i}\n'
+        )
+
+
+def _make_indexer(repo_path: Path) -> RepositoryIndexer:
+    """Create an indexer whose vector store does no real work."""
+    config = Config()
+    config.parsing.languages = ["python"]
+    config.chunking.batch_size = 5000
+
+    with patch("local_deepwiki.core.indexer.VectorStore"):
+        indexer = RepositoryIndexer(repo_path, config)
+
+    store = MagicMock()
+    store.embed_chunks = AsyncMock(side_effect=lambda chunks: [[0.0]] * len(chunks))
+    store.create_or_update_table = AsyncMock(side_effect=lambda chunks, **kwargs: len(chunks))
+    store.add_chunks = AsyncMock(side_effect=lambda chunks, **kwargs: len(chunks))
+    store.delete_chunks_by_file = AsyncMock(return_value=0)
+    indexer.vector_store = store
+    return indexer
+
+
+async def _bench_size(file_count: int, repeats: int) -> tuple[float, float]:
+    """Return (full index seconds, best no-op reindex seconds) for a repo size."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = Path(tmp) / "repo"
+        repo_path.mkdir()
+        _make_repo(repo_path, file_count)
+        indexer = _make_indexer(repo_path)
+
+        start = time.perf_counter()
+        await indexer.index(full_rebuild=True)
+        full_time = time.perf_counter() - start
+
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            status = await indexer.index()
+            best = min(best, time.perf_counter() - start)
+            assert status.total_files == file_count
+
+        return full_time, best
+
+
+async def main() -> None:
+    """Run the benchmark across the requested sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="500,2000,5000,10000")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(f"{'files':>8} {'full index (s)':>15} {'no-op reindex (s)':>18} {'us/file':>9}")
+    for size in sizes:
+        full_time, noop_time = await _bench_size(size, args.repeats)
+        print(f"{size:>8} {full_time:>15.2f} {noop_time:>18.3f} {noop_time / size * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""Benchmark: parse throughput of thread and process backends versus worker count.
+
+Generates a synthetic Python repository, then runs a full
+``RepositoryIndexer.index()`` for each parse backend and worker count and
+reports the parse stage's throughput. Thread workers share the GIL while
+CodeChunker walks the AST, so they should flatten out after a core or two;
+process workers should keep scaling until cores run out (minus a fixed
+startup cost per run).
+
+The vector store is replaced with an in-memory stub so the numbers reflect
+parsing and chunking only, not embedding or LanceDB writes.
+
+Usage:
+    uv run python benchmarks/bench_parse_scaling.py [--files 2000] [--workers 1,2,4,8]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from local_deepwiki.config import Config
+
+if TYPE_CHECKING:
+    from local_deepwiki.core.indexer import RepositoryIndexer
+
+
+def _make_repo(root: Path, file_count: int) -> None:
+    """Create a repository of Python files with typed classes and methods."""
+    per_dir = 200
+    for i in range(file_count):
+        pkg = root / f"pkg{i // per_dir}"
+        pkg.mkdir(exist_ok=True)
+        methods = "\n".join(
+            f'''    def method_{m}(self, value: int, label: str = "x") -> dict[str, int]:
+        """Return a mapping for value {m}."""
+        result = {{label: value + {m}}}
+        for key in range(value % 5):
+            result[str(key)] = key * {m}
+        return result
+'''
+            for m in range(8)
+        )
+        (pkg / f"mod{i}.py").write_text(
+            f'''"""Module {i}."""
+
+from collections.abc import Mapping
+
+
+class Base{i}:
+    """Base class {i}."""
+
+
+class Service{i}(Base{i}, Mapping):
+    """Service {i} with several typed methods."""
+
+{methods}
+
+def helper_{i}(items: list[int], scale: float = 1.0) -> float:
+    """Scale and sum items."""
+    return sum(item * scale for item in items)
+'''
+        )
+
+
+def _make_indexer(repo_path: Path, backend: str, workers: int) -> "RepositoryIndexer":
+    """Create an indexer whose vector store does no real work."""
+    # Imported here, not at module level: spawned workers re-import this script,
+    # and the indexer pulls in LanceDB, which would dominate worker startup
+    from local_deepwiki.core.indexer import RepositoryIndexer
+
+    config = Config()
+    config.parsing.languages = ["python"]
+    config.chunking.parse_backend = backend  # type: ignore[assignment]
+    config.chunking.parallel_workers = workers
+    config.chunking.batch_size = 5000
+
+    with patch("local_deepwiki.core.indexer.VectorStore"):
+        indexer = RepositoryIndexer(repo_path, config)
+
+    store = MagicMock()
+    store.embed_chunks = AsyncMock(side_effect=lambda chunks: [[0.0]] * len(chunks))
+    store.create_or_update_table = AsyncMock(side_effect=lambda chunks, **kwargs: len(chunks))
+    store.add_chunks = AsyncMock(side_effect=lambda chunks, **kwargs: len(chunks))
+    indexer.vector_store = store
+    return indexer
+
+
+async def main() -> None:
+    """Run the benchmark across backends and worker counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    args = parser.parse_args()
+
+    worker_counts = [min(int(w), 16) for w in args.workers.split(",") if w]
+    print(f"cpus: {os.cpu_count()}, files: {args.files}")
+    print(f"{'backend':>8} {'workers':>8} {'index (s)':>10} {'files/s':>9} {'speedup':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_path = Path(tmp) / "repo"
+        repo_path.mkdir()
+        _make_repo(repo_path, args.files)
+
+        for backend in ("thread", "process"):
+            baseline: float | None = None
+            for workers in worker_counts:
+                indexer = _make_indexer(repo_path, backend, workers)
+                start = time.perf_counter()
+                status = await indexer.index(full_rebuild=True)
+                elapsed = time.perf_counter() - start
+                assert status.total_files == args.files
+
+                rate = indexer.pipeline_stats["parse"].throughput
+                baseline = baseline or rate
+                print(
+                    f"{backend:>8} {workers:>8} {elapsed:>10.2f} {rate:>9.0f} "
+                    f"{rate / baseline:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+"""Benchmark: ANN vector index recall and latency versus flat search.
+
+Builds a ``code_chunks`` table of synthetic, clustered, unit-length embeddings
+(real code embeddings cluster by topic, which is what IVF partitioning relies
+on), measures exact flat-scan latency as the baseline and ground truth, then
+builds the index through ``VectorStore.ensure_vector_index()`` and sweeps the
+nprobes and refine_factor knobs, reporting recall@k and per-query latency for
+each setting. Queries go through ``VectorStore.search()`` so the numbers
+include row conversion, as ``ask_question`` would see them.
+
+Usage:
+    uv run python benchmarks/bench_vector_index.py [--rows 200000] [--dim 384]
+        [--queries 100] [--index-type ivf_pq] [--nprobes 5,10,20,50] [--refine 0,5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import lancedb
+import numpy as np
+import pyarrow as pa
+
+from local_deepwiki.config import VectorIndexConfig
+from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.providers.base import EmbeddingProvider
+
+
+class QueryVectors(EmbeddingProvider):
+    """Embedding provider that maps query strings "q<n>" to prepared vectors."""
+
+    def __init__(self, vectors: np.ndarray):
+        self._vectors = vectors
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return "bench:queries"
+
+    def get_dimension(self) -> int:
+        """Return embedding dimension."""
+        return self._vectors.shape[1]
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Return the prepared vector for each query."""
+        return [self._vectors[int(text[1:])].tolist() for text in texts]
+
+
+def _clustered_vectors(
+    rng: np.random.Generator, centres: np.ndarray, basis: np.ndarray, count: int
+) -> np.ndarray:
+    """Sample unit vectors around randomly chosen centres.
+
+    Variation within a topic lies mostly in a low-dimensional subspace, like
+    real embeddings; isotropic noise would make every neighbour equidistant.
+    """
+    vectors = centres[rng.integers(0, len(centres), count)]
+    vectors += rng.standard_normal((count, len(basis))).astype(np.float32) @ basis
+    vectors += 0.05 * rng.standard_normal(vectors.shape).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _build_table(db_path: Path, vectors: np.ndarray) -> None:
+    """Write a code_chunks table with the store's schema in one shot."""
+    rows = len(vectors)
+    ids = [f"chunk_{i}" for i in range(rows)]
+    table = pa.table(
+        {
+            "id": ids,
+            "file_path": [f"pkg{i // 5000}/mod{i // 50}.py" for i in range(rows)],
+            "language": ["python"] * rows,
+            "chunk_type": ["function"] * rows,
+            "name": [f"func_{i}" for i in range(rows)],
+            "content": [f"def func_{i}(x):\n    return x + {i}\n" for i in range(rows)],
+            "start_line": [1] * rows,
+            "end_line": [2] * rows,
+            "docstring": [""] * rows,
+            "parent_name": [""] * rows,
+            "metadata": ["{}"] * rows,
+            "vector": pa.FixedSizeListArray.from_arrays(
+                pa.array(vectors.ravel()), vectors.shape[1]
+            ),
+        }
+    )
+    lancedb.connect(str(db_path)).create_table(VectorStore.TABLE_NAME, table)
+
+
+async def _run_queries(
+    store: VectorStore, count: int, k: int
+) -> tuple[list[list[str]], list[float]]:
+    """Run every query through the store, returning result ids and latencies."""
+    ids: list[list[str]] = []
+    latencies: list[float] = []
+    for i in range(count):
+        start = time.perf_counter()
+        results = await store.search(f"q{i}", limit=k)
+        latencies.append(time.perf_counter() - start)
+        ids.append([r.chunk.id for r in results])
+    return ids, latencies
+
+
+def _recall(found: list[list[str]], truth: list[list[str]]) -> float:
+    """Mean fraction of true nearest neighbours found per query."""
+    return statistics.mean(len(set(f) & set(t)) / len(t) for f, t in zip(found, truth))
+
+
+def _ms(latencies: list[float]) -> tuple[float, float]:
+    """Median and p95 latency in milliseconds."""
+    ordered = sorted(latencies)
+    return statistics.median(ordered) * 1000, ordered[int(0.95 * (len(ordered) - 1))] * 1000
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--index-type", default="ivf_pq", choices=["ivf_pq", "ivf_hnsw_sq"])
+    parser.add_argument("--nprobes", default="5,10,20,50")
+    parser.add_argument("--refine", default="0,5")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Data and queries share topics, as code and questions about it do
+    centres = rng.standard_normal((256, args.dim)).astype(np.float32)
+    basis = 0.5 * rng.standard_normal((16, args.dim)).astype(np.float32)
+    vectors = _clustered_vectors(rng, centres, basis, args.rows)
+    queries = _clustered_vectors(rng, centres, basis, args.queries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "vectors.lance"
+        _build_table(db_path, vectors)
+        config = VectorIndexConfig(index_type=args.index_type, min_rows=256)
+        store = VectorStore(db_path, QueryVectors(queries), index_config=config)
+
+        truth, flat_latencies = await _run_queries(store, args.queries, args.k)
+        flat_p50, flat_p95 = _ms(flat_latencies)
+
+        start = time.perf_counter()
+        action = store.ensure_vector_index()
+        build_seconds = time.perf_counter() - start
+        if action != "created":
+            raise SystemExit(f"Index was not built: {action}")
+
+        print(f"rows: {args.rows}, dim: {args.dim}, queries: {args.queries}, k: {args.k}")
+        print(f"{args.index_type} build: {build_seconds:.1f}s")
+        print(f"{'search':>16} {'recall':>7} {'p50 ms':>8} {'p95 ms':>8} {'speedup':>8}")
+        print(f"{'flat':>16} {1.0:>7.3f} {flat_p50:>8.2f} {flat_p95:>8.2f} {1.0:>7.2f}x")
+
+        for refine in (int(r) for r in args.refine.split(",") if r):
+            for nprobes in (int(n) for n in args.nprobes.split(",") if n):
+                config.nprobes = nprobes
+                config.refine_factor = refine
+                found, latencies = await _run_queries(store, args.queries, args.k)
+                p50, p95 = _ms(latencies)
+                label = f"np={nprobes} rf={refine}"
+                print(
+                    f"{label:>16} {_recall(found, truth):>7.3f} {p50:>8.2f} {p95:>8.2f} "
+                    f"{flat_p50 / p50:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
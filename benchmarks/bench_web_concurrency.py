@@ -0,0 +1,243 @@
+"""Benchmark: concurrent /api/chat load against the Flask and ASGI servers.
+
+Indexes a small synthetic repository into a real LanceDB table, then starts
+each web server on a local port and fires waves of concurrent streaming chat
+requests, reporting throughput and time-to-first-byte / total latency
+percentiles per concurrency level.
+
+Providers are stubs so the numbers isolate serving overhead: the embedding
+provider charges a configurable model-load cost on construction (standing in
+for loading a sentence-transformers model) and the LLM streams a fixed number
+of tokens with a per-token delay. The Flask server pays the load cost and
+spins up a thread plus event loop on every request; the ASGI server pays it
+once at startup and streams every request from one event loop.
+
+Usage:
+    uv run python benchmarks/bench_web_concurrency.py [--concurrency 1,8,32]
+        [--requests 64] [--load-ms 300] [--tokens 20] [--token-ms 5]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import AsyncIterator, Callable
+from unittest.mock import patch
+
+import httpx
+import uvicorn
+from werkzeug.serving import make_server
+
+from local_deepwiki.config import get_config
+from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.models import ChunkType, CodeChunk, Language
+from local_deepwiki.providers.base import EmbeddingProvider, LLMProvider
+from local_deepwiki.web.app import create_app
+from local_deepwiki.web.asgi import create_asgi_app
+
+DIMENSION = 64
+
+
+class HashEmbeddings(EmbeddingProvider):
+    """Deterministic embeddings derived from a hash of the text."""
+
+    def __init__(self, load_seconds: float = 0.0):
+        # Stand-in for loading model weights
+        time.sleep(load_seconds)
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return "bench:hash"
+
+    def get_dimension(self) -> int:
+        """Return embedding dimension."""
+        return DIMENSION
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed each text as normalized hash bytes."""
+        vectors = []
+        for text in texts:
+            digest = hashlib.sha512(text.encode()).digest()
+            vectors.append([b / 255.0 for b in digest[:DIMENSION]])
+        return vectors
+
+
+class TokenStream(LLMProvider):
+    """LLM that streams a fixed number of tokens at a fixed rate."""
+
+    def __init__(self, tokens: int, token_seconds: float):
+        self._tokens = tokens
+        self._token_seconds = token_seconds
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return "bench:tokens"
+
+    async def generate(self, prompt: str, **kwargs: object) -> str:
+        """Return the whole answer."""
+        return "".join([chunk async for chunk in self.generate_stream(prompt)])
+
+    async def generate_stream(self, prompt: str, **kwargs: object) -> AsyncIterator[str]:
+        """Yield tokens with a delay between each."""
+        for i in range(self._tokens):
+            await asyncio.sleep(self._token_seconds)
+            yield f"tok{i} "
+
+
+async def _index_repo(repo_path: Path, chunk_count: int) -> None:
+    """Write a code_chunks table of synthetic functions for the repository."""
+    chunks = [
+        CodeChunk(
+            id=f"chunk_{i}",
+            file_path=f"pkg/mod{i // 20}.py",
+            language=Language.PYTHON,
+            chunk_type=ChunkType.FUNCTION,
+            name=f"handler_{i}",
+            content=f"def handler_{i}(request):\n    return respond(request, {i})\n",
+            start_line=1,
+            end_line=2,
+        )
+        for i in range(chunk_count)
+    ]
+    db_path = get_config().get_vector_db_path(repo_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    store = VectorStore(db_path, HashEmbeddings())
+    await store.create_or_update_table(chunks)
+    (db_path.parent / "index.md").write_text("# Home\n")
+
+
+def _free_port() -> int:
+    """Pick an unused local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_flask(wiki_path: Path, port: int) -> Callable[[], None]:
+    """Serve the Flask app from a threaded werkzeug server; returns a stop function."""
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", port, create_app(wiki_path), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def stop() -> None:
+        server.shutdown()
+        thread.join()
+
+    return stop
+
+
+def _start_asgi(wiki_path: Path, port: int) -> Callable[[], None]:
+    """Serve the ASGI app under uvicorn in a thread; returns a stop function."""
+    config = uvicorn.Config(
+        create_asgi_app(wiki_path), host="127.0.0.1", port=port, log_level="warning"
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    def stop() -> None:
+        server.should_exit = True
+        thread.join()
+
+    return stop
+
+
+async def _chat(client: httpx.AsyncClient, question: str) -> tuple[float, float]:
+    """Stream one chat answer; returns (time to first byte, total time)."""
+    start = time.perf_counter()
+    first_byte = 0.0
+    async with client.stream("POST", "/api/chat", json={"question": question}) as response:
+        response.raise_for_status()
+        async for _ in response.aiter_bytes():
+            if not first_byte:
+                first_byte = time.perf_counter() - start
+    return first_byte, time.perf_counter() - start
+
+
+async def _load(port: int, concurrency: int, total: int) -> tuple[float, list, list]:
+    """Send total requests, at most concurrency at a time."""
+    limits = httpx.Limits(max_connections=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120
+    ) as client:
+
+        async def one(i: int) -> tuple[float, float]:
+            async with semaphore:
+                return await _chat(client, f"how does handler_{i} respond?")
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+    return elapsed, [r[0] for r in results], [r[1] for r in results]
+
+
+def _pct(values: list[float], q: float) -> float:
+    """Percentile in milliseconds."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))] * 1000
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--load-ms", type=float, default=300)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--token-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    def embedding_factory(config: object = None) -> EmbeddingProvider:
+        return HashEmbeddings(args.load_ms / 1000)
+
+    def llm_factory(**kwargs: object) -> LLMProvider:
+        return TokenStream(args.tokens, args.token_ms / 1000)
+
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+    print(
+        f"requests/level: {args.requests}, load: {args.load_ms:.0f} ms, "
+        f"tokens: {args.tokens} x {args.token_ms:.0f} ms"
+    )
+    print(
+        f"{'server':>7} {'conc':>5} {'req/s':>7} {'ttfb p50':>9} {'ttfb p95':>9} "
+        f"{'total p50':>10} {'total p95':>10}"
+    )
+
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        patch("local_deepwiki.providers.embeddings.get_embedding_provider", embedding_factory),
+        patch("local_deepwiki.providers.llm.get_cached_llm_provider", llm_factory),
+    ):
+        repo_path = Path(tmp)
+        await _index_repo(repo_path, args.chunks)
+        wiki_path = get_config().get_wiki_path(repo_path)
+
+        for server, start_server in (("flask", _start_flask), ("asgi", _start_asgi)):
+            port = _free_port()
+            stop = start_server(wiki_path, port)
+            try:
+                for concurrency in levels:
+                    elapsed, ttfb, totals = await _load(port, concurrency, args.requests)
+                    print(
+                        f"{server:>7} {concurrency:>5} {args.requests / elapsed:>7.1f} "
+                        f"{_pct(ttfb, 0.5):>9.1f} {_pct(ttfb, 0.95):>9.1f} "
+                        f"{_pct(totals, 0.5):>10.1f} {_pct(totals, 0.95):>10.1f}"
+                    )
+            finally:
+                stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -28,6 +28,7 @@ RESEARCH_PRESETS: dict[ResearchPreset, dict[str, Any]] = {
         "max_follow_up_queries": 1,
         "synthesis_temperature": 0.3,
         "synthesis_max_tokens": 2048,
+        "context_token_budget": 6000,
     },
     ResearchPreset.DEFAULT: {
         "max_sub_questions": 4,
@@ -36,6 +37,7 @@ RESEARCH_PRESETS: dict[ResearchPreset, dict[str, Any]] = {
         "max_follow_up_queries": 3,
         "synthesis_temperature": 0.5,
         "synthesis_max_tokens": 4096,
+        "context_token_budget": 12000,
     },
     ResearchPreset.THOROUGH: {
         "max_sub_questions": 6,
@@ -44,6 +46,7 @@ RESEARCH_PRESETS: dict[ResearchPreset, dict[str, Any]] = {
         "max_follow_up_queries": 5,
         "synthesis_temperature": 0.5,
         "synthesis_max_tokens": 8192,
+        "context_token_budget": 24000,
     },
 }
 
@@ -68,6 +71,10 @@ class EmbeddingConfig(BaseModel):
     provider: Literal["local", "openai"] = Field(default="local", description="Embedding provider")
     local: LocalEmbeddingConfig = Field(default_factory=LocalEmbeddingConfig)
     openai: OpenAIEmbeddingConfig = Field(default_factory=OpenAIEmbeddingConfig)
+    cache_enabled: bool = Field(
+        default=True,
+        description="Reuse chunk embeddings across index runs, keyed by content hash",
+    )
 
 
 class OllamaConfig(BaseModel):
@@ -98,6 +105,12 @@ class LLMConfig(BaseModel):
     ollama: OllamaConfig = Field(default_factory=OllamaConfig)
     anthropic: AnthropicConfig = Field(default_factory=AnthropicConfig)
     openai: OpenAILLMConfig = Field(default_factory=OpenAILLMConfig)
+    context_token_budget: int = Field(
+        default=6000,
+        ge=500,
+        le=200000,
+        description="Maximum tokens of code context in ask_question and chat prompts",
+    )
 
 
 class ParsingConfig(BaseModel):
@@ -122,6 +135,18 @@ class ParsingConfig(BaseModel):
         description="Languages to parse",
     )
     max_file_size: int = Field(default=1048576, description="Max file size in bytes (1MB)")
+    parse_cache_max_files: int = Field(
+        default=128,
+        ge=1,
+        le=10000,
+        description="Maximum parsed files kept in memory for reuse across file-doc extractors",
+    )
+    parse_cache_max_mb: int = Field(
+        default=32,
+        ge=1,
+        le=4096,
+        description="Maximum total source size (MB) of parsed files kept in memory",
+    )
     exclude_patterns: list[str] = Field(
         default=[
             "node_modules/**",
@@ -144,8 +169,15 @@ class ParsingConfig(BaseModel):
 class ChunkingConfig(BaseModel):
     """Chunking configuration."""
 
-    max_chunk_tokens: int = Field(default=512, description="Max tokens per chunk")
-    overlap_tokens: int = Field(default=50, description="Overlap between chunks")
+    max_chunk_tokens: int = Field(
+        default=512,
+        ge=1,
+        description="Max tokens per chunk. Larger functions and classes are split on "
+        "statement boundaries so the embedding model never truncates them.",
+    )
+    overlap_tokens: int = Field(
+        default=50, ge=0, description="Tokens of trailing statements repeated between split parts"
+    )
     batch_size: int = Field(
         default=500, description="Number of chunks to process in each batch for memory efficiency"
     )
@@ -160,6 +192,79 @@ class ChunkingConfig(BaseModel):
         description="Number of parallel workers for file parsing. "
         "Higher values speed up indexing on multi-core systems.",
     )
+    parse_backend: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Executor for file parsing. 'process' runs parse workers in separate "
+        "processes so chunking scales across cores; 'thread' avoids process startup cost.",
+    )
+    embedding_batch_size: int = Field(
+        default=0,
+        ge=0,
+        description="Number of chunks per embedding call during indexing. "
+        "0 uses the embedding provider's preferred batch size.",
+    )
+    parse_queue_depth: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum parsed files waiting for the embedding stage. "
+        "Parse workers pause when the queue is full.",
+    )
+    write_queue_depth: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum embedded batches waiting for the LanceDB writer. "
+        "The embedding stage pauses when the queue is full.",
+    )
+
+
+class VectorIndexConfig(BaseModel):
+    """Approximate nearest neighbour index configuration for the chunks table."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Build a vector index once the table is large enough. "
+        "Smaller tables are searched with an exact flat scan.",
+    )
+    index_type: Literal["ivf_pq", "ivf_hnsw_sq"] = Field(
+        default="ivf_pq",
+        description="Index type: 'ivf_pq' is compact and fast to build; 'ivf_hnsw_sq' "
+        "gives higher recall at the same latency but uses more memory.",
+    )
+    min_rows: int = Field(
+        default=100_000,
+        ge=256,
+        description="Row count at which the index is built. Below it, flat search is "
+        "fast enough and exact.",
+    )
+    num_partitions: int = Field(
+        default=0,
+        ge=0,
+        description="IVF partitions (0 lets LanceDB choose from the row count)",
+    )
+    num_sub_vectors: int = Field(
+        default=0,
+        ge=0,
+        description="PQ sub-vectors for 'ivf_pq' (0 lets LanceDB choose from the dimension)",
+    )
+    nprobes: int = Field(
+        default=20,
+        ge=1,
+        description="IVF partitions searched per query. Higher improves recall, costs latency.",
+    )
+    refine_factor: int = Field(
+        default=10,
+        ge=0,
+        description="Re-rank refine_factor * limit candidates by exact distance "
+        "(0 disables refinement). PQ distances are coarse, so refinement recovers "
+        "most of the recall lost to compression.",
+    )
+    rebuild_churn_fraction: float = Field(
+        default=0.25,
+        gt=0.0,
+        le=1.0,
+        description="Retrain the index when rows added or deleted since it was trained "
+        "exceed this fraction of the table; smaller churn is merged incrementally.",
+    )
 
 
 class WikiConfig(BaseModel):
@@ -174,8 +279,8 @@ class WikiConfig(BaseModel):
         default=8,
         ge=1,
         le=20,
-        description="Maximum concurrent LLM calls for file documentation generation. "
-        "Higher values speed up generation but increase memory/API usage.",
+        description="Maximum concurrent LLM calls during wiki generation, shared by all "
+        "pages. Higher values speed up generation but increase memory/API usage.",
     )
     use_cloud_for_github: bool = Field(
         default=False,
@@ -198,7 +303,11 @@ class WikiConfig(BaseModel):
         default=50, description="Maximum chunks to search for context when generating documentation"
     )
     fallback_search_limit: int = Field(
-        default=30, description="Maximum chunks to search in fallback queries"
+        default=30,
+        description=(
+            "Deprecated and unused since file pages batch their context searches; "
+            "kept for compatibility"
+        ),
     )
 
 
@@ -241,6 +350,12 @@ class DeepResearchConfig(BaseModel):
         le=16000,
         description="Maximum tokens in synthesis response",
     )
+    context_token_budget: int = Field(
+        default=12000,
+        ge=1000,
+        le=200000,
+        description="Maximum tokens of code context in the synthesis prompt",
+    )
 
     def with_preset(self, preset: ResearchPreset | str | None) -> "DeepResearchConfig":
         """Return a new config with preset values applied.
@@ -278,6 +393,9 @@ class OutputConfig(BaseModel):
 
     wiki_dir: str = Field(default=".deepwiki", description="Wiki output directory name")
     vector_db_name: str = Field(default="vectors.lance", description="Vector DB filename")
+    embedding_cache_name: str = Field(
+        default="embedding_cache.lance", description="Embedding cache DB filename"
+    )
 
 
 class LLMCacheConfig(BaseModel):
@@ -296,6 +414,16 @@ class LLMCacheConfig(BaseModel):
         le=100000,
         description="Maximum cache entries before eviction",
     )
+    max_size_mb: int = Field(
+        default=256,
+        ge=1,
+        le=10240,
+        description="Maximum total size of cached prompts and responses in MB before eviction",
+    )
+    eviction_policy: Literal["lru", "lfu"] = Field(
+        default="lru",
+        description="Which live entries to evict first: least recently or least frequently hit",
+    )
     similarity_threshold: float = Field(
         default=0.95,
         ge=0.0,
@@ -310,6 +438,35 @@ class LLMCacheConfig(BaseModel):
     )
 
 
+class RegistryConfig(BaseModel):
+    """Process-wide provider and vector store registry configuration."""
+
+    max_embedding_providers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Maximum warm embedding providers (loaded models) kept in memory",
+    )
+    max_vector_stores: int = Field(
+        default=8,
+        ge=1,
+        le=128,
+        description="Maximum open vector stores (one per repository) kept in memory",
+    )
+    max_llm_providers: int = Field(
+        default=8,
+        ge=1,
+        le=128,
+        description="Maximum cached LLM providers kept in memory",
+    )
+    idle_timeout_seconds: int = Field(
+        default=1800,
+        ge=0,
+        le=86400,
+        description="Evict registry entries unused for this many seconds (0 disables)",
+    )
+
+
 # Default prompts optimized for each provider
 # Ollama: Concise, direct (local models have limited context)
 # Anthropic: Detailed, nuanced (Claude excels at complex instructions)
@@ -459,8 +616,10 @@ class Config(BaseModel):
     embedding: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
     llm_cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
+    registry: RegistryConfig = Field(default_factory=RegistryConfig)
     parsing: ParsingConfig = Field(default_factory=ParsingConfig)
     chunking: ChunkingConfig = Field(default_factory=ChunkingConfig)
+    vector_index: VectorIndexConfig = Field(default_factory=VectorIndexConfig)
     wiki: WikiConfig = Field(default_factory=WikiConfig)
     deep_research: DeepResearchConfig = Field(default_factory=DeepResearchConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
@@ -503,6 +662,10 @@ class Config(BaseModel):
         """Get the vector database path for a repository."""
         return self.get_wiki_path(repo_path) / self.output.vector_db_name
 
+    def get_embedding_cache_path(self, repo_path: Path) -> Path:
+        """Get the embedding cache database path for a repository."""
+        return self.get_wiki_path(repo_path) / self.output.embedding_cache_name
+
 
 # Thread-safe global config singleton
 _config: Config | None = None
@@ -1,10 +1,12 @@
 """AST-based code chunking for semantic extraction."""
 
 import hashlib
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator
 
-from tree_sitter import Node
+from tree_sitter import Node, Query, QueryCursor
 
 from local_deepwiki.config import ChunkingConfig, get_config
 from local_deepwiki.core.parser import (
@@ -90,6 +92,67 @@ IMPORT_NODE_TYPES: dict[Language, set[str]] = {
     Language.CSHARP: {"using_directive"},
 }
 
+# Query patterns replacing the plain node type match for a capture, where the
+# node type alone is too broad
+_QUERY_OVERRIDES: dict[tuple[Language, str], str] = {
+    # Only receiver-less require/require_relative calls, not every method call
+    (Language.RUBY, "import"): (
+        "((call !receiver method: (identifier) @_method) @import"
+        ' (#match? @_method "^require(_relative)?$"))'
+    ),
+}
+
+# Node types holding the statements of a function or class body, for grammars
+# whose definitions have no "body" field
+BODY_NODE_TYPES = {
+    "block",
+    "class_body",
+    "declaration_list",
+    "statement_block",
+    "compound_statement",
+    "function_body",
+    "body_statement",
+}
+
+
+@dataclass
+class _FileNodes:
+    """The nodes of a file that become chunks, in source order."""
+
+    imports: list[Node]
+    classes: list[tuple[Node, list[Node]]]  # Each class with every function inside it
+    functions: list[Node]  # Functions not inside any class
+
+
+# Sub-word pieces: camelCase humps, all-caps runs, digit runs and single symbols
+_TOKEN_PIECE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+|[^\sA-Za-z\d]")
+
+
+def approximate_token_count(text: str) -> int:
+    """Estimate how many tokens an embedding tokenizer produces for text.
+
+    Counts sub-word pieces (camelCase humps, snake_case words, numbers and
+    individual punctuation), which tracks WordPiece/BPE counts for source code
+    far better than characters / 4 and needs no model download.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Estimated token count.
+    """
+    return len(_TOKEN_PIECE.findall(text))
+
+
+@dataclass
+class _SplitUnit:
+    """A run of lines that is kept together when splitting an oversized chunk."""
+
+    start: int  # First line, relative to the chunk
+    end: int  # One past the last line
+    text: str
+    tokens: int
+
 
 def get_parent_classes(class_node: Node, source: bytes, language: Language) -> list[str]:
     """Extract parent class names from a class definition.
@@ -498,26 +561,38 @@ def extract_function_type_metadata(
 class CodeChunker:
     """Extract semantic code chunks from source files using AST analysis."""
 
-    def __init__(self, config: ChunkingConfig | None = None):
+    def __init__(
+        self,
+        config: ChunkingConfig | None = None,
+        token_counter: Callable[[str], int] | None = None,
+    ):
         """Initialize the chunker.
 
         Args:
             config: Optional chunking configuration.
+            token_counter: Function counting tokens in a text, e.g. backed by
+                the embedding model's tokenizer. Defaults to
+                approximate_token_count.
         """
         self.config = config or get_config().chunking
         self.parser = CodeParser()
+        self.count_tokens = token_counter or approximate_token_count
+        self._queries: dict[Language, Query | None] = {}
 
-    def chunk_file(self, file_path: Path, repo_root: Path) -> Iterator[CodeChunk]:
+    def chunk_file(
+        self, file_path: Path, repo_root: Path, source: bytes | None = None
+    ) -> Iterator[CodeChunk]:
         """Extract code chunks from a source file.
 
         Args:
             file_path: Path to the source file.
             repo_root: Root directory of the repository.
+            source: Optional file content already read by the caller.
 
         Yields:
             CodeChunk objects for each semantic unit found.
         """
-        result = self.parser.parse_file(file_path)
+        result = self.parser.parse_file(file_path, source)
         if result is None:
             logger.debug(f"Skipping unsupported file: {file_path}")
             return
@@ -526,30 +601,123 @@ class CodeChunker:
         rel_path = str(file_path.relative_to(repo_root))
         logger.debug(f"Chunking {rel_path} ({language.value})")
 
+        nodes = self._collect_nodes(root, language)
+
         # Extract module-level chunk (file overview)
-        yield self._create_module_chunk(root, source, language, rel_path)
+        yield from self._fit_token_budget(
+            self._create_module_chunk(root, nodes, source, language, rel_path)
+        )
 
         # Extract imports
-        import_types = IMPORT_NODE_TYPES.get(language, set())
-        import_nodes = find_nodes_by_type(root, import_types)
-        if import_nodes:
-            yield self._create_imports_chunk(import_nodes, source, language, rel_path)
+        if nodes.imports:
+            yield from self._fit_token_budget(
+                self._create_imports_chunk(nodes.imports, source, language, rel_path)
+            )
 
         # Extract classes and their methods
-        class_types = CLASS_NODE_TYPES.get(language, set())
-        for class_node in find_nodes_by_type(root, class_types):
-            yield from self._extract_class_chunks(class_node, source, language, rel_path)
+        for class_node, method_nodes in nodes.classes:
+            yield from self._extract_class_chunks(
+                class_node, method_nodes, source, language, rel_path
+            )
 
         # Extract top-level functions (not inside classes)
-        function_types = FUNCTION_NODE_TYPES.get(language, set())
-        for func_node in find_nodes_by_type(root, function_types):
-            # Skip if inside a class (already processed)
-            if not self._is_inside_class(func_node, class_types):
-                yield self._create_function_chunk(func_node, source, language, rel_path)
+        for func_node in nodes.functions:
+            yield from self._fit_token_budget(
+                self._create_function_chunk(func_node, source, language, rel_path),
+                func_node,
+            )
+
+    def _collect_nodes(self, root: Node, language: Language) -> _FileNodes:
+        """Find the import, class and function nodes of a file in one traversal.
+
+        The language's compiled query captures every node of interest in a
+        single pass over the tree; a sweep over the captures in source order
+        then assigns each function to the classes enclosing it.
+
+        Args:
+            root: AST root node.
+            language: Programming language.
+
+        Returns:
+            The file's imports, classes with their methods, and top-level functions.
+        """
+        nodes = _FileNodes(imports=[], classes=[], functions=[])
+        query = self._get_query(language)
+        if query is None:
+            return nodes
+
+        captures = QueryCursor(query).captures(root)
+        ordered = sorted(
+            (
+                (node.start_byte, -node.end_byte, kind, node)
+                for kind in ("import", "class", "function")
+                for node in captures.get(kind, [])
+            ),
+            key=lambda item: item[:2],
+        )
+
+        # End byte and method list of each class enclosing the current node
+        open_classes: list[tuple[int, list[Node]]] = []
+        for start_byte, _, kind, node in ordered:
+            while open_classes and open_classes[-1][0] <= start_byte:
+                open_classes.pop()
+            if kind == "import":
+                nodes.imports.append(node)
+            elif kind == "class":
+                methods: list[Node] = []
+                nodes.classes.append((node, methods))
+                open_classes.append((node.end_byte, methods))
+            elif open_classes:
+                # A method of a nested class also belongs to every outer class
+                for _, methods in open_classes:
+                    methods.append(node)
+            else:
+                nodes.functions.append(node)
+        return nodes
+
+    def _get_query(self, language: Language) -> Query | None:
+        """Get the compiled chunk extraction query for a language.
+
+        Node types a grammar does not define are left out, since the query
+        would not compile with them.
+
+        Args:
+            language: Programming language.
+
+        Returns:
+            The query, or None if the language has no extractable node types.
+        """
+        if language in self._queries:
+            return self._queries[language]
+
+        ts_language = self.parser.get_language(language)
+        patterns = []
+        for kind, type_map in (
+            ("import", IMPORT_NODE_TYPES),
+            ("class", CLASS_NODE_TYPES),
+            ("function", FUNCTION_NODE_TYPES),
+        ):
+            override = _QUERY_OVERRIDES.get((language, kind))
+            if override is not None:
+                patterns.append(override)
+                continue
+            node_types = sorted(
+                node_type
+                for node_type in type_map.get(language, set())
+                if ts_language.id_for_node_kind(node_type, True) is not None
+            )
+            if node_types:
+                alternatives = " ".join(f"({node_type})" for node_type in node_types)
+                patterns.append(f"[{alternatives}] @{kind}")
+
+        query = Query(ts_language, "\n".join(patterns)) if patterns else None
+        self._queries[language] = query
+        return query
 
     def _create_module_chunk(
         self,
         root: Node,
+        nodes: _FileNodes,
         source: bytes,
         language: Language,
         file_path: str,
@@ -558,6 +726,7 @@ class CodeChunker:
 
         Args:
             root: AST root node.
+            nodes: The file's import, class and function nodes.
             source: Source bytes.
             language: Programming language.
             file_path: Relative file path.
@@ -577,7 +746,7 @@ class CodeChunker:
                         docstring = docstring[3:-3].strip()
 
         # Create a summary of the file structure
-        content = self._create_file_summary(root, source, language)
+        content = self._create_file_summary(nodes, source, language)
 
         chunk_id = self._generate_id(file_path, "module", 0)
         return CodeChunk(
@@ -593,11 +762,11 @@ class CodeChunker:
             metadata={"is_overview": True},
         )
 
-    def _create_file_summary(self, root: Node, source: bytes, language: Language) -> str:
+    def _create_file_summary(self, nodes: _FileNodes, source: bytes, language: Language) -> str:
         """Create a summary of file structure for the module chunk.
 
         Args:
-            root: AST root node.
+            nodes: The file's import, class and function nodes.
             source: Source bytes.
             language: Programming language.
 
@@ -607,8 +776,7 @@ class CodeChunker:
         parts = []
 
         # List imports
-        import_types = IMPORT_NODE_TYPES.get(language, set())
-        imports = find_nodes_by_type(root, import_types)
+        imports = nodes.imports
         if imports:
             import_text = "\n".join(get_node_text(n, source) for n in imports[:10])
             if len(imports) > 10:
@@ -616,19 +784,14 @@ class CodeChunker:
             parts.append(f"# Imports:\n{import_text}")
 
         # List classes
-        class_types = CLASS_NODE_TYPES.get(language, set())
-        classes = find_nodes_by_type(root, class_types)
-        if classes:
-            class_names = [get_node_name(c, source, language) or "anonymous" for c in classes]
+        if nodes.classes:
+            class_names = [
+                get_node_name(c, source, language) or "anonymous" for c, _ in nodes.classes
+            ]
             parts.append(f"# Classes: {', '.join(class_names)}")
 
         # List functions
-        function_types = FUNCTION_NODE_TYPES.get(language, set())
-        functions = [
-            f
-            for f in find_nodes_by_type(root, function_types)
-            if not self._is_inside_class(f, class_types)
-        ]
+        functions = nodes.functions
         if functions:
             func_names = [get_node_name(f, source, language) or "anonymous" for f in functions]
             parts.append(f"# Functions: {', '.join(func_names)}")
@@ -673,6 +836,7 @@ class CodeChunker:
     def _extract_class_chunks(
         self,
         class_node: Node,
+        method_nodes: list[Node],
         source: bytes,
         language: Language,
         file_path: str,
@@ -681,6 +845,7 @@ class CodeChunker:
 
         Args:
             class_node: The class AST node.
+            method_nodes: Function nodes inside the class.
             source: Source bytes.
             language: Programming language.
             file_path: Relative file path.
@@ -695,19 +860,31 @@ class CodeChunker:
         # Extract parent classes for inheritance
         parent_classes = get_parent_classes(class_node, source, language)
 
-        # Check if class is too large and needs to be split
+        # Check if class is too large and needs to be split; a class over the
+        # token budget is also split, if it has methods to split it into
         lines = content.count("\n") + 1
-        if lines > self.config.class_split_threshold:
+        if lines > self.config.class_split_threshold or (
+            method_nodes and self.count_tokens(content) > self.config.max_chunk_tokens
+        ):
             # For large classes, create a summary chunk and method chunks
-            yield self._create_class_summary_chunk(
-                class_node, source, language, file_path, class_name, docstring, parent_classes
+            yield from self._fit_token_budget(
+                self._create_class_summary_chunk(
+                    class_node,
+                    method_nodes,
+                    source,
+                    language,
+                    file_path,
+                    class_name,
+                    docstring,
+                    parent_classes,
+                )
             )
 
             # Extract methods separately
-            function_types = FUNCTION_NODE_TYPES.get(language, set())
-            for method_node in find_nodes_by_type(class_node, function_types):
-                yield self._create_method_chunk(
-                    method_node, source, language, file_path, class_name
+            for method_node in method_nodes:
+                yield from self._fit_token_budget(
+                    self._create_method_chunk(method_node, source, language, file_path, class_name),
+                    method_node,
                 )
         else:
             # Small class - include everything in one chunk
@@ -717,7 +894,7 @@ class CodeChunker:
             metadata: dict[str, int | list[str]] = {"line_count": lines}
             if parent_classes:
                 metadata["parent_classes"] = parent_classes
-            yield CodeChunk(
+            chunk = CodeChunk(
                 id=chunk_id,
                 file_path=file_path,
                 language=language,
@@ -729,10 +906,12 @@ class CodeChunker:
                 docstring=docstring,
                 metadata=metadata,
             )
+            yield from self._fit_token_budget(chunk, class_node)
 
     def _create_class_summary_chunk(
         self,
         class_node: Node,
+        methods: list[Node],
         source: bytes,
         language: Language,
         file_path: str,
@@ -744,6 +923,7 @@ class CodeChunker:
 
         Args:
             class_node: The class AST node.
+            methods: Function nodes inside the class.
             source: Source bytes.
             language: Programming language.
             file_path: Relative file path.
@@ -755,8 +935,6 @@ class CodeChunker:
             A summary CodeChunk for the class.
         """
         # Get class signature and method list
-        function_types = FUNCTION_NODE_TYPES.get(language, set())
-        methods = find_nodes_by_type(class_node, function_types)
         method_names = [get_node_name(m, source, language) or "anonymous" for m in methods]
 
         # Build summary content
@@ -874,22 +1052,181 @@ class CodeChunker:
             metadata=metadata,
         )
 
-    def _is_inside_class(self, node: Node, class_types: set[str]) -> bool:
-        """Check if a node is inside a class definition.
+    def _fit_token_budget(self, chunk: CodeChunk, node: Node | None = None) -> Iterator[CodeChunk]:
+        """Split a chunk that exceeds max_chunk_tokens into parts that fit.
+
+        Function and class chunks are split between the statements of their
+        body, so no part starts mid-statement; other chunks (and statements
+        that alone exceed the budget) are split between lines. Every part
+        repeats the definition's header (e.g. the signature) for context, and
+        consecutive parts share up to overlap_tokens of trailing statements.
+
+        The first part keeps the chunk's id, type and metadata, so callers that
+        enumerate functions and classes still see exactly one chunk per
+        definition. Continuation parts are OTHER chunks with the same name,
+        linked to the first part through ``split_from`` in their metadata.
 
         Args:
-            node: The node to check.
-            class_types: Set of class node type names.
+            chunk: The chunk to fit.
+            node: AST node the chunk's content was taken from, if any.
+
+        Yields:
+            The chunk itself if it fits, otherwise its parts.
+        """
+        budget = self.config.max_chunk_tokens
+        if self.count_tokens(chunk.content) <= budget:
+            yield chunk
+            return
+
+        lines = chunk.content.split("\n")
+        # Headers are capped at a quarter of the budget, so units that fit the
+        # remaining three quarters always fit alongside the header
+        body_start, units = self._split_units(lines, node, budget - budget // 4)
+        header = "\n".join(lines[:body_start])
+        header_tokens = self.count_tokens(header) if header else 0
+        if header_tokens > budget // 4:
+            # Oversized headers (long signatures, decorators) keep only their first line
+            header = lines[0] if body_start else ""
+            header_tokens = self.count_tokens(header) if header else 0
+            if header_tokens > budget // 4:
+                header, header_tokens = "", 0
+
+        groups = self._pack_units(
+            units, budget - header_tokens, min(self.config.overlap_tokens, budget // 2)
+        )
+        logger.debug(f"Split {chunk.name or chunk.chunk_type.value} into {len(groups)} parts")
+
+        for index, group in enumerate(groups):
+            body = group[0].text
+            for previous, unit in zip(group, group[1:]):
+                # Pieces of one cut line are rejoined without a line break
+                body += ("" if unit.start == previous.start else "\n") + unit.text
+            first_line = 0 if index == 0 else group[0].start
+            part = {
+                "content": f"{header}\n{body}" if header else body,
+                "start_line": chunk.start_line + first_line,
+                "end_line": chunk.start_line + group[-1].end - 1,
+            }
+            if index == 0:
+                metadata = {**chunk.metadata, "part_index": 1, "part_count": len(groups)}
+                yield chunk.model_copy(update={**part, "metadata": metadata})
+            else:
+                yield chunk.model_copy(
+                    update={
+                        **part,
+                        "id": self._generate_id(chunk.id, "part", index + 1),
+                        "chunk_type": ChunkType.OTHER,
+                        "docstring": None,
+                        "metadata": {
+                            "split_from": chunk.id,
+                            "split_chunk_type": chunk.chunk_type.value,
+                            "part_index": index + 1,
+                            "part_count": len(groups),
+                        },
+                    }
+                )
+
+    def _split_units(
+        self, lines: list[str], node: Node | None, budget: int
+    ) -> tuple[int, list[_SplitUnit]]:
+        """Divide chunk lines into a header and units that must stay together.
+
+        Args:
+            lines: Lines of the chunk content.
+            node: AST node the content came from, if any.
+            budget: Token budget for the body of each part.
 
         Returns:
-            True if the node is inside a class.
+            Tuple of (number of header lines, units covering the remaining lines).
+        """
+        # Line ranges of body statements, relative to the chunk's first line
+        ranges: list[tuple[int, int]] = []
+        body = self._find_body(node) if node is not None else None
+        if body is not None and node is not None:
+            base = node.start_point[0]
+            for statement in body.named_children:
+                start = statement.start_point[0] - base
+                end = statement.end_point[0] - base + 1
+                if ranges and start < ranges[-1][1]:
+                    # Shares a line with the previous statement
+                    ranges[-1] = (ranges[-1][0], max(end, ranges[-1][1]))
+                else:
+                    ranges.append((start, end))
+
+        if not ranges:
+            return 0, self._line_units(lines, 0, len(lines), budget)
+
+        body_start = ranges[0][0]
+        units: list[_SplitUnit] = []
+        for i, (_, end) in enumerate(ranges):
+            # Blank lines and comments before a statement travel with it; the
+            # closing lines of the body travel with the last statement
+            start = ranges[i - 1][1] if i else body_start
+            end = len(lines) if i == len(ranges) - 1 else end
+            text = "\n".join(lines[start:end])
+            tokens = self.count_tokens(text)
+            if tokens > budget:
+                units.extend(self._line_units(lines, start, end, budget))
+            else:
+                units.append(_SplitUnit(start, end, text, tokens))
+        return body_start, units
+
+    def _line_units(self, lines: list[str], start: int, end: int, budget: int) -> list[_SplitUnit]:
+        """Make one unit per line, cutting lines that alone exceed the budget."""
+        units = []
+        for number in range(start, end):
+            line = lines[number]
+            tokens = self.count_tokens(line)
+            if tokens <= budget:
+                units.append(_SplitUnit(number, number + 1, line, tokens))
+                continue
+            # Minified or generated code: cut the line into budget-sized pieces
+            width = max(1, len(line) * budget // tokens)
+            for offset in range(0, len(line), width):
+                piece = line[offset : offset + width]
+                units.append(_SplitUnit(number, number + 1, piece, self.count_tokens(piece)))
+        return units
+
+    @staticmethod
+    def _pack_units(units: list[_SplitUnit], budget: int, overlap: int) -> list[list[_SplitUnit]]:
+        """Group consecutive units into parts of at most budget tokens.
+
+        Each part after the first starts with the previous part's trailing
+        units, up to overlap tokens.
         """
-        parent = node.parent
-        while parent:
-            if parent.type in class_types:
-                return True
-            parent = parent.parent
-        return False
+        groups: list[list[_SplitUnit]] = []
+        current: list[_SplitUnit] = []
+        current_tokens = 0
+        for unit in units:
+            if current and current_tokens + unit.tokens > budget:
+                groups.append(current)
+                carried: list[_SplitUnit] = []
+                carried_tokens = 0
+                # Always leave at least one unit behind so every part adds new content
+                for previous in reversed(current[1:]):
+                    if carried_tokens + previous.tokens > overlap:
+                        break
+                    carried.insert(0, previous)
+                    carried_tokens += previous.tokens
+                if carried_tokens + unit.tokens > budget:
+                    carried, carried_tokens = [], 0
+                current, current_tokens = carried, carried_tokens
+            current.append(unit)
+            current_tokens += unit.tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    @staticmethod
+    def _find_body(node: Node) -> Node | None:
+        """Find the node holding a definition's body statements."""
+        body = node.child_by_field_name("body")
+        if body is not None and body.named_child_count:
+            return body
+        for child in node.children:
+            if child.type in BODY_NODE_TYPES and child.named_child_count:
+                return child
+        return None
 
     def _generate_id(self, file_path: str, name: str, line: int) -> str:
         """Generate a unique chunk ID.
@@ -0,0 +1,240 @@
+"""Token-budget aware packing of retrieved code into prompt context.
+
+Q&A, chat and deep research synthesis all turn search results into a single
+code context for the LLM prompt. pack_context() fits that context into a
+token budget measured with the provider's own counter: chunks of one file
+whose line ranges overlap or touch are merged into one block (so a method
+inside a retrieved class is not sent twice), blocks are added most relevant
+first, and a block that no longer fits whole is cut down to the lines that do.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+
+from local_deepwiki.logging import get_logger
+from local_deepwiki.models import SearchResult
+
+logger = get_logger(__name__)
+
+# Placed between blocks in the packed context
+CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+# Trimming a block to fewer tokens than this leaves too little code to be useful
+MIN_TRIMMED_TOKENS = 64
+
+# Last line of a block whose tail was cut to fit the budget
+TRUNCATION_MARKER = "... (truncated to fit the context budget)"
+
+TokenCounter = Callable[[str], int]
+
+
+@dataclass
+class ContextBlock:
+    """A contiguous piece of one file in the packed context.
+
+    Attributes:
+        file_path: File the code comes from.
+        start_line: First line of the block.
+        end_line: Last line of the block.
+        lines: The block's code, one entry per line.
+        score: Best relevance score of the chunks in the block.
+        results: Search results the block was built from.
+        line_exact: Whether lines map one-to-one onto start_line..end_line,
+            which merging and line ranges of trimmed blocks rely on.
+        truncated: Whether the block's tail was cut to fit the budget.
+    """
+
+    file_path: str
+    start_line: int
+    end_line: int
+    lines: list[str]
+    score: float
+    results: list[SearchResult] = field(default_factory=list)
+    line_exact: bool = True
+    truncated: bool = False
+
+    @classmethod
+    def from_result(cls, result: SearchResult) -> "ContextBlock":
+        """Create a block holding a single search result."""
+        chunk = result.chunk
+        lines = chunk.content.split("\n")
+        return cls(
+            file_path=chunk.file_path,
+            start_line=chunk.start_line,
+            end_line=chunk.end_line,
+            lines=lines,
+            score=result.score,
+            results=[result],
+            line_exact=len(lines) == chunk.end_line - chunk.start_line + 1,
+        )
+
+    def absorb(self, other: "ContextBlock") -> None:
+        """Merge a block of the same file that starts inside or right after this one."""
+        if other.end_line > self.end_line:
+            self.lines = self.lines + other.lines[self.end_line - other.start_line + 1 :]
+            self.end_line = other.end_line
+        self.score = max(self.score, other.score)
+        self.results = self.results + other.results
+
+    def truncate(self, keep_lines: int) -> "ContextBlock":
+        """Get a copy of the block cut down to its first keep_lines lines."""
+        if not self.line_exact:
+            return replace(self, lines=self.lines[:keep_lines], truncated=True)
+        end_line = self.start_line + keep_lines - 1
+        return replace(
+            self,
+            end_line=end_line,
+            lines=self.lines[:keep_lines],
+            results=[r for r in self.results if r.chunk.start_line <= end_line],
+            truncated=True,
+        )
+
+    def render(self) -> str:
+        """Format the block for a prompt, with a header citing its location."""
+        kinds = ", ".join(dict.fromkeys(r.chunk.chunk_type.value for r in self.results))
+        names = ", ".join(dict.fromkeys(r.chunk.name for r in self.results if r.chunk.name))
+        header = f"File: {self.file_path}:{self.start_line}-{self.end_line} | Type: {kinds}"
+        if names:
+            header += f" | Name: {names}"
+        body = "\n".join(self.lines)
+        if self.truncated:
+            body += f"\n{TRUNCATION_MARKER}"
+        return f"{header}\n```\n{body}\n```"
+
+
+@dataclass
+class PackedContext:
+    """Code context packed into a token budget.
+
+    Attributes:
+        text: The context to put in the prompt.
+        blocks: Blocks in the order they appear in text.
+        tokens_used: Tokens text takes, by the counter used for packing.
+        token_budget: The budget text was packed into.
+        chunks_packed: Distinct chunks that made it into text.
+        chunks_dropped: Distinct chunks left out for lack of budget.
+    """
+
+    text: str
+    blocks: list[ContextBlock]
+    tokens_used: int
+    token_budget: int
+    chunks_packed: int
+    chunks_dropped: int
+
+    @property
+    def results(self) -> list[SearchResult]:
+        """Get the search results in the context, most relevant first."""
+        results = [r for block in self.blocks for r in block.results]
+        return sorted(results, key=lambda r: r.score, reverse=True)
+
+
+def _merge_blocks(results: list[SearchResult]) -> list[ContextBlock]:
+    """Turn search results into blocks, merging overlapping and adjacent chunks per file.
+
+    Chunks whose content does not line up with their line range (such as
+    summaries) cannot be spliced, so they always stay blocks of their own.
+    """
+    blocks: list[ContextBlock] = []
+    by_file: dict[str, list[ContextBlock]] = {}
+    for result in results:
+        block = ContextBlock.from_result(result)
+        if block.line_exact:
+            by_file.setdefault(block.file_path, []).append(block)
+        else:
+            blocks.append(block)
+
+    for file_blocks in by_file.values():
+        # Longest first among blocks starting together, so it absorbs the rest
+        file_blocks.sort(key=lambda b: (b.start_line, -b.end_line))
+        current = file_blocks[0]
+        for block in file_blocks[1:]:
+            if block.start_line <= current.end_line + 1:
+                current.absorb(block)
+            else:
+                blocks.append(current)
+                current = block
+        blocks.append(current)
+    return blocks
+
+
+def _trim_block(
+    block: ContextBlock, available: int, count_tokens: TokenCounter
+) -> tuple[ContextBlock, int] | None:
+    """Cut a block to the most leading lines that fit in available tokens.
+
+    Returns:
+        Tuple of (trimmed block, its token count), or None if not even the
+        first line fits.
+    """
+    best: tuple[ContextBlock, int] | None = None
+    low, high = 1, len(block.lines) - 1
+    while low <= high:
+        keep = (low + high) // 2
+        trimmed = block.truncate(keep)
+        tokens = count_tokens(trimmed.render())
+        if tokens <= available:
+            best = (trimmed, tokens)
+            low = keep + 1
+        else:
+            high = keep - 1
+    return best
+
+
+def pack_context(
+    results: list[SearchResult],
+    token_budget: int,
+    count_tokens: TokenCounter,
+) -> PackedContext:
+    """Pack search results into a prompt context of at most token_budget tokens.
+
+    Args:
+        results: Search results to pack, in any order.
+        token_budget: Maximum tokens the context may take.
+        count_tokens: Token counter of the LLM that will read the context,
+            usually the provider's count_tokens.
+
+    Returns:
+        The packed context, with the blocks and token and chunk counts.
+    """
+    # The same chunk can come back from several queries; keep its best score
+    unique: dict[str, SearchResult] = {}
+    for result in results:
+        seen = unique.get(result.chunk.id)
+        if seen is None or result.score > seen.score:
+            unique[result.chunk.id] = result
+
+    blocks = sorted(_merge_blocks(list(unique.values())), key=lambda b: b.score, reverse=True)
+    separator_tokens = count_tokens(CONTEXT_SEPARATOR)
+
+    packed: list[ContextBlock] = []
+    tokens_used = 0
+    for block in blocks:
+        overhead = separator_tokens if packed else 0
+        tokens = count_tokens(block.render())
+        if tokens_used + overhead + tokens <= token_budget:
+            packed.append(block)
+            tokens_used += overhead + tokens
+            continue
+
+        available = token_budget - tokens_used - overhead
+        if available < MIN_TRIMMED_TOKENS:
+            continue
+        trimmed = _trim_block(block, available, count_tokens)
+        if trimmed is not None:
+            packed.append(trimmed[0])
+            tokens_used += overhead + trimmed[1]
+
+    chunks_packed = len({r.chunk.id for block in packed for r in block.results})
+    logger.debug(
+        f"Packed {chunks_packed}/{len(unique)} chunks into {len(packed)} blocks, "
+        f"{tokens_used}/{token_budget} tokens"
+    )
+    return PackedContext(
+        text=CONTEXT_SEPARATOR.join(block.render() for block in packed),
+        blocks=packed,
+        tokens_used=tokens_used,
+        token_budget=token_budget,
+        chunks_packed=chunks_packed,
+        chunks_dropped=len(unique) - chunks_packed,
+    )
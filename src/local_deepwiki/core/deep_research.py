@@ -3,9 +3,13 @@
 import asyncio
 import json
 import re
+import threading
 import time
-from collections.abc import Awaitable, Callable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import TypeVar
 
+from local_deepwiki.core.context_packer import PackedContext, pack_context
 from local_deepwiki.core.vectorstore import VectorStore
 from local_deepwiki.logging import get_logger
 from local_deepwiki.models import (
@@ -19,6 +23,7 @@ from local_deepwiki.models import (
     SubQuestion,
 )
 from local_deepwiki.providers.base import LLMProvider
+from local_deepwiki.providers.metrics import TextCallback, generate_with_metrics
 
 # Type alias for progress callback
 ProgressCallback = Callable[[ResearchProgress], Awaitable[None]] | None
@@ -29,6 +34,14 @@ CancellationCallback = Callable[[], bool] | None
 
 logger = get_logger(__name__)
 
+# Value type of a ResearchSession cache
+_V = TypeVar("_V")
+
+# Entries a ResearchSession keeps of each kind before evicting the oldest
+SESSION_MAX_EMBEDDINGS = 512
+SESSION_MAX_RETRIEVALS = 256
+SESSION_MAX_GAP_ANALYSES = 64
+
 
 class ResearchCancelledError(Exception):
     """Raised when a deep research operation is cancelled."""
@@ -110,12 +123,123 @@ Provide a comprehensive answer that:
 Format your answer with clear sections if appropriate."""
 
 
+def normalize_query(query: str) -> str:
+    """Normalize a query for research session lookups.
+
+    Case, runs of whitespace and trailing punctuation do not change what a
+    query asks, so "How does auth work?" and "how does  auth work" share
+    session entries.
+
+    Args:
+        query: Query or question text.
+
+    Returns:
+        The normalized query.
+    """
+    return " ".join(query.casefold().split()).rstrip("?.! ")
+
+
+class ResearchSession:
+    """Cache of deep research work on one repository, reused across questions.
+
+    Follow-up questions about the same area repeat sub-questions and
+    follow-up queries. A session keeps their embeddings, the chunks
+    retrieved for them and gap analysis results, keyed by normalized query,
+    so a repeat costs no embedding call, search or LLM call. Sessions do not
+    track the index, so the owner must drop a session when its repository is
+    re-indexed; the resource registry does this for its sessions.
+    """
+
+    def __init__(
+        self,
+        max_embeddings: int = SESSION_MAX_EMBEDDINGS,
+        max_retrievals: int = SESSION_MAX_RETRIEVALS,
+        max_gap_analyses: int = SESSION_MAX_GAP_ANALYSES,
+    ):
+        """Initialize an empty session.
+
+        Args:
+            max_embeddings: Query embeddings to keep.
+            max_retrievals: Retrieved result lists to keep.
+            max_gap_analyses: Gap analysis results to keep.
+        """
+        self._embeddings: OrderedDict[Hashable, list[float]] = OrderedDict()
+        self._retrievals: OrderedDict[Hashable, list[SearchResult]] = OrderedDict()
+        self._gap_analyses: OrderedDict[Hashable, list[str]] = OrderedDict()
+        self.max_embeddings = max_embeddings
+        self.max_retrievals = max_retrievals
+        self.max_gap_analyses = max_gap_analyses
+        # Web servers may run research for one repository on several threads
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get lookup statistics and the number of cached entries."""
+        with self._lock:
+            return {
+                **self._stats,
+                "embeddings": len(self._embeddings),
+                "retrievals": len(self._retrievals),
+                "gap_analyses": len(self._gap_analyses),
+            }
+
+    def _get(self, entries: OrderedDict[Hashable, _V], key: Hashable) -> _V | None:
+        """Look up an entry, marking it recently used."""
+        with self._lock:
+            value = entries.get(key)
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def _put(
+        self, entries: OrderedDict[Hashable, _V], max_entries: int, key: Hashable, value: _V
+    ) -> None:
+        """Store an entry, evicting the least recently used beyond max_entries."""
+        with self._lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+
+    def get_embedding(self, query: str) -> list[float] | None:
+        """Get a cached query embedding."""
+        return self._get(self._embeddings, normalize_query(query))
+
+    def put_embedding(self, query: str, embedding: list[float]) -> None:
+        """Cache a query embedding."""
+        self._put(self._embeddings, self.max_embeddings, normalize_query(query), embedding)
+
+    def get_results(self, query: str, limit: int) -> list[SearchResult] | None:
+        """Get the cached results of searching for a query with a limit."""
+        return self._get(self._retrievals, (normalize_query(query), limit))
+
+    def put_results(self, query: str, limit: int, results: list[SearchResult]) -> None:
+        """Cache the results of searching for a query with a limit."""
+        self._put(self._retrievals, self.max_retrievals, (normalize_query(query), limit), results)
+
+    def get_gap_analysis(self, question: str, chunk_ids: Iterable[str]) -> list[str] | None:
+        """Get cached follow-up queries for a question and the chunks it was given."""
+        return self._get(self._gap_analyses, (normalize_query(question), frozenset(chunk_ids)))
+
+    def put_gap_analysis(
+        self, question: str, chunk_ids: Iterable[str], follow_up_queries: list[str]
+    ) -> None:
+        """Cache follow-up queries for a question and the chunks it was given."""
+        key = (normalize_query(question), frozenset(chunk_ids))
+        self._put(self._gap_analyses, self.max_gap_analyses, key, follow_up_queries)
+
+
 class DeepResearchPipeline:
     """Multi-step research pipeline for complex codebase questions.
 
     This pipeline performs:
-    1. Query decomposition - breaks question into sub-questions
-    2. Parallel retrieval - searches for each sub-question
+    1. Query decomposition - breaks question into sub-questions, while the
+       question itself is retrieved for speculatively
+    2. Parallel retrieval - searches for all sub-questions in one batch
     3. Gap analysis - identifies missing context
     4. Follow-up retrieval - targeted search for gaps
     5. Synthesis - combines context into comprehensive answer
@@ -131,9 +255,11 @@ class DeepResearchPipeline:
         max_follow_up_queries: int = 3,
         synthesis_temperature: float = 0.5,
         synthesis_max_tokens: int = 4096,
+        context_token_budget: int = 12000,
         decomposition_prompt: str | None = None,
         gap_analysis_prompt: str | None = None,
         synthesis_prompt: str | None = None,
+        session: ResearchSession | None = None,
     ):
         """Initialize the deep research pipeline.
 
@@ -146,9 +272,13 @@ class DeepResearchPipeline:
             max_follow_up_queries: Maximum follow-up queries in gap analysis.
             synthesis_temperature: LLM temperature for synthesis (0.0-2.0).
             synthesis_max_tokens: Maximum tokens in synthesis response.
+            context_token_budget: Maximum tokens of code context in the
+                synthesis prompt, counted with the LLM provider's tokenizer.
             decomposition_prompt: Custom system prompt for decomposition (optional).
             gap_analysis_prompt: Custom system prompt for gap analysis (optional).
             synthesis_prompt: Custom system prompt for synthesis (optional).
+            session: Research session of the repository, to reuse embeddings,
+                retrievals and gap analyses across questions (optional).
         """
         self.vector_store = vector_store
         self.llm = llm_provider
@@ -158,15 +288,18 @@ class DeepResearchPipeline:
         self.max_follow_up_queries = max_follow_up_queries
         self.synthesis_temperature = synthesis_temperature
         self.synthesis_max_tokens = synthesis_max_tokens
+        self.context_token_budget = context_token_budget
 
         # Use custom prompts if provided, otherwise use defaults
         self.decomposition_prompt = decomposition_prompt or DECOMPOSITION_SYSTEM_PROMPT
         self.gap_analysis_prompt = gap_analysis_prompt or GAP_ANALYSIS_SYSTEM_PROMPT
         self.synthesis_prompt = synthesis_prompt or SYNTHESIS_SYSTEM_PROMPT
+        self.session = session
 
         # Runtime state (set during research())
         self._progress_callback: ProgressCallback = None
         self._cancellation_check: CancellationCallback = None
+        self._answer_callback: TextCallback | None = None
 
     def _check_cancelled(self, step_name: str) -> None:
         """Check if research was cancelled and raise if so.
@@ -211,6 +344,7 @@ class DeepResearchPipeline:
         question: str,
         progress_callback: ProgressCallback = None,
         cancellation_check: CancellationCallback = None,
+        answer_callback: TextCallback | None = None,
     ) -> DeepResearchResult:
         """Execute the full research pipeline.
 
@@ -218,6 +352,8 @@ class DeepResearchPipeline:
             question: The complex question to research.
             progress_callback: Optional async callback for progress updates.
             cancellation_check: Optional callback that returns True if cancelled.
+            answer_callback: Optional async callback given each piece of the
+                answer as synthesis streams it.
 
         Returns:
             DeepResearchResult with answer, sources, and reasoning trace.
@@ -228,6 +364,7 @@ class DeepResearchPipeline:
         # Store callbacks for use by helper methods
         self._progress_callback = progress_callback
         self._cancellation_check = cancellation_check
+        self._answer_callback = answer_callback
 
         try:
             return await self._execute_pipeline(question)
@@ -235,6 +372,7 @@ class DeepResearchPipeline:
             # Clear callbacks after execution
             self._progress_callback = None
             self._cancellation_check = None
+            self._answer_callback = None
 
     async def _execute_pipeline(self, question: str) -> DeepResearchResult:
         """Execute the research pipeline steps.
@@ -250,14 +388,22 @@ class DeepResearchPipeline:
 
         await self._report_progress(0, ResearchProgressType.STARTED, "Starting deep research...")
 
-        # Step 1: Decompose question
-        sub_questions, step, calls = await self._step_decompose(question)
-        trace.append(step)
-        llm_calls += calls
+        # Retrieval for the question itself needs no sub-questions, so it
+        # runs while the decomposition LLM call is in flight
+        speculative = asyncio.create_task(self._retrieve([question], self.chunks_per_subquestion))
+        try:
+            # Step 1: Decompose question
+            sub_questions, step, calls = await self._step_decompose(question)
+            trace.append(step)
+            llm_calls += calls
 
-        # Step 2: Parallel retrieval
-        initial_results, step = await self._step_retrieve(sub_questions)
-        trace.append(step)
+            # Step 2: Parallel retrieval
+            initial_results, step = await self._step_retrieve(question, sub_questions, speculative)
+            trace.append(step)
+        finally:
+            # No-op once awaited; otherwise stops it and collects its outcome
+            speculative.cancel()
+            await asyncio.gather(speculative, return_exceptions=True)
 
         # Step 3: Gap analysis
         follow_up_queries, step, calls = await self._step_gap_analysis(
@@ -274,11 +420,13 @@ class DeepResearchPipeline:
             )
             trace.append(step)
 
-        # Prepare results for synthesis
+        # Prepare results for synthesis, fitted into the context budget
         all_results = self._prepare_results_for_synthesis(initial_results, additional_results)
+        context = pack_context(all_results, self.context_token_budget, self.llm.count_tokens)
+        packed_results = context.results
 
         # Step 5: Synthesis
-        answer, step, calls = await self._step_synthesize(question, sub_questions, all_results)
+        answer, step, calls = await self._step_synthesize(question, sub_questions, context)
         trace.append(step)
         llm_calls += calls
 
@@ -286,8 +434,8 @@ class DeepResearchPipeline:
         await self._report_progress(
             5,
             ResearchProgressType.COMPLETE,
-            f"Research complete: {len(all_results)} chunks analyzed, {llm_calls} LLM calls",
-            chunks_retrieved=len(all_results),
+            f"Research complete: {len(packed_results)} chunks analyzed, {llm_calls} LLM calls",
+            chunks_retrieved=len(packed_results),
             duration_ms=step.duration_ms,
         )
 
@@ -295,9 +443,9 @@ class DeepResearchPipeline:
             question=question,
             answer=answer,
             sub_questions=sub_questions,
-            sources=self._build_sources(all_results),
+            sources=self._build_sources(packed_results),
             reasoning_trace=trace,
-            total_chunks_analyzed=len(all_results),
+            total_chunks_analyzed=len(packed_results),
             total_llm_calls=llm_calls,
         )
 
@@ -331,17 +479,31 @@ class DeepResearchPipeline:
         return sub_questions, step, 1
 
     async def _step_retrieve(
-        self, sub_questions: list[SubQuestion]
+        self,
+        question: str,
+        sub_questions: list[SubQuestion],
+        speculative: asyncio.Task[list[list[SearchResult]]],
     ) -> tuple[list[SearchResult], ResearchStep]:
         """Execute the initial retrieval step.
 
+        Args:
+            question: The original question.
+            sub_questions: Sub-questions to retrieve for.
+            speculative: Retrieval for the original question, started
+                alongside decomposition.
+
         Returns:
             Tuple of (search_results, trace_step).
         """
         self._check_cancelled("retrieval")
         start_time = time.time()
 
+        # Awaited first: a sub-question repeating the question then hits the session
+        question_results = (await speculative)[0]
         results = await self._parallel_retrieve(sub_questions)
+        asked = {normalize_query(sq.question) for sq in sub_questions}
+        if normalize_query(question) not in asked:
+            results.extend(question_results)
         duration_ms = int((time.time() - start_time) * 1000)
 
         step = ResearchStep(
@@ -375,7 +537,15 @@ class DeepResearchPipeline:
         self._check_cancelled("gap_analysis")
         start_time = time.time()
 
-        follow_up_queries = await self._analyze_gaps(question, sub_questions, results)
+        chunk_ids = [r.chunk.id for r in results]
+        cached = self.session.get_gap_analysis(question, chunk_ids) if self.session else None
+        if cached is not None:
+            follow_up_queries, calls = list(cached), 0
+        else:
+            follow_up_queries = await self._analyze_gaps(question, sub_questions, results)
+            calls = 1
+            if self.session:
+                self.session.put_gap_analysis(question, chunk_ids, follow_up_queries)
         duration_ms = int((time.time() - start_time) * 1000)
 
         step = ResearchStep(
@@ -393,7 +563,7 @@ class DeepResearchPipeline:
             duration_ms=duration_ms,
         )
 
-        return follow_up_queries, step, 1
+        return follow_up_queries, step, calls
 
     async def _step_follow_up_retrieve(
         self, queries: list[str], initial_count: int
@@ -448,7 +618,7 @@ class DeepResearchPipeline:
         self,
         question: str,
         sub_questions: list[SubQuestion],
-        results: list[SearchResult],
+        context: PackedContext,
     ) -> tuple[str, ResearchStep, int]:
         """Execute the synthesis step.
 
@@ -459,23 +629,30 @@ class DeepResearchPipeline:
         await self._report_progress(
             4,
             ResearchProgressType.SYNTHESIS_STARTED,
-            f"Synthesizing answer from {len(results)} chunks...",
-            chunks_retrieved=len(results),
+            f"Synthesizing answer from {context.chunks_packed} chunks...",
+            chunks_retrieved=context.chunks_packed,
         )
 
         self._check_cancelled("synthesis")
         start_time = time.time()
 
-        answer = await self._synthesize(question, sub_questions, results)
+        answer = await self._synthesize(question, sub_questions, context)
         duration_ms = int((time.time() - start_time) * 1000)
 
         step = ResearchStep(
             step_type=ResearchStepType.SYNTHESIS,
-            description=f"Synthesized answer from {len(results)} chunks",
+            description=(
+                f"Synthesized answer from {context.chunks_packed} chunks "
+                f"({context.tokens_used} context tokens)"
+            ),
             duration_ms=duration_ms,
         )
 
-        logger.info("Synthesis complete")
+        logger.info(
+            f"Synthesis complete: {context.chunks_packed} chunks packed, "
+            f"{context.chunks_dropped} dropped, "
+            f"{context.tokens_used}/{context.token_budget} context tokens"
+        )
 
         return answer, step, 1
 
@@ -540,7 +717,7 @@ class DeepResearchPipeline:
             return []
 
     async def _parallel_retrieve(self, sub_questions: list[SubQuestion]) -> list[SearchResult]:
-        """Retrieve code chunks for each sub-question in parallel.
+        """Retrieve code chunks for every sub-question in one batch.
 
         Args:
             sub_questions: List of sub-questions to search for.
@@ -548,27 +725,10 @@ class DeepResearchPipeline:
         Returns:
             Combined list of search results.
         """
-        if not sub_questions:
-            return []
-
-        # Create search tasks
-        tasks = [
-            self.vector_store.search(sq.question, limit=self.chunks_per_subquestion)
-            for sq in sub_questions
-        ]
-
-        # Execute in parallel
-        results_lists = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Combine results
-        all_results: list[SearchResult] = []
-        for i, result_or_exc in enumerate(results_lists):
-            if isinstance(result_or_exc, BaseException):
-                logger.warning(f"Search failed for sub-question {i}: {result_or_exc}")
-                continue
-            all_results.extend(result_or_exc)
-
-        return all_results
+        results_lists = await self._retrieve(
+            [sq.question for sq in sub_questions], self.chunks_per_subquestion
+        )
+        return [result for results in results_lists for result in results]
 
     async def _analyze_gaps(
         self,
@@ -678,24 +838,76 @@ class DeepResearchPipeline:
         Returns:
             Combined search results.
         """
-        if not queries:
-            return []
-
         # Use slightly fewer chunks per query for follow-ups
         chunks_per_query = max(3, self.chunks_per_subquestion - 2)
 
-        tasks = [self.vector_store.search(query, limit=chunks_per_query) for query in queries]
+        results_lists = await self._retrieve(queries, chunks_per_query)
+        return [result for results in results_lists for result in results]
 
-        results_lists = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _retrieve(self, queries: list[str], limit: int) -> list[list[SearchResult]]:
+        """Search for several queries at once, reusing the session where possible.
 
-        all_results: list[SearchResult] = []
-        for i, result_or_exc in enumerate(results_lists):
-            if isinstance(result_or_exc, BaseException):
-                logger.warning(f"Follow-up search failed for query {i}: {result_or_exc}")
-                continue
-            all_results.extend(result_or_exc)
+        Queries the session has results for cost nothing; the rest are
+        embedded in one batch (minus any cached embeddings) and searched with
+        one batched vector store call.
 
-        return all_results
+        Args:
+            queries: Search queries.
+            limit: Maximum results per query.
+
+        Returns:
+            One list of search results per query; empty for failed searches.
+        """
+        results: list[list[SearchResult] | None] = [
+            self.session.get_results(query, limit) if self.session else None for query in queries
+        ]
+        missing = [i for i, cached in enumerate(results) if cached is None]
+        if missing:
+            texts = [queries[i] for i in missing]
+            found: list[list[SearchResult] | BaseException]
+            try:
+                embeddings = await self._embed_queries(texts)
+                found = list(
+                    await self.vector_store.search_many(texts, limit=limit, embeddings=embeddings)
+                )
+            except Exception as e:
+                # Any provider or storage error; search each query on its own
+                # so one bad query only loses its own results
+                logger.warning(f"Batched search failed for {len(texts)} queries: {e}")
+                found = await asyncio.gather(
+                    *(self.vector_store.search(text, limit=limit) for text in texts),
+                    return_exceptions=True,
+                )
+            for i, text, query_results in zip(missing, texts, found):
+                if isinstance(query_results, BaseException):
+                    logger.warning(f"Search failed for query {text!r}: {query_results}")
+                    continue
+                results[i] = query_results
+                if self.session:
+                    self.session.put_results(text, limit, query_results)
+
+        return [query_results or [] for query_results in results]
+
+    async def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed queries in one provider call, reusing session embeddings.
+
+        Args:
+            queries: Query texts.
+
+        Returns:
+            One embedding per query.
+        """
+        embeddings: list[list[float] | None] = [
+            self.session.get_embedding(query) if self.session else None for query in queries
+        ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            new = await self.vector_store.embedding_provider.embed([queries[i] for i in missing])
+            for i, embedding in zip(missing, new):
+                embeddings[i] = embedding
+                if self.session:
+                    self.session.put_embedding(queries[i], embedding)
+        return [embedding for embedding in embeddings if embedding is not None]
 
     def _deduplicate_results(self, results: list[SearchResult]) -> list[SearchResult]:
         """Remove duplicate chunks, keeping highest-scoring ones.
@@ -720,70 +932,48 @@ class DeepResearchPipeline:
         self,
         question: str,
         sub_questions: list[SubQuestion],
-        results: list[SearchResult],
+        context: PackedContext,
     ) -> str:
         """Synthesize a comprehensive answer from all context.
 
         Args:
             question: Original question.
             sub_questions: Sub-questions investigated.
-            results: All retrieved search results.
+            context: Retrieved code, packed into the context budget.
 
         Returns:
             Comprehensive answer string.
         """
-        if not results:
+        if not context.blocks:
             return (
                 "I couldn't find relevant code context to answer this question. "
                 "Please ensure the repository has been indexed."
             )
 
-        # Build full context
-        full_context = self._build_full_context(results)
         sub_q_text = "\n".join(f"- [{sq.category}] {sq.question}" for sq in sub_questions)
 
         # Count unique files
-        unique_files = len(set(r.chunk.file_path for r in results))
+        unique_files = len(set(block.file_path for block in context.blocks))
 
         prompt = SYNTHESIS_USER_PROMPT.format(
             question=question,
             sub_questions=sub_q_text,
             num_files=unique_files,
-            num_chunks=len(results),
-            full_context=full_context,
+            num_chunks=context.chunks_packed,
+            full_context=context.text,
         )
 
-        answer = await self.llm.generate(
-            prompt=prompt,
+        answer = await generate_with_metrics(
+            self.llm,
+            prompt,
             system_prompt=self.synthesis_prompt,
             temperature=self.synthesis_temperature,
             max_tokens=self.synthesis_max_tokens,
+            on_text=self._answer_callback,
         )
 
         return answer
 
-    def _build_full_context(self, results: list[SearchResult]) -> str:
-        """Build full context string for synthesis.
-
-        Args:
-            results: Search results to include.
-
-        Returns:
-            Formatted context string.
-        """
-        context_parts = []
-
-        for r in results:
-            chunk = r.chunk
-            header = f"File: {chunk.file_path}:{chunk.start_line}-{chunk.end_line}"
-            header += f" | Type: {chunk.chunk_type.value}"
-            if chunk.name:
-                header += f" | Name: {chunk.name}"
-
-            context_parts.append(f"{header}\n```\n{chunk.content}\n```")
-
-        return "\n\n---\n\n".join(context_parts)
-
     def _build_sources(self, results: list[SearchResult]) -> list[SourceReference]:
         """Build source references from search results.
 
@@ -0,0 +1,244 @@
+"""Persistent content-addressed cache for chunk embeddings."""
+
+import hashlib
+import time
+from pathlib import Path
+
+import lancedb
+from lancedb.table import Table
+
+from local_deepwiki.logging import get_logger
+from local_deepwiki.providers.base import EmbeddingProvider
+
+logger = get_logger(__name__)
+
+
+def embedding_text_hash(text: str) -> str:
+    """Compute the cache key for an embedding text.
+
+    Args:
+        text: The exact text sent to the embedding provider.
+
+    Returns:
+        SHA256 hex digest of the text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """LanceDB-backed cache of embeddings keyed by provider and text hash.
+
+    Full rebuilds, schema migrations and edits to one part of a file re-chunk
+    code whose text is mostly identical to the previous run. The cache stores
+    every embedding under (provider name, sha256 of the embedding text) so only
+    texts never seen before are sent to the provider. Each provider gets its
+    own table, since vector dimensions differ between models.
+
+    Entries are never invalidated by edits, so prune() drops those the last
+    full rebuild no longer used.
+    """
+
+    TABLE_PREFIX = "embeddings_"
+    # Maximum number of hashes per IN (...) lookup query
+    LOOKUP_BATCH_SIZE = 500
+
+    def __init__(self, cache_path: Path):
+        """Initialize the embedding cache.
+
+        Args:
+            cache_path: Path to the LanceDB cache database.
+        """
+        self.cache_path = cache_path
+        self._db: lancedb.DBConnection | None = None
+        self._tables: dict[str, Table] = {}
+        self._stats = {"hits": 0, "misses": 0}
+        # Hashes embedded or served per provider since the last reset_stats()
+        self._used_hashes: dict[str, set[str]] = {}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics."""
+        return self._stats.copy()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters and used hashes (e.g. at the start of an index run)."""
+        self._stats = {"hits": 0, "misses": 0}
+        self._used_hashes = {}
+
+    def _connect(self) -> lancedb.DBConnection:
+        """Get or create database connection."""
+        if self._db is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = lancedb.connect(str(self.cache_path))
+        return self._db
+
+    def _table_name(self, provider_name: str) -> str:
+        """Get the table name holding embeddings for a provider."""
+        digest = hashlib.sha256(provider_name.encode("utf-8")).hexdigest()[:16]
+        return f"{self.TABLE_PREFIX}{digest}"
+
+    def _get_table(self, provider_name: str) -> Table | None:
+        """Get a provider's cache table if it exists."""
+        name = self._table_name(provider_name)
+        if name not in self._tables:
+            db = self._connect()
+            if name not in db.list_tables().tables:
+                return None
+            self._tables[name] = db.open_table(name)
+        return self._tables[name]
+
+    def lookup(self, provider_name: str, hashes: list[str]) -> dict[str, list[float]]:
+        """Fetch cached embeddings for a set of text hashes.
+
+        Args:
+            provider_name: Name of the embedding provider (includes the model).
+            hashes: Text hashes to look up.
+
+        Returns:
+            Mapping of text hash to embedding for the hashes found.
+        """
+        table = self._get_table(provider_name)
+        if table is None or not hashes:
+            return {}
+
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(hashes), self.LOOKUP_BATCH_SIZE):
+            batch = hashes[start : start + self.LOOKUP_BATCH_SIZE]
+            # Hashes are hex digests, so they are safe to inline in the filter
+            in_list = ", ".join(f"'{h}'" for h in batch)
+            try:
+                rows = (
+                    table.search()
+                    .where(f"text_hash IN ({in_list})")
+                    .select(["text_hash", "vector"])
+                    .limit(None)
+                    .to_arrow()
+                    .to_pylist()
+                )
+            except (ValueError, RuntimeError, OSError) as e:
+                # ValueError: Invalid filter expression
+                # RuntimeError: LanceDB query execution error
+                # OSError: Database file access issues
+                logger.warning(f"Embedding cache lookup failed: {e}")
+                return found
+            for row in rows:
+                found.setdefault(row["text_hash"], row["vector"])
+        return found
+
+    def store(self, provider_name: str, embeddings: dict[str, list[float]]) -> None:
+        """Persist embeddings for a provider.
+
+        Args:
+            provider_name: Name of the embedding provider (includes the model).
+            embeddings: Mapping of text hash to embedding.
+        """
+        if not embeddings:
+            return
+
+        now = time.time()
+        records = [
+            {"text_hash": text_hash, "vector": vector, "created_at": now}
+            for text_hash, vector in embeddings.items()
+        ]
+        try:
+            table = self._get_table(provider_name)
+            if table is not None:
+                table.add(records)
+                return
+
+            name = self._table_name(provider_name)
+            table = self._connect().create_table(name, records)
+            self._tables[name] = table
+            try:
+                table.create_scalar_index("text_hash")
+            except (ValueError, RuntimeError, OSError) as e:
+                # ValueError: Index already exists
+                # RuntimeError: Column type not supported
+                # OSError: Storage issues
+                logger.debug(f"Could not create index on text_hash: {e}")
+        except (ValueError, RuntimeError, OSError) as e:
+            # ValueError: Invalid data format (e.g. dimension mismatch)
+            # RuntimeError: Database operation failure
+            # OSError: File system or storage issues
+            logger.warning(f"Failed to store embeddings in cache: {e}")
+
+    async def embed(self, texts: list[str], provider: EmbeddingProvider) -> list[list[float]]:
+        """Embed texts, reusing cached embeddings and embedding only misses.
+
+        Duplicate texts within a call are embedded once.
+
+        Args:
+            texts: Texts to embed.
+            provider: Provider used for cache misses.
+
+        Returns:
+            One embedding per input text, in input order.
+        """
+        if not texts:
+            return []
+
+        hashes = [embedding_text_hash(text) for text in texts]
+        self._used_hashes.setdefault(provider.name, set()).update(hashes)
+        cached = self.lookup(provider.name, list(dict.fromkeys(hashes)))
+
+        missing: dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in cached and text_hash not in missing:
+                missing[text_hash] = text
+
+        hits = sum(1 for h in hashes if h in cached)
+        self._stats["hits"] += hits
+        self._stats["misses"] += len(hashes) - hits
+
+        if missing:
+            vectors = await provider.embed(list(missing.values()))
+            fresh = dict(zip(missing.keys(), vectors))
+            self.store(provider.name, fresh)
+            cached.update(fresh)
+
+        logger.debug(
+            f"Embedding cache: {hits}/{len(texts)} hits, {len(missing)} texts sent to provider"
+        )
+        return [cached[h] for h in hashes]
+
+    def prune(self) -> int:
+        """Drop every embedding not used since the last reset_stats().
+
+        Call after a full rebuild, which embeds every chunk of the repository:
+        anything else in the cache belongs to edited or deleted code, or to
+        providers the repository no longer uses, whose tables are dropped.
+
+        Returns:
+            Number of embeddings dropped from tables still in use.
+        """
+        used_tables = {self._table_name(name): name for name in self._used_hashes}
+        dropped = 0
+        try:
+            db = self._connect()
+            for name in db.list_tables().tables:
+                if name.startswith(self.TABLE_PREFIX) and name not in used_tables:
+                    db.drop_table(name)
+                    self._tables.pop(name, None)
+                    logger.info(f"Dropped embedding cache table {name} of a previous provider")
+
+            for provider_name, used in self._used_hashes.items():
+                table = self._get_table(provider_name)
+                if table is None:
+                    continue
+                cached = table.search().select(["text_hash"]).limit(None).to_arrow()
+                stale = sorted(set(cached.column("text_hash").to_pylist()) - used)
+                for start in range(0, len(stale), self.LOOKUP_BATCH_SIZE):
+                    batch = stale[start : start + self.LOOKUP_BATCH_SIZE]
+                    # Hashes are hex digests, so they are safe to inline in the filter
+                    in_list = ", ".join(f"'{h}'" for h in batch)
+                    table.delete(f"text_hash IN ({in_list})")
+                dropped += len(stale)
+        except (ValueError, RuntimeError, OSError) as e:
+            # ValueError: Invalid filter expression
+            # RuntimeError: Database operation failure
+            # OSError: File system or storage issues
+            logger.warning(f"Failed to prune embedding cache: {e}")
+
+        if dropped:
+            logger.info(f"Pruned {dropped} unused embeddings from the cache")
+        return dropped
@@ -7,7 +7,9 @@ Also provides git blame integration for tracking code authorship.
 
 import re
 import subprocess
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -419,16 +421,20 @@ def get_file_entity_blame(
     repo_path: Path,
     file_path: str,
     entities: list[tuple[str, str, int, int]],  # [(name, type, start, end), ...]
+    git_index: "GitMetadataIndex | None" = None,
 ) -> list[EntityBlameInfo]:
     """Get blame information for multiple code entities in a file.
 
     This is more efficient than calling get_range_blame for each entity,
-    as it runs a single git blame command for the entire file.
+    as it runs a single git blame command for the entire file. When a git
+    metadata index is given, files it can answer from history alone (no
+    history, or a single unmodified commit) skip git blame entirely.
 
     Args:
         repo_path: Path to the repository root.
         file_path: Relative path to the file.
         entities: List of (entity_name, entity_type, start_line, end_line) tuples.
+        git_index: Optional git metadata index for the repository.
 
     Returns:
         List of EntityBlameInfo objects.
@@ -436,6 +442,11 @@ def get_file_entity_blame(
     if not entities:
         return []
 
+    if git_index is not None:
+        from_history = git_index.entity_blame(file_path, entities)
+        if from_history is not None:
+            return from_history
+
     try:
         # Get blame for entire file
         result = subprocess.run(
@@ -586,6 +597,362 @@ def format_blame_date(dt: datetime) -> str:
         return dt.strftime("%b %d, %Y")
 
 
+@dataclass
+class CommitRecord:
+    """A commit recorded by the git metadata index."""
+
+    commit_hash: str
+    author: str
+    author_email: str | None
+    authored_at: datetime
+    committed_at: datetime
+    summary: str
+    files: list[str] = field(default_factory=list)
+
+
+# Field and record separators for the git log format used by GitMetadataIndex
+_LOG_RECORD_SEP = "\x1e"
+_LOG_FIELD_SEP = "\x1f"
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%at%x1f%ct%x1f%s"
+
+
+class GitMetadataIndex:
+    """In-memory view of repository history built from a single ``git log`` walk.
+
+    Answers "when was this file last changed" and "which commit last touched
+    it" for every path at once, so staleness checks, the changelog and blame
+    sections do not spawn one git process per file. Instances are tied to the
+    HEAD commit they were built from; use ``get_git_metadata_index`` to get a
+    cached instance that is rebuilt when HEAD moves.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        head: str,
+        commits: list[CommitRecord],
+        added_paths: set[str] | None = None,
+        dirty_files: frozenset[str] = frozenset(),
+    ):
+        """Initialize the index.
+
+        Args:
+            repo_path: Path to the repository (or subdirectory) the index covers.
+            head: HEAD commit hash the history was read from.
+            commits: Commits newest first, with paths relative to repo_path.
+            added_paths: Paths whose oldest commit created them (not a rename or copy).
+            dirty_files: Paths with uncommitted changes relative to HEAD.
+        """
+        self.repo_path = repo_path
+        self.head = head
+        self.commits = commits
+        self.dirty_files = dirty_files
+        self._added_paths = added_paths or set()
+        self._last_commit: dict[str, CommitRecord] = {}
+        self._commit_counts: dict[str, int] = {}
+
+        for commit in commits:
+            for path in commit.files:
+                if path not in self._last_commit:
+                    self._last_commit[path] = commit
+                self._commit_counts[path] = self._commit_counts.get(path, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._last_commit)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._last_commit
+
+    @classmethod
+    def build(
+        cls,
+        repo_path: Path,
+        head: str | None = None,
+    ) -> "GitMetadataIndex | None":
+        """Walk the repository history once and build an index.
+
+        Args:
+            repo_path: Path to the repository.
+            head: HEAD commit hash, resolved if not given.
+
+        Returns:
+            GitMetadataIndex, or None if the path is not a git repository
+            or has no commits.
+        """
+        head = head or _get_head_sha(repo_path)
+        if head is None:
+            return None
+
+        commits: list[CommitRecord] = []
+        added_paths: set[str] = set()
+        try:
+            # Paths are reported relative to repo_path (--relative) and
+            # renames are detected explicitly so blame shortcuts stay exact.
+            with subprocess.Popen(
+                [
+                    "git",
+                    "-c",
+                    "core.quotePath=false",
+                    "log",
+                    head,
+                    "-M",
+                    "--relative",
+                    "--name-status",
+                    f"--format={_LOG_FORMAT}",
+                ],
+                cwd=repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            ) as proc:
+                current: CommitRecord | None = None
+                for line in proc.stdout or ():
+                    line = line.rstrip("\n")
+                    if line.startswith(_LOG_RECORD_SEP):
+                        current = _parse_log_header(line[1:])
+                        if current is not None:
+                            commits.append(current)
+                    elif line and current is not None:
+                        status, _, paths = line.partition("\t")
+                        # Renames and copies list "old<TAB>new"; the new path is
+                        # the one that exists after this commit.
+                        path = paths.rsplit("\t", 1)[-1]
+                        current.files.append(path)
+                        # Walking newest to oldest, the last status seen for a
+                        # path belongs to the commit that introduced it.
+                        if status == "A":
+                            added_paths.add(path)
+                        else:
+                            added_paths.discard(path)
+                returncode = proc.wait()
+        except (FileNotFoundError, OSError) as e:
+            logger.debug(f"Failed to read git history for {repo_path}: {e}")
+            return None
+
+        if returncode != 0:
+            logger.debug(f"git log exited with {returncode} in {repo_path}")
+            return None
+
+        index = cls(
+            repo_path,
+            head,
+            commits,
+            added_paths=added_paths,
+            dirty_files=_get_dirty_files(repo_path),
+        )
+        logger.debug(
+            f"Built git metadata index for {repo_path}: "
+            f"{len(commits)} commits, {len(index)} paths"
+        )
+        return index
+
+    def last_commit(self, file_path: str) -> CommitRecord | None:
+        """Get the most recent commit that touched a file.
+
+        Args:
+            file_path: Path relative to the indexed directory.
+
+        Returns:
+            CommitRecord, or None if the file has no history.
+        """
+        return self._last_commit.get(file_path)
+
+    def last_modified(self, file_path: str) -> datetime | None:
+        """Get the commit date of the last change to a file.
+
+        Args:
+            file_path: Path relative to the indexed directory.
+
+        Returns:
+            Commit datetime, or None if the file has no history.
+        """
+        commit = self._last_commit.get(file_path)
+        return commit.committed_at if commit else None
+
+    def commit_count(self, file_path: str) -> int:
+        """Get the number of commits that touched a file."""
+        return self._commit_counts.get(file_path, 0)
+
+    def recent_commits(self, limit: int) -> list[CommitRecord]:
+        """Get the newest commits, newest first.
+
+        Args:
+            limit: Maximum number of commits to return.
+
+        Returns:
+            List of CommitRecord objects.
+        """
+        return self.commits[:limit]
+
+    def entity_blame(
+        self,
+        file_path: str,
+        entities: list[tuple[str, str, int, int]],
+    ) -> list[EntityBlameInfo] | None:
+        """Answer an entity blame query from history alone when possible.
+
+        A committed file with no local changes that was created by a single
+        commit and never touched again blames every line to that commit, so
+        no ``git blame`` is needed. Files without history have nothing to
+        blame.
+
+        Args:
+            file_path: Path relative to the indexed directory.
+            entities: List of (entity_name, entity_type, start_line, end_line) tuples.
+
+        Returns:
+            List of EntityBlameInfo, or None if a real blame is required.
+        """
+        if file_path in self.dirty_files:
+            return None
+        commit = self._last_commit.get(file_path)
+        if commit is None:
+            return []
+        if self._commit_counts[file_path] != 1 or file_path not in self._added_paths:
+            return None
+
+        return [
+            EntityBlameInfo(
+                entity_name=name,
+                entity_type=entity_type,
+                start_line=start,
+                end_line=end,
+                last_modified_by=commit.author,
+                last_modified_date=commit.authored_at,
+                commit_hash=commit.commit_hash,
+                commit_summary=commit.summary,
+            )
+            for name, entity_type, start, end in entities
+        ]
+
+
+def _parse_log_header(header: str) -> CommitRecord | None:
+    """Parse a commit header line produced with ``_LOG_FORMAT``.
+
+    Args:
+        header: Header line without the leading record separator.
+
+    Returns:
+        CommitRecord, or None if the line is malformed.
+    """
+    parts = header.split(_LOG_FIELD_SEP, 5)
+    if len(parts) != 6:
+        return None
+    commit_hash, author, email, author_time, commit_time, summary = parts
+    try:
+        authored_at = datetime.fromtimestamp(int(author_time))
+        committed_at = datetime.fromtimestamp(int(commit_time))
+    except ValueError:
+        return None
+    return CommitRecord(
+        commit_hash=commit_hash,
+        author=author,
+        author_email=email or None,
+        authored_at=authored_at,
+        committed_at=committed_at,
+        summary=summary,
+    )
+
+
+def _get_head_sha(repo_path: Path) -> str | None:
+    """Get the commit hash HEAD points to.
+
+    Args:
+        repo_path: Path to the repository.
+
+    Returns:
+        Full commit hash, or None if not a git repo or there are no commits.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "-q", "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip() or None
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        logger.debug(f"Failed to resolve HEAD: {e}")
+    return None
+
+
+def _get_dirty_files(repo_path: Path) -> frozenset[str]:
+    """Get tracked files with staged or unstaged changes relative to HEAD.
+
+    Args:
+        repo_path: Path to the repository.
+
+    Returns:
+        Set of paths relative to repo_path.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "diff", "HEAD", "--relative", "--name-only", "-z"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            return frozenset(p for p in result.stdout.split("\0") if p)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        logger.debug(f"Failed to list modified files: {e}")
+    return frozenset()
+
+
+# Cache of GitMetadataIndex per repository, validated against HEAD
+_GIT_INDEX_CACHE_SIZE = 8
+_git_index_cache: OrderedDict[str, GitMetadataIndex] = OrderedDict()
+_git_index_lock = threading.Lock()
+
+
+def get_git_metadata_index(repo_path: Path) -> GitMetadataIndex | None:
+    """Get the git metadata index for a repository, building it if needed.
+
+    The history walk is cached per repository and reused until HEAD moves.
+    The set of locally modified files is refreshed on every call since it
+    can change without a new commit.
+
+    Args:
+        repo_path: Path to the repository.
+
+    Returns:
+        GitMetadataIndex, or None if the path is not a git repository.
+    """
+    head = _get_head_sha(repo_path)
+    if head is None:
+        return None
+
+    key = str(Path(repo_path).resolve())
+    with _git_index_lock:
+        index = _git_index_cache.get(key)
+        if index is not None and index.head == head:
+            _git_index_cache.move_to_end(key)
+            index.dirty_files = _get_dirty_files(repo_path)
+            return index
+
+    index = GitMetadataIndex.build(repo_path, head)
+    if index is None:
+        return None
+
+    with _git_index_lock:
+        _git_index_cache[key] = index
+        _git_index_cache.move_to_end(key)
+        while len(_git_index_cache) > _GIT_INDEX_CACHE_SIZE:
+            _git_index_cache.popitem(last=False)
+    return index
+
+
+def clear_git_metadata_cache() -> None:
+    """Discard all cached git metadata indexes."""
+    with _git_index_lock:
+        _git_index_cache.clear()
+
+
 def get_file_last_modified(repo_path: Path, file_path: str) -> datetime | None:
     """Get the last modification date of a file from git history.
 
@@ -615,14 +982,17 @@ def get_file_last_modified(repo_path: Path, file_path: str) -> datetime | None:
 def get_files_last_modified(
     repo_path: Path,
     file_paths: list[str],
+    git_index: GitMetadataIndex | None = None,
 ) -> dict[str, datetime]:
     """Get last modification dates for multiple files efficiently.
 
-    Uses a single git log command to get dates for all files.
+    Dates are served from the git metadata index, which reads the whole
+    history with a single git log command.
 
     Args:
         repo_path: Path to the repository root.
         file_paths: List of relative file paths.
+        git_index: Optional prebuilt index; fetched from the cache if not given.
 
     Returns:
         Dictionary mapping file paths to their last modification datetime.
@@ -630,11 +1000,14 @@ def get_files_last_modified(
     if not file_paths:
         return {}
 
-    result: dict[str, datetime] = {}
+    if git_index is None:
+        git_index = get_git_metadata_index(repo_path)
+        if git_index is None:
+            return {}
 
-    # Get dates for each file (git log doesn't support bulk queries well)
+    result: dict[str, datetime] = {}
     for file_path in file_paths:
-        mod_date = get_file_last_modified(repo_path, file_path)
+        mod_date = git_index.last_modified(file_path)
         if mod_date:
             result[file_path] = mod_date
 
@@ -659,6 +1032,7 @@ def check_page_staleness(
     generated_at: float,
     source_files: list[str],
     stale_threshold_days: int = 0,
+    git_index: GitMetadataIndex | None = None,
 ) -> StaleInfo | None:
     """Check if a wiki page is potentially stale.
 
@@ -671,6 +1045,7 @@ def check_page_staleness(
         generated_at: Timestamp when the page was generated.
         source_files: Source files that contributed to the page.
         stale_threshold_days: Minimum days difference to consider stale.
+        git_index: Optional prebuilt git metadata index to read dates from.
 
     Returns:
         StaleInfo if the page is stale, None otherwise.
@@ -679,7 +1054,7 @@ def check_page_staleness(
         return None
 
     doc_date = datetime.fromtimestamp(generated_at)
-    mod_dates = get_files_last_modified(repo_path, source_files)
+    mod_dates = get_files_last_modified(repo_path, source_files, git_index=git_index)
 
     if not mod_dates:
         return None
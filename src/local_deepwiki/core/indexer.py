@@ -2,16 +2,27 @@
 
 import asyncio
 import fnmatch
+import hashlib
 import json
+import multiprocessing
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from local_deepwiki.config import Config, get_config
 from local_deepwiki.core.chunker import CodeChunker
-from local_deepwiki.core.parser import CodeParser
+from local_deepwiki.core.embedding_cache import EmbeddingCache
+from local_deepwiki.core.parse_worker import ParsedFile, init_worker, parse_file, parse_in_worker
+from local_deepwiki.core.parser import CodeParser, _read_file_content
 from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.generators.callgraph import (
+    CALL_GRAPH_INDEX_FILE,
+    CALL_NODE_TYPES,
+    CallGraphExtractor,
+    CallGraphIndex,
+)
 from local_deepwiki.logging import get_logger
 from local_deepwiki.models import CodeChunk, FileInfo, IndexStatus, ProgressCallback
 from local_deepwiki.providers.embeddings import get_embedding_provider
@@ -27,6 +38,94 @@ class ParseResult:
     file_info: FileInfo
     chunks: list[CodeChunk]
     error: str | None = None
+    call_graph: dict[str, list[str]] = field(default_factory=dict)
+
+
+@dataclass
+class ParseTask:
+    """A file scheduled for parsing, with anything change detection already read.
+
+    Change detection stats every file and reads/hashes the ones whose stat
+    differs from the previous index. Those bytes and hashes are carried into
+    parsing so each file is read and hashed at most once per run.
+    """
+
+    file_path: Path
+    stat: os.stat_result | None = None
+    source: bytes | None = None
+    file_hash: str | None = None
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for one stage of the indexing pipeline.
+
+    ``busy_seconds`` is time spent doing the stage's work, summed over
+    workers; ``elapsed_seconds`` is wall time from the stage's first unit of
+    work starting to its last one finishing.
+    """
+
+    name: str
+    unit: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def record(self, items: int, started_at: float) -> None:
+        """Record a unit of work.
+
+        Args:
+            items: Number of items the work covered.
+            started_at: time.perf_counter() value when the work began.
+        """
+        now = time.perf_counter()
+        self.items += items
+        self.busy_seconds += now - started_at
+        if self.started_at is None or started_at < self.started_at:
+            self.started_at = started_at
+        self.finished_at = now
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Wall time the stage was active."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items per second of wall time while the stage was active."""
+        elapsed = self.elapsed_seconds
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class _EmbeddedBatch:
+    """Embedded chunks handed from the embedding stage to the writer.
+
+    ``stale_files`` lists re-parsed files whose previous chunks must be
+    deleted before any of their new chunks are written.
+    """
+
+    chunks: list[CodeChunk]
+    embeddings: list[list[float]]
+    stale_files: list[str]
+
+
+def _stat_unchanged(prev: FileInfo, stat: os.stat_result) -> bool:
+    """Check whether a file's stat matches its previously indexed record.
+
+    Args:
+        prev: FileInfo from the previous index run.
+        stat: Current stat result for the file.
+
+    Returns:
+        True if size, mtime and (when recorded) inode are all unchanged.
+    """
+    if prev.size_bytes != stat.st_size or prev.last_modified != stat.st_mtime:
+        return False
+    return prev.inode is None or prev.inode == stat.st_ino
 
 
 # Schema version for tracking index format changes.
@@ -36,6 +135,10 @@ class ParseResult:
 #   2 - Added schema_version field and scalar indexes on id/file_path columns
 CURRENT_SCHEMA_VERSION = 2
 
+# Spawned parse workers re-import the package before doing any work, so runs
+# with fewer files than this per worker parse on threads even in process mode
+MIN_FILES_PER_PROCESS_WORKER = 16
+
 
 def _needs_migration(status: IndexStatus) -> bool:
     """Check if an index status needs migration to the current schema version.
@@ -67,10 +170,10 @@ def _migrate_status(status: IndexStatus) -> tuple[IndexStatus, bool]:
 
     # Migration from version 1 to 2
     # Version 2 added scalar indexes - the index data is compatible but
-    # indexes need to be created (handled by _ensure_scalar_indexes in VectorStore)
+    # indexes need to be created (handled by ensure_fts_index in VectorStore)
     if current_version < 2:
         logger.info("Migrating index status from schema version 1 to 2")
-        # No data migration needed - indexes are created on table open
+        # No data migration needed - indexes are created on the next index run
         current_version = 2
 
     # Update schema version
@@ -109,33 +212,130 @@ class RepositoryIndexer:
 
         self.parser = CodeParser()
         self.chunker = CodeChunker(self.config.chunking)
+        self.call_graph_extractor = CallGraphExtractor()
         self.embedding_provider = get_embedding_provider(self.config.embedding)
-        self.vector_store = VectorStore(self.vector_db_path, self.embedding_provider)
+        self.embedding_cache = (
+            EmbeddingCache(self.config.get_embedding_cache_path(self.repo_path))
+            if self.config.embedding.cache_enabled
+            else None
+        )
+        self.vector_store = VectorStore(
+            self.vector_db_path,
+            self.embedding_provider,
+            self.embedding_cache,
+            self.config.vector_index,
+        )
+        # Per-stage throughput of the most recent index() run
+        self.pipeline_stats: dict[str, StageStats] = {}
 
-    def _parse_single_file(self, file_path: Path) -> ParseResult:
+    def _parse_single_file(self, task: ParseTask | Path) -> ParseResult:
         """Parse and chunk a single file (CPU-bound, runs in thread pool).
 
+        The file is read at most once: bytes and hash carried over from change
+        detection are reused, otherwise the content is read here and hashed
+        from the same buffer that is parsed.
+
         Args:
-            file_path: Path to the file to parse.
+            task: The parse task (or a bare path) for the file.
 
         Returns:
             ParseResult with file info and chunks, or error message.
         """
-        try:
-            file_info = self.parser.get_file_info(file_path, self.repo_path)
-            chunks = list(self.chunker.chunk_file(file_path, self.repo_path))
-            file_info.chunk_count = len(chunks)
-            return ParseResult(file_path=file_path, file_info=file_info, chunks=chunks)
-        except (OSError, ValueError, RuntimeError, UnicodeDecodeError) as e:
-            # Return error result instead of raising
-            file_info = self.parser.get_file_info(file_path, self.repo_path)
-            return ParseResult(
-                file_path=file_path,
-                file_info=file_info,
-                chunks=[],
-                error=str(e),
+        if isinstance(task, Path):
+            task = ParseTask(file_path=task)
+        file_info, chunks, call_graph, error = parse_file(
+            self.parser,
+            self.chunker,
+            self.repo_path,
+            task.file_path,
+            source=task.source,
+            file_hash=task.file_hash,
+            stat=task.stat,
+            call_graph_extractor=self.call_graph_extractor,
+        )
+        return ParseResult(
+            file_path=task.file_path,
+            file_info=file_info,
+            chunks=chunks,
+            error=error,
+            call_graph=call_graph,
+        )
+
+    def _detect_changes(
+        self,
+        source_files: list[Path],
+        previous_status: IndexStatus | None,
+    ) -> tuple[list[ParseTask], list[FileInfo]]:
+        """Split source files into those needing parsing and those unchanged.
+
+        Previous records are looked up through a path map built once. A file
+        whose size, mtime and inode match its previous record is skipped without
+        being read. Files with a differing stat are read and hashed once; if the
+        content is identical (e.g. after a touch or checkout) the record is kept
+        with refreshed stat fields, otherwise the bytes and hash are handed to
+        parsing. Files with no previous record are left for the parse workers
+        to read, so a full rebuild holds no file content here.
+
+        Args:
+            source_files: Candidate source files.
+            previous_status: Status from the previous run, or None for a full rebuild.
+
+        Returns:
+            Tuple of (files to parse, unchanged file records).
+        """
+        previous_by_path: dict[str, FileInfo] = (
+            {f.path: f for f in previous_status.files} if previous_status else {}
+        )
+        to_process: list[ParseTask] = []
+        unchanged: list[FileInfo] = []
+        stat_hits = 0
+
+        for file_path in source_files:
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                logger.debug(f"Could not stat {file_path}: {e}")
+                continue
+
+            prev = previous_by_path.get(str(file_path.relative_to(self.repo_path)))
+            if prev is None:
+                to_process.append(ParseTask(file_path=file_path, stat=stat))
+                continue
+
+            if _stat_unchanged(prev, stat):
+                stat_hits += 1
+                unchanged.append(prev)
+                continue
+
+            try:
+                source = _read_file_content(file_path)
+            except OSError as e:
+                logger.debug(f"Could not read {file_path}: {e}")
+                continue
+
+            file_hash = hashlib.sha256(source).hexdigest()
+            if file_hash == prev.hash:
+                unchanged.append(
+                    prev.model_copy(
+                        update={
+                            "size_bytes": stat.st_size,
+                            "last_modified": stat.st_mtime,
+                            "inode": stat.st_ino,
+                        }
+                    )
+                )
+                continue
+
+            to_process.append(
+                ParseTask(file_path=file_path, stat=stat, source=source, file_hash=file_hash)
             )
 
+        logger.debug(
+            f"Change detection: {len(to_process)} to parse, {len(unchanged)} unchanged "
+            f"({stat_hits} via stat fast path)"
+        )
+        return to_process, unchanged
+
     async def index(
         self,
         full_rebuild: bool = False,
@@ -156,6 +356,9 @@ class RepositoryIndexer:
         logger.info(f"Starting indexing for repository: {self.repo_path}")
         logger.debug(f"Wiki path: {self.wiki_path}, Full rebuild: {full_rebuild}")
 
+        if self.embedding_cache is not None:
+            self.embedding_cache.reset_stats()
+
         # Load previous status for incremental updates
         previous_status = None
         if not full_rebuild:
@@ -176,22 +379,9 @@ class RepositoryIndexer:
             progress_callback("Found source files", len(source_files), len(source_files))
 
         # Determine which files need processing
-        files_to_process: list[Path] = []
-        files_unchanged: list[FileInfo] = []
-
-        for file_path in source_files:
-            file_info = self.parser.get_file_info(file_path, self.repo_path)
-
-            if previous_status and not full_rebuild:
-                # Check if file has changed
-                prev_file = next(
-                    (f for f in previous_status.files if f.path == file_info.path), None
-                )
-                if prev_file and prev_file.hash == file_info.hash:
-                    files_unchanged.append(prev_file)
-                    continue
-
-            files_to_process.append(file_path)
+        files_to_process, files_unchanged = self._detect_changes(
+            source_files, None if full_rebuild else previous_status
+        )
 
         if progress_callback:
             progress_callback(
@@ -200,88 +390,32 @@ class RepositoryIndexer:
                 len(files_to_process),
             )
 
-        # Process files in parallel using thread pool for CPU-bound parsing
-        batch_size = self.config.chunking.batch_size
-        parallel_workers = self.config.chunking.parallel_workers
-        chunk_batch: list[CodeChunk] = []
-        processed_files: list[FileInfo] = []
-        total_chunks_processed = 0
-        is_first_batch = True
-
-        logger.info(f"Parsing files with {parallel_workers} parallel workers")
-
-        # Use thread pool for parallel parsing (CPU-bound work)
-        with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-            # Submit all parsing tasks
-            futures = {
-                executor.submit(self._parse_single_file, file_path): file_path
-                for file_path in files_to_process
-            }
-
-            # Process results as they complete
-            from concurrent.futures import as_completed
-
-            for i, future in enumerate(as_completed(futures)):
-                file_path = futures[future]
-                if progress_callback:
-                    progress_callback(f"Parsing {file_path.name}", i, len(files_to_process))
-
-                result = future.result()
-
-                if result.error:
-                    logger.warning(f"Error processing {result.file_path}: {result.error}")
-                    if progress_callback:
-                        progress_callback(
-                            f"Error processing {result.file_path}: {result.error}",
-                            i,
-                            len(files_to_process),
-                        )
-                    continue
-
-                # If incremental, delete old chunks for this file before adding new ones
-                if not full_rebuild and previous_status:
-                    await self.vector_store.delete_chunks_by_file(result.file_info.path)
-
-                chunk_batch.extend(result.chunks)
-                processed_files.append(result.file_info)
-
-                # Process batch if it reaches the batch size
-                if len(chunk_batch) >= batch_size:
-                    if progress_callback:
-                        progress_callback(
-                            f"Storing batch of {len(chunk_batch)} chunks...",
-                            i,
-                            len(files_to_process),
-                        )
-
-                    if full_rebuild and is_first_batch:
-                        await self.vector_store.create_or_update_table(chunk_batch)
-                        is_first_batch = False
-                    else:
-                        await self.vector_store.add_chunks(chunk_batch)
-
-                    total_chunks_processed += len(chunk_batch)
-                    chunk_batch = []  # Clear batch to free memory
+        # Parse, embed and write concurrently through bounded queues
+        processed_files, call_graphs, total_chunks_processed = await self._run_pipeline(
+            files_to_process,
+            create_table=full_rebuild,
+            delete_existing=not full_rebuild and previous_status is not None,
+            progress_callback=progress_callback,
+        )
 
-        # Process any remaining chunks in the final batch
-        if chunk_batch:
+        # Build the ANN index once the table is large enough, or fold this
+        # run's adds and deletes into it and into the full-text indexes
+        if files_to_process:
             if progress_callback:
-                progress_callback(
-                    f"Storing final batch of {len(chunk_batch)} chunks...",
-                    len(files_to_process),
-                    len(files_to_process),
-                )
-
-            if full_rebuild and is_first_batch:
-                await self.vector_store.create_or_update_table(chunk_batch)
-            else:
-                await self.vector_store.add_chunks(chunk_batch)
+                progress_callback("Updating search indexes", 0, 1)
+            await asyncio.to_thread(self.vector_store.ensure_vector_index)
+        # Also builds the full-text indexes of tables written by older versions
+        await asyncio.to_thread(self.vector_store.ensure_fts_index)
 
-            total_chunks_processed += len(chunk_batch)
+        # A full rebuild embedded every chunk, so whatever else is cached is stale
+        if full_rebuild and self.embedding_cache is not None:
+            await asyncio.to_thread(self.embedding_cache.prune)
 
         # Combine processed and unchanged files
         all_files = processed_files + files_unchanged
 
+        self._update_call_graph_index(call_graphs, all_files, full_rebuild)
+
         # Calculate language statistics
         languages: dict[str, int] = {}
         for file_info in all_files:
@@ -289,6 +423,8 @@ class RepositoryIndexer:
                 lang = file_info.language.value
                 languages[lang] = languages.get(lang, 0) + 1
 
+        cache_stats = self.embedding_cache.stats if self.embedding_cache is not None else {}
+
         # Create status with current schema version
         status = IndexStatus(
             repo_path=str(self.repo_path),
@@ -298,6 +434,8 @@ class RepositoryIndexer:
             languages=languages,
             files=all_files,
             schema_version=CURRENT_SCHEMA_VERSION,
+            embedding_cache_hits=cache_stats.get("hits", 0),
+            embedding_cache_misses=cache_stats.get("misses", 0),
         )
 
         # Save status
@@ -307,12 +445,290 @@ class RepositoryIndexer:
             f"Indexing complete: {status.total_files} files, "
             f"{status.total_chunks} chunks, languages: {list(status.languages.keys())}"
         )
+        if status.embedding_cache_hits or status.embedding_cache_misses:
+            logger.info(
+                f"Embedding cache: {status.embedding_cache_hits} hits, "
+                f"{status.embedding_cache_misses} misses "
+                f"({status.embedding_cache_hit_rate:.0%} hit rate)"
+            )
 
         if progress_callback:
             progress_callback("Indexing complete", 1, 1)
 
         return status
 
+    def _embedding_batch_size(self) -> int:
+        """Get the number of chunks per embedding call during indexing."""
+        configured = self.config.chunking.embedding_batch_size
+        if configured:
+            return configured
+        preferred = getattr(self.embedding_provider, "batch_size", None)
+        return preferred if isinstance(preferred, int) and preferred > 0 else 64
+
+    def _create_parse_executor(self, backend: str, workers: int) -> Executor:
+        """Create the executor that runs parse workers.
+
+        Args:
+            backend: "thread" or "process".
+            workers: Number of workers.
+
+        Returns:
+            A thread pool, or a process pool whose workers each hold their own
+            parser and chunker.
+        """
+        if backend == "process":
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                # Forking a process that has loaded the embedding model (and its
+                # thread pools) can deadlock the children, so always spawn
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self.config.chunking, str(self.repo_path)),
+            )
+        return ThreadPoolExecutor(max_workers=workers)
+
+    async def _run_pipeline(
+        self,
+        tasks: list[ParseTask],
+        create_table: bool,
+        delete_existing: bool,
+        progress_callback: ProgressCallback | None = None,
+    ) -> tuple[list[FileInfo], dict[str, dict[str, list[str]]], int]:
+        """Parse, embed and store files through a bounded three-stage pipeline.
+
+        Parse workers run _parse_single_file in a thread pool and feed a queue
+        of parse results. The embedding stage groups chunks into batches of the
+        provider's preferred size, embeds them and feeds a queue of embedded
+        batches. The writer deletes the old chunks of re-parsed files and
+        stores chunks in batches of ``chunking.batch_size``. Both queues are
+        bounded, so a slow stage makes the stages before it wait instead of
+        letting parsed chunks pile up in memory, while otherwise parsing,
+        embedding and writing run at the same time.
+
+        Args:
+            tasks: Files to parse.
+            create_table: Replace the table with the first stored batch (full rebuild).
+            delete_existing: Delete each file's previous chunks before storing new ones.
+            progress_callback: Optional callback for progress updates.
+
+        Returns:
+            Tuple of (records for successfully parsed files, their call graphs
+            keyed by path, number of chunks stored).
+        """
+        chunking = self.config.chunking
+        workers = chunking.parallel_workers
+        backend = chunking.parse_backend
+        if backend == "process" and len(tasks) < workers * MIN_FILES_PER_PROCESS_WORKER:
+            # Starting worker processes costs more than parsing a handful of files
+            backend = "thread"
+        embed_batch_size = self._embedding_batch_size()
+        write_batch_size = chunking.batch_size
+        total = len(tasks)
+
+        stats = {
+            "parse": StageStats("parse", "files"),
+            "embed": StageStats("embed", "chunks"),
+            "write": StageStats("write", "chunks"),
+        }
+        self.pipeline_stats = stats
+
+        parse_queue: asyncio.Queue[ParseResult | None] = asyncio.Queue(
+            maxsize=chunking.parse_queue_depth
+        )
+        write_queue: asyncio.Queue[_EmbeddedBatch | None] = asyncio.Queue(
+            maxsize=chunking.write_queue_depth
+        )
+        pending = iter(tasks)
+        processed_files: list[FileInfo] = []
+        call_graphs: dict[str, dict[str, list[str]]] = {}
+        stored = 0
+        loop = asyncio.get_running_loop()
+
+        logger.info(
+            f"Parsing files with {workers} parallel {backend} workers, "
+            f"embedding in batches of {embed_batch_size} chunks"
+        )
+
+        async def parse_worker(executor: Executor) -> None:
+            # Workers share one iterator, so each task is taken exactly once
+            for task in pending:
+                started = time.perf_counter()
+                if backend == "process":
+                    parsed: ParsedFile = await loop.run_in_executor(
+                        executor,
+                        parse_in_worker,
+                        task.file_path,
+                        task.source,
+                        task.file_hash,
+                        task.stat,
+                    )
+                    result = ParseResult(
+                        file_path=task.file_path,
+                        file_info=parsed.file_info,
+                        chunks=parsed.to_chunks(),
+                        error=parsed.error,
+                        call_graph=parsed.call_graph,
+                    )
+                else:
+                    result = await loop.run_in_executor(executor, self._parse_single_file, task)
+                stats["parse"].record(1, started)
+                await parse_queue.put(result)
+            await parse_queue.put(None)
+
+        async def embed_stage() -> None:
+            chunks: list[CodeChunk] = []
+            stale_files: list[str] = []
+            finished_workers = 0
+            received = 0
+
+            async def flush(batch: list[CodeChunk]) -> None:
+                nonlocal stale_files
+                embeddings: list[list[float]] = []
+                if batch:
+                    started = time.perf_counter()
+                    embeddings = await self.vector_store.embed_chunks(batch)
+                    stats["embed"].record(len(batch), started)
+                # Deletes travel with the first batch flushed after the file was
+                # parsed, which is never later than the batch holding its chunks
+                await write_queue.put(_EmbeddedBatch(batch, embeddings, stale_files))
+                stale_files = []
+
+            while finished_workers < workers:
+                result = await parse_queue.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+
+                if progress_callback:
+                    progress_callback(f"Parsing {result.file_path.name}", received, total)
+                received += 1
+
+                if result.error:
+                    logger.warning(f"Error processing {result.file_path}: {result.error}")
+                    if progress_callback:
+                        progress_callback(
+                            f"Error processing {result.file_path}: {result.error}",
+                            received,
+                            total,
+                        )
+                    continue
+
+                if delete_existing:
+                    stale_files.append(result.file_info.path)
+                processed_files.append(result.file_info)
+                call_graphs[result.file_info.path] = result.call_graph
+                chunks.extend(result.chunks)
+
+                while len(chunks) >= embed_batch_size:
+                    await flush(chunks[:embed_batch_size])
+                    chunks = chunks[embed_batch_size:]
+
+            if chunks or stale_files:
+                await flush(chunks)
+            await write_queue.put(None)
+
+        async def write_stage() -> None:
+            chunks: list[CodeChunk] = []
+            embeddings: list[list[float]] = []
+
+            async def store(count: int) -> None:
+                nonlocal stored, create_table
+                batch, batch_embeddings = chunks[:count], embeddings[:count]
+                del chunks[:count], embeddings[:count]
+                if progress_callback:
+                    progress_callback(
+                        f"Storing batch of {len(batch)} chunks...", stats["parse"].items, total
+                    )
+                started = time.perf_counter()
+                if create_table:
+                    await self.vector_store.create_or_update_table(
+                        batch, embeddings=batch_embeddings
+                    )
+                    create_table = False
+                else:
+                    await self.vector_store.add_chunks(batch, embeddings=batch_embeddings)
+                stats["write"].record(len(batch), started)
+                stored += len(batch)
+
+            while (embedded := await write_queue.get()) is not None:
+                for file_path in embedded.stale_files:
+                    await self.vector_store.delete_chunks_by_file(file_path)
+                chunks.extend(embedded.chunks)
+                embeddings.extend(embedded.embeddings)
+                while len(chunks) >= write_batch_size:
+                    await store(write_batch_size)
+
+            if chunks:
+                await store(len(chunks))
+
+        with self._create_parse_executor(backend, workers) as executor:
+            stages = [asyncio.create_task(parse_worker(executor)) for _ in range(workers)]
+            stages.append(asyncio.create_task(embed_stage()))
+            stages.append(asyncio.create_task(write_stage()))
+            try:
+                await asyncio.gather(*stages)
+            except BaseException:
+                # A failed stage would leave the others blocked on their queues
+                for stage in stages:
+                    stage.cancel()
+                await asyncio.gather(*stages, return_exceptions=True)
+                raise
+
+        for stage_stats in stats.values():
+            logger.info(
+                f"Pipeline {stage_stats.name}: {stage_stats.items} {stage_stats.unit} "
+                f"in {stage_stats.elapsed_seconds:.2f}s "
+                f"({stage_stats.throughput:.1f} {stage_stats.unit}/s, "
+                f"busy {stage_stats.busy_seconds:.2f}s)"
+            )
+
+        return processed_files, call_graphs, stored
+
+    def _update_call_graph_index(
+        self,
+        call_graphs: dict[str, dict[str, list[str]]],
+        all_files: list[FileInfo],
+        full_rebuild: bool,
+    ) -> None:
+        """Bring the persisted call graph index in line with this run's files.
+
+        Re-parsed files take the call graphs extracted during parsing, deleted
+        files are dropped, and unchanged files without a current entry (e.g.
+        indexed before the call graph index existed) are extracted once here.
+
+        Args:
+            call_graphs: Call graphs of files parsed in this run, keyed by path.
+            all_files: Records for every file in the new index.
+            full_rebuild: Whether the previous index was discarded.
+        """
+        index_path = self.wiki_path / CALL_GRAPH_INDEX_FILE
+        call_graph_index = CallGraphIndex() if full_rebuild else CallGraphIndex.load(index_path)
+        changed = call_graph_index.retain({f.path for f in all_files}) > 0
+
+        for file_info in all_files:
+            if file_info.path in call_graphs:
+                call_graph = call_graphs[file_info.path]
+            elif call_graph_index.is_current(file_info.path, file_info.hash):
+                continue
+            elif file_info.language in CALL_NODE_TYPES:
+                try:
+                    call_graph = self.call_graph_extractor.extract_from_file(
+                        self.repo_path / file_info.path, self.repo_path
+                    )
+                except (OSError, ValueError, RuntimeError) as e:
+                    # OSError: File vanished or unreadable since change detection
+                    # ValueError/RuntimeError: Parser failure
+                    logger.debug(f"Could not extract call graph for {file_info.path}: {e}")
+                    continue
+            else:
+                call_graph = {}
+            call_graph_index.set_file(file_info.path, file_info.hash, call_graph)
+            changed = True
+
+        if changed or not index_path.exists():
+            call_graph_index.save(index_path)
+            logger.debug(f"Saved call graph index with {len(call_graph_index)} files")
+
     def _find_source_files(self) -> list[Path]:
         """Find all source files in the repository.
 
@@ -1,12 +1,18 @@
 """LLM response cache using LanceDB for vector similarity search."""
 
+import asyncio
 import hashlib
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Generator, NamedTuple, cast
 
 import lancedb
+import pyarrow as pa
 from lancedb.table import Table
 
 from local_deepwiki.config import LLMCacheConfig
@@ -15,19 +21,70 @@ from local_deepwiki.providers.base import EmbeddingProvider
 
 logger = get_logger(__name__)
 
+# Whether LLMCache.get falls back to embedding similarity search (per context)
+_semantic_lookups: ContextVar[bool] = ContextVar("llm_cache_semantic_lookups", default=True)
+
+
+@contextmanager
+def exact_lookups_only() -> Generator[None, None, None]:
+    """Restrict LLM cache lookups within the context to exact prompt matches.
+
+    For call sites whose prompts only ever repeat verbatim (such as wiki
+    generation), where a similarity search costs an embedding and a vector
+    query without ever producing a hit.
+    """
+    token = _semantic_lookups.set(False)
+    try:
+        yield
+    finally:
+        _semantic_lookups.reset(token)
+
+
+class _FrontEntry(NamedTuple):
+    """A cached response held in memory, keyed by its exact hash."""
+
+    id: str
+    response: str
+    created_at: float
+    ttl_seconds: float
+
 
 class LLMCache:
     """Vector-based cache for LLM responses with exact and similarity matching.
 
     Uses a hybrid approach:
-    1. Fast path: Exact SHA256 hash match on (system_prompt + prompt)
+    1. Fast path: Exact SHA256 hash match on (system_prompt + prompt), served
+       from a process-local LRU of responses; the set of hashes in the table is
+       loaded once, so exact misses never query the table
     2. Slow path: Embedding similarity search for semantic matches
 
-    Cache entries expire based on TTL and are evicted using LRU when max_entries is reached.
+    Cache entries expire based on TTL. When the cache grows past max_entries or
+    max_size_mb, the least recently (or least frequently) hit live entries are
+    evicted. Hits are counted in memory and written back in batches, and
+    eviction sweeps run in the background rather than inside set().
     """
 
     TABLE_NAME = "llm_cache"
 
+    # Pending hit counters that trigger a background flush
+    HIT_FLUSH_THRESHOLD = 64
+
+    # Longest time a hit waits in memory before a background flush writes it
+    HIT_FLUSH_INTERVAL_SECONDS = 10.0
+
+    # Longest time between background sweeps while entries are being written
+    SWEEP_INTERVAL_SECONDS = 60.0
+
+    # An over-limit sweep trims to this fraction of the limits, so the next
+    # few writes do not each trigger another eviction
+    EVICTION_TARGET_RATIO = 0.9
+
+    # Responses kept in the in-memory exact-match cache
+    FRONT_CACHE_SIZE = 1024
+
+    # Prompt embeddings computed by get() kept for the set() that follows a miss
+    EMBEDDING_MEMO_SIZE = 64
+
     def __init__(
         self,
         cache_path: Path,
@@ -46,7 +103,28 @@ class LLMCache:
         self.config = config
         self._db: lancedb.DBConnection | None = None
         self._table: Table | None = None
-        self._stats = {"hits": 0, "misses": 0, "skipped": 0}
+        self._stats = {"hits": 0, "misses": 0, "skipped": 0, "evicted": 0}
+
+        # entry id -> (hits not yet written, time of the latest one)
+        self._pending_hits: dict[str, tuple[int, float]] = {}
+        self._hits_lock = threading.Lock()
+        # When the oldest pending hit was counted, and the timer that flushes it
+        self._pending_since = 0.0
+        self._hit_flush_timer: asyncio.TimerHandle | None = None
+        # Serializes flushes and sweeps, which run in worker threads
+        self._maintenance_lock = threading.Lock()
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._writes_since_sweep = 0
+        self._last_sweep = 0.0
+
+        # exact_hash -> response read from the table, least recently used first
+        self._front: OrderedDict[str, _FrontEntry] = OrderedDict()
+        # Every exact_hash in the table; None until first loaded
+        self._known_hashes: set[str] | None = None
+        # Guards _front and _known_hashes, which sweeps update from a worker thread
+        self._front_lock = threading.Lock()
+        # exact_hash -> prompt embedding computed by a get() that missed
+        self._embedding_memo: OrderedDict[str, list[float]] = OrderedDict()
 
     @property
     def stats(self) -> dict[str, int]:
@@ -117,18 +195,87 @@ class LLMCache:
         age = time.time() - created_at
         return age < ttl
 
+    def _front_get(self, exact_hash: str) -> _FrontEntry | None:
+        """Get a live entry from the in-memory cache, dropping it if expired."""
+        with self._front_lock:
+            entry = self._front.get(exact_hash)
+            if entry is None:
+                return None
+            if time.time() - entry.created_at >= entry.ttl_seconds:
+                del self._front[exact_hash]
+                return None
+            self._front.move_to_end(exact_hash)
+            return entry
+
+    def _front_put(self, exact_hash: str, entry: _FrontEntry) -> None:
+        """Add an entry to the in-memory cache, dropping the least recently used."""
+        with self._front_lock:
+            self._front[exact_hash] = entry
+            self._front.move_to_end(exact_hash)
+            while len(self._front) > self.FRONT_CACHE_SIZE:
+                self._front.popitem(last=False)
+
+    def _may_contain(self, table: Table, exact_hash: str) -> bool:
+        """Check whether the table has an entry with this hash, without querying it.
+
+        The hash column is read once on first use; set() and sweeps keep the
+        set current. Entries written by other processes are not seen until
+        the cache is reopened.
+        """
+        with self._front_lock:
+            known = self._known_hashes
+        if known is None:
+            try:
+                rows = table.search().select(["exact_hash"]).limit(table.count_rows()).to_list()
+                known = {row["exact_hash"] for row in rows}
+            except (KeyError, ValueError, RuntimeError, OSError) as e:
+                # KeyError: Missing hash column
+                # ValueError: Invalid query
+                # RuntimeError: LanceDB query execution error
+                # OSError: Database file access issues
+                logger.debug(f"Could not load cached hashes: {e}")
+                return True
+            with self._front_lock:
+                if self._known_hashes is None:
+                    self._known_hashes = known
+                known = self._known_hashes
+        return exact_hash in known
+
+    async def _embed_prompt(self, exact_hash: str, prompt: str, remember: bool) -> list[float]:
+        """Embed a prompt, reusing an embedding a previous get() computed for it.
+
+        Args:
+            exact_hash: Hash of the prompt (and system prompt).
+            prompt: The prompt to embed.
+            remember: Keep the embedding for a later call (get); otherwise
+                consume any kept one (set).
+        """
+        if remember:
+            embedding = self._embedding_memo.get(exact_hash)
+        else:
+            embedding = self._embedding_memo.pop(exact_hash, None)
+        if embedding is None:
+            embedding = (await self.embedding_provider.embed([prompt]))[0]
+            if remember:
+                self._embedding_memo[exact_hash] = embedding
+                while len(self._embedding_memo) > self.EMBEDDING_MEMO_SIZE:
+                    self._embedding_memo.popitem(last=False)
+        return embedding
+
     async def get(
         self,
         prompt: str,
         system_prompt: str | None = None,
         temperature: float = 0.7,
         model_name: str = "",
+        semantic: bool | None = None,
     ) -> str | None:
         """Try to get a cached response.
 
         Strategy:
         1. Skip if temperature too high (non-deterministic)
-        2. Try exact hash match (fast path)
+        2. Try exact hash match (fast path): in memory, then the table if the
+           hash is known to be there
         3. If no exact match, try embedding similarity search (slow path)
         4. Return None if no suitable cache hit
 
@@ -137,6 +284,8 @@ class LLMCache:
             system_prompt: System prompt.
             temperature: LLM temperature used.
             model_name: Name of the LLM model.
+            semantic: Whether to fall back to similarity search. Defaults to
+                True unless inside exact_lookups_only().
 
         Returns:
             Cached response if found and valid, None otherwise.
@@ -156,19 +305,38 @@ class LLMCache:
 
         exact_hash = self._compute_hash(system_prompt, prompt)
 
-        # Fast path: exact hash match
+        # Fast path: exact hash match, from memory first
+        front = self._front_get(exact_hash)
+        if front is not None:
+            self._stats["hits"] += 1
+            logger.debug(f"Cache exact hit (memory): hash={exact_hash[:12]}...")
+            await self._record_hit(front.id)
+            return front.response
+
         try:
-            # LanceDB filter query for exact hash
-            exact_results = table.search().where(f"exact_hash = '{exact_hash}'").limit(1).to_list()
-
-            if exact_results:
-                entry = exact_results[0]
-                if self._is_valid_entry(entry):
-                    self._stats["hits"] += 1
-                    logger.debug(f"Cache exact hit: hash={exact_hash[:12]}...")
-                    # Update hit tracking
-                    await self._record_hit(entry["id"])
-                    return cast(str, entry["response"])
+            if self._may_contain(table, exact_hash):
+                # LanceDB filter query for exact hash
+                exact_results = (
+                    table.search().where(f"exact_hash = '{exact_hash}'").limit(1).to_list()
+                )
+
+                if exact_results:
+                    entry = exact_results[0]
+                    if self._is_valid_entry(entry):
+                        self._stats["hits"] += 1
+                        logger.debug(f"Cache exact hit: hash={exact_hash[:12]}...")
+                        self._front_put(
+                            exact_hash,
+                            _FrontEntry(
+                                id=entry["id"],
+                                response=entry["response"],
+                                created_at=entry["created_at"],
+                                ttl_seconds=entry["ttl_seconds"],
+                            ),
+                        )
+                        # Update hit tracking
+                        await self._record_hit(entry["id"])
+                        return cast(str, entry["response"])
         except (KeyError, ValueError, RuntimeError, OSError) as e:
             # KeyError: Missing field in result
             # ValueError: Invalid query or filter expression
@@ -176,9 +344,15 @@ class LLMCache:
             # OSError: Database file access issues
             logger.debug(f"Exact hash lookup failed: {e}")
 
+        if semantic is None:
+            semantic = _semantic_lookups.get()
+        if not semantic:
+            self._stats["misses"] += 1
+            return None
+
         # Slow path: embedding similarity search
         try:
-            query_embedding = (await self.embedding_provider.embed([prompt]))[0]
+            query_embedding = await self._embed_prompt(exact_hash, prompt, remember=True)
 
             # Search for similar prompts with same model
             similar_results = table.search(query_embedding).limit(5).to_list()
@@ -233,7 +407,7 @@ class LLMCache:
 
         try:
             exact_hash = self._compute_hash(system_prompt, prompt)
-            prompt_embedding = (await self.embedding_provider.embed([prompt]))[0]
+            prompt_embedding = await self._embed_prompt(exact_hash, prompt, remember=False)
             now = time.time()
 
             entry_id = str(uuid.uuid4())
@@ -252,14 +426,12 @@ class LLMCache:
                 "ttl_seconds": ttl_seconds or self.config.ttl_seconds,
             }
 
-            db = self._connect()
-            if self.TABLE_NAME in db.list_tables().tables:
-                table = db.open_table(self.TABLE_NAME)
+            table = self._get_table()
+            if table is not None:
                 table.add([record])
-                self._table = table
             else:
                 # Create table with first record
-                self._table = db.create_table(self.TABLE_NAME, [record])
+                self._table = self._connect().create_table(self.TABLE_NAME, [record])
                 # Create index on exact_hash for fast lookups
                 try:
                     self._table.create_scalar_index("exact_hash")
@@ -270,10 +442,14 @@ class LLMCache:
                     # OSError: Storage issues
                     logger.debug(f"Could not create index: {e}")
 
+            with self._front_lock:
+                if self._known_hashes is not None:
+                    self._known_hashes.add(exact_hash)
             logger.debug(f"Cached response: id={entry_id[:8]}..., hash={exact_hash[:12]}...")
 
-            # Check if we need to evict old entries
-            await self._maybe_evict()
+            # Evict old entries in the background if a sweep is due
+            self._writes_since_sweep += 1
+            self._schedule_maintenance()
 
         except (ValueError, RuntimeError, OSError) as e:
             # ValueError: Invalid data format or embedding failure
@@ -284,66 +460,221 @@ class LLMCache:
     async def _record_hit(self, entry_id: str) -> None:
         """Record a cache hit for an entry.
 
+        The hit is counted in memory; counters are written to the table in
+        one batch by the next flush, which starts in the background once
+        HIT_FLUSH_THRESHOLD entries have pending hits or the oldest pending
+        hit is HIT_FLUSH_INTERVAL_SECONDS old, so hits on a few hot entries
+        are persisted too.
+
         Args:
             entry_id: ID of the cache entry.
         """
+        with self._hits_lock:
+            first = not self._pending_hits
+            if first:
+                self._pending_since = time.monotonic()
+            count, _ = self._pending_hits.get(entry_id, (0, 0.0))
+            self._pending_hits[entry_id] = (count + 1, time.time())
+        if first:
+            self._arm_hit_flush_timer()
+        self._schedule_maintenance()
+
+    def _arm_hit_flush_timer(self) -> None:
+        """Schedule a maintenance check for when the pending hits fall due."""
+        if self._hit_flush_timer is not None:
+            self._hit_flush_timer.cancel()
         try:
-            table = self._get_table()
-            if table is None:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (synchronous caller); flush() or close() writes them
+            return
+        self._hit_flush_timer = loop.call_later(
+            self.HIT_FLUSH_INTERVAL_SECONDS, self._on_hit_flush_timer
+        )
+
+    def _on_hit_flush_timer(self) -> None:
+        """Flush hits that fell due, checking again later if maintenance was busy."""
+        self._hit_flush_timer = None
+        self._schedule_maintenance()
+        with self._hits_lock:
+            still_pending = bool(self._pending_hits)
+        if still_pending:
+            self._arm_hit_flush_timer()
+
+    def _hit_flush_due(self) -> bool:
+        """Check whether enough hits are pending, or have waited long enough, to flush."""
+        with self._hits_lock:
+            if not self._pending_hits:
+                return False
+            return (
+                len(self._pending_hits) >= self.HIT_FLUSH_THRESHOLD
+                or time.monotonic() - self._pending_since >= self.HIT_FLUSH_INTERVAL_SECONDS
+            )
+
+    def _sweep_due(self) -> bool:
+        """Check whether enough has been written since the last sweep."""
+        return (
+            self._writes_since_sweep >= max(1, self.config.max_entries // 10)
+            or time.monotonic() - self._last_sweep >= self.SWEEP_INTERVAL_SECONDS
+        )
+
+    def _schedule_maintenance(self) -> None:
+        """Start a background hit flush and sweep if one is due and none is running."""
+        if self._maintenance_task is not None and not self._maintenance_task.done():
+            return
+        if self._writes_since_sweep == 0 or not self._sweep_due():
+            if not self._hit_flush_due():
                 return
 
-            # Update hit_count and last_hit_at
-            # Note: LanceDB doesn't support UPDATE, so we'd need to
-            # delete and re-add. For simplicity, we skip this for now.
-            # The hit tracking is mainly for future LRU eviction.
-            pass
-        except (KeyError, RuntimeError, OSError) as e:
-            # KeyError: Entry not found
-            # RuntimeError: Database operation failure
-            # OSError: Storage issues
-            logger.debug(f"Failed to record hit: {e}")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (synchronous caller); the next flush picks it up
+            return
+        self._maintenance_task = loop.create_task(asyncio.to_thread(self._maintain))
+
+    async def flush(self) -> None:
+        """Wait for background maintenance and write out pending hit counters."""
+        if self._maintenance_task is not None:
+            await asyncio.gather(self._maintenance_task, return_exceptions=True)
+        await asyncio.to_thread(self._maintain, sweep=False)
+
+    def close(self) -> None:
+        """Write out pending hit counters before the cache is discarded.
+
+        Synchronous counterpart of flush() for callers without an event loop,
+        such as registry eviction and process shutdown.
+        """
+        if self._hit_flush_timer is not None:
+            self._hit_flush_timer.cancel()
+            self._hit_flush_timer = None
+        self._maintain(sweep=False)
 
     async def _maybe_evict(self) -> None:
-        """Evict old entries if cache exceeds max_entries."""
-        try:
-            table = self._get_table()
-            if table is None:
-                return
+        """Flush hit counters and evict expired and excess entries now."""
+        await asyncio.to_thread(self._maintain, force=True)
+
+    def _maintain(self, force: bool = False, sweep: bool = True) -> None:
+        """Flush pending hits, then sweep if forced or due (runs in a worker thread)."""
+        with self._maintenance_lock:
+            try:
+                table = self._get_table()
+                if table is None:
+                    return
+                self._flush_hits(table)
+                if sweep and (force or (self._writes_since_sweep and self._sweep_due())):
+                    self._writes_since_sweep = 0
+                    self._last_sweep = time.monotonic()
+                    self._sweep(table)
+            except (KeyError, ValueError, RuntimeError, OSError) as e:
+                # KeyError: Missing fields in entries
+                # ValueError: Invalid query during eviction
+                # RuntimeError: Database operation failure
+                # OSError: Storage issues
+                logger.debug(f"Cache maintenance failed: {e}")
+
+    def _flush_hits(self, table: Table) -> None:
+        """Add pending hit counts to their entries with a single merge."""
+        with self._hits_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if not pending:
+            return
 
-            # Count entries (approximate)
-            count = table.count_rows()
-            if count <= self.config.max_entries:
-                return
+        id_list = ", ".join(f"'{entry_id}'" for entry_id in pending)
+        current = (
+            table.search()
+            .where(f"id IN ({id_list})")
+            .select(["id", "hit_count"])
+            .limit(len(pending))
+            .to_list()
+        )
+        # Entries evicted since their hit simply have nothing to update
+        if not current:
+            return
 
-            logger.info(f"Cache has {count} entries, evicting old entries...")
+        updates = pa.table(
+            {
+                "id": [row["id"] for row in current],
+                "hit_count": [row["hit_count"] + pending[row["id"]][0] for row in current],
+                "last_hit_at": [pending[row["id"]][1] for row in current],
+            }
+        )
+        table.merge_insert("id").when_matched_update_all().execute(updates)
+        logger.debug(f"Flushed hit counts for {len(current)} cache entries")
 
-            # Get oldest entries to delete
-            # Note: LanceDB doesn't support ORDER BY + DELETE easily
-            # For now, we'll just delete expired entries
-            all_entries = table.search().limit(count).to_list()
+    def _sweep(self, table: Table) -> None:
+        """Delete expired entries and evict live ones over the entry or size limit.
 
-            expired_ids = []
-            for entry in all_entries:
-                if not self._is_valid_entry(entry):
-                    expired_ids.append(entry["id"])
+        Reads only the bookkeeping columns (never the vectors) and removes
+        everything selected with one predicate delete.
+        """
+        count = table.count_rows()
+        if count == 0:
+            return
 
-            if expired_ids:
-                # Delete expired entries
-                for entry_id in expired_ids[:100]:  # Batch delete
-                    try:
-                        table.delete(f"id = '{entry_id}'")
-                    except (ValueError, RuntimeError, OSError):
-                        # Delete may fail for individual entries; continue with others
-                        pass
+        rows = (
+            table.search()
+            .select(
+                {
+                    "id": "id",
+                    "exact_hash": "exact_hash",
+                    "created_at": "created_at",
+                    "ttl_seconds": "ttl_seconds",
+                    "hit_count": "hit_count",
+                    "last_hit_at": "last_hit_at",
+                    "size": "octet_length(system_prompt) + octet_length(prompt)"
+                    " + octet_length(response)",
+                }
+            )
+            .limit(count)
+            .to_list()
+        )
+
+        evict = [row["id"] for row in rows if not self._is_valid_entry(row)]
+        expired = len(evict)
+        live = [row for row in rows if self._is_valid_entry(row)]
+
+        max_bytes = self.config.max_size_mb * 1024 * 1024
+        total_bytes = sum(row["size"] or 0 for row in live)
+        if len(live) > self.config.max_entries or total_bytes > max_bytes:
+            target_entries = int(self.config.max_entries * self.EVICTION_TARGET_RATIO)
+            target_bytes = int(max_bytes * self.EVICTION_TARGET_RATIO)
+            if self.config.eviction_policy == "lfu":
+                live.sort(key=lambda row: (row["hit_count"], row["last_hit_at"]))
+            else:
+                live.sort(key=lambda row: row["last_hit_at"])
 
-                logger.info(f"Evicted {len(expired_ids)} expired cache entries")
+            remaining = len(live)
+            for row in live:
+                if remaining <= target_entries and total_bytes <= target_bytes:
+                    break
+                evict.append(row["id"])
+                remaining -= 1
+                total_bytes -= row["size"] or 0
 
-        except (KeyError, ValueError, RuntimeError, OSError) as e:
-            # KeyError: Missing fields in entries
-            # ValueError: Invalid query during eviction
-            # RuntimeError: Database operation failure
-            # OSError: Storage issues
-            logger.debug(f"Eviction failed: {e}")
+        if not evict:
+            return
+
+        id_list = ", ".join(f"'{entry_id}'" for entry_id in evict)
+        table.delete(f"id IN ({id_list})")
+        self._stats["evicted"] += len(evict)
+        self._forget(rows, frozenset(evict))
+        logger.info(
+            f"Evicted {len(evict)} cache entries ({expired} expired, "
+            f"{len(evict) - expired} over limit)"
+        )
+
+    def _forget(self, rows: list[dict[str, Any]], evicted: frozenset[str]) -> None:
+        """Drop evicted entries from the in-memory cache and hash set."""
+        remaining = {row["exact_hash"] for row in rows if row["id"] not in evicted}
+        with self._front_lock:
+            for exact_hash, entry in list(self._front.items()):
+                if entry.id in evicted:
+                    del self._front[exact_hash]
+            if self._known_hashes is not None:
+                # A hash may belong to several entries; keep it while one survives
+                gone = {row["exact_hash"] for row in rows if row["id"] in evicted}
+                self._known_hashes -= gone - remaining
 
     async def clear(self) -> int:
         """Clear all cache entries.
@@ -358,6 +689,11 @@ class LLMCache:
                 count = cast(int, table.count_rows())
                 db.drop_table(self.TABLE_NAME)
                 self._table = None
+                with self._hits_lock:
+                    self._pending_hits.clear()
+                with self._front_lock:
+                    self._front.clear()
+                    self._known_hashes = None
                 logger.info(f"Cleared {count} cache entries")
                 return count
             return 0
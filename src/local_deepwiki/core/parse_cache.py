@@ -0,0 +1,224 @@
+"""Bounded cache of parsed source files shared by the file-doc extractors.
+
+Generating one file page used to parse the same file separately for the API
+reference, the call graph and the "Used By" section, and parse every matching
+test file again for usage examples. ParsedFileCache parses each file once and
+hands every extractor the same tree. Entries are validated against a hash of
+the current file content on every lookup, so an edited file is never served
+from a stale tree, and the cache is bounded by entry count and total source
+size with least-recently-used eviction.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from tree_sitter import Node
+
+from local_deepwiki.config import get_config
+from local_deepwiki.core.parser import CodeParser, _read_file_content
+from local_deepwiki.logging import get_logger
+from local_deepwiki.models import Language
+
+logger = get_logger(__name__)
+
+
+class ParsedSource:
+    """A parsed source file: its bytes, syntax tree and language.
+
+    Root-level node lookups go through find_nodes(), which walks the tree once
+    and then serves every node-type query from an index, so extractors that
+    each look for functions and classes do not each walk the whole tree.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        root: Node,
+        language: Language,
+        source: bytes,
+        file_hash: str,
+    ):
+        """Initialize the parsed source.
+
+        Args:
+            path: Path of the parsed file.
+            root: Root node of the syntax tree.
+            language: Detected language.
+            source: File content the tree was parsed from.
+            file_hash: SHA256 hex digest of the content.
+        """
+        self.path = path
+        self.root = root
+        self.language = language
+        self.source = source
+        self.file_hash = file_hash
+        self._nodes_by_type: dict[str, list[tuple[int, Node]]] | None = None
+
+    def find_nodes(self, node_types: set[str]) -> list[Node]:
+        """Find all nodes of the given types, in document order.
+
+        Equivalent to find_nodes_by_type(self.root, node_types).
+
+        Args:
+            node_types: Node type names to find.
+
+        Returns:
+            Matching nodes in pre-order.
+        """
+        if self._nodes_by_type is None:
+            self._nodes_by_type = {}
+            stack = [self.root]
+            order = 0
+            while stack:
+                node = stack.pop()
+                self._nodes_by_type.setdefault(node.type, []).append((order, node))
+                order += 1
+                stack.extend(reversed(node.children))
+
+        matches = [
+            entry for node_type in node_types for entry in self._nodes_by_type.get(node_type, ())
+        ]
+        if len(node_types) > 1:
+            matches.sort(key=lambda entry: entry[0])
+        return [node for _, node in matches]
+
+
+class ParsedFileCache:
+    """LRU cache of parsed files, validated by content hash.
+
+    Every lookup reads the file and compares its hash with the cached entry;
+    reading and hashing are cheap next to parsing and walking the tree.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 32 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of parsed files kept.
+            max_bytes: Maximum total size of cached source content. Trees are
+                a roughly constant multiple of their source size, so this
+                bounds tree memory too.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._parser = CodeParser()
+        self._entries: OrderedDict[Path, ParsedSource] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss/eviction counts and current size."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return self._stats["hits"] / lookups if lookups else 0.0
+
+    def get(self, file_path: Path) -> ParsedSource | None:
+        """Get a parsed file, parsing it on a miss or when its content changed.
+
+        Args:
+            file_path: Path to the source file.
+
+        Returns:
+            The parsed source, or None if the file type is unsupported or the
+            file cannot be read.
+        """
+        language = self._parser.detect_language(file_path)
+        if language is None:
+            return None
+
+        try:
+            source = _read_file_content(file_path)
+        except OSError as e:
+            logger.warning(f"Failed to read file {file_path}: {e}")
+            return None
+
+        key = file_path.resolve()
+        file_hash = hashlib.sha256(source).hexdigest()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.file_hash == file_hash:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+
+            self._stats["misses"] += 1
+            root = self._parser.parse_source(source, language)
+            entry = ParsedSource(file_path, root, language, source, file_hash)
+            self._store(key, entry)
+            return entry
+
+    def clear(self) -> None:
+        """Drop all cached trees and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _store(self, key: Path, entry: ParsedSource) -> None:
+        """Insert an entry and evict least recently used ones over the limits."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= len(previous.source)
+
+        if len(entry.source) > self.max_bytes:
+            # Larger than the whole budget; hand it out without caching
+            return
+
+        self._entries[key] = entry
+        self._total_bytes += len(entry.source)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted.source)
+            self._stats["evictions"] += 1
+
+
+# Thread-safe global cache singleton
+_parse_cache: ParsedFileCache | None = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParsedFileCache:
+    """Get the process-wide parsed file cache.
+
+    The cache is created on first use with limits from the active configuration.
+
+    Returns:
+        The shared ParsedFileCache instance.
+    """
+    global _parse_cache
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            parsing = get_config().parsing
+            _parse_cache = ParsedFileCache(
+                max_entries=parsing.parse_cache_max_files,
+                max_bytes=parsing.parse_cache_max_mb * 1024 * 1024,
+            )
+        return _parse_cache
+
+
+def reset_parse_cache() -> None:
+    """Discard the global parsed file cache.
+
+    Useful for testing and after configuration changes.
+    """
+    global _parse_cache
+    with _parse_cache_lock:
+        _parse_cache = None
@@ -0,0 +1,190 @@
+"""Parsing and chunking of single files, including process-pool workers.
+
+Tree-sitter parsing itself is native code, but most of CodeChunker's work
+(docstring extraction, parameter types, parent classes) is pure Python and
+holds the GIL, so thread workers stop scaling after a core or two. With
+``chunking.parse_backend = "process"`` the indexer runs parse_in_worker() in a
+ProcessPoolExecutor instead. Each worker process builds its own CodeParser,
+CodeChunker and CallGraphExtractor once in init_worker() and sends chunks back
+as plain tuples, which pickle far more compactly than pydantic models.
+
+This module only imports parsing code so spawned workers start quickly.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from local_deepwiki.config import ChunkingConfig
+from local_deepwiki.core.chunker import CodeChunker
+from local_deepwiki.core.parser import CodeParser, _read_file_content
+from local_deepwiki.generators.callgraph import CALL_NODE_TYPES, CallGraphExtractor
+from local_deepwiki.models import ChunkType, CodeChunk, FileInfo, Language
+
+# Field order of packed chunk tuples
+_CHUNK_FIELDS = (
+    "id",
+    "file_path",
+    "language",
+    "chunk_type",
+    "name",
+    "content",
+    "start_line",
+    "end_line",
+    "docstring",
+    "parent_name",
+    "metadata",
+)
+
+# Per-process parser state, set by init_worker()
+_worker_state: tuple[CodeParser, CodeChunker, CallGraphExtractor, Path] | None = None
+
+
+@dataclass
+class ParsedFile:
+    """Picklable result of parsing one file in a worker process."""
+
+    file_info: FileInfo
+    chunks: list[tuple[Any, ...]]
+    call_graph: dict[str, list[str]]
+    error: str | None = None
+
+    def to_chunks(self) -> list[CodeChunk]:
+        """Rebuild the CodeChunk models from their packed tuples."""
+        return [unpack_chunk(values) for values in self.chunks]
+
+
+def pack_chunk(chunk: CodeChunk) -> tuple[Any, ...]:
+    """Convert a chunk to a tuple of field values for cheap pickling.
+
+    Args:
+        chunk: The chunk to pack.
+
+    Returns:
+        Tuple of field values in _CHUNK_FIELDS order, with enums as their values.
+    """
+    return (
+        chunk.id,
+        chunk.file_path,
+        chunk.language.value,
+        chunk.chunk_type.value,
+        chunk.name,
+        chunk.content,
+        chunk.start_line,
+        chunk.end_line,
+        chunk.docstring,
+        chunk.parent_name,
+        chunk.metadata,
+    )
+
+
+def unpack_chunk(values: tuple[Any, ...]) -> CodeChunk:
+    """Rebuild a chunk from a tuple produced by pack_chunk().
+
+    The values were produced from a validated model, so validation is skipped.
+
+    Args:
+        values: Packed field values.
+
+    Returns:
+        The reconstructed CodeChunk.
+    """
+    data = dict(zip(_CHUNK_FIELDS, values))
+    data["language"] = Language(data["language"])
+    data["chunk_type"] = ChunkType(data["chunk_type"])
+    return CodeChunk.model_construct(**data)
+
+
+def parse_file(
+    parser: CodeParser,
+    chunker: CodeChunker,
+    repo_path: Path,
+    file_path: Path,
+    source: bytes | None = None,
+    file_hash: str | None = None,
+    stat: os.stat_result | None = None,
+    call_graph_extractor: CallGraphExtractor | None = None,
+) -> tuple[FileInfo, list[CodeChunk], dict[str, list[str]], str | None]:
+    """Parse and chunk a single file, optionally extracting its call edges.
+
+    The file is read at most once: bytes and hash supplied by the caller are
+    reused, otherwise the content is read here and hashed from the same buffer
+    that is parsed.
+
+    Args:
+        parser: Parser used for file info.
+        chunker: Chunker used to extract chunks.
+        repo_path: Repository root.
+        file_path: File to parse.
+        source: File content if already read.
+        file_hash: Content hash if already computed.
+        stat: Stat result if already taken.
+        call_graph_extractor: Extractor for the file's call graph, if wanted.
+
+    Returns:
+        Tuple of (file info, chunks, call graph, error message or None).
+    """
+    try:
+        if source is None:
+            source = _read_file_content(file_path)
+        file_info = parser.get_file_info(
+            file_path, repo_path, source=source, file_hash=file_hash, stat=stat
+        )
+        chunks = list(chunker.chunk_file(file_path, repo_path, source=source))
+        file_info.chunk_count = len(chunks)
+        call_graph: dict[str, list[str]] = {}
+        if call_graph_extractor is not None and file_info.language in CALL_NODE_TYPES:
+            call_graph = call_graph_extractor.extract_from_file(file_path, repo_path, source)
+        return file_info, chunks, call_graph, None
+    except (OSError, ValueError, RuntimeError, UnicodeDecodeError) as e:
+        # Return error result instead of raising
+        file_info = parser.get_file_info(file_path, repo_path, file_hash=file_hash, stat=stat)
+        return file_info, [], {}, str(e)
+
+
+def init_worker(chunking: ChunkingConfig, repo_path: str) -> None:
+    """Create this worker process's parser, chunker and call graph extractor.
+
+    Used as the ProcessPoolExecutor initializer, so it runs once per process.
+
+    Args:
+        chunking: Chunking configuration from the parent process.
+        repo_path: Repository root.
+    """
+    global _worker_state
+    _worker_state = (CodeParser(), CodeChunker(chunking), CallGraphExtractor(), Path(repo_path))
+
+
+def parse_in_worker(
+    file_path: Path,
+    source: bytes | None = None,
+    file_hash: str | None = None,
+    stat: os.stat_result | None = None,
+) -> ParsedFile:
+    """Parse and chunk a file inside a worker process.
+
+    Args:
+        file_path: File to parse.
+        source: File content if already read by change detection.
+        file_hash: Content hash if already computed.
+        stat: Stat result if already taken.
+
+    Returns:
+        ParsedFile with packed chunks.
+
+    Raises:
+        RuntimeError: If init_worker() has not run in this process.
+    """
+    if _worker_state is None:
+        raise RuntimeError("Parse worker used before init_worker()")
+    parser, chunker, extractor, repo_path = _worker_state
+    file_info, chunks, call_graph, error = parse_file(
+        parser, chunker, repo_path, file_path, source, file_hash, stat, extractor
+    )
+    return ParsedFile(
+        file_info=file_info,
+        chunks=[pack_chunk(chunk) for chunk in chunks],
+        call_graph=call_graph,
+        error=error,
+    )
@@ -2,6 +2,7 @@
 
 import hashlib
 import mmap
+import os
 from pathlib import Path
 from typing import Any, cast
 
@@ -174,6 +175,18 @@ class CodeParser:
 
         return self._parsers[language]
 
+    def get_language(self, language: LangEnum) -> Language:
+        """Get the tree-sitter Language for a language, e.g. to compile queries.
+
+        Args:
+            language: The programming language.
+
+        Returns:
+            The tree-sitter Language the language's parser uses.
+        """
+        self._get_parser(language)
+        return self._languages[language]
+
     def detect_language(self, file_path: Path) -> LangEnum | None:
         """Detect the programming language from file extension.
 
@@ -186,11 +199,15 @@ class CodeParser:
         suffix = file_path.suffix.lower()
         return EXTENSION_MAP.get(suffix)
 
-    def parse_file(self, file_path: Path) -> tuple[Node, LangEnum, bytes] | None:
+    def parse_file(
+        self, file_path: Path, source: bytes | None = None
+    ) -> tuple[Node, LangEnum, bytes] | None:
         """Parse a source file and return the AST root.
 
         Args:
             file_path: Path to the source file.
+            source: Optional file content already read by the caller. When
+                provided, the file is not read again.
 
         Returns:
             Tuple of (AST root node, language, source bytes) or None if not supported.
@@ -200,11 +217,12 @@ class CodeParser:
             logger.debug(f"Unsupported file type: {file_path}")
             return None
 
-        try:
-            source = _read_file_content(file_path)
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to read file {file_path}: {e}")
-            return None
+        if source is None:
+            try:
+                source = _read_file_content(file_path)
+            except (OSError, IOError) as e:
+                logger.warning(f"Failed to read file {file_path}: {e}")
+                return None
 
         logger.debug(f"Parsing {file_path.name} as {language.value}")
         parser = self._get_parser(language)
@@ -228,7 +246,14 @@ class CodeParser:
         tree = parser.parse(source)
         return tree.root_node
 
-    def get_file_info(self, file_path: Path, repo_root: Path) -> FileInfo:
+    def get_file_info(
+        self,
+        file_path: Path,
+        repo_root: Path,
+        source: bytes | None = None,
+        file_hash: str | None = None,
+        stat: os.stat_result | None = None,
+    ) -> FileInfo:
         """Get information about a source file.
 
         Uses chunked reading for large files to avoid loading
@@ -237,18 +262,29 @@ class CodeParser:
         Args:
             file_path: Absolute path to the file.
             repo_root: Root directory of the repository.
+            source: Optional file content; hashed instead of re-reading the file.
+            file_hash: Optional precomputed content hash.
+            stat: Optional precomputed stat result.
 
         Returns:
             FileInfo with file metadata.
         """
-        stat = file_path.stat()
+        if stat is None:
+            stat = file_path.stat()
+
+        if file_hash is None:
+            if source is not None:
+                file_hash = hashlib.sha256(source).hexdigest()
+            else:
+                file_hash = _compute_file_hash(file_path)
 
         return FileInfo(
             path=str(file_path.relative_to(repo_root)),
             language=self.detect_language(file_path),
             size_bytes=stat.st_size,
             last_modified=stat.st_mtime,
-            hash=_compute_file_hash(file_path),
+            inode=stat.st_ino,
+            hash=file_hash,
         )
 
 
@@ -0,0 +1,434 @@
+"""Process-wide registry of warm providers and open vector stores.
+
+MCP tool calls and web requests are short-lived, but the resources they need
+are not: loading a sentence-transformers model or opening a LanceDB table costs
+far more than the query itself. The registry keeps those resources alive across
+calls, keyed by repository path and provider configuration, with LRU eviction
+and idle timeouts so long-running servers do not accumulate stale state.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+from local_deepwiki.config import (
+    EmbeddingConfig,
+    LLMCacheConfig,
+    LLMConfig,
+    RegistryConfig,
+    get_config,
+)
+from local_deepwiki.core.deep_research import ResearchSession
+from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.logging import get_logger
+from local_deepwiki.providers.base import EmbeddingProvider, LLMProvider
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _PoolEntry(Generic[T]):
+    """A pooled resource with its access bookkeeping."""
+
+    value: T
+    version: Hashable
+    last_used: float
+
+
+class ResourcePool(Generic[T]):
+    """Thread-safe LRU pool of long-lived resources with idle expiry.
+
+    Resources are created on demand through a factory and reused for
+    subsequent lookups with the same key. An optional ``version`` token
+    invalidates an entry when the underlying data changes (for example
+    when a repository is re-indexed).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        idle_timeout: float = 0,
+        on_release: Callable[[T], None] | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            name: Pool name used in logs and statistics.
+            max_entries: Maximum number of live entries before LRU eviction.
+            idle_timeout: Seconds after which an unused entry expires (0 disables).
+            on_release: Optional callback given every resource the pool drops,
+                called outside the pool lock.
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.idle_timeout = idle_timeout
+        self.on_release = on_release
+        self._entries: OrderedDict[Hashable, _PoolEntry[T]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get pool statistics."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], T],
+        version: Hashable = None,
+    ) -> T:
+        """Get a pooled resource, creating it if absent, stale or expired.
+
+        Args:
+            key: Lookup key for the resource.
+            factory: Zero-argument callable that builds the resource on a miss.
+            version: Optional version token; a mismatch forces recreation.
+
+        Returns:
+            The pooled resource.
+        """
+        now = time.monotonic()
+        with self._lock:
+            dropped = self._expire_idle(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                entry.last_used = now
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                value = entry.value
+            else:
+                if entry is not None:
+                    logger.debug(f"Registry pool '{self.name}': entry {key!r} is stale, recreating")
+                    del self._entries[key]
+                    dropped.append(entry.value)
+
+                self._stats["misses"] += 1
+                value = factory()
+                self._entries[key] = _PoolEntry(value=value, version=version, last_used=now)
+                dropped.extend(self._evict_overflow())
+        self._release(dropped)
+        return value
+
+    def put(self, key: Hashable, value: T, version: Hashable = None) -> None:
+        """Insert or replace a resource built elsewhere.
+
+        Args:
+            key: Lookup key for the resource.
+            value: The resource to pool.
+            version: Optional version token for the resource.
+        """
+        with self._lock:
+            replaced = self._entries.pop(key, None)
+            self._entries[key] = _PoolEntry(
+                value=value, version=version, last_used=time.monotonic()
+            )
+            dropped = self._evict_overflow()
+        if replaced is not None and replaced.value is not value:
+            dropped.append(replaced.value)
+        self._release(dropped)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] | None = None) -> int:
+        """Drop entries whose key matches a predicate (all entries if None).
+
+        Args:
+            predicate: Optional function selecting keys to drop.
+
+        Returns:
+            Number of entries dropped.
+        """
+        with self._lock:
+            keys = [k for k in self._entries if predicate is None or predicate(k)]
+            dropped = [self._entries.pop(key).value for key in keys]
+        self._release(dropped)
+        return len(keys)
+
+    def _release(self, values: list[T]) -> None:
+        """Hand dropped resources to on_release."""
+        if self.on_release is None:
+            return
+        for value in values:
+            self.on_release(value)
+
+    def _evict_overflow(self) -> list[T]:
+        """Evict least recently used entries beyond max_entries, returning them."""
+        evicted: list[T] = []
+        while len(self._entries) > self.max_entries:
+            evicted_key, entry = self._entries.popitem(last=False)
+            evicted.append(entry.value)
+            self._stats["evictions"] += 1
+            logger.debug(f"Registry pool '{self.name}': evicted LRU entry {evicted_key!r}")
+        return evicted
+
+    def _expire_idle(self, now: float) -> list[T]:
+        """Drop entries that have been idle longer than the timeout, returning them."""
+        if self.idle_timeout <= 0:
+            return []
+        cutoff = now - self.idle_timeout
+        expired = [k for k, e in self._entries.items() if e.last_used < cutoff]
+        dropped = []
+        for key in expired:
+            dropped.append(self._entries.pop(key).value)
+            self._stats["expirations"] += 1
+            logger.debug(f"Registry pool '{self.name}': expired idle entry {key!r}")
+        return dropped
+
+
+def _config_key(config: Any) -> Hashable:
+    """Build a registry key for a configuration model.
+
+    Pydantic configs are keyed by their JSON dump so equal settings share an
+    entry; anything else (e.g. test doubles) is keyed by identity.
+
+    Args:
+        config: The configuration object.
+
+    Returns:
+        Hashable key for the configuration.
+    """
+    if isinstance(config, BaseModel):
+        return config.model_dump_json()
+    return ("object", id(config))
+
+
+def index_version(wiki_path: Path, status_file: str = "index_status.json") -> Hashable:
+    """Get a cheap version token for a repository's index.
+
+    The indexer rewrites the index status file at the end of every run, so its
+    modification time changes whenever the vector table does.
+
+    Args:
+        wiki_path: Path to the repository's wiki directory.
+        status_file: Name of the index status file.
+
+    Returns:
+        The status file mtime in nanoseconds, or None if it does not exist.
+    """
+    try:
+        return (wiki_path / status_file).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _close_llm_provider(provider: LLMProvider) -> None:
+    """Close an LLM provider dropped from the registry."""
+    try:
+        provider.close()
+    except Exception as e:  # noqa: BLE001 - Dropping a resource must not fail the caller
+        logger.warning(f"Failed to close LLM provider {provider.name}: {e}")
+
+
+class ResourceRegistry:
+    """Long-lived registry of providers, vector stores and research sessions."""
+
+    def __init__(self, config: RegistryConfig | None = None):
+        """Initialize the registry.
+
+        Args:
+            config: Registry configuration. Uses defaults if not provided.
+        """
+        config = config or RegistryConfig()
+        idle = float(config.idle_timeout_seconds)
+        self.embedding_providers: ResourcePool[EmbeddingProvider] = ResourcePool(
+            "embedding_providers", config.max_embedding_providers, idle
+        )
+        self.vector_stores: ResourcePool[VectorStore] = ResourcePool(
+            "vector_stores", config.max_vector_stores, idle
+        )
+        # Dropped providers write out buffered state such as cache hit counters
+        self.llm_providers: ResourcePool[LLMProvider] = ResourcePool(
+            "llm_providers", config.max_llm_providers, idle, on_release=_close_llm_provider
+        )
+        # One session per open vector store at most
+        self.research_sessions: ResourcePool[ResearchSession] = ResourcePool(
+            "research_sessions", config.max_vector_stores, idle
+        )
+
+    def get_embedding_provider(
+        self,
+        config: EmbeddingConfig,
+        factory: Callable[[], EmbeddingProvider] | None = None,
+    ) -> EmbeddingProvider:
+        """Get a warm embedding provider for a configuration.
+
+        Args:
+            config: The embedding configuration.
+            factory: Optional factory override; defaults to get_embedding_provider.
+
+        Returns:
+            The shared embedding provider.
+        """
+        if factory is None:
+            from local_deepwiki.providers.embeddings import get_embedding_provider
+
+            def factory() -> EmbeddingProvider:
+                return get_embedding_provider(config)
+
+        return self.embedding_providers.get_or_create(_config_key(config), factory)
+
+    def get_vector_store(
+        self,
+        db_path: Path,
+        embedding_config: EmbeddingConfig,
+        embedding_provider: EmbeddingProvider | None = None,
+        factory: Callable[[], VectorStore] | None = None,
+        version: Hashable = None,
+    ) -> VectorStore:
+        """Get an open vector store for a repository.
+
+        Args:
+            db_path: Path to the repository's LanceDB database.
+            embedding_config: The embedding configuration used by the store.
+            embedding_provider: Optional provider; fetched from the registry if absent.
+            factory: Optional factory override for constructing the store.
+            version: Optional index version token (see ``index_version``).
+
+        Returns:
+            The shared vector store.
+        """
+        if factory is None:
+            provider = embedding_provider or self.get_embedding_provider(embedding_config)
+
+            def factory() -> VectorStore:
+                return VectorStore(db_path, provider)
+
+        key = (str(db_path), _config_key(embedding_config))
+        return self.vector_stores.get_or_create(key, factory, version)
+
+    def get_cached_llm_provider(
+        self,
+        cache_path: Path,
+        embedding_config: EmbeddingConfig,
+        cache_config: LLMCacheConfig,
+        llm_config: LLMConfig,
+        factory: Callable[[], LLMProvider],
+    ) -> LLMProvider:
+        """Get a shared (optionally cache-wrapped) LLM provider.
+
+        Args:
+            cache_path: Path to the LLM cache database.
+            embedding_config: Embedding configuration used for cache lookups.
+            cache_config: LLM cache configuration.
+            llm_config: LLM provider configuration.
+            factory: Factory that builds the provider on a miss.
+
+        Returns:
+            The shared LLM provider.
+        """
+        key = (
+            str(cache_path),
+            _config_key(embedding_config),
+            _config_key(cache_config),
+            _config_key(llm_config),
+        )
+        return self.llm_providers.get_or_create(key, factory)
+
+    def get_research_session(
+        self,
+        db_path: Path,
+        embedding_config: EmbeddingConfig,
+        version: Hashable = None,
+    ) -> ResearchSession:
+        """Get the deep research session for a repository.
+
+        Args:
+            db_path: Path to the repository's LanceDB database.
+            embedding_config: The embedding configuration the session's
+                embeddings were computed with.
+            version: Optional index version token (see ``index_version``);
+                re-indexing starts a fresh session.
+
+        Returns:
+            The shared research session.
+        """
+        key = (str(db_path), _config_key(embedding_config))
+        return self.research_sessions.get_or_create(key, ResearchSession, version)
+
+    def invalidate_repository(self, db_path: Path) -> int:
+        """Drop vector stores and research sessions of a repository's database.
+
+        Args:
+            db_path: Path to the repository's LanceDB database.
+
+        Returns:
+            Number of entries dropped.
+        """
+        db_str = str(db_path)
+
+        def in_repository(key: Any) -> bool:
+            return bool(key[0] == db_str)
+
+        dropped = self.vector_stores.invalidate(in_repository)
+        return dropped + self.research_sessions.invalidate(in_repository)
+
+    def clear(self) -> None:
+        """Drop every pooled resource."""
+        self.embedding_providers.invalidate()
+        self.vector_stores.invalidate()
+        self.llm_providers.invalidate()
+        self.research_sessions.invalidate()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Get hit/miss statistics for every pool.
+
+        Returns:
+            Mapping of pool name to its statistics.
+        """
+        return {
+            pool.name: pool.stats
+            for pool in (
+                self.embedding_providers,
+                self.vector_stores,
+                self.llm_providers,
+                self.research_sessions,
+            )
+        }
+
+
+# Thread-safe global registry singleton
+_registry: ResourceRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ResourceRegistry:
+    """Get the process-wide resource registry.
+
+    The registry is created on first use from the active configuration.
+
+    Returns:
+        The shared ResourceRegistry instance.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ResourceRegistry(get_config().registry)
+        return _registry
+
+
+def reset_registry() -> None:
+    """Discard the global registry and everything it holds.
+
+    Useful for testing and after configuration changes.
+    """
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.clear()
@@ -1,12 +1,20 @@
 """LanceDB vector store for code chunk storage and retrieval."""
 
+import asyncio
 import json
+import re
+import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, cast
 
 import lancedb
+import pyarrow as pa
+from lancedb.query import FullTextOperator, LanceVectorQueryBuilder, MultiMatchQuery
 from lancedb.table import Table
 
+from local_deepwiki.config import VectorIndexConfig, get_config
+from local_deepwiki.core.embedding_cache import EmbeddingCache
 from local_deepwiki.logging import get_logger
 from local_deepwiki.models import ChunkType, CodeChunk, Language, SearchResult
 from local_deepwiki.providers.base import EmbeddingProvider
@@ -18,6 +26,52 @@ logger = get_logger(__name__)
 VALID_LANGUAGES = {lang.value for lang in Language}
 VALID_CHUNK_TYPES = {ct.value for ct in ChunkType}
 
+# Search modes accepted by VectorStore.search()
+SearchMode = Literal["vector", "keyword", "hybrid", "auto"]
+SEARCH_MODES = {"vector", "keyword", "hybrid", "auto"}
+
+# Text columns with a full-text index, and their BM25 score boosts
+FTS_COLUMNS = ("name", "content", "docstring")
+FTS_BOOSTS = (3.0, 1.0, 1.5)
+
+# A bare identifier, optionally written as a definition ("class Foo",
+# "def foo") or a call ("foo(", "foo()"); group 1 is the identifier
+_IDENTIFIER_QUERY = re.compile(
+    r"^\s*(?:(?:class|def|fn|func|function|interface|struct|type)\s+)?"
+    r"([A-Za-z_$][\w$]*(?:(?:\.|::)[A-Za-z_$][\w$]*)*)"
+    r"\s*(?:\(\s*\)?)?\s*$"
+)
+
+
+def identifier_query(query: str) -> str | None:
+    """Extract the identifier from a query that only names a code symbol.
+
+    Args:
+        query: Search query text.
+
+    Returns:
+        The identifier (e.g. "Foo" for "class Foo" or "Foo("), or None if the
+        query is free text.
+    """
+    match = _IDENTIFIER_QUERY.match(query)
+    return match.group(1) if match else None
+
+
+# Non-vector columns of the chunks table, in CodeChunk field order
+CHUNK_COLUMNS = (
+    "id",
+    "file_path",
+    "language",
+    "chunk_type",
+    "name",
+    "content",
+    "start_line",
+    "end_line",
+    "docstring",
+    "parent_name",
+    "metadata",
+)
+
 
 def _sanitize_string_value(value: str) -> str:
     """Sanitize a string value for use in LanceDB filter expressions.
@@ -34,22 +88,86 @@ def _sanitize_string_value(value: str) -> str:
     return value.replace("'", "''")
 
 
+class ChunkSnapshot:
+    """In-memory, per-file view of every chunk in a vector store.
+
+    Whole-repo generators (glossary, coverage, inheritance, search index) all
+    need every chunk grouped by file. Building one snapshot from a single
+    table scan and sharing it replaces thousands of per-file LanceDB queries.
+    """
+
+    def __init__(self, chunks: Iterable[CodeChunk] = ()):
+        """Initialize the snapshot.
+
+        Args:
+            chunks: Chunks to include, in table order.
+        """
+        self._by_file: dict[str, list[CodeChunk]] = {}
+        self._count = 0
+        for chunk in chunks:
+            self._by_file.setdefault(chunk.file_path, []).append(chunk)
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[CodeChunk]:
+        for chunks in self._by_file.values():
+            yield from chunks
+
+    @property
+    def files(self) -> list[str]:
+        """Get the file paths present in the snapshot."""
+        return list(self._by_file)
+
+    def get_chunks_by_file(self, file_path: str) -> list[CodeChunk]:
+        """Get all chunks for a specific file.
+
+        Args:
+            file_path: The file path.
+
+        Returns:
+            List of CodeChunks for the file (empty if none).
+        """
+        return self._by_file.get(file_path, [])
+
+
 class VectorStore:
     """Vector store using LanceDB for code chunk storage and semantic search."""
 
     TABLE_NAME = "code_chunks"
+    VECTOR_INDEX_NAME = "vector_idx"
+    # Reciprocal rank fusion constant: higher values flatten the rank weighting
+    RRF_K = 60
+    # Candidates fetched from each retriever per requested hybrid result
+    HYBRID_CANDIDATE_FACTOR = 3
 
-    def __init__(self, db_path: Path, embedding_provider: EmbeddingProvider):
+    def __init__(
+        self,
+        db_path: Path,
+        embedding_provider: EmbeddingProvider,
+        embedding_cache: EmbeddingCache | None = None,
+        index_config: VectorIndexConfig | None = None,
+    ):
         """Initialize the vector store.
 
         Args:
             db_path: Path to the LanceDB database directory.
             embedding_provider: Provider for generating embeddings.
+            embedding_cache: Optional cache consulted before embedding chunks.
+            index_config: Vector index settings (default: from the global config).
         """
         self.db_path = db_path
         self.embedding_provider = embedding_provider
+        self.embedding_cache = embedding_cache
+        self.index_config = index_config or get_config().vector_index
         self._db: lancedb.DBConnection | None = None
         self._table: Table | None = None
+        self._has_vector_index = False
+        self._has_fts_index = False
+        # Rows deleted since the vector index was last maintained; LanceDB's
+        # index statistics only report rows added since then
+        self._deleted_since_index = 0
 
     def _connect(self) -> lancedb.DBConnection:
         """Get or create database connection."""
@@ -59,25 +177,28 @@ class VectorStore:
         return self._db
 
     def _get_table(self) -> Table | None:
-        """Get the chunks table if it exists."""
+        """Get the chunks table if it exists.
+
+        Only opens the table: searches call this on the event loop, so
+        indexes missing from tables written by older versions are built by
+        the indexer (see ensure_fts_index()), not here.
+        """
         if self._table is None:
             db = self._connect()
             if self.TABLE_NAME in db.list_tables().tables:
                 self._table = db.open_table(self.TABLE_NAME)
-                # Ensure indexes exist (may have been created by older code version)
-                self._ensure_scalar_indexes()
+                existing_indexes = self._list_index_names()
+                self._has_vector_index = self.VECTOR_INDEX_NAME in existing_indexes
+                self._has_fts_index = all(
+                    f"{column}_idx" in existing_indexes for column in FTS_COLUMNS
+                )
         return self._table
 
-    def _ensure_scalar_indexes(self) -> None:
-        """Ensure scalar indexes exist, creating them if needed.
-
-        This is called when opening an existing table to ensure indexes
-        are present even if the table was created by an older version.
-        """
+    def _list_index_names(self) -> set[str]:
+        """Get the names of the indexes on the chunks table."""
         if self._table is None:
-            return
+            return set()
 
-        # Check existing indexes
         try:
             indices = self._table.list_indices()
             # Handle both dict-style and object-style index configs (LanceDB version compat)
@@ -93,12 +214,22 @@ class VectorStore:
             # RuntimeError: Table may not support listing indices
             logger.debug(f"Could not list existing indexes: {e}")
             existing_indexes = set()
+        return existing_indexes
+
+    def _ensure_scalar_indexes(self) -> None:
+        """Create the scalar and full-text indexes missing from the table.
 
-        # Create missing indexes
+        Tables written by older versions lack some of them.
+        """
+        existing_indexes = self._list_index_names()
         if "id_idx" not in existing_indexes:
             self._create_index_safe("id")
         if "file_path_idx" not in existing_indexes:
             self._create_index_safe("file_path")
+        self._has_fts_index = True
+        for column in FTS_COLUMNS:
+            if f"{column}_idx" not in existing_indexes:
+                self._has_fts_index &= self._create_fts_index_safe(column)
 
     def _create_index_safe(self, column: str) -> None:
         """Safely create a scalar index on a column.
@@ -118,20 +249,56 @@ class VectorStore:
             # OSError: Underlying storage issues
             logger.debug(f"Could not create index on '{column}': {e}")
 
+    def _create_fts_index_safe(self, column: str) -> bool:
+        """Safely create a full-text (BM25) index on a text column.
+
+        Tokens are lowercased but not stemmed and stop words are kept, since
+        identifiers like "get" or "is_valid" are meaningful in code.
+
+        Args:
+            column: The column name to index.
+
+        Returns:
+            True if the index was created.
+        """
+        if self._table is None:
+            return False
+
+        try:
+            self._table.create_fts_index(column, replace=True, stem=False, remove_stop_words=False)
+            logger.debug(f"Created full-text index on '{column}' column")
+        except (ValueError, RuntimeError, OSError) as e:
+            # ValueError: Invalid column or tokenizer options
+            # RuntimeError: Index build failure
+            # OSError: Underlying storage issues
+            logger.debug(f"Could not create full-text index on '{column}': {e}")
+            return False
+        return True
+
     def _create_scalar_indexes(self) -> None:
-        """Create scalar indexes for efficient lookups.
+        """Create scalar and full-text indexes for efficient lookups.
 
         Creates indexes on 'id' and 'file_path' columns to optimize
-        get_chunk_by_id() and get_chunks_by_file() operations.
+        get_chunk_by_id() and get_chunks_by_file() operations, and BM25
+        indexes on the text columns for keyword search.
         """
         self._create_index_safe("id")
         self._create_index_safe("file_path")
+        self._has_fts_index = True
+        for column in FTS_COLUMNS:
+            self._has_fts_index &= self._create_fts_index_safe(column)
 
-    async def create_or_update_table(self, chunks: list[CodeChunk]) -> int:
+    async def create_or_update_table(
+        self,
+        chunks: list[CodeChunk],
+        embeddings: list[list[float]] | None = None,
+    ) -> int:
         """Create or update the vector table with code chunks.
 
         Args:
             chunks: List of code chunks to store.
+            embeddings: Precomputed embeddings (one per chunk), e.g. from
+                embed_chunks(). Chunks are embedded here when omitted.
 
         Returns:
             Number of chunks stored.
@@ -144,8 +311,8 @@ class VectorStore:
         db = self._connect()
 
         # Generate embeddings for all chunks
-        texts = [self._chunk_to_text(chunk) for chunk in chunks]
-        embeddings = await self.embedding_provider.embed(texts)
+        if embeddings is None:
+            embeddings = await self.embed_chunks(chunks)
 
         # Prepare data for LanceDB
         data = [
@@ -157,17 +324,25 @@ class VectorStore:
             db.drop_table(self.TABLE_NAME)
 
         self._table = db.create_table(self.TABLE_NAME, data)
+        self._has_vector_index = False
+        self._deleted_since_index = 0
 
         # Create scalar indexes for efficient lookups
         self._create_scalar_indexes()
 
         return len(data)
 
-    async def add_chunks(self, chunks: list[CodeChunk]) -> int:
+    async def add_chunks(
+        self,
+        chunks: list[CodeChunk],
+        embeddings: list[list[float]] | None = None,
+    ) -> int:
         """Add chunks to existing table.
 
         Args:
             chunks: List of code chunks to add.
+            embeddings: Precomputed embeddings (one per chunk), e.g. from
+                embed_chunks(). Chunks are embedded here when omitted.
 
         Returns:
             Number of chunks added.
@@ -178,11 +353,11 @@ class VectorStore:
         logger.debug(f"Adding {len(chunks)} chunks to existing table")
         table = self._get_table()
         if table is None:
-            return await self.create_or_update_table(chunks)
+            return await self.create_or_update_table(chunks, embeddings)
 
         # Generate embeddings
-        texts = [self._chunk_to_text(chunk) for chunk in chunks]
-        embeddings = await self.embedding_provider.embed(texts)
+        if embeddings is None:
+            embeddings = await self.embed_chunks(chunks)
 
         # Prepare data
         data = [
@@ -198,32 +373,144 @@ class VectorStore:
         limit: int = 10,
         language: str | None = None,
         chunk_type: str | None = None,
+        mode: SearchMode = "vector",
+        path_prefix: str | None = None,
+        file_paths: Iterable[str] | None = None,
     ) -> list[SearchResult]:
-        """Search for similar code chunks.
+        """Search for code chunks.
+
+        Modes:
+            vector: Embedding similarity only.
+            keyword: BM25 over chunk names, content and docstrings. Never
+                computes an embedding.
+            hybrid: Vector and keyword results fused by reciprocal rank.
+            auto: Keyword search when the query is a bare identifier (e.g.
+                "VectorStore", "class Foo", "foo("), falling back to hybrid
+                when it finds nothing; hybrid otherwise.
 
         Args:
             query: Search query text.
             limit: Maximum number of results.
             language: Optional language filter.
             chunk_type: Optional chunk type filter.
+            mode: Retrieval mode.
+            path_prefix: Only search chunks whose file path starts with this.
+            file_paths: Only search chunks from these files.
 
         Returns:
             List of search results with scores.
         """
-        table = self._get_table()
-        if table is None:
-            logger.debug("No table found for search")
-            return []
+        results = await self.search_many(
+            [query],
+            limit=limit,
+            language=language,
+            chunk_type=chunk_type,
+            mode=mode,
+            path_prefix=path_prefix,
+            file_paths=file_paths,
+        )
+        return results[0]
 
-        logger.debug(f"Searching for: '{query[:50]}...' limit={limit}")
+    async def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        language: str | None = None,
+        chunk_type: str | None = None,
+        mode: SearchMode = "vector",
+        path_prefix: str | None = None,
+        file_paths: Iterable[str] | None = None,
+        embeddings: list[list[float]] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Run several searches sharing the same filters in one batch.
+
+        All queries needing an embedding are embedded in a single provider
+        call and answered by a single multi-vector table query; keyword
+        queries share one worker thread. Filters are pushed down into
+        LanceDB, so every result list holds up to limit matching chunks
+        rather than whatever survives filtering the top hits afterwards.
+        See search() for the modes.
 
-        # Generate query embedding
-        query_embedding = (await self.embedding_provider.embed([query]))[0]
+        Args:
+            queries: Search query texts.
+            limit: Maximum number of results per query.
+            language: Optional language filter.
+            chunk_type: Optional chunk type filter.
+            mode: Retrieval mode.
+            path_prefix: Only search chunks whose file path starts with this.
+            file_paths: Only search chunks from these files.
+            embeddings: Precomputed query embeddings, one per query, used
+                instead of calling the embedding provider.
 
-        # Build search query
-        search = table.search(query_embedding).limit(limit)
+        Returns:
+            One list of search results per query, in query order.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Invalid search mode: {mode}")
+        if embeddings is not None and len(embeddings) != len(queries):
+            raise ValueError("Expected one embedding per query")
+
+        results: list[list[SearchResult]] = [[] for _ in queries]
+        table = self._get_table()
+        if table is None:
+            logger.debug("No table found for search")
+            return results
+
+        if file_paths is not None:
+            file_paths = list(file_paths)
+            if not file_paths:
+                return results
+
+        where = self._build_filter(language, chunk_type, path_prefix, file_paths)
+        if mode != "vector" and not self._has_fts_index:
+            logger.warning(
+                f"No full-text index on {self.db_path}, falling back to vector search "
+                "(re-index the repository to enable keyword search)"
+            )
+            mode = "vector"
+        logger.debug(f"Searching for {len(queries)} queries limit={limit} mode={mode}")
+
+        if mode == "vector":
+            return await self._vector_search(table, queries, limit, where, embeddings)
+        # Table reads block, so run them in threads to keep concurrent
+        # searches on one event loop (e.g. the ASGI web server) from queueing
+        if mode == "keyword":
+            return await asyncio.to_thread(self._keyword_search_many, table, queries, limit, where)
+
+        if mode == "auto":
+            identifiers = [i for i, query in enumerate(queries) if identifier_query(query)]
+            found = await asyncio.to_thread(
+                self._keyword_search_many, table, [queries[i] for i in identifiers], limit, where
+            )
+            for i, query_results in zip(identifiers, found):
+                results[i] = query_results
+
+        pending = [i for i, query_results in enumerate(results) if not query_results]
+        pending_queries = [queries[i] for i in pending]
+        candidates = limit * self.HYBRID_CANDIDATE_FACTOR
+        pending_embeddings = [embeddings[i] for i in pending] if embeddings is not None else None
+        vector = await self._vector_search(
+            table, pending_queries, candidates, where, pending_embeddings
+        )
+        keyword = await asyncio.to_thread(
+            self._keyword_search_many, table, pending_queries, candidates, where
+        )
+        for i, vector_results, keyword_results in zip(pending, vector, keyword):
+            results[i] = self._fuse([vector_results, keyword_results], limit)
+        return results
 
-        # Apply filters with validation to prevent injection
+    def _build_filter(
+        self,
+        language: str | None,
+        chunk_type: str | None,
+        path_prefix: str | None = None,
+        file_paths: list[str] | None = None,
+    ) -> str | None:
+        """Build a validated filter expression for search queries.
+
+        Raises:
+            ValueError: If a filter value is not a known language or chunk type.
+        """
         filters = []
         if language:
             if language not in VALID_LANGUAGES:
@@ -233,26 +520,121 @@ class VectorStore:
             if chunk_type not in VALID_CHUNK_TYPES:
                 raise ValueError(f"Invalid chunk_type filter: {chunk_type}")
             filters.append(f"chunk_type = '{chunk_type}'")
+        if path_prefix:
+            filters.append(f"starts_with(file_path, '{_sanitize_string_value(path_prefix)}')")
+        if file_paths:
+            paths = ", ".join(f"'{_sanitize_string_value(path)}'" for path in file_paths)
+            filters.append(f"file_path IN ({paths})")
+        return " AND ".join(filters) if filters else None
+
+    async def _vector_search(
+        self,
+        table: Table,
+        queries: list[str],
+        limit: int,
+        where: str | None,
+        embeddings: list[list[float]] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Rank chunks by embedding similarity to each query.
+
+        Embeds every query in one provider call (unless embeddings are given)
+        and answers them with one multi-vector query, whose rows carry the
+        index of their query.
+        """
+        if not queries:
+            return []
+        if embeddings is None:
+            embeddings = await self.embedding_provider.embed(queries)
 
-        if filters:
-            search = search.where(" AND ".join(filters))
-
-        # Execute search
-        results = search.to_list()
-
-        # Convert to SearchResult objects
-        search_results = []
-        for row in results:
-            chunk = self._row_to_chunk(row)
-            search_results.append(
+        # A vector query always gets a vector query builder, which has nprobes
+        search = cast(
+            LanceVectorQueryBuilder,
+            table.search(embeddings if len(embeddings) > 1 else embeddings[0]).limit(limit),
+        )
+        if self._has_vector_index:
+            search = search.nprobes(self.index_config.nprobes)
+            if self.index_config.refine_factor:
+                search = search.refine_factor(self.index_config.refine_factor)
+        if where:
+            search = search.where(where)
+
+        results: list[list[SearchResult]] = [[] for _ in queries]
+        for row in await asyncio.to_thread(search.to_list):
+            results[row.get("query_index", 0)].append(
                 SearchResult(
-                    chunk=chunk,
+                    chunk=self._row_to_chunk(row),
                     score=1.0 - row.get("_distance", 0),  # Convert distance to similarity
                     highlights=[],
                 )
             )
+        return results
 
-        return search_results
+    def _keyword_search_many(
+        self, table: Table, queries: list[str], limit: int, where: str | None
+    ) -> list[list[SearchResult]]:
+        """Run keyword searches one after another in the calling thread."""
+        return [self._keyword_search(table, query, limit, where) for query in queries]
+
+    def _keyword_search(
+        self, table: Table, query: str, limit: int, where: str | None
+    ) -> list[SearchResult]:
+        """Rank chunks by BM25 over the full-text indexed columns.
+
+        Identifier queries require every token of the identifier to match
+        (so "get_file_docs" does not match everything containing "get");
+        free-text queries match any token. Scores are relative to the best
+        match, so the top result scores 1.0.
+        """
+        identifier = identifier_query(query)
+        text_query = MultiMatchQuery(
+            identifier or query,
+            list(FTS_COLUMNS),
+            boosts=list(FTS_BOOSTS),
+            operator=FullTextOperator.AND if identifier else FullTextOperator.OR,
+        )
+        search = table.search(text_query, query_type="fts").limit(limit)
+        if where:
+            search = search.where(where)
+
+        try:
+            rows = search.to_list()
+        except (ValueError, RuntimeError, OSError) as e:
+            # ValueError: No full-text index on an older table
+            # RuntimeError: Query execution error
+            # OSError: Storage issues
+            logger.warning(f"Keyword search failed: {e}")
+            return []
+
+        best = max((row.get("_score", 0.0) for row in rows), default=0.0) or 1.0
+        return [
+            SearchResult(
+                chunk=self._row_to_chunk(row),
+                score=row.get("_score", 0.0) / best,
+                highlights=[],
+            )
+            for row in rows
+        ]
+
+    def _fuse(self, rankings: list[list[SearchResult]], limit: int) -> list[SearchResult]:
+        """Merge ranked result lists with reciprocal rank fusion.
+
+        Each chunk scores sum(1 / (RRF_K + rank)) over the lists it appears
+        in, normalized so a chunk ranked first everywhere scores 1.0. Ranks
+        are comparable across retrievers where raw scores are not.
+        """
+        fused: dict[str, float] = {}
+        chunks: dict[str, SearchResult] = {}
+        for ranking in rankings:
+            for rank, result in enumerate(ranking, start=1):
+                fused[result.chunk.id] = fused.get(result.chunk.id, 0.0) + 1.0 / (self.RRF_K + rank)
+                chunks.setdefault(result.chunk.id, result)
+
+        best_possible = len(rankings) / (self.RRF_K + 1)
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            SearchResult(chunk=chunks[chunk_id].chunk, score=score / best_possible, highlights=[])
+            for chunk_id, score in ranked
+        ]
 
     async def get_chunk_by_id(self, chunk_id: str) -> CodeChunk | None:
         """Get a specific chunk by ID.
@@ -291,6 +673,64 @@ class VectorStore:
         results = table.search().where(f"file_path = '{safe_path}'").to_list()
         return [self._row_to_chunk(row) for row in results]
 
+    def iter_chunks(
+        self,
+        columns: Iterable[str] | None = None,
+        chunk_types: Iterable[str] | None = None,
+        batch_size: int = 1024,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the chunks table as Arrow record batches.
+
+        Reads the table in a single scan and never loads the vector column,
+        so whole-repo passes cost one query instead of one per file.
+
+        Args:
+            columns: Columns to read (default: all non-vector columns).
+            chunk_types: Optional chunk type values to restrict the scan to.
+            batch_size: Maximum rows per record batch.
+
+        Yields:
+            Arrow record batches with the requested columns.
+        """
+        table = self._get_table()
+        if table is None:
+            return
+
+        selected = list(columns) if columns is not None else list(CHUNK_COLUMNS)
+        unknown = set(selected) - set(CHUNK_COLUMNS)
+        if unknown:
+            raise ValueError(f"Invalid columns for chunk scan: {sorted(unknown)}")
+
+        query = table.search().select(selected)
+        if chunk_types is not None:
+            types = list(chunk_types)
+            invalid = [t for t in types if t not in VALID_CHUNK_TYPES]
+            if invalid:
+                raise ValueError(f"Invalid chunk_type filter: {invalid[0]}")
+            if not types:
+                return
+            type_list = ", ".join(f"'{t}'" for t in types)
+            query = query.where(f"chunk_type IN ({type_list})")
+
+        yield from query.limit(None).to_batches(batch_size)
+
+    def snapshot(self, chunk_types: Iterable[str] | None = None) -> ChunkSnapshot:
+        """Load every chunk (without vectors) into an in-memory snapshot.
+
+        Args:
+            chunk_types: Optional chunk type values to include.
+
+        Returns:
+            ChunkSnapshot grouping the chunks by file.
+        """
+        snapshot = ChunkSnapshot(
+            self._row_to_chunk(row)
+            for batch in self.iter_chunks(chunk_types=chunk_types)
+            for row in batch.to_pylist()
+        )
+        logger.debug(f"Loaded chunk snapshot: {len(snapshot)} chunks, {len(snapshot.files)} files")
+        return snapshot
+
     async def delete_chunks_by_file(self, file_path: str) -> int:
         """Delete all chunks for a specific file.
 
@@ -312,9 +752,120 @@ class VectorStore:
 
         # Delete matching rows
         table.delete(f"file_path = '{safe_path}'")
+        self._deleted_since_index += before
 
         return before
 
+    def ensure_vector_index(self) -> str:
+        """Build or maintain the ANN index on the vector column.
+
+        Tables below ``index_config.min_rows`` keep using exact flat search.
+        Once the threshold is crossed the index is created; after that, rows
+        added or deleted since the last maintenance are merged into it with
+        optimize(), and the index is trained again from scratch when that
+        churn exceeds ``index_config.rebuild_churn_fraction`` of the table,
+        since partition centroids trained on the old data stop fitting the new
+        data.
+
+        Returns:
+            The action taken: "disabled", "skipped" (below threshold),
+            "current", "created", "optimized", "retrained" or "failed".
+        """
+        table = self._get_table()
+        if table is None or not self.index_config.enabled:
+            return "disabled"
+
+        row_count = table.count_rows()
+        try:
+            if not self._has_vector_index:
+                if row_count < self.index_config.min_rows:
+                    return "skipped"
+                self._create_vector_index(table)
+                return "created"
+
+            stats = table.index_stats(self.VECTOR_INDEX_NAME)
+            unindexed = stats.num_unindexed_rows if stats is not None else row_count
+            churn = unindexed + self._deleted_since_index
+            if churn == 0:
+                return "current"
+
+            if churn > self.index_config.rebuild_churn_fraction * max(row_count, 1):
+                self._create_vector_index(table)
+                return "retrained"
+
+            start = time.perf_counter()
+            table.optimize()
+        except (ValueError, RuntimeError, OSError) as e:
+            # ValueError: Invalid index parameters (e.g. sub-vectors vs dimension)
+            # RuntimeError: Index training or optimization failure
+            # OSError: Storage issues
+            # Searches keep working, with a flat scan or the previous index
+            logger.warning(f"Vector index maintenance failed: {e}")
+            return "failed"
+
+        self._deleted_since_index = 0
+        logger.info(
+            f"Vector index updated with {churn} changed rows "
+            f"({row_count} rows, {time.perf_counter() - start:.1f}s)"
+        )
+        return "optimized"
+
+    def ensure_fts_index(self) -> int:
+        """Fold rows written since the full-text indexes were built into them.
+
+        Rows missing from the indexes are still found by keyword search, with
+        a flat scan over just those rows, so this restores speed rather than
+        correctness. Tables written by older versions get their missing
+        indexes built here; until then, keyword searches fall back to vector
+        search.
+
+        Returns:
+            Number of rows merged into (or indexed by new) indexes.
+        """
+        table = self._get_table()
+        if table is None:
+            return 0
+        if not self._has_fts_index:
+            self._ensure_scalar_indexes()
+            return table.count_rows() if self._has_fts_index else 0
+
+        try:
+            # Every write touches all text columns, so one index speaks for all
+            stats = table.index_stats(f"{FTS_COLUMNS[0]}_idx")
+            if stats is None or not stats.num_unindexed_rows:
+                return 0
+            table.optimize()
+        except (ValueError, RuntimeError, OSError) as e:
+            # ValueError: Index does not exist
+            # RuntimeError: Optimization failure
+            # OSError: Storage issues
+            logger.warning(f"Full-text index maintenance failed: {e}")
+            return 0
+
+        logger.debug(f"Merged {stats.num_unindexed_rows} rows into full-text indexes")
+        return int(stats.num_unindexed_rows)
+
+    def _create_vector_index(self, table: Table) -> None:
+        """Train and write the ANN index described by index_config."""
+        cfg = self.index_config
+        start = time.perf_counter()
+        table.create_index(
+            metric="l2",
+            num_partitions=cfg.num_partitions or None,
+            # Sub-vectors only apply to PQ; HNSW-SQ ignores them
+            num_sub_vectors=(cfg.num_sub_vectors or None) if cfg.index_type == "ivf_pq" else None,
+            vector_column_name="vector",
+            index_type="IVF_HNSW_SQ" if cfg.index_type == "ivf_hnsw_sq" else "IVF_PQ",
+            name=self.VECTOR_INDEX_NAME,
+            replace=True,
+        )
+        self._has_vector_index = True
+        self._deleted_since_index = 0
+        logger.info(
+            f"Created {cfg.index_type} vector index over {table.count_rows()} rows "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
     def get_stats(self) -> dict[str, Any]:
         """Get statistics about the vector store.
 
@@ -383,6 +934,20 @@ class VectorStore:
             metadata=json.loads(row["metadata"]) if row["metadata"] else {},
         )
 
+    async def embed_chunks(self, chunks: list[CodeChunk]) -> list[list[float]]:
+        """Embed chunks, going through the embedding cache when configured.
+
+        Args:
+            chunks: Chunks to embed.
+
+        Returns:
+            One embedding per chunk, in order.
+        """
+        texts = [self._chunk_to_text(chunk) for chunk in chunks]
+        if self.embedding_cache is not None:
+            return await self.embedding_cache.embed(texts, self.embedding_provider)
+        return await self.embedding_provider.embed(texts)
+
     def _chunk_to_text(self, chunk: CodeChunk) -> str:
         """Convert a chunk to text for embedding.
 
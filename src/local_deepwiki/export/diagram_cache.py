@@ -0,0 +1,172 @@
+"""Persistent cache and parallel rendering for mermaid diagrams.
+
+Rendering a diagram with mermaid-cli starts a headless browser, which costs a
+second or more per diagram, and a wiki repeats the same diagrams across pages
+and across exports. DiagramCache stores each rendered image in the wiki
+directory under a hash of the diagram source and the render options, so
+re-exporting a wiki whose diagrams have not changed starts no browser at all.
+render_diagrams renders only the cache misses, on a bounded thread pool.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+from local_deepwiki.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Cache directory inside the wiki directory (hidden, so it is not a wiki section)
+DIAGRAM_CACHE_DIR = ".diagram_cache"
+
+# Each render runs its own browser, so keep the pool small
+DEFAULT_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def diagram_key(diagram_code: str, options: Mapping[str, str]) -> str:
+    """Get the cache key for a diagram rendered with the given options.
+
+    Args:
+        diagram_code: The mermaid diagram source.
+        options: Render options that affect the output (format, scale, ...).
+
+    Returns:
+        Hex SHA-256 of the source and options.
+    """
+    payload = json.dumps([diagram_code, sorted(options.items())])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiagramCache:
+    """Rendered diagram images stored as one file per key."""
+
+    def __init__(self, cache_dir: Path, suffix: str = ".png"):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached images; created on first write.
+            suffix: File suffix of the cached images.
+        """
+        self.cache_dir = cache_dir
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get hit, miss and write counts."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> bytes | None:
+        """Get a cached image, or None on a miss."""
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            data = None
+        except OSError as e:
+            logger.warning(f"Could not read cached diagram {key}: {e}")
+            data = None
+
+        with self._lock:
+            self._stats["hits" if data is not None else "misses"] += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an image.
+
+        The file is written under a temporary name and renamed into place, so
+        concurrent exports never read a partial image. Write failures are
+        logged and otherwise ignored: the cache only saves work.
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache diagram {key}: {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._stats["writes"] += 1
+
+    def prune(self, keep: set[str]) -> int:
+        """Delete cached images whose key is not in keep.
+
+        Args:
+            keep: Keys of the diagrams still in use.
+
+        Returns:
+            Number of files deleted.
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+
+        removed = 0
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            if path.name.removesuffix(self.suffix) in keep:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.debug(f"Could not remove stale diagram {path.name}: {e}")
+        if removed:
+            logger.debug(f"Pruned {removed} stale diagrams from {self.cache_dir}")
+        return removed
+
+
+def render_diagrams(
+    diagram_codes: Iterable[str],
+    render: Callable[[str], bytes | None],
+    options: Mapping[str, str],
+    cache: DiagramCache | None = None,
+    max_workers: int = DEFAULT_RENDER_WORKERS,
+) -> dict[str, bytes | None]:
+    """Render diagrams, each distinct one once, taking what it can from the cache.
+
+    Args:
+        diagram_codes: Mermaid diagram sources, possibly repeated.
+        render: Function rendering one diagram, returning None on failure.
+        options: The render options render uses, for the cache key.
+        cache: Optional persistent cache to read hits from and store renders in.
+        max_workers: Maximum diagrams rendered at once.
+
+    Returns:
+        Mapping of diagram source to image bytes, or None where rendering failed.
+        Failures are not cached, so they are retried on the next export.
+    """
+    results: dict[str, bytes | None] = {}
+    misses: list[str] = []
+    for code in dict.fromkeys(diagram_codes):
+        cached = cache.get(diagram_key(code, options)) if cache is not None else None
+        if cached is not None:
+            results[code] = cached
+        else:
+            misses.append(code)
+
+    if not misses:
+        return results
+
+    logger.info(
+        f"Rendering {len(misses)} diagrams ({len(results)} cached) "
+        f"with up to {max_workers} workers"
+    )
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(misses)))) as pool:
+        for code, data in zip(misses, pool.map(render, misses)):
+            results[code] = data
+            if data is not None and cache is not None:
+                cache.put(diagram_key(code, options), data)
+    return results
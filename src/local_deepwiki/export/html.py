@@ -1,8 +1,14 @@
 """HTML export functionality for DeepWiki documentation."""
 
 import argparse
+import filecmp
+import hashlib
 import json
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
@@ -646,13 +652,7 @@ def render_markdown(content: str) -> str:
 def extract_title(md_file: Path) -> str:
     """Extract title from markdown file."""
     try:
-        content = md_file.read_text()
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("# "):
-                return line[2:].strip()
-            if line.startswith("**") and line.endswith("**"):
-                return line[2:-2].strip()
+        return _title_from_content(md_file.read_text(), md_file)
     except (OSError, UnicodeDecodeError) as e:
         # OSError: File access issues
         # UnicodeDecodeError: File encoding issues
@@ -660,25 +660,148 @@ def extract_title(md_file: Path) -> str:
     return md_file.stem.replace("_", " ").replace("-", " ").title()
 
 
+def _title_from_content(content: str, md_file: Path) -> str:
+    """Extract the title from a page's markdown, falling back to its filename."""
+    for line in content.split("\n"):
+        line = line.strip()
+        if line.startswith("# "):
+            return line[2:].strip()
+        if line.startswith("**") and line.endswith("**"):
+            return line[2:-2].strip()
+    return md_file.stem.replace("_", " ").replace("-", " ").title()
+
+
+# Manifest of the last export, kept in the output directory
+EXPORT_MANIFEST = ".export_manifest.json"
+
+# Bumped when the exporter's output changes for unchanged inputs
+_MANIFEST_VERSION = 1
+
+# Below this many pages to render, process start-up costs more than it saves
+_PROCESS_POOL_MIN_PAGES = 64
+
+# A TOC with more entries than this is not inlined into every page, which would
+# make the export O(pages^2) in size, but written once per page depth to a
+# script in TOC_SCRIPT_DIR that each page includes
+TOC_INLINE_MAX_ENTRIES = 300
+TOC_SCRIPT_DIR = "_toc"
+
+# Inserts the TOC before the including script tag and marks the page's link
+_TOC_SCRIPT_TEMPLATE = """(function () {{
+    var script = document.currentScript;
+    script.insertAdjacentHTML("beforebegin", {toc_json});
+    var active = script.getAttribute("data-active");
+    script.parentNode.querySelectorAll("a").forEach(function (link) {{
+        if (link.getAttribute("href") === active) link.classList.add("active");
+    }});
+}})();
+"""
+
+# Inline TOC fragments by root path (None for shared TOC scripts), set by
+# _init_render_worker()
+_worker_toc: dict[str, str] | None = None
+
+
+@dataclass(frozen=True)
+class _PageJob:
+    """Everything needed to render and write one page."""
+
+    rel_path: str  # Path of the markdown file relative to the wiki, with "/"
+    content: str
+    title: str
+    breadcrumb_html: str
+    output_file: str
+
+
+def _count_toc_entries(entries: list[dict]) -> int:
+    """Count TOC entries, including nested ones."""
+    return sum(1 + _count_toc_entries(entry.get("children") or []) for entry in entries)
+
+
+def _init_render_worker(toc_fragments: dict[str, str] | None) -> None:
+    """Receive the shared TOC fragments once per worker process."""
+    global _worker_toc
+    _worker_toc = toc_fragments
+
+
+def _render_job(job: _PageJob) -> None:
+    """Render a page in a worker process."""
+    _write_page(job, _worker_toc)
+
+
+def _write_page(job: _PageJob, toc_fragments: dict[str, str] | None) -> None:
+    """Render a page's markdown into the site template and write it.
+
+    Args:
+        job: The page to render.
+        toc_fragments: TOC HTML per root path with no link marked active, or
+            None to include the shared TOC script for the page's depth.
+    """
+    depth = job.rel_path.count("/")
+    root_path = "../" * depth if depth > 0 else "./"
+
+    html_path = job.rel_path.replace(".md", ".html")
+    if toc_fragments is None:
+        toc_html = (
+            f'<script src="{root_path}{TOC_SCRIPT_DIR}/toc-{depth}.js" '
+            f'data-active="{root_path}{html_path}"></script>'
+        )
+    else:
+        # Only the current page's own TOC link differs between pages at one depth
+        toc_html = toc_fragments[root_path].replace(
+            f'<a href="{root_path}{html_path}" class="">',
+            f'<a href="{root_path}{html_path}" class="active">',
+        )
+
+    html = STATIC_HTML_TEMPLATE.format(
+        title=job.title,
+        toc_html=toc_html,
+        breadcrumb_html=job.breadcrumb_html,
+        content_html=render_markdown(job.content),
+        search_json_path=root_path + "search.json",
+        root_path=root_path,
+    )
+
+    output_file = Path(job.output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(html)
+
+
 class HtmlExporter:
     """Export wiki markdown to static HTML files."""
 
-    def __init__(self, wiki_path: Path, output_path: Path):
+    def __init__(
+        self,
+        wiki_path: Path,
+        output_path: Path,
+        workers: int | None = None,
+        incremental: bool = True,
+    ):
         """Initialize the exporter.
 
         Args:
             wiki_path: Path to the .deepwiki directory
             output_path: Output directory for HTML files
+            workers: Processes rendering pages (default: CPU count, up to 8)
+            incremental: Skip pages whose output is up to date according to
+                the manifest of the previous export
         """
         self.wiki_path = Path(wiki_path)
         self.output_path = Path(output_path)
         self.toc_entries: list[dict] = []
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.incremental = incremental
+        self.rendered_pages = 0
 
     def export(self) -> int:
         """Export all wiki pages to HTML.
 
+        Pages are rendered only if their markdown, breadcrumb, the TOC or the
+        template changed since the previous export into the same directory.
+        Outputs of pages deleted from the wiki are removed.
+
         Returns:
-            Number of pages exported
+            Number of pages in the exported site
         """
         logger.info(f"Starting HTML export from {self.wiki_path} to {self.output_path}")
 
@@ -694,61 +817,153 @@ class HtmlExporter:
 
         # Copy search.json
         search_src = self.wiki_path / "search.json"
-        if search_src.exists():
-            shutil.copy(search_src, self.output_path / "search.json")
+        search_dst = self.output_path / "search.json"
+        if search_src.exists() and not (
+            search_dst.exists() and filecmp.cmp(search_src, search_dst, shallow=False)
+        ):
+            shutil.copy(search_src, search_dst)
             logger.debug("Copied search.json to output directory")
 
-        # Find and export all markdown files
-        exported = 0
-        for md_file in self.wiki_path.rglob("*.md"):
-            rel_path = md_file.relative_to(self.wiki_path)
-            self._export_page(md_file, rel_path)
-            exported += 1
-
-        logger.info(f"Exported {exported} pages to HTML")
-        return exported
+        previous = self._load_manifest() if self.incremental else {}
+        layout = hashlib.sha256(
+            f"{_MANIFEST_VERSION}\0{TOC_INLINE_MAX_ENTRIES}\0{STATIC_HTML_TEMPLATE}\0".encode()
+            + json.dumps(self.toc_entries, sort_keys=True).encode()
+        ).hexdigest()
+        previous_pages = previous.get("pages", {}) if previous.get("layout") == layout else {}
+
+        # Find all markdown files and the ones whose output is out of date
+        page_keys: dict[str, str] = {}
+        jobs: list[_PageJob] = []
+        for md_file in sorted(self.wiki_path.rglob("*.md")):
+            job = self._page_job(md_file)
+            key = hashlib.sha256(
+                f"{job.content}\0{job.breadcrumb_html}".encode("utf-8", "surrogatepass")
+            ).hexdigest()
+            page_keys[job.rel_path] = key
+            if previous_pages.get(job.rel_path) != key or not Path(job.output_file).exists():
+                jobs.append(job)
+
+        if _count_toc_entries(self.toc_entries) > TOC_INLINE_MAX_ENTRIES:
+            depths = {rel_path.count("/") for rel_path in page_keys}
+            self._write_toc_scripts(depths)
+            self._render_pages(jobs, None)
+        else:
+            shutil.rmtree(self.output_path / TOC_SCRIPT_DIR, ignore_errors=True)
+            depths = {job.rel_path.count("/") for job in jobs}
+            self._render_pages(jobs, self._toc_fragments(depths))
+        self._remove_deleted_pages(set(previous.get("pages", {})) - set(page_keys))
+        self._save_manifest({"layout": layout, "pages": page_keys})
+
+        self.rendered_pages = len(jobs)
+        logger.info(
+            f"Exported {len(page_keys)} pages to HTML "
+            f"({len(jobs)} rendered, {len(page_keys) - len(jobs)} up to date)"
+        )
+        return len(page_keys)
 
-    def _export_page(self, md_file: Path, rel_path: Path) -> None:
-        """Export a single markdown page to HTML.
+    def _page_job(self, md_file: Path) -> _PageJob:
+        """Read a page and collect what rendering it needs.
 
         Args:
             md_file: Path to the markdown file
-            rel_path: Relative path from wiki root
-        """
-        logger.debug(f"Exporting page: {rel_path}")
-
-        # Read and convert markdown
-        content = md_file.read_text()
-        html_content = render_markdown(content)
-        title = extract_title(md_file)
 
-        # Calculate depth for relative paths
+        Returns:
+            The page's render job
+        """
+        rel_path = md_file.relative_to(self.wiki_path)
         depth = len(rel_path.parts) - 1
         root_path = "../" * depth if depth > 0 else "./"
+        content = md_file.read_text()
+        return _PageJob(
+            rel_path=rel_path.as_posix(),
+            content=content,
+            title=_title_from_content(content, md_file),
+            breadcrumb_html=self._build_breadcrumb(rel_path, root_path),
+            output_file=str(self.output_path / rel_path.with_suffix(".html")),
+        )
 
-        # Build TOC HTML with correct relative paths
-        toc_html = self._render_toc(self.toc_entries, str(rel_path), root_path)
+    def _toc_fragments(self, depths: set[int]) -> dict[str, str]:
+        """Render the TOC once per page depth, with no link marked active.
 
-        # Build breadcrumb HTML
-        breadcrumb_html = self._build_breadcrumb(rel_path, root_path)
+        Args:
+            depths: Directory depths of the pages that need the TOC
 
-        # Calculate search.json path relative to this page
-        search_json_path = root_path + "search.json"
+        Returns:
+            TOC HTML by the pages' relative path to the root
+        """
+        root_paths = ("../" * depth if depth > 0 else "./" for depth in depths)
+        return {
+            root_path: self._render_toc(self.toc_entries, "", root_path) for root_path in root_paths
+        }
 
-        # Render full HTML
-        html = STATIC_HTML_TEMPLATE.format(
-            title=title,
-            toc_html=toc_html,
-            breadcrumb_html=breadcrumb_html,
-            content_html=html_content,
-            search_json_path=search_json_path,
-            root_path=root_path,
-        )
+    def _write_toc_scripts(self, depths: set[int]) -> None:
+        """Write the shared TOC script for each page depth.
+
+        Args:
+            depths: Directory depths of all pages in the wiki
+        """
+        script_dir = self.output_path / TOC_SCRIPT_DIR
+        script_dir.mkdir(exist_ok=True)
+        for depth in depths:
+            root_path = "../" * depth if depth > 0 else "./"
+            toc_json = json.dumps(self._render_toc(self.toc_entries, "", root_path))
+            script = _TOC_SCRIPT_TEMPLATE.format(toc_json=toc_json)
+            (script_dir / f"toc-{depth}.js").write_text(script)
 
-        # Write output file
-        output_file = self.output_path / rel_path.with_suffix(".html")
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html)
+    def _render_pages(self, jobs: list[_PageJob], toc_fragments: dict[str, str] | None) -> None:
+        """Render pages, on a process pool when there are enough of them.
+
+        Args:
+            jobs: Pages to render
+            toc_fragments: Inline TOC HTML per root path, or None if pages
+                include the shared TOC scripts
+        """
+        if not jobs:
+            return
+
+        if self.workers <= 1 or len(jobs) < _PROCESS_POOL_MIN_PAGES:
+            for job in jobs:
+                logger.debug(f"Exporting page: {job.rel_path}")
+                _write_page(job, toc_fragments)
+            return
+
+        logger.debug(f"Rendering {len(jobs)} pages with {self.workers} processes")
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            # The exporter may run inside a server that holds model threads,
+            # which forked children can deadlock on
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker,
+            initargs=(toc_fragments,),
+        ) as pool:
+            chunksize = max(1, len(jobs) // (self.workers * 4))
+            for _ in pool.map(_render_job, jobs, chunksize=chunksize):
+                pass
+
+    def _load_manifest(self) -> dict:
+        """Load the previous export's manifest, or {} if there is none usable."""
+        try:
+            manifest = json.loads((self.output_path / EXPORT_MANIFEST).read_text())
+        except (OSError, ValueError) as e:
+            # OSError: No previous export
+            # ValueError: Corrupt manifest, so render everything
+            logger.debug(f"No usable export manifest: {e}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self, manifest: dict) -> None:
+        """Write the manifest of this export."""
+        manifest_path = self.output_path / EXPORT_MANIFEST
+        tmp_path = manifest_path.with_name(f"{EXPORT_MANIFEST}.tmp")
+        tmp_path.write_text(json.dumps(manifest))
+        os.replace(tmp_path, manifest_path)
+
+    def _remove_deleted_pages(self, rel_paths: set[str]) -> None:
+        """Delete the outputs of pages no longer in the wiki."""
+        for rel_path in rel_paths:
+            output_file = self.output_path / Path(rel_path).with_suffix(".html")
+            output_file.unlink(missing_ok=True)
+            logger.debug(f"Removed output of deleted page: {rel_path}")
 
     def _render_toc(self, entries: list[dict], current_path: str, root_path: str) -> str:
         """Render TOC entries as HTML.
@@ -859,12 +1074,19 @@ class HtmlExporter:
         )
 
 
-def export_to_html(wiki_path: str | Path, output_path: str | Path | None = None) -> str:
+def export_to_html(
+    wiki_path: str | Path,
+    output_path: str | Path | None = None,
+    workers: int | None = None,
+    incremental: bool = True,
+) -> str:
     """Export wiki to static HTML files.
 
     Args:
         wiki_path: Path to the .deepwiki directory
         output_path: Output directory (default: {wiki_path}_html)
+        workers: Processes rendering pages (default: CPU count, up to 8)
+        incremental: Only re-render pages changed since the last export
 
     Returns:
         Path to the output directory
@@ -876,7 +1098,7 @@ def export_to_html(wiki_path: str | Path, output_path: str | Path | None = None)
         output_path = Path(output_path)
 
     logger.info(f"Exporting wiki from {wiki_path} to {output_path}")
-    exporter = HtmlExporter(wiki_path, output_path)
+    exporter = HtmlExporter(wiki_path, output_path, workers=workers, incremental=incremental)
     count = exporter.export()
 
     logger.info(f"HTML export complete: {count} pages")
@@ -893,6 +1115,14 @@ def main():
         help="Path to the .deepwiki directory (default: .deepwiki)",
     )
     parser.add_argument("--output", "-o", help="Output directory (default: {wiki_path}_html)")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processes rendering pages (default: CPU count)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-render every page instead of only those changed since the last export",
+    )
 
     args = parser.parse_args()
 
@@ -903,7 +1133,7 @@ def main():
 
     output_path = Path(args.output).resolve() if args.output else None
 
-    result = export_to_html(wiki_path, output_path)
+    result = export_to_html(wiki_path, output_path, workers=args.workers, incremental=not args.full)
     print(result)
 
     # Print location hint
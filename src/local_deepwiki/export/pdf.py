@@ -9,11 +9,18 @@ import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import cast
+from typing import Iterable, Mapping, cast
 
 import markdown
 from weasyprint import CSS, HTML
 
+from local_deepwiki.export.diagram_cache import (
+    DEFAULT_RENDER_WORKERS,
+    DIAGRAM_CACHE_DIR,
+    DiagramCache,
+    diagram_key,
+    render_diagrams,
+)
 from local_deepwiki.logging import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +28,9 @@ logger = get_logger(__name__)
 # Cache for mermaid CLI availability check
 _mmdc_available: bool | None = None
 
+# mmdc options for PDF diagrams; also part of the diagram cache key
+PNG_RENDER_OPTIONS = {"format": "png", "background": "white", "scale": "2"}
+
 
 def is_mmdc_available() -> bool:
     """Check if mermaid-cli (mmdc) is available on the system.
@@ -71,9 +81,9 @@ def render_mermaid_to_png(diagram_code: str, timeout: int = 30) -> bytes | None:
                     "-o",
                     str(output_file),
                     "-b",
-                    "white",  # White background for PDF
+                    PNG_RENDER_OPTIONS["background"],  # White background for PDF
                     "-s",
-                    "2",  # Scale 2x for better quality
+                    PNG_RENDER_OPTIONS["scale"],  # Scale 2x for better quality
                     "--quiet",
                 ],
                 capture_output=True,
@@ -165,6 +175,26 @@ def render_mermaid_to_svg(diagram_code: str, timeout: int = 30) -> str | None:
         return None
 
 
+def render_mermaid_diagrams(
+    diagram_codes: Iterable[str],
+    cache: DiagramCache | None = None,
+    max_workers: int = DEFAULT_RENDER_WORKERS,
+) -> dict[str, bytes | None]:
+    """Render mermaid diagrams to PNG in parallel, reusing cached images.
+
+    Args:
+        diagram_codes: Mermaid diagram sources, possibly repeated.
+        cache: Optional persistent diagram cache.
+        max_workers: Maximum mmdc processes run at once.
+
+    Returns:
+        Mapping of diagram source to PNG bytes, or None where rendering failed.
+    """
+    return render_diagrams(
+        diagram_codes, render_mermaid_to_png, PNG_RENDER_OPTIONS, cache, max_workers
+    )
+
+
 def extract_mermaid_blocks(content: str) -> list[tuple[str, str]]:
     """Extract mermaid code blocks from markdown content.
 
@@ -405,13 +435,19 @@ PDF_HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
-def render_markdown_for_pdf(content: str, render_mermaid: bool = True) -> str:
+def render_markdown_for_pdf(
+    content: str,
+    render_mermaid: bool = True,
+    rendered: Mapping[str, bytes | None] | None = None,
+) -> str:
     """Render markdown to HTML suitable for PDF.
 
     Args:
         content: Markdown content.
         render_mermaid: If True, attempt to render mermaid diagrams using CLI.
             Falls back to placeholder if CLI is not available.
+        rendered: Diagrams already rendered, as returned by
+            render_mermaid_diagrams. Diagrams not in it are rendered here.
 
     Returns:
         HTML string.
@@ -422,8 +458,12 @@ def render_markdown_for_pdf(content: str, render_mermaid: bool = True) -> str:
     if render_mermaid and is_mmdc_available():
         # Try to render mermaid diagrams to PNG (better font support than SVG)
         mermaid_blocks = extract_mermaid_blocks(content)
+        images = dict(rendered or {})
+        missing = [code for _, code in mermaid_blocks if code not in images]
+        if missing:
+            images.update(render_mermaid_diagrams(missing))
         for full_block, diagram_code in mermaid_blocks:
-            png_bytes = render_mermaid_to_png(diagram_code)
+            png_bytes = images.get(diagram_code)
             if png_bytes:
                 # Embed PNG as base64 data URI
                 b64_data = base64.b64encode(png_bytes).decode("ascii")
@@ -496,16 +536,29 @@ def extract_title(md_file: Path) -> str:
 class PdfExporter:
     """Export wiki markdown to PDF format."""
 
-    def __init__(self, wiki_path: Path, output_path: Path):
+    def __init__(
+        self,
+        wiki_path: Path,
+        output_path: Path,
+        diagram_workers: int = DEFAULT_RENDER_WORKERS,
+        cache_diagrams: bool = True,
+    ):
         """Initialize the exporter.
 
         Args:
             wiki_path: Path to the .deepwiki directory.
             output_path: Output path for PDF file(s).
+            diagram_workers: Maximum mermaid diagrams rendered at once.
+            cache_diagrams: Keep rendered diagrams in the wiki directory and
+                reuse them in later exports.
         """
         self.wiki_path = Path(wiki_path)
         self.output_path = Path(output_path)
         self.toc_entries: list[dict] = []
+        self.diagram_workers = diagram_workers
+        self.diagram_cache = (
+            DiagramCache(self.wiki_path / DIAGRAM_CACHE_DIR) if cache_diagrams else None
+        )
 
     def export_single(self) -> Path:
         """Export all wiki pages to a single PDF.
@@ -557,18 +610,44 @@ class PdfExporter:
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        md_files = sorted(self.wiki_path.rglob("*.md"))
+        rendered = self._render_diagrams(md_file.read_text() for md_file in md_files)
+
         generated = []
-        for md_file in sorted(self.wiki_path.rglob("*.md")):
+        for md_file in md_files:
             rel_path = md_file.relative_to(self.wiki_path)
             output_file = output_dir / rel_path.with_suffix(".pdf")
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            self._export_page(md_file, output_file)
+            self._export_page(md_file, output_file, rendered)
             generated.append(output_file)
 
         logger.info(f"Generated {len(generated)} PDF files")
         return generated
 
+    def _render_diagrams(self, contents: Iterable[str]) -> dict[str, bytes | None]:
+        """Render the mermaid diagrams of every page before building any HTML.
+
+        Rendering the whole wiki's diagrams at once lets distinct diagrams
+        render in parallel and repeated ones render once. Cached images not
+        used by any page are removed afterwards.
+
+        Args:
+            contents: Markdown content of all pages being exported.
+
+        Returns:
+            Mapping of diagram source to PNG bytes (None where rendering failed).
+        """
+        if not is_mmdc_available():
+            return {}
+
+        codes = [code for content in contents for _, code in extract_mermaid_blocks(content)]
+        rendered = render_mermaid_diagrams(codes, self.diagram_cache, self.diagram_workers)
+        if self.diagram_cache is not None:
+            self.diagram_cache.prune({diagram_key(code, PNG_RENDER_OPTIONS) for code in rendered})
+            logger.debug(f"Diagram cache: {self.diagram_cache.stats}")
+        return rendered
+
     def _collect_pages_in_order(self) -> list[Path]:
         """Collect markdown files in TOC order.
 
@@ -616,6 +695,8 @@ class PdfExporter:
             Combined HTML string.
         """
         parts = []
+        contents = [page.read_text() for page in pages]
+        rendered = self._render_diagrams(contents)
 
         # Add title page
         parts.append("<h1>Documentation</h1>")
@@ -624,9 +705,8 @@ class PdfExporter:
         parts.append('<div class="page-break"></div>')
 
         # Add each page
-        for i, page in enumerate(pages):
-            content = page.read_text()
-            html_content = render_markdown_for_pdf(content)
+        for i, content in enumerate(contents):
+            html_content = render_markdown_for_pdf(content, rendered=rendered)
             parts.append(html_content)
 
             # Add page break between pages (except last)
@@ -657,17 +737,23 @@ class PdfExporter:
         parts.append("</div>")
         return "\n".join(parts)
 
-    def _export_page(self, md_file: Path, output_file: Path) -> None:
+    def _export_page(
+        self,
+        md_file: Path,
+        output_file: Path,
+        rendered: Mapping[str, bytes | None] | None = None,
+    ) -> None:
         """Export a single page to PDF.
 
         Args:
             md_file: Path to markdown file.
             output_file: Output PDF path.
+            rendered: Diagrams already rendered for this export.
         """
         logger.debug(f"Exporting page: {md_file.name}")
 
         content = md_file.read_text()
-        html_content = render_markdown_for_pdf(content)
+        html_content = render_markdown_for_pdf(content, rendered=rendered)
         title = extract_title(md_file)
 
         full_html = PDF_HTML_TEMPLATE.format(
@@ -7,6 +7,7 @@ from pathlib import Path
 from tree_sitter import Node
 
 from local_deepwiki.core.chunker import CLASS_NODE_TYPES, FUNCTION_NODE_TYPES
+from local_deepwiki.core.parse_cache import get_parse_cache
 from local_deepwiki.core.parser import CodeParser, find_nodes_by_type, get_node_name, get_node_text
 from local_deepwiki.models import Language
 
@@ -487,11 +488,11 @@ class APIDocExtractor:
         Returns:
             Tuple of (functions, classes) signatures.
         """
-        result = self.parser.parse_file(file_path)
-        if result is None:
+        parsed = get_parse_cache().get(file_path)
+        if parsed is None:
             return [], []
 
-        root, language, source = result
+        language, source = parsed.language, parsed.source
         functions: list[FunctionSignature] = []
         classes: list[ClassSignature] = []
 
@@ -499,7 +500,7 @@ class APIDocExtractor:
         class_types = CLASS_NODE_TYPES.get(language, set())
 
         # Extract top-level functions
-        for func_node in find_nodes_by_type(root, function_types):
+        for func_node in parsed.find_nodes(function_types):
             # Skip if inside a class
             if self._is_inside_class(func_node, class_types):
                 continue
@@ -509,7 +510,7 @@ class APIDocExtractor:
                 functions.append(sig)
 
         # Extract classes
-        for class_node in find_nodes_by_type(root, class_types):
+        for class_node in parsed.find_nodes(class_types):
             sig = extract_class_signature(class_node, source, language)
             if sig:
                 classes.append(sig)
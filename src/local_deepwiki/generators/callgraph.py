@@ -1,12 +1,21 @@
 """Call graph extraction and diagram generation."""
 
+import json
+from dataclasses import dataclass
 from pathlib import Path
 
 from tree_sitter import Node
 
 from local_deepwiki.core.chunker import CLASS_NODE_TYPES, FUNCTION_NODE_TYPES
+from local_deepwiki.core.parse_cache import ParsedSource, get_parse_cache
 from local_deepwiki.core.parser import CodeParser, find_nodes_by_type, get_node_name, get_node_text
-from local_deepwiki.models import Language
+from local_deepwiki.logging import get_logger
+from local_deepwiki.models import FileInfo, Language
+
+logger = get_logger(__name__)
+
+# File name of the persisted call graph index, stored next to index_status.json
+CALL_GRAPH_INDEX_FILE = "call_graph.json"
 
 # Node types that represent function calls per language
 CALL_NODE_TYPES: dict[Language, set[str]] = {
@@ -265,21 +274,33 @@ class CallGraphExtractor:
         self,
         file_path: Path,
         repo_root: Path,
+        source: bytes | None = None,
     ) -> dict[str, list[str]]:
         """Extract call graph from a source file.
 
         Args:
             file_path: Path to the source file.
             repo_root: Repository root path.
+            source: Optional file content already read by the caller.
 
         Returns:
             Dictionary mapping function name to list of called functions.
         """
-        result = self.parser.parse_file(file_path)
-        if result is None:
+        parsed: ParsedSource | None
+        if source is None:
+            # Wiki generation: share the tree with the other file-doc extractors
+            parsed = get_parse_cache().get(file_path)
+        else:
+            # Indexing: the caller owns the content, so parse it without caching
+            result = self.parser.parse_file(file_path, source)
+            parsed = None
+            if result is not None:
+                root, language, content = result
+                parsed = ParsedSource(file_path, root, language, content, file_hash="")
+        if parsed is None:
             return {}
 
-        root, language, source = result
+        language, source = parsed.language, parsed.source
         call_graph: dict[str, list[str]] = {}
 
         # Get function and class node types
@@ -287,7 +308,7 @@ class CallGraphExtractor:
         class_types = CLASS_NODE_TYPES.get(language, set())
 
         # Extract from top-level functions
-        for func_node in find_nodes_by_type(root, function_types):
+        for func_node in parsed.find_nodes(function_types):
             # Skip if inside a class
             if self._is_inside_class(func_node, class_types):
                 continue
@@ -299,7 +320,7 @@ class CallGraphExtractor:
                     call_graph[func_name] = calls
 
         # Extract from class methods
-        for class_node in find_nodes_by_type(root, class_types):
+        for class_node in parsed.find_nodes(class_types):
             class_name = get_node_name(class_node, source, language)
             if not class_name:
                 continue
@@ -407,18 +428,36 @@ def generate_call_graph_diagram(
     return "\n".join(lines)
 
 
-def get_file_call_graph(file_path: Path, repo_root: Path) -> str | None:
+def _file_call_graph(
+    file_path: Path,
+    repo_root: Path,
+    call_graph_index: "CallGraphIndex | None",
+) -> dict[str, list[str]]:
+    """Get a file's call graph from the index, extracting it only on a miss."""
+    if call_graph_index is not None and file_path.is_relative_to(repo_root):
+        call_graph = call_graph_index.get_call_graph(str(file_path.relative_to(repo_root)))
+        if call_graph is not None:
+            return call_graph
+    return CallGraphExtractor().extract_from_file(file_path, repo_root)
+
+
+def get_file_call_graph(
+    file_path: Path,
+    repo_root: Path,
+    call_graph_index: "CallGraphIndex | None" = None,
+) -> str | None:
     """Get a call graph diagram for a single file.
 
     Args:
         file_path: Path to the source file.
         repo_root: Repository root path.
+        call_graph_index: Optional persisted index to read call edges from
+            instead of re-parsing the file.
 
     Returns:
         Mermaid diagram string or None if no calls found.
     """
-    extractor = CallGraphExtractor()
-    call_graph = extractor.extract_from_file(file_path, repo_root)
+    call_graph = _file_call_graph(file_path, repo_root, call_graph_index)
     return generate_call_graph_diagram(call_graph)
 
 
@@ -441,16 +480,206 @@ def build_reverse_call_graph(call_graph: dict[str, list[str]]) -> dict[str, list
     return reverse
 
 
-def get_file_callers(file_path: Path, repo_root: Path) -> dict[str, list[str]]:
+def get_file_callers(
+    file_path: Path,
+    repo_root: Path,
+    call_graph_index: "CallGraphIndex | None" = None,
+) -> dict[str, list[str]]:
     """Get a mapping of function/method names to their callers within a file.
 
     Args:
         file_path: Path to the source file.
         repo_root: Repository root path.
+        call_graph_index: Optional persisted index to read call edges from
+            instead of re-parsing the file.
 
     Returns:
         Mapping of function name -> list of caller names.
     """
-    extractor = CallGraphExtractor()
-    call_graph = extractor.extract_from_file(file_path, repo_root)
+    call_graph = _file_call_graph(file_path, repo_root, call_graph_index)
     return build_reverse_call_graph(call_graph)
+
+
+@dataclass
+class FileCallGraph:
+    """Call edges extracted from one version of a file."""
+
+    hash: str
+    calls: dict[str, list[str]]
+
+
+class CallGraphIndex:
+    """Repository-wide caller/callee index, persisted next to the index status.
+
+    The indexer extracts call edges once per file version while parsing and
+    records them under the file's content hash, so incremental runs only
+    re-extract changed files. Wiki generation then answers "what does this
+    file call", "who calls this inside the file" and "which other files call
+    this" with dictionary lookups instead of re-parsing files or running a
+    vector search per entity.
+    """
+
+    VERSION = 1
+
+    def __init__(self, files: dict[str, FileCallGraph] | None = None):
+        """Initialize the index.
+
+        Args:
+            files: Call graphs keyed by repo-relative file path.
+        """
+        self._files: dict[str, FileCallGraph] = files or {}
+        self._callers_by_name: dict[str, set[str]] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of files in the index."""
+        return len(self._files)
+
+    def __contains__(self, file_path: object) -> bool:
+        """Check whether a file has an entry."""
+        return file_path in self._files
+
+    @classmethod
+    def load(cls, path: Path, files: list[FileInfo] | None = None) -> "CallGraphIndex":
+        """Load an index from disk.
+
+        Args:
+            path: Path to the JSON index file.
+            files: Optional current file records. Entries for files that are
+                missing or whose hash differs are dropped, so every lookup is
+                consistent with these records.
+
+        Returns:
+            The loaded index, or an empty one if the file is missing or unreadable.
+        """
+        if not path.exists():
+            return cls()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") != cls.VERSION:
+                return cls()
+            entries = {
+                file_path: FileCallGraph(hash=entry["hash"], calls=entry["calls"])
+                for file_path, entry in data["files"].items()
+            }
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, AttributeError) as e:
+            # json.JSONDecodeError: Corrupted or invalid JSON
+            # OSError: File read issues
+            # KeyError/TypeError/AttributeError: Unexpected structure
+            logger.warning(f"Failed to load call graph index from {path}: {e}")
+            return cls()
+
+        if files is not None:
+            current = {f.path: f.hash for f in files}
+            entries = {p: e for p, e in entries.items() if current.get(p) == e.hash}
+        return cls(entries)
+
+    def save(self, path: Path) -> None:
+        """Write the index to disk.
+
+        Args:
+            path: Path to the JSON index file.
+        """
+        data = {
+            "version": self.VERSION,
+            "files": {
+                file_path: {"hash": entry.hash, "calls": entry.calls}
+                for file_path, entry in sorted(self._files.items())
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    def is_current(self, file_path: str, file_hash: str) -> bool:
+        """Check whether a file's entry matches the given content hash."""
+        entry = self._files.get(file_path)
+        return entry is not None and entry.hash == file_hash
+
+    def set_file(self, file_path: str, file_hash: str, calls: dict[str, list[str]]) -> None:
+        """Record the call edges of a file version.
+
+        Args:
+            file_path: Repo-relative file path.
+            file_hash: Content hash of the version the edges came from.
+            calls: Mapping of caller to called names.
+        """
+        self._files[file_path] = FileCallGraph(hash=file_hash, calls=calls)
+        self._callers_by_name = None
+
+    def retain(self, file_paths: set[str]) -> int:
+        """Drop entries for files not in the given set.
+
+        Args:
+            file_paths: Paths to keep.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = [p for p in self._files if p not in file_paths]
+        for file_path in removed:
+            del self._files[file_path]
+        if removed:
+            self._callers_by_name = None
+        return len(removed)
+
+    def get_call_graph(self, file_path: str) -> dict[str, list[str]] | None:
+        """Get a file's caller -> callees mapping.
+
+        Args:
+            file_path: Repo-relative file path.
+
+        Returns:
+            The mapping, or None if the file has no entry.
+        """
+        entry = self._files.get(file_path)
+        return entry.calls if entry is not None else None
+
+    def get_callers(self, file_path: str) -> dict[str, list[str]] | None:
+        """Get a file's callee -> callers mapping (calls within the file).
+
+        Args:
+            file_path: Repo-relative file path.
+
+        Returns:
+            The reverse mapping, or None if the file has no entry.
+        """
+        call_graph = self.get_call_graph(file_path)
+        return build_reverse_call_graph(call_graph) if call_graph is not None else None
+
+    def get_cross_file_callers(
+        self,
+        file_path: str,
+        entity_names: list[str],
+        max_files: int = 10,
+    ) -> dict[str, list[str]]:
+        """Find other files that call entities defined in a file.
+
+        Calls are matched by name, since call sites are not resolved to
+        definitions; names shorter than four characters are skipped as too
+        ambiguous.
+
+        Args:
+            file_path: Repo-relative path of the defining file (excluded).
+            entity_names: Names of functions/classes defined in the file.
+            max_files: Maximum number of caller files per entity.
+
+        Returns:
+            Mapping of entity name to sorted calling file paths.
+        """
+        if self._callers_by_name is None:
+            callers_by_name: dict[str, set[str]] = {}
+            for caller_path, entry in self._files.items():
+                for callees in entry.calls.values():
+                    for callee in callees:
+                        callers_by_name.setdefault(callee, set()).add(caller_path)
+            self._callers_by_name = callers_by_name
+
+        callers: dict[str, list[str]] = {}
+        for entity_name in entity_names:
+            if len(entity_name) < 4:
+                continue
+            caller_files = self._callers_by_name.get(entity_name, set()) - {file_path}
+            if caller_files:
+                callers[entity_name] = sorted(caller_files)[:max_files]
+        return callers
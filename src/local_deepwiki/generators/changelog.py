@@ -4,13 +4,12 @@ This module extracts commit history from git and generates a changelog
 wiki page with links to GitHub/GitLab commits.
 """
 
-import subprocess
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
-from local_deepwiki.core.git_utils import GitRepoInfo, get_repo_info
+from local_deepwiki.core.git_utils import GitRepoInfo, get_git_metadata_index, get_repo_info
 from local_deepwiki.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +30,9 @@ class CommitInfo:
 def get_commit_history(repo_path: Path, limit: int = 30) -> list[CommitInfo]:
     """Get recent commit history with file changes.
 
+    Commits are served from the cached git metadata index, so the changelog
+    shares one history walk with staleness detection and blame.
+
     Args:
         repo_path: Path to the repository.
         limit: Maximum number of commits to retrieve.
@@ -38,73 +40,23 @@ def get_commit_history(repo_path: Path, limit: int = 30) -> list[CommitInfo]:
     Returns:
         List of CommitInfo objects, newest first.
     """
-    try:
-        # Get commit info with changed files
-        # Format: short_hash|full_hash|author|date|message
-        # Followed by file names (one per line) until empty line
-        result = subprocess.run(
-            [
-                "git",
-                "log",
-                f"--max-count={limit}",
-                "--pretty=format:%h|%H|%an|%ai|%s",
-                "--name-only",
-            ],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        if result.returncode != 0:
-            logger.debug(f"Git log failed: {result.stderr}")
-            return []
-
-        commits: list[CommitInfo] = []
-        current_commit: CommitInfo | None = None
-
-        for line in result.stdout.split("\n"):
-            line = line.strip()
-
-            if "|" in line and line.count("|") >= 4:
-                # This is a commit header line
-                if current_commit:
-                    commits.append(current_commit)
-
-                parts = line.split("|", 4)
-                if len(parts) >= 5:
-                    try:
-                        # Parse date (format: 2026-01-13 10:30:00 -0500)
-                        date_str = parts[3].rsplit(" ", 1)[0]  # Remove timezone
-                        date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    except ValueError:
-                        date = datetime.now()
-
-                    current_commit = CommitInfo(
-                        hash=parts[0],
-                        full_hash=parts[1],
-                        author=parts[2],
-                        date=date,
-                        message=parts[4],
-                        files=[],
-                    )
-            elif line and current_commit:
-                # This is a file path
-                current_commit.files.append(line)
-
-        # Don't forget the last commit
-        if current_commit:
-            commits.append(current_commit)
-
-        return commits
-
-    except subprocess.TimeoutExpired:
-        logger.warning("Git log timed out")
-        return []
-    except (FileNotFoundError, OSError) as e:
-        logger.debug(f"Failed to get git history: {e}")
+    git_index = get_git_metadata_index(repo_path)
+    if git_index is None:
+        logger.debug(f"No git history available for {repo_path}")
         return []
 
+    return [
+        CommitInfo(
+            hash=record.commit_hash[:7],
+            full_hash=record.commit_hash,
+            author=record.author,
+            date=record.authored_at,
+            message=record.summary,
+            files=list(record.files),
+        )
+        for record in git_index.recent_commits(limit)
+    ]
+
 
 def build_commit_url(repo_info: GitRepoInfo, commit_hash: str) -> str | None:
     """Build URL to commit on GitHub/GitLab.
@@ -12,11 +12,16 @@ Context includes:
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from local_deepwiki.core.vectorstore import VectorStore
-from local_deepwiki.generators.callgraph import CallGraphExtractor, build_reverse_call_graph
+from local_deepwiki.generators.callgraph import (
+    CallGraphExtractor,
+    CallGraphIndex,
+    build_reverse_call_graph,
+)
 from local_deepwiki.logging import get_logger
-from local_deepwiki.models import ChunkType, CodeChunk
+from local_deepwiki.models import ChunkType, CodeChunk, SearchResult
 
 logger = get_logger(__name__)
 
@@ -87,6 +92,36 @@ def _parse_import_module(import_line: str) -> str | None:
     return None
 
 
+async def _search_many_or_each(
+    vector_store: VectorStore, queries: list[str], description: str, **kwargs: Any
+) -> list[list[SearchResult]]:
+    """Run keyword searches in one batch, retrying them one by one if it fails.
+
+    Args:
+        vector_store: Vector store for searching code.
+        queries: Search queries.
+        description: What the searches are for, used in log messages.
+        **kwargs: Search options passed to both search_many and search.
+
+    Returns:
+        Results per query; a query that fails on its own gets an empty list.
+    """
+    try:
+        return await vector_store.search_many(queries, mode="keyword", **kwargs)
+    except Exception as e:
+        # Retry one query at a time so one bad query only loses its own results
+        logger.debug(f"Batched {description} search failed, searching per query: {e}")
+
+    all_results: list[list[SearchResult]] = []
+    for query in queries:
+        try:
+            all_results.append(await vector_store.search(query, mode="keyword", **kwargs))
+        except Exception as e:
+            logger.debug(f"Error in {description} search for {query}: {e}")
+            all_results.append([])
+    return all_results
+
+
 async def get_callers_from_other_files(
     file_path: str,
     entity_names: list[str],
@@ -107,37 +142,31 @@ async def get_callers_from_other_files(
         Mapping of entity name to list of calling file paths.
     """
     callers: dict[str, list[str]] = {}
-
-    for entity_name in entity_names:
-        if len(entity_name) < 4:  # Skip short names (likely false positives)
-            continue
-
-        # Search for uses of this entity
-        try:
-            results = await vector_store.search(
-                f"{entity_name}(",  # Function call pattern
-                limit=20,
-            )
-
-            caller_files: set[str] = set()
-            for result in results:
-                chunk = result.chunk
-                # Skip the file that defines the entity
-                if chunk.file_path == file_path:
-                    continue
-                # Skip if entity name not actually in the content
-                if entity_name not in chunk.content:
-                    continue
-                caller_files.add(chunk.file_path)
-
-                if len(caller_files) >= max_files:
-                    break
-
-            if caller_files:
-                callers[entity_name] = sorted(caller_files)[:max_files]
-
-        except Exception as e:
-            logger.debug(f"Error searching for callers of {entity_name}: {e}")
+    # Skip short names (likely false positives)
+    names = [name for name in entity_names if len(name) >= 4]
+    if not names:
+        return callers
+
+    # Search for uses of every entity by name in one batch; no embedding needed
+    all_results = await _search_many_or_each(vector_store, names, f"caller ({file_path})", limit=20)
+
+    for entity_name, results in zip(names, all_results):
+        caller_files: set[str] = set()
+        for result in results:
+            chunk = result.chunk
+            # Skip the file that defines the entity
+            if chunk.file_path == file_path:
+                continue
+            # Skip if entity name not actually in the content
+            if entity_name not in chunk.content:
+                continue
+            caller_files.add(chunk.file_path)
+
+            if len(caller_files) >= max_files:
+                break
+
+        if caller_files:
+            callers[entity_name] = sorted(caller_files)[:max_files]
 
     return callers
 
@@ -165,18 +194,17 @@ async def find_related_files(
     """
     related: set[str] = set()
 
+    if not imported_modules:
+        return []
+
     # Find files that this file imports (within same project)
-    for module in imported_modules:
-        try:
-            results = await vector_store.search(
-                f"def {module}" if not module[0].isupper() else f"class {module}",
-                limit=5,
-            )
-            for result in results:
-                if result.chunk.file_path != file_path:
-                    related.add(result.chunk.file_path)
-        except Exception:
-            pass
+    all_results = await _search_many_or_each(
+        vector_store, imported_modules, f"related file ({file_path})", limit=5
+    )
+    for results in all_results:
+        for result in results:
+            if result.chunk.file_path != file_path:
+                related.add(result.chunk.file_path)
 
     return sorted(related)[:max_files]
 
@@ -215,22 +243,22 @@ async def get_type_definitions_used(
             if type_name not in type_names and len(type_name) > 3:
                 type_names.add(type_name)
 
-    # Look up definitions of these types
-    for type_name in list(type_names)[:max_types]:
-        try:
-            results = await vector_store.search(
-                f"class {type_name}",
-                limit=3,
-            )
-            for result in results:
-                if result.chunk.chunk_type == ChunkType.CLASS:
-                    # Get just the class definition line
-                    first_line = result.chunk.content.split("\n")[0]
-                    if type_name in first_line:
-                        type_defs.append(f"{type_name}: {first_line}")
-                        break
-        except Exception:
-            pass
+    lookups = list(type_names)[:max_types]
+    if not lookups:
+        return type_defs
+
+    # Look up definitions of these types in one batch
+    all_results = await _search_many_or_each(
+        vector_store, lookups, "type definition", limit=3, chunk_type=ChunkType.CLASS.value
+    )
+    for type_name, results in zip(lookups, all_results):
+        for result in results:
+            if result.chunk.chunk_type == ChunkType.CLASS:
+                # Get just the class definition line
+                first_line = result.chunk.content.split("\n")[0]
+                if type_name in first_line:
+                    type_defs.append(f"{type_name}: {first_line}")
+                    break
 
     return type_defs
 
@@ -240,6 +268,7 @@ async def build_file_context(
     chunks: list[CodeChunk],
     repo_path: Path,
     vector_store: VectorStore,
+    call_graph_index: CallGraphIndex | None = None,
 ) -> FileContext:
     """Build comprehensive context for a source file.
 
@@ -248,6 +277,8 @@ async def build_file_context(
         chunks: Code chunks for the file.
         repo_path: Repository root path.
         vector_store: Vector store for searching.
+        call_graph_index: Optional call graph index. When given, callers from
+            other files are looked up in it instead of searched for.
 
     Returns:
         FileContext with all extracted information.
@@ -262,12 +293,15 @@ async def build_file_context(
     ]
 
     # Get callers from other files
-    callers = await get_callers_from_other_files(
-        file_path=file_path,
-        entity_names=entity_names,
-        repo_path=repo_path,
-        vector_store=vector_store,
-    )
+    if call_graph_index is not None:
+        callers = call_graph_index.get_cross_file_callers(file_path, entity_names)
+    else:
+        callers = await get_callers_from_other_files(
+            file_path=file_path,
+            entity_names=entity_names,
+            repo_path=repo_path,
+            vector_store=vector_store,
+        )
 
     # Find related files
     related_files = await find_related_files(
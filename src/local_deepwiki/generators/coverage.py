@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.core.vectorstore import ChunkSnapshot, VectorStore
 from local_deepwiki.models import ChunkType, IndexStatus
 
 
@@ -73,18 +73,25 @@ def _has_meaningful_docstring(docstring: str | None) -> bool:
 async def analyze_file_coverage(
     file_path: str,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> FileCoverage:
     """Analyze documentation coverage for a single file.
 
     Args:
         file_path: Path to the source file.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot to read from instead of querying
+            the vector store once per file.
 
     Returns:
         FileCoverage object with statistics.
     """
     coverage = FileCoverage(file_path=file_path)
-    chunks = await vector_store.get_chunks_by_file(file_path)
+    chunks = (
+        snapshot.get_chunks_by_file(file_path)
+        if snapshot is not None
+        else await vector_store.get_chunks_by_file(file_path)
+    )
 
     for chunk in chunks:
         name = chunk.name or "Unknown"
@@ -118,12 +125,14 @@ async def analyze_file_coverage(
 async def analyze_project_coverage(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> tuple[CoverageStats, list[FileCoverage]]:
     """Analyze documentation coverage for the entire project.
 
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot shared across generators.
 
     Returns:
         Tuple of (overall stats, list of per-file coverage).
@@ -132,7 +141,7 @@ async def analyze_project_coverage(
     file_coverages: list[FileCoverage] = []
 
     for file_info in index_status.files:
-        file_coverage = await analyze_file_coverage(file_info.path, vector_store)
+        file_coverage = await analyze_file_coverage(file_info.path, vector_store, snapshot=snapshot)
         file_coverages.append(file_coverage)
 
         # Aggregate stats
@@ -177,17 +186,21 @@ def _get_wiki_link(file_path: str) -> str:
 async def generate_coverage_page(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> str | None:
     """Generate the documentation coverage report page.
 
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot shared across generators.
 
     Returns:
         Markdown content for the coverage page, or None if no entities found.
     """
-    overall, file_coverages = await analyze_project_coverage(index_status, vector_store)
+    overall, file_coverages = await analyze_project_coverage(
+        index_status, vector_store, snapshot=snapshot
+    )
 
     if overall.total_entities == 0:
         return None
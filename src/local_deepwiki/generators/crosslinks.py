@@ -5,7 +5,7 @@ wiki pages when classes, functions, or other documented entities are mentioned.
 """
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -61,6 +61,216 @@ def camel_to_spaced(name: str) -> str | None:
     return spaced if spaced != name else None
 
 
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation for a set of words, factored as a trie.
+
+    Shared prefixes are matched once and greedy optional groups prefer the
+    longest word, so ``Vector Store Config`` wins over ``Vector Store`` at
+    the same position unless a following boundary check forces a backtrack.
+
+    Args:
+        words: Words to match.
+
+    Returns:
+        Regex source matching any of the words (empty if there are none).
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: dict[str, dict]) -> str:
+    """Build the regex source for one trie node.
+
+    Args:
+        node: Trie node mapping characters to child nodes ("" marks a word end).
+
+    Returns:
+        Regex source for the subtree.
+    """
+    branches = [
+        re.escape(char) + _trie_node_pattern(child) for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    alternation = "(?:" + "|".join(branches) + ")"
+    return alternation + "?" if "" in node else alternation
+
+
+@dataclass(frozen=True)
+class _LinkTarget:
+    """A linkable name (entity or alias) and the entity it points to."""
+
+    canonical_name: str
+    entity: EntityInfo
+
+
+# Identifier segments preceding an entity name in `module.EntityName`
+_QUALIFIED_PREFIX = re.compile(r"(?:[a-zA-Z_][a-zA-Z0-9_]*\.)+")
+_WORD_CHAR = re.compile(r"\w")
+
+
+class EntityMatcher:
+    """Single-pass matcher for every linkable entity name and alias.
+
+    All names and aliases are compiled into one trie-shaped regex together
+    with the constructs that must not be rewritten (existing links, headings
+    and inline code), so each text segment is scanned once regardless of
+    how many entities are registered. Matches use longest-match semantics.
+    """
+
+    def __init__(self, entities: dict[str, EntityInfo], aliases: dict[str, str]) -> None:
+        """Build the matcher.
+
+        Args:
+            entities: Mapping of entity name to EntityInfo.
+            aliases: Mapping of alias (spaced name) to canonical entity name.
+        """
+        self._targets: dict[str, _LinkTarget] = {
+            name: _LinkTarget(name, entity) for name, entity in entities.items()
+        }
+        for alias, canonical in aliases.items():
+            entity = entities.get(canonical)
+            if entity and alias not in self._targets:
+                self._targets[alias] = _LinkTarget(canonical, entity)
+
+        self._pattern: re.Pattern[str] | None = None
+        if self._targets:
+            names = _trie_pattern(self._targets)
+            self._pattern = re.compile(
+                r"(?P<link>\[[^\]]+\]\([^)]+\))"
+                r"|(?P<heading>^#{1,6}\s+.+$)"
+                r"|(?P<code>`[^`]+`)"
+                rf"|\*\*(?P<bold>{names})\*\*"
+                rf"|\b(?P<plain>{names})\b",
+                re.MULTILINE,
+            )
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def link_text(
+        self,
+        text: str,
+        excluded: set[str],
+        relative_path: Callable[[str], str],
+    ) -> str:
+        """Replace entity mentions in a prose segment with markdown links.
+
+        Existing links and headings are left untouched. Inline code is linked
+        only when it is exactly an entity name or a qualified name ending in
+        one (`module.EntityName`); bold mentions keep their emphasis.
+
+        Args:
+            text: The text to process (must not contain fenced code blocks).
+            excluded: Canonical entity names that must not be linked.
+            relative_path: Function mapping a target wiki path to a link href.
+
+        Returns:
+            Text with links added.
+        """
+        if self._pattern is None:
+            return text
+
+        hrefs: dict[str, str] = {}
+
+        def href(target: _LinkTarget) -> str:
+            wiki_path = target.entity.wiki_path
+            if wiki_path not in hrefs:
+                hrefs[wiki_path] = relative_path(wiki_path)
+            return hrefs[wiki_path]
+
+        out: list[str] = []
+        last = 0
+        pos = 0
+        while (match := self._pattern.search(text, pos)) is not None:
+            kind = match.lastgroup
+            start, end = match.span()
+
+            if kind in ("link", "heading"):
+                pos = end
+                continue
+
+            if kind == "code":
+                code = match.group(0)[1:-1]
+                target = self._code_target(code, excluded)
+                if target is not None:
+                    out.append(text[last:start])
+                    out.append(f"[`{code}`]({href(target)})")
+                    last = end
+                pos = end
+                continue
+
+            if kind == "bold":
+                name = match.group("bold")
+                target = self._targets[name]
+                if target.canonical_name not in excluded:
+                    out.append(text[last:start])
+                    out.append(f"**[{name}]({href(target)})**")
+                    last = pos = end
+                else:
+                    pos = start + 1
+                continue
+
+            # Plain mention: the regex found the longest name here; fall back
+            # to a shorter one if the longest points at an excluded entity.
+            name = self._longest_linkable(match.group("plain"), excluded)
+            if name is None:
+                pos = start + 1
+                continue
+            out.append(text[last:start])
+            out.append(f"[{name}]({href(self._targets[name])})")
+            last = pos = start + len(name)
+
+        if not out:
+            return text
+        out.append(text[last:])
+        return "".join(out)
+
+    def _code_target(self, code: str, excluded: set[str]) -> _LinkTarget | None:
+        """Resolve inline code to a link target, if it names an entity."""
+        target = self._targets.get(code)
+        if target is None:
+            qualified = _QUALIFIED_PREFIX.match(code)
+            if qualified is not None:
+                target = self._targets.get(code[qualified.end() :])
+        if target is None or target.canonical_name in excluded:
+            return None
+        return target
+
+    def _longest_linkable(self, matched: str, excluded: set[str]) -> str | None:
+        """Find the longest non-excluded name that is a prefix of a match.
+
+        Args:
+            matched: The longest name the regex matched at this position.
+            excluded: Canonical entity names that must not be linked.
+
+        Returns:
+            The name to link, or None if every candidate is excluded.
+        """
+        target = self._targets[matched]
+        if target.canonical_name not in excluded:
+            return matched
+
+        for k in range(len(matched) - 1, 0, -1):
+            candidate = matched[:k]
+            at_boundary = bool(_WORD_CHAR.match(matched[k - 1])) != bool(
+                _WORD_CHAR.match(matched[k])
+            )
+            if not at_boundary:
+                continue
+            candidate_target = self._targets.get(candidate)
+            if candidate_target is not None and candidate_target.canonical_name not in excluded:
+                return candidate
+        return None
+
+
 class EntityRegistry:
     """Registry of documented entities and their wiki page locations.
 
@@ -76,6 +286,8 @@ class EntityRegistry:
         self._aliases: dict[str, str] = {}
         # Map of wiki_path -> list of entities defined in that page
         self._page_entities: dict[str, list[str]] = {}
+        # Compiled matcher for all entities, rebuilt after registrations
+        self._matcher: EntityMatcher | None = None
         # Set of common words to exclude from linking
         self._excluded_names: set[str] = {
             # Python builtins and common names
@@ -175,6 +387,7 @@ class EntityRegistry:
 
         self._entities[name] = entity
         self._page_entities.setdefault(wiki_path, []).append(name)
+        self._matcher = None
 
         # Register spaced alias for CamelCase names
         spaced = camel_to_spaced(name)
@@ -248,6 +461,19 @@ class EntityRegistry:
         """
         return self._entities.copy()
 
+    def get_matcher(self) -> EntityMatcher:
+        """Get the compiled matcher for all registered entities and aliases.
+
+        The matcher is built on first use and reused until another entity
+        is registered.
+
+        Returns:
+            EntityMatcher for the current registry contents.
+        """
+        if self._matcher is None:
+            self._matcher = EntityMatcher(self._entities, self._aliases)
+        return self._matcher
+
     def get_page_entities(self, wiki_path: str) -> list[str]:
         """Get all entities defined in a specific wiki page.
 
@@ -370,160 +596,11 @@ class CrossLinker:
         Returns:
             Text with links added.
         """
-        entities = self.registry.get_all_entities()
-        aliases = self.registry.get_all_aliases()
-
-        if not entities and not aliases:
-            return text
-
-        # Sort by name length (longest first) to avoid partial replacements
-        sorted_names = sorted(entities.keys(), key=len, reverse=True)
-
-        for name in sorted_names:
-            # Skip entities on the current page
-            if name in current_page_entities:
-                continue
-
-            entity = entities[name]
-
-            # Calculate relative path from current page to target
-            rel_path = self._relative_path(current_page, entity.wiki_path)
-
-            # Create the link
-            link = f"[{name}]({rel_path})"
-
-            # Replace mentions of the entity with links
-            # Use word boundaries to avoid partial matches
-            # Also avoid replacing inside existing links or inline code
-            text = self._replace_entity_mentions(text, name, link, rel_path)
-
-        # Also try to match aliases (spaced versions like "Vector Store")
-        # Sort by length (longest first)
-        sorted_aliases = sorted(aliases.keys(), key=len, reverse=True)
-
-        for alias in sorted_aliases:
-            canonical_name = aliases[alias]
-
-            # Skip if canonical entity is on current page
-            if canonical_name in current_page_entities:
-                continue
-
-            alias_entity = entities.get(canonical_name)
-            if not alias_entity:
-                continue
-
-            # Calculate relative path
-            rel_path = self._relative_path(current_page, alias_entity.wiki_path)
-
-            # Create link - use alias as display text
-            link = f"[{alias}]({rel_path})"
-
-            # Replace alias mentions
-            text = self._replace_entity_mentions(text, alias, link, rel_path)
-
-        return text
-
-    def _replace_entity_mentions(
-        self,
-        text: str,
-        entity_name: str,
-        link: str,
-        rel_path: str,
-    ) -> str:
-        """Replace entity mentions with links.
-
-        Args:
-            text: The text to process.
-            entity_name: The entity name to find.
-            link: The markdown link to insert.
-            rel_path: The relative path to the entity's wiki page.
-
-        Returns:
-            Text with entity mentions replaced.
-        """
-        # First, protect existing links and headings by replacing them temporarily
-        protected: list[tuple[str, str]] = []
-        counter = 0
-
-        def protect(match: re.Match) -> str:
-            nonlocal counter
-            placeholder = f"\x00PROTECTED{counter}\x00"
-            protected.append((placeholder, match.group(0)))
-            counter += 1
-            return placeholder
-
-        # Protect existing markdown links and headings
-        temp_text = re.sub(r"\[([^\]]+)\]\([^)]+\)", protect, text)
-        temp_text = re.sub(r"^(#{1,6}\s+.+)$", protect, temp_text, flags=re.MULTILINE)
-
-        # Convert backticked entity names to links: `EntityName` -> [`EntityName`](path)
-        # Also handle qualified names like `module.EntityName` -> [`EntityName`](path)
-        temp_text = self._link_backticked_entities(temp_text, entity_name, rel_path, protect)
-
-        # Protect all remaining inline code (that didn't match entities)
-        temp_text = re.sub(r"`[^`]+`", protect, temp_text)
-
-        # Replace bold entity mentions: **EntityName** -> **[EntityName](path)**
-        bold_pattern = rf"\*\*{re.escape(entity_name)}\*\*"
-        bold_link = f"**[{entity_name}]({rel_path})**"
-        temp_text = re.sub(bold_pattern, bold_link, temp_text)
-
-        # Protect links we just created to avoid double-linking
-        temp_text = re.sub(r"\[([^\]]+)\]\([^)]+\)", protect, temp_text)
-
-        # Also replace plain entity mentions (but not inside headings to avoid breaking them)
-        pattern = rf"\b{re.escape(entity_name)}\b"
-        temp_text = re.sub(pattern, link, temp_text)
-
-        # Restore protected content
-        for placeholder, original in protected:
-            temp_text = temp_text.replace(placeholder, original)
-
-        return temp_text
-
-    def _link_backticked_entities(
-        self,
-        text: str,
-        entity_name: str,
-        rel_path: str,
-        protect: Callable[[re.Match[str]], str],
-    ) -> str:
-        """Convert backticked entity names to links.
-
-        Handles:
-        - `EntityName` -> [`EntityName`](path)
-        - `module.EntityName` -> [`EntityName`](path)
-        - `module.submodule.EntityName` -> [`EntityName`](path)
-
-        Args:
-            text: The text to process.
-            entity_name: The entity name to find.
-            rel_path: The relative path to the entity's wiki page.
-            protect: Function to protect already-processed content.
-
-        Returns:
-            Text with backticked entities converted to links.
-        """
-        # Pattern for exact match: `EntityName`
-        exact_pattern = rf"`{re.escape(entity_name)}`"
-        exact_replacement = f"[`{entity_name}`]({rel_path})"
-        text = re.sub(exact_pattern, exact_replacement, text)
-
-        # Pattern for qualified names: `something.EntityName` or `a.b.EntityName`
-        # Captures the entity name at the end after a dot
-        qualified_pattern = rf"`([a-zA-Z_][a-zA-Z0-9_]*\.)+{re.escape(entity_name)}`"
-
-        def qualified_replacement(match: re.Match) -> str:
-            # Link just the entity name, showing full qualified name
-            full_name = match.group(0)[1:-1]  # Remove backticks
-            return f"[`{full_name}`]({rel_path})"
-
-        text = re.sub(qualified_pattern, qualified_replacement, text)
-
-        # Protect the links we just created
-        text = re.sub(r"\[`[^`]+`\]\([^)]+\)", protect, text)
-
-        return text
+        return self.registry.get_matcher().link_text(
+            text,
+            excluded=current_page_entities,
+            relative_path=lambda wiki_path: self._relative_path(current_page, wiki_path),
+        )
 
     def _relative_path(self, from_path: str, to_path: str) -> str:
         """Calculate relative path between two wiki pages.
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.core.vectorstore import ChunkSnapshot, VectorStore
 from local_deepwiki.models import ChunkType, IndexStatus
 
 
@@ -27,12 +27,15 @@ class EntityEntry:
 async def collect_all_entities(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> list[EntityEntry]:
     """Collect all classes, functions, and methods from the codebase.
 
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot to read from instead of querying
+            the vector store once per file.
 
     Returns:
         List of EntityEntry objects sorted alphabetically by name.
@@ -40,7 +43,11 @@ async def collect_all_entities(
     entities: list[EntityEntry] = []
 
     for file_info in index_status.files:
-        chunks = await vector_store.get_chunks_by_file(file_info.path)
+        chunks = (
+            snapshot.get_chunks_by_file(file_info.path)
+            if snapshot is not None
+            else await vector_store.get_chunks_by_file(file_info.path)
+        )
 
         for chunk in chunks:
             # Extract type annotation metadata if available
@@ -202,17 +209,19 @@ def _format_signature(entity: EntityEntry, max_params: int = 3) -> str:
 async def generate_glossary_page(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> str | None:
     """Generate the glossary/index page content.
 
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot shared across generators.
 
     Returns:
         Markdown content for the glossary page, or None if no entities found.
     """
-    entities = await collect_all_entities(index_status, vector_store)
+    entities = await collect_all_entities(index_status, vector_store, snapshot=snapshot)
 
     if not entities:
         return None
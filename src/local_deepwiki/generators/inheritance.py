@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.core.vectorstore import ChunkSnapshot, VectorStore
 from local_deepwiki.generators.diagrams import sanitize_mermaid_name
 from local_deepwiki.models import ChunkType, IndexStatus
 
@@ -23,12 +23,15 @@ class ClassNode:
 async def collect_class_hierarchy(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> dict[str, ClassNode]:
     """Collect all classes and their inheritance relationships.
 
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot to read from instead of querying
+            the vector store once per file.
 
     Returns:
         Dictionary mapping class name to ClassNode.
@@ -37,7 +40,11 @@ async def collect_class_hierarchy(
 
     # Iterate through all indexed files
     for file_info in index_status.files:
-        chunks = await vector_store.get_chunks_by_file(file_info.path)
+        chunks = (
+            snapshot.get_chunks_by_file(file_info.path)
+            if snapshot is not None
+            else await vector_store.get_chunks_by_file(file_info.path)
+        )
 
         for chunk in chunks:
             if chunk.chunk_type != ChunkType.CLASS:
@@ -234,17 +241,19 @@ def generate_inheritance_tree_text(
 async def generate_inheritance_page(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> str | None:
     """Generate the inheritance documentation page content.
 
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot shared across generators.
 
     Returns:
         Markdown content for the inheritance page, or None if no inheritance found.
     """
-    classes = await collect_class_hierarchy(index_status, vector_store)
+    classes = await collect_class_hierarchy(index_status, vector_store, snapshot=snapshot)
 
     if not classes:
         return None
@@ -131,6 +131,28 @@ class GenerationProgress:
         self._log(f"[{phase}] Started (total: {total})")
         self._write_status()
 
+    def record_phase(self, phase: str, started_at: float, items_completed: int = 0) -> None:
+        """Record a phase that ran alongside the current one and has finished.
+
+        Unlike start_phase/complete_phase, this leaves the live phase (and its
+        file counts) untouched, so concurrently running work can still be
+        reported in the summary.
+
+        Args:
+            phase: Name of the phase.
+            started_at: When the phase started (time.time()).
+            items_completed: Items the phase produced.
+        """
+        self._phase_stats[phase] = PhaseStats(
+            name=phase,
+            started_at=started_at,
+            ended_at=time.time(),
+            items_completed=items_completed,
+            items_total=items_completed,
+        )
+        self._log(f"[{phase}] Complete ({items_completed} items)")
+        self._write_status()
+
     def start_file(self, file_path: str) -> None:
         """Mark a file as being processed.
 
@@ -0,0 +1,257 @@
+"""Dependency-ordered concurrent scheduling of wiki generation tasks.
+
+Wiki generation is a set of tasks (one per page or page family, plus the
+passes that post-process the whole page set) with a few dependencies between
+them. PageScheduler starts every task as soon as the tasks it depends on have
+finished, so independent LLM pages overlap and a full build takes about as
+long as its longest dependency chain rather than the sum of all tasks. The
+LLM calls themselves are bounded by one shared budget: wrap the provider in
+ConcurrencyLimitedLLMProvider and hand that to every task.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from local_deepwiki.models import ProgressCallback
+from local_deepwiki.providers.base import LLMProvider
+
+
+@dataclass
+class PageTask:
+    """A unit of wiki generation work.
+
+    Attributes:
+        name: Unique task name, referenced by other tasks' depends_on.
+        run: Coroutine function doing the work; its return value is the
+            task's result.
+        depends_on: Names of tasks that must finish before this one starts.
+        description: Progress message reported when the task starts.
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    description: str = ""
+
+
+@dataclass
+class TaskTiming:
+    """When a task ran, relative to the start of the schedule."""
+
+    name: str
+    started_at: float
+    finished_at: float
+    depends_on: tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get how long the task ran."""
+        return self.finished_at - self.started_at
+
+
+class PageScheduler:
+    """Run PageTasks concurrently in dependency order."""
+
+    def __init__(
+        self,
+        tasks: list[PageTask],
+        progress_callback: ProgressCallback | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            tasks: Tasks to run. Their order breaks ties: of the tasks that
+                become ready together, earlier ones start first.
+            progress_callback: Optional callback, called as each task with a
+                description starts.
+
+        Raises:
+            ValueError: If task names repeat, a dependency is unknown, or the
+                dependencies form a cycle.
+        """
+        self._tasks = {task.name: task for task in tasks}
+        if len(self._tasks) != len(tasks):
+            raise ValueError("Task names must be unique")
+        for task in tasks:
+            unknown = [name for name in task.depends_on if name not in self._tasks]
+            if unknown:
+                raise ValueError(f"Task {task.name!r} depends on unknown tasks: {unknown}")
+        self._check_acyclic()
+        self._progress_callback = progress_callback
+        # Filled in as tasks finish, so a task can read its dependencies' results
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, TaskTiming] = {}
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if the dependencies contain a cycle."""
+        remaining = {name: set(task.depends_on) for name, task in self._tasks.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Task dependencies form a cycle among: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    async def run(self) -> dict[str, Any]:
+        """Run every task, each once all its dependencies have finished.
+
+        Returns:
+            Mapping of task name to the task's result (also kept as results).
+
+        Raises:
+            Exception: The first exception raised by a task; tasks still
+                running are cancelled.
+        """
+        results = self.results
+        pending = dict(self._tasks)
+        running: dict[asyncio.Task[Any], str] = {}
+        total = len(pending)
+        origin = time.monotonic()
+
+        async def timed(task: PageTask) -> Any:
+            started = time.monotonic() - origin
+            try:
+                return await task.run()
+            finally:
+                self.timings[task.name] = TaskTiming(
+                    name=task.name,
+                    started_at=started,
+                    finished_at=time.monotonic() - origin,
+                    depends_on=task.depends_on,
+                )
+
+        try:
+            while pending or running:
+                for name, task in list(pending.items()):
+                    if all(dep in results for dep in task.depends_on):
+                        del pending[name]
+                        if task.description and self._progress_callback:
+                            self._progress_callback(task.description, len(results), total)
+                        running[asyncio.create_task(timed(task))] = name
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    name = running.pop(finished)
+                    # Re-raises the task's exception, cancelling the rest below
+                    results[name] = finished.result()
+        finally:
+            for running_task in running:
+                running_task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return results
+
+    def critical_path(self) -> list[str]:
+        """Get the chain of tasks that determined the total run time.
+
+        Walks back from the task that finished last, at each step taking the
+        dependency that finished last.
+
+        Returns:
+            Task names from first to last; empty before run().
+        """
+        if not self.timings:
+            return []
+        current = max(self.timings.values(), key=lambda t: t.finished_at)
+        path = [current.name]
+        while current.depends_on:
+            current = max(
+                (self.timings[name] for name in current.depends_on),
+                key=lambda t: t.finished_at,
+            )
+            path.append(current.name)
+        return path[::-1]
+
+
+class ConcurrencyLimitedLLMProvider(LLMProvider):
+    """LLM provider wrapper that caps how many requests are in flight at once.
+
+    Every generation task shares one instance, so the cap is a global budget
+    across pages rather than a per-phase limit.
+    """
+
+    def __init__(self, provider: LLMProvider, max_concurrent: int):
+        """Initialize the wrapper.
+
+        Args:
+            provider: The underlying LLM provider.
+            max_concurrent: Maximum requests in flight at once.
+        """
+        self._provider = provider
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    @property
+    def name(self) -> str:
+        """Get the underlying provider's name."""
+        return self._provider.name
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the underlying provider's tokenizer."""
+        return self._provider.count_tokens(text)
+
+    async def flush(self) -> None:
+        """Flush the underlying provider."""
+        await self._provider.flush()
+
+    def close(self) -> None:
+        """Close the underlying provider."""
+        self._provider.close()
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> str:
+        """Generate text once a slot in the budget is free.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+
+        Returns:
+            Generated text.
+        """
+        async with self._semaphore:
+            return await self._provider.generate(
+                prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """Stream generated text, holding a slot until the stream ends.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+
+        Yields:
+            Text chunks.
+        """
+        async with self._semaphore:
+            async for chunk in self._provider.generate_stream(
+                prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            ):
+                yield chunk
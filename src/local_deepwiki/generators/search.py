@@ -9,7 +9,7 @@ import json
 import re
 from pathlib import Path
 
-from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.core.vectorstore import ChunkSnapshot, VectorStore
 from local_deepwiki.models import ChunkType, IndexStatus, WikiPage
 
 
@@ -123,6 +123,7 @@ def generate_search_index(pages: list[WikiPage]) -> list[dict]:
 async def generate_entity_entries(
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> list[dict]:
     """Generate search entries for individual code entities.
 
@@ -132,6 +133,8 @@ async def generate_entity_entries(
     Args:
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot to read from instead of querying
+            the vector store once per file.
 
     Returns:
         List of entity search entries.
@@ -139,7 +142,11 @@ async def generate_entity_entries(
     entries: list[dict] = []
 
     for file_info in index_status.files:
-        chunks = await vector_store.get_chunks_by_file(file_info.path)
+        chunks = (
+            snapshot.get_chunks_by_file(file_info.path)
+            if snapshot is not None
+            else await vector_store.get_chunks_by_file(file_info.path)
+        )
 
         for chunk in chunks:
             if chunk.chunk_type not in (ChunkType.CLASS, ChunkType.FUNCTION, ChunkType.METHOD):
@@ -263,6 +270,7 @@ async def generate_full_search_index(
     pages: list[WikiPage],
     index_status: IndexStatus | None = None,
     vector_store: VectorStore | None = None,
+    snapshot: ChunkSnapshot | None = None,
 ) -> dict:
     """Generate a comprehensive search index with pages and entities.
 
@@ -270,6 +278,7 @@ async def generate_full_search_index(
         pages: List of wiki pages.
         index_status: Optional index status for entity extraction.
         vector_store: Optional vector store for entity extraction.
+        snapshot: Optional chunk snapshot shared across generators.
 
     Returns:
         Dictionary with 'pages' and 'entities' lists.
@@ -278,7 +287,9 @@ async def generate_full_search_index(
 
     entity_entries: list[dict] = []
     if index_status and vector_store:
-        entity_entries = await generate_entity_entries(index_status, vector_store)
+        entity_entries = await generate_entity_entries(
+            index_status, vector_store, snapshot=snapshot
+        )
 
     return {
         "pages": page_entries,
@@ -311,6 +322,7 @@ async def write_full_search_index(
     pages: list[WikiPage],
     index_status: IndexStatus,
     vector_store: VectorStore,
+    snapshot: ChunkSnapshot | None = None,
 ) -> Path:
     """Generate and write comprehensive search index to disk.
 
@@ -321,11 +333,12 @@ async def write_full_search_index(
         pages: List of wiki pages.
         index_status: Index status with file information.
         vector_store: Vector store with code chunks.
+        snapshot: Optional chunk snapshot shared across generators.
 
     Returns:
         Path to the generated search.json file.
     """
-    index = await generate_full_search_index(pages, index_status, vector_store)
+    index = await generate_full_search_index(pages, index_status, vector_store, snapshot=snapshot)
     index_path = wiki_path / "search.json"
     index_path.write_text(json.dumps(index, indent=2))
     return index_path
@@ -10,9 +10,11 @@ from datetime import datetime
 from pathlib import Path
 
 from local_deepwiki.core.git_utils import (
+    GitMetadataIndex,
     StaleInfo,
     check_page_staleness,
     format_blame_date,
+    get_git_metadata_index,
 )
 from local_deepwiki.logging import get_logger
 from local_deepwiki.models import WikiGenerationStatus, WikiPage
@@ -34,6 +36,7 @@ def analyze_staleness(
     repo_path: Path,
     wiki_status: WikiGenerationStatus,
     stale_threshold_days: int = 0,
+    git_index: GitMetadataIndex | None = None,
 ) -> StaleReport:
     """Analyze all wiki pages for staleness.
 
@@ -41,11 +44,14 @@ def analyze_staleness(
         repo_path: Path to the repository root.
         wiki_status: Wiki generation status with page info.
         stale_threshold_days: Minimum days to consider a page stale.
+        git_index: Optional git metadata index; fetched once if not given.
 
     Returns:
         StaleReport with analysis results.
     """
     stale_info: list[StaleInfo] = []
+    if git_index is None:
+        git_index = get_git_metadata_index(repo_path)
 
     for page_path, page_status in wiki_status.pages.items():
         # Skip non-file pages (overview, architecture, etc.)
@@ -58,6 +64,7 @@ def analyze_staleness(
             generated_at=page_status.generated_at,
             source_files=page_status.source_files,
             stale_threshold_days=stale_threshold_days,
+            git_index=git_index,
         )
 
         if info:
@@ -78,6 +85,7 @@ def generate_stale_report_page(
     repo_path: Path,
     wiki_status: WikiGenerationStatus,
     stale_threshold_days: int = 0,
+    git_index: GitMetadataIndex | None = None,
 ) -> WikiPage:
     """Generate a wiki page reporting potentially stale documentation.
 
@@ -85,11 +93,12 @@ def generate_stale_report_page(
         repo_path: Path to the repository root.
         wiki_status: Wiki generation status with page info.
         stale_threshold_days: Minimum days to consider a page stale.
+        git_index: Optional git metadata index; fetched once if not given.
 
     Returns:
         WikiPage with the stale documentation report.
     """
-    report = analyze_staleness(repo_path, wiki_status, stale_threshold_days)
+    report = analyze_staleness(repo_path, wiki_status, stale_threshold_days, git_index)
 
     lines = [
         "# Documentation Freshness Report",
@@ -202,6 +211,7 @@ def add_stale_banners(
         List of wiki pages with banners added where appropriate.
     """
     updated_pages: list[WikiPage] = []
+    git_index = get_git_metadata_index(repo_path)
 
     for page in pages:
         page_status = wiki_status.pages.get(page.path)
@@ -213,6 +223,7 @@ def add_stale_banners(
                 generated_at=page_status.generated_at,
                 source_files=page_status.source_files,
                 stale_threshold_days=stale_threshold_days,
+                git_index=git_index,
             )
 
             if stale_info:
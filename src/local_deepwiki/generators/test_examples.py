@@ -11,7 +11,7 @@ from textwrap import dedent
 
 from tree_sitter import Node
 
-from local_deepwiki.core.parser import CodeParser
+from local_deepwiki.core.parse_cache import get_parse_cache
 from local_deepwiki.logging import get_logger
 from local_deepwiki.models import Language
 
@@ -327,17 +327,12 @@ def extract_examples_for_entities(
     Returns:
         List of UsageExample objects.
     """
-    parser = CodeParser()
-
-    try:
-        source = test_file.read_bytes()
-    except (OSError, IOError) as e:
-        logger.warning(f"Failed to read test file {test_file}: {e}")
+    parsed = get_parse_cache().get(test_file)
+    if parsed is None or parsed.language != Language.PYTHON:
         return []
 
-    root = parser.parse_source(source, Language.PYTHON)
-
-    test_functions = _find_test_functions(root)
+    source = parsed.source
+    test_functions = _find_test_functions(parsed.root)
     examples: list[UsageExample] = []
     entity_counts: dict[str, int] = {}
 
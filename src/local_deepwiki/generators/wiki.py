@@ -1,12 +1,16 @@
 """Wiki documentation generator using LLM providers."""
 
+import asyncio
 import hashlib
 import json
 import time
 from pathlib import Path
+from typing import Awaitable, Callable
 
 from local_deepwiki.config import Config, get_config
-from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.core.llm_cache import exact_lookups_only
+from local_deepwiki.core.vectorstore import ChunkSnapshot, VectorStore
+from local_deepwiki.generators.callgraph import CALL_GRAPH_INDEX_FILE, CallGraphIndex
 from local_deepwiki.generators.coverage import generate_coverage_page
 from local_deepwiki.generators.crosslinks import EntityRegistry, add_cross_links
 from local_deepwiki.generators.stale_detection import generate_stale_report_page
@@ -14,6 +18,12 @@ from local_deepwiki.generators.glossary import generate_glossary_page
 from local_deepwiki.generators.inheritance import generate_inheritance_page
 from local_deepwiki.generators.manifest import ProjectManifest, get_cached_manifest
 from local_deepwiki.generators.progress_tracker import GenerationProgress
+from local_deepwiki.generators.scheduler import (
+    ConcurrencyLimitedLLMProvider,
+    PageScheduler,
+    PageTask,
+    TaskTiming,
+)
 from local_deepwiki.generators.search import write_full_search_index
 from local_deepwiki.generators.see_also import RelationshipAnalyzer, add_see_also_sections
 from local_deepwiki.generators.source_refs import add_source_refs_sections
@@ -29,12 +39,14 @@ from local_deepwiki.generators.wiki_pages import (
 from local_deepwiki.generators.wiki_status import WikiStatusManager
 from local_deepwiki.logging import get_logger
 from local_deepwiki.models import (
+    ChunkType,
     IndexStatus,
     ProgressCallback,
     WikiGenerationStatus,
     WikiPage,
     WikiStructure,
 )
+from local_deepwiki.providers.base import LLMProvider
 from local_deepwiki.providers.llm import get_llm_provider
 
 logger = get_logger(__name__)
@@ -86,34 +98,52 @@ class WikiGenerator:
         # Repository path (set during generation)
         self._repo_path: Path | None = None
 
-    def _get_main_definition_lines(self) -> dict[str, tuple[int, int]]:
+        # Chunk snapshot shared by whole-repo generators (loaded per generation)
+        self._chunk_snapshot_task: asyncio.Task[ChunkSnapshot] | None = None
+
+        # Start/finish time of each generation task in the last generate()
+        self.task_timings: dict[str, TaskTiming] = {}
+
+    async def _get_main_definition_lines(self) -> dict[str, tuple[int, int]]:
         """Get line range of main definition (first class or function) per file.
 
         Returns:
             Dict mapping file_path to (start_line, end_line) tuple.
         """
-        table = self.vector_store._get_table()
-        if table is None:
-            return {}
+        classes: dict[str, tuple[int, int]] = {}
+        functions: dict[str, tuple[int, int]] = {}
+
+        for chunk in await self._get_chunk_snapshot():
+            if chunk.chunk_type == ChunkType.CLASS:
+                first = classes
+            elif chunk.chunk_type == ChunkType.FUNCTION:
+                first = functions
+            else:
+                continue
+            current = first.get(chunk.file_path)
+            if current is None or chunk.start_line < current[0]:
+                first[chunk.file_path] = (chunk.start_line, chunk.end_line)
 
-        df = table.to_pandas()
-        result: dict[str, tuple[int, int]] = {}
+        # Prefer the first class definition, falling back to the first function
+        return {**functions, **classes}
 
-        for file_path, group in df.groupby("file_path"):
-            # Sort by start_line to get first definitions
-            classes = group[group["chunk_type"] == "class"].sort_values(by="start_line")  # type: ignore[call-overload]
-            functions = group[group["chunk_type"] == "function"].sort_values(by="start_line")  # type: ignore[call-overload]
+    async def _get_chunk_snapshot(self) -> ChunkSnapshot:
+        """Get the chunk snapshot shared by whole-repo generators.
 
-            if not classes.empty:
-                # Use first class definition
-                row = classes.iloc[0]
-                result[str(file_path)] = (int(row["start_line"]), int(row["end_line"]))
-            elif not functions.empty:
-                # Use first function definition
-                row = functions.iloc[0]
-                result[str(file_path)] = (int(row["start_line"]), int(row["end_line"]))
+        Loaded with a single table scan the first time it is needed during a
+        generation run, then reused by the glossary, coverage, inheritance and
+        search index generators. The scan runs in a worker thread so page
+        tasks in flight keep going, and concurrent callers share it.
 
-        return result
+        Returns:
+            ChunkSnapshot of every indexed chunk.
+        """
+        if self._chunk_snapshot_task is None:
+            self._chunk_snapshot_task = asyncio.create_task(
+                asyncio.to_thread(self.vector_store.snapshot)
+            )
+        # Shielded so a cancelled caller does not cancel the scan others await
+        return await asyncio.shield(self._chunk_snapshot_task)
 
     async def generate(
         self,
@@ -131,17 +161,36 @@ class WikiGenerator:
         Returns:
             WikiStructure with generated pages.
         """
+        # Wiki prompts only ever repeat verbatim, so a cached LLM never needs
+        # similarity lookups here
+        with exact_lookups_only():
+            return await self._generate(index_status, progress_callback, full_rebuild)
+
+    async def _generate(
+        self,
+        index_status: IndexStatus,
+        progress_callback: ProgressCallback | None,
+        full_rebuild: bool,
+    ) -> WikiStructure:
+        """Generate wiki documentation; see generate().
+
+        Pages are built by a PageScheduler: every page family runs as soon as
+        generation starts, all LLM calls share one concurrency budget
+        (config.wiki.max_concurrent_llm_calls), and the passes over the whole
+        page set (cross-links, source refs, See Also, search index, TOC) wait
+        for every page.
+        """
         logger.info(f"Starting wiki generation for {index_status.repo_path}")
         logger.debug(f"Full rebuild: {full_rebuild}, Total files: {index_status.total_files}")
 
+        # Chunks may have changed since the last run; reload lazily
+        self._chunk_snapshot_task = None
+
         # Initialize live progress tracker
         self._progress = GenerationProgress(wiki_path=self.wiki_path)
         self._progress.start_phase("initializing", total=0)
 
-        pages: list[WikiPage] = []
-        total_steps = 13  # overview, architecture, modules, files, dependencies, changelog, inheritance, glossary, coverage, cross-links, see-also, search, freshness
-        pages_generated = 0
-        pages_skipped = 0
+        counts = {"generated": 0, "skipped": 0}
 
         # Store repo path and parse manifest for grounded generation (with caching)
         self._repo_path = Path(index_status.repo_path)
@@ -156,231 +205,219 @@ class WikiGenerator:
             await self.status_manager.load_status()
 
         # Pre-compute line info for source files (for source refs with line numbers)
-        self.status_manager.file_line_info = self._get_main_definition_lines()
-
-        # Generate index page (overview) - depends on all files
-        if progress_callback:
-            progress_callback("Generating overview", 0, total_steps)
-
-        overview_path = "index.md"
-        overview_page: WikiPage
-        if full_rebuild or self.status_manager.needs_regeneration(overview_path, all_source_files):
-            overview_page = await self._generate_overview(index_status)
-            pages_generated += 1
-        else:
-            existing_page = await self.status_manager.load_existing_page(overview_path)
-            if existing_page is None:
-                overview_page = await self._generate_overview(index_status)
-                pages_generated += 1
-            else:
-                overview_page = existing_page
-                pages_skipped += 1
-
-        pages.append(overview_page)
-        self.status_manager.record_page_status(overview_page, all_source_files)
-        await self._write_page(overview_page)
-
-        # Generate architecture page - depends on all files
-        if progress_callback:
-            progress_callback("Generating architecture docs", 1, total_steps)
-
-        architecture_path = "architecture.md"
-        architecture_page: WikiPage
-        if full_rebuild or self.status_manager.needs_regeneration(
-            architecture_path, all_source_files
-        ):
-            architecture_page = await self._generate_architecture(index_status)
-            pages_generated += 1
-        else:
-            existing_arch_page = await self.status_manager.load_existing_page(architecture_path)
-            if existing_arch_page is None:
-                architecture_page = await self._generate_architecture(index_status)
-                pages_generated += 1
-            else:
-                architecture_page = existing_arch_page
-                pages_skipped += 1
-
-        pages.append(architecture_page)
-        self.status_manager.record_page_status(architecture_page, all_source_files)
-        await self._write_page(architecture_page)
-
-        # Collect import chunks for relationship analysis (needed for See Also)
-        import_results = await self.vector_store.search(
-            "import require include",
-            limit=self.config.wiki.import_search_limit,
-        )
-        import_chunks = [r.chunk for r in import_results if r.chunk.chunk_type.value == "import"]
-        self.relationship_analyzer.analyze_chunks(import_chunks)
-
-        # Generate module pages
-        if progress_callback:
-            progress_callback("Generating module documentation", 2, total_steps)
-
-        # Track module docs phase
-        self._progress.start_phase("modules", total=0)
-
-        module_pages, gen_count, skip_count = await generate_module_docs(
-            index_status=index_status,
-            vector_store=self.vector_store,
-            llm=self.llm,
-            system_prompt=self._system_prompt,
-            status_manager=self.status_manager,
-            full_rebuild=full_rebuild,
-        )
-        pages_generated += gen_count
-        pages_skipped += skip_count
+        self.status_manager.file_line_info = await self._get_main_definition_lines()
 
-        # Update module stats and write pages
-        self._progress._phase_stats["modules"].items_completed = len(module_pages)
-        self._progress.complete_phase()
+        # One budget for every LLM call, whichever page it is for
+        llm = ConcurrencyLimitedLLMProvider(self.llm, self.config.wiki.max_concurrent_llm_calls)
 
-        for page in module_pages:
-            pages.append(page)
+        async def add_page(page: WikiPage, source_files: list[str], generated: bool) -> None:
+            counts["generated" if generated else "skipped"] += 1
+            self.status_manager.record_page_status(page, source_files)
             await self._write_page(page)
 
-        # Generate file-level documentation
-        if progress_callback:
-            progress_callback("Generating file documentation", 3, total_steps)
-
-        file_pages, gen_count, skip_count = await generate_file_docs(
-            index_status=index_status,
-            vector_store=self.vector_store,
-            llm=self.llm,
-            system_prompt=self._system_prompt,
-            status_manager=self.status_manager,
-            entity_registry=self.entity_registry,
-            config=self.config,
-            progress_callback=progress_callback,
-            full_rebuild=full_rebuild,
-            write_callback=self._write_page,  # Write pages as they complete
-            generation_progress=self._progress,  # Live status tracking
-        )
-        pages_generated += gen_count
-        pages_skipped += skip_count
-        # Pages already written by write_callback, just add to list
-        pages.extend(file_pages)
-
-        # Generate dependencies page - depends on all files
-        if progress_callback:
-            progress_callback("Generating dependencies", 4, total_steps)
-
-        deps_path = "dependencies.md"
-        deps_page: WikiPage
-        deps_source_files: list[str]
-        if full_rebuild or self.status_manager.needs_regeneration(deps_path, all_source_files):
-            deps_page, deps_source_files = await self._generate_dependencies(index_status)
-            pages_generated += 1
-        else:
-            existing_deps_page = await self.status_manager.load_existing_page(deps_path)
-            if existing_deps_page is None:
-                deps_page, deps_source_files = await self._generate_dependencies(index_status)
-                pages_generated += 1
-            else:
-                deps_page = existing_deps_page
+        async def overview() -> list[WikiPage]:
+            # Depends on all files
+            page, generated = await self._regenerate_or_load(
+                "index.md",
+                all_source_files,
+                full_rebuild,
+                lambda: self._generate_overview(index_status, llm),
+            )
+            await add_page(page, all_source_files, generated)
+            return [page]
+
+        async def architecture() -> list[WikiPage]:
+            # Depends on all files
+            page, generated = await self._regenerate_or_load(
+                "architecture.md",
+                all_source_files,
+                full_rebuild,
+                lambda: self._generate_architecture(index_status, llm),
+            )
+            await add_page(page, all_source_files, generated)
+            return [page]
+
+        async def imports() -> None:
+            # Collect import chunks for relationship analysis (needed for See Also)
+            import_results = await self.vector_store.search(
+                "import require include",
+                limit=self.config.wiki.import_search_limit,
+                chunk_type="import",
+            )
+            import_chunks = [r.chunk for r in import_results]
+            self.relationship_analyzer.analyze_chunks(import_chunks)
+
+        async def modules() -> list[WikiPage]:
+            started_at = time.time()
+            module_pages, gen_count, skip_count = await generate_module_docs(
+                index_status=index_status,
+                vector_store=self.vector_store,
+                llm=llm,
+                system_prompt=self._system_prompt,
+                status_manager=self.status_manager,
+                full_rebuild=full_rebuild,
+            )
+            counts["generated"] += gen_count
+            counts["skipped"] += skip_count
+            # Runs alongside file docs, which own the live phase
+            self._progress.record_phase("modules", started_at, len(module_pages))
+            for page in module_pages:
+                await self._write_page(page)
+            return module_pages
+
+        async def files() -> list[WikiPage]:
+            file_pages, gen_count, skip_count = await generate_file_docs(
+                index_status=index_status,
+                vector_store=self.vector_store,
+                llm=llm,
+                system_prompt=self._system_prompt,
+                status_manager=self.status_manager,
+                entity_registry=self.entity_registry,
+                config=self.config,
+                progress_callback=progress_callback,
+                full_rebuild=full_rebuild,
+                write_callback=self._write_page,  # Write pages as they complete
+                generation_progress=self._progress,  # Live status tracking
+                call_graph_index=CallGraphIndex.load(
+                    self.wiki_path / CALL_GRAPH_INDEX_FILE, index_status.files
+                ),
+            )
+            counts["generated"] += gen_count
+            counts["skipped"] += skip_count
+            # Pages already written by write_callback
+            return file_pages
+
+        async def dependencies() -> list[WikiPage]:
+            # Depends on all files
+            deps_path = "dependencies.md"
+            deps_source_files = all_source_files
+
+            async def generate_deps() -> WikiPage:
+                nonlocal deps_source_files
+                page, deps_source_files = await self._generate_dependencies(index_status, llm)
+                return page
+
+            page, generated = await self._regenerate_or_load(
+                deps_path, all_source_files, full_rebuild, generate_deps
+            )
+            if not generated:
                 # Use source files from previous status if available
                 prev_status = self.status_manager.page_statuses.get(deps_path) or (
                     self.status_manager.previous_status.pages.get(deps_path)
                     if self.status_manager.previous_status
                     else None
                 )
-                deps_source_files = prev_status.source_files if prev_status else all_source_files
-                pages_skipped += 1
-
-        pages.append(deps_page)
-        self.status_manager.record_page_status(deps_page, deps_source_files)
-        await self._write_page(deps_page)
-
-        # Generate changelog page from git history
-        if progress_callback:
-            progress_callback("Generating changelog", 5, total_steps)
-
-        changelog_page = await self._generate_changelog()
-        if changelog_page:
-            pages.append(changelog_page)
-            self.status_manager.record_page_status(changelog_page, all_source_files)
-            await self._write_page(changelog_page)
-            pages_generated += 1
-
-        # Generate inheritance page
-        if progress_callback:
-            progress_callback("Generating inheritance tree", 6, total_steps)
-
-        inheritance_content = await generate_inheritance_page(index_status, self.vector_store)
-        if inheritance_content:
-            inheritance_page = WikiPage(
-                path="inheritance.md",
-                title="Class Inheritance",
-                content=inheritance_content,
-                generated_at=time.time(),
-            )
-            pages.append(inheritance_page)
-            self.status_manager.record_page_status(inheritance_page, all_source_files)
-            await self._write_page(inheritance_page)
-            pages_generated += 1
-
-        # Generate glossary page
-        if progress_callback:
-            progress_callback("Generating glossary", 7, total_steps)
-
-        glossary_content = await generate_glossary_page(index_status, self.vector_store)
-        if glossary_content:
-            glossary_page = WikiPage(
-                path="glossary.md",
-                title="Glossary",
-                content=glossary_content,
-                generated_at=time.time(),
+                if prev_status:
+                    deps_source_files = prev_status.source_files
+            await add_page(page, deps_source_files, generated)
+            return [page]
+
+        async def changelog() -> list[WikiPage]:
+            # Generate changelog page from git history
+            changelog_page = await self._generate_changelog()
+            if not changelog_page:
+                return []
+            await add_page(changelog_page, all_source_files, True)
+            return [changelog_page]
+
+        def report_page(
+            path: str, title: str, generate_content: Callable[..., Awaitable[str | None]]
+        ) -> Callable[[], Awaitable[list[WikiPage]]]:
+            async def run() -> list[WikiPage]:
+                content = await generate_content(
+                    index_status, self.vector_store, snapshot=await self._get_chunk_snapshot()
+                )
+                if not content:
+                    return []
+                page = WikiPage(path=path, title=title, content=content, generated_at=time.time())
+                await add_page(page, all_source_files, True)
+                return [page]
+
+            return run
+
+        # Page order in the final wiki, independent of completion order
+        page_tasks = [
+            PageTask("overview", overview, description="Generating overview"),
+            PageTask("architecture", architecture, description="Generating architecture docs"),
+            PageTask("modules", modules, description="Generating module documentation"),
+            PageTask("files", files, description="Generating file documentation"),
+            PageTask("dependencies", dependencies, description="Generating dependencies"),
+            PageTask("changelog", changelog, description="Generating changelog"),
+            PageTask(
+                "inheritance",
+                report_page("inheritance.md", "Class Inheritance", generate_inheritance_page),
+                description="Generating inheritance tree",
+            ),
+            PageTask(
+                "glossary",
+                report_page("glossary.md", "Glossary", generate_glossary_page),
+                description="Generating glossary",
+            ),
+            PageTask(
+                "coverage",
+                report_page("coverage.md", "Documentation Coverage", generate_coverage_page),
+                description="Generating coverage report",
+            ),
+        ]
+        page_task_names = tuple(task.name for task in page_tasks)
+
+        async def links() -> list[WikiPage]:
+            pages = [page for name in page_task_names for page in scheduler.results[name]]
+
+            # Apply cross-links to all pages
+            pages = add_cross_links(pages, self.entity_registry)
+
+            # Add Relevant Source Files sections with local wiki links
+            pages = add_source_refs_sections(
+                pages, self.status_manager.page_statuses, self.wiki_path
             )
-            pages.append(glossary_page)
-            self.status_manager.record_page_status(glossary_page, all_source_files)
-            await self._write_page(glossary_page)
-            pages_generated += 1
 
-        # Generate coverage report page
-        if progress_callback:
-            progress_callback("Generating coverage report", 8, total_steps)
-
-        coverage_content = await generate_coverage_page(index_status, self.vector_store)
-        if coverage_content:
-            coverage_page = WikiPage(
-                path="coverage.md",
-                title="Documentation Coverage",
-                content=coverage_content,
-                generated_at=time.time(),
+            # Add See Also sections
+            pages = add_see_also_sections(pages, self.relationship_analyzer)
+
+            # Re-write pages with cross-links and See Also sections
+            for page in pages:
+                await self._write_page(page)
+            return pages
+
+        async def search() -> None:
+            # Generate search index with entity-level entries
+            await write_full_search_index(
+                self.wiki_path,
+                scheduler.results["links"],
+                index_status,
+                self.vector_store,
+                snapshot=await self._get_chunk_snapshot(),
             )
-            pages.append(coverage_page)
-            self.status_manager.record_page_status(coverage_page, all_source_files)
-            await self._write_page(coverage_page)
-            pages_generated += 1
 
-        # Apply cross-links to all pages
-        if progress_callback:
-            progress_callback("Adding cross-links", 9, total_steps)
-
-        pages = add_cross_links(pages, self.entity_registry)
-
-        # Add Relevant Source Files sections with local wiki links
-        pages = add_source_refs_sections(pages, self.status_manager.page_statuses, self.wiki_path)
-
-        # Add See Also sections
-        if progress_callback:
-            progress_callback("Adding See Also sections", 10, total_steps)
-
-        pages = add_see_also_sections(pages, self.relationship_analyzer)
-
-        # Re-write pages with cross-links and See Also sections
-        for page in pages:
-            await self._write_page(page)
-
-        # Generate search index with entity-level entries
-        if progress_callback:
-            progress_callback("Generating search index", 11, total_steps)
+        async def toc() -> None:
+            # Generate table of contents with hierarchical numbering
+            page_list = [{"path": p.path, "title": p.title} for p in scheduler.results["links"]]
+            write_toc(generate_toc(page_list), self.wiki_path)
+
+        scheduler = PageScheduler(
+            [
+                *page_tasks,
+                PageTask("imports", imports),
+                PageTask(
+                    "links",
+                    links,
+                    depends_on=(*page_task_names, "imports"),
+                    description="Adding cross-links",
+                ),
+                PageTask(
+                    "search", search, depends_on=("links",), description="Generating search index"
+                ),
+                PageTask("toc", toc, depends_on=("links",)),
+            ],
+            progress_callback=progress_callback,
+        )
 
-        await write_full_search_index(self.wiki_path, pages, index_status, self.vector_store)
+        await scheduler.run()
+        self.task_timings = scheduler.timings
+        self._log_task_timings(scheduler)
 
-        # Generate table of contents with hierarchical numbering
-        page_list = [{"path": p.path, "title": p.title} for p in pages]
-        toc = generate_toc(page_list)
-        write_toc(toc, self.wiki_path)
+        pages: list[WikiPage] = list(scheduler.results["links"])
 
         # Build wiki generation status
         wiki_status = WikiGenerationStatus(
@@ -400,17 +437,20 @@ class WikiGenerator:
             stale_threshold_days=0,
         )
         pages.append(freshness_page)
-        self.status_manager.record_page_status(freshness_page, all_source_files)
-        await self._write_page(freshness_page)
-        pages_generated += 1
+        await add_page(freshness_page, all_source_files, True)
 
         # Update wiki status with freshness page
-        wiki_status.pages[freshness_page.path] = self.status_manager.page_statuses[freshness_page.path]
+        wiki_status.pages[freshness_page.path] = self.status_manager.page_statuses[
+            freshness_page.path
+        ]
         wiki_status.total_pages = len(pages)
 
         await self.status_manager.save_status(wiki_status)
 
+        pages_generated = counts["generated"]
+        pages_skipped = counts["skipped"]
         if progress_callback:
+            total_steps = len(scheduler.timings)
             progress_callback(
                 f"Wiki generation complete ({pages_generated} generated, {pages_skipped} unchanged)",
                 total_steps,
@@ -428,34 +468,69 @@ class WikiGenerator:
 
         return WikiStructure(root=str(self.wiki_path), pages=pages)
 
-    async def _generate_overview(self, index_status: IndexStatus) -> WikiPage:
+    async def _regenerate_or_load(
+        self,
+        path: str,
+        source_files: list[str],
+        full_rebuild: bool,
+        generate: Callable[[], Awaitable[WikiPage]],
+    ) -> tuple[WikiPage, bool]:
+        """Generate a page, or load the existing one if its sources are unchanged.
+
+        Args:
+            path: Wiki-relative page path.
+            source_files: Source files the page depends on.
+            full_rebuild: If True, always generate.
+            generate: Coroutine function generating the page.
+
+        Returns:
+            Tuple of (page, whether it was generated).
+        """
+        if not full_rebuild and not self.status_manager.needs_regeneration(path, source_files):
+            existing_page = await self.status_manager.load_existing_page(path)
+            if existing_page is not None:
+                return existing_page, False
+        return await generate(), True
+
+    def _log_task_timings(self, scheduler: PageScheduler) -> None:
+        """Log how long each generation task took and the critical path."""
+        for timing in sorted(scheduler.timings.values(), key=lambda t: t.started_at):
+            logger.debug(
+                f"Task {timing.name}: {timing.started_at:.2f}s -> {timing.finished_at:.2f}s "
+                f"({timing.duration_seconds:.2f}s)"
+            )
+        logger.info(f"Generation critical path: {' -> '.join(scheduler.critical_path())}")
+
+    async def _generate_overview(self, index_status: IndexStatus, llm: LLMProvider) -> WikiPage:
         """Generate the main overview/index page with grounded facts."""
         return await generate_overview_page(
             index_status=index_status,
             vector_store=self.vector_store,
-            llm=self.llm,
+            llm=llm,
             system_prompt=self._system_prompt,
             manifest=self._manifest,
             repo_path=self._repo_path,
         )
 
-    async def _generate_architecture(self, index_status: IndexStatus) -> WikiPage:
+    async def _generate_architecture(self, index_status: IndexStatus, llm: LLMProvider) -> WikiPage:
         """Generate architecture documentation with diagrams and grounded facts."""
         return await generate_architecture_page(
             index_status=index_status,
             vector_store=self.vector_store,
-            llm=self.llm,
+            llm=llm,
             system_prompt=self._system_prompt,
             manifest=self._manifest,
             repo_path=self._repo_path,
         )
 
-    async def _generate_dependencies(self, index_status: IndexStatus) -> tuple[WikiPage, list[str]]:
+    async def _generate_dependencies(
+        self, index_status: IndexStatus, llm: LLMProvider
+    ) -> tuple[WikiPage, list[str]]:
         """Generate dependencies documentation with grounded facts from manifest."""
         return await generate_dependencies_page(
             index_status=index_status,
             vector_store=self.vector_store,
-            llm=self.llm,
+            llm=llm,
             system_prompt=self._system_prompt,
             manifest=self._manifest,
             import_search_limit=self.config.wiki.import_search_limit,
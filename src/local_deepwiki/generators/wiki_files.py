@@ -8,15 +8,22 @@ from typing import TYPE_CHECKING, Awaitable, Callable
 
 from local_deepwiki.config import Config
 from local_deepwiki.core.git_utils import (
+    GitMetadataIndex,
     GitRepoInfo,
     build_source_url,
     format_blame_date,
     get_file_entity_blame,
+    get_git_metadata_index,
     get_repo_info,
 )
+from local_deepwiki.core.parse_cache import get_parse_cache
 from local_deepwiki.core.vectorstore import VectorStore
 from local_deepwiki.generators.api_docs import get_file_api_docs
-from local_deepwiki.generators.callgraph import get_file_call_graph, get_file_callers
+from local_deepwiki.generators.callgraph import (
+    CallGraphIndex,
+    get_file_call_graph,
+    get_file_callers,
+)
 from local_deepwiki.generators.context_builder import build_file_context, format_context_for_llm
 from local_deepwiki.generators.crosslinks import EntityRegistry
 from local_deepwiki.generators.diagrams import generate_class_diagram
@@ -267,6 +274,8 @@ async def generate_single_file_doc(
     entity_registry: EntityRegistry,
     config: Config,
     full_rebuild: bool,
+    git_index: GitMetadataIndex | None = None,
+    call_graph_index: CallGraphIndex | None = None,
 ) -> tuple[WikiPage | None, bool]:
     """Generate documentation for a single source file.
 
@@ -280,6 +289,9 @@ async def generate_single_file_doc(
         entity_registry: Entity registry for cross-linking.
         config: Configuration.
         full_rebuild: If True, regenerate even if unchanged.
+        git_index: Optional git metadata index used for the blame section.
+        call_graph_index: Optional call graph index used for call graph, "Used By"
+            and cross-file caller sections instead of re-parsing the file.
 
     Returns:
         Tuple of (WikiPage or None, was_skipped).
@@ -308,23 +320,13 @@ async def generate_single_file_doc(
             status_manager.record_page_status(existing_page, source_files)
             return existing_page, True  # Skipped (reused existing)
 
-    # Get all chunks for this file
-    search_results = await vector_store.search(
+    # Get the chunks for this file, ranked against the file as a whole
+    file_chunks = await vector_store.search(
         f"file:{file_info.path}",
         limit=config.wiki.context_search_limit,
+        file_paths=[file_info.path],
     )
 
-    # Filter to chunks from this specific file
-    file_chunks = [r for r in search_results if r.chunk.file_path == file_info.path]
-
-    if not file_chunks:
-        # Fallback: search by filename
-        search_results = await vector_store.search(
-            file_path.stem,
-            limit=config.wiki.fallback_search_limit,
-        )
-        file_chunks = [r for r in search_results if r.chunk.file_path == file_info.path]
-
     if not file_chunks:
         return None, False  # No content to document
 
@@ -348,6 +350,7 @@ async def generate_single_file_doc(
         chunks=chunks_list,
         repo_path=Path(index_status.repo_path),
         vector_store=vector_store,
+        call_graph_index=call_graph_index,
     )
     rich_context_text = format_context_for_llm(rich_context)
 
@@ -403,12 +406,16 @@ Do NOT include mermaid class diagrams - they will be auto-generated."""
 
     # Generate call graph diagram and used-by information
     if abs_file_path.exists():
-        call_graph = get_file_call_graph(abs_file_path, Path(index_status.repo_path))
+        call_graph = get_file_call_graph(
+            abs_file_path, Path(index_status.repo_path), call_graph_index
+        )
         if call_graph:
             content += "\n\n## Call Graph\n\n```mermaid\n" + call_graph + "\n```"
 
         # Add "Used by" section showing callers for each function
-        callers_map = get_file_callers(abs_file_path, Path(index_status.repo_path))
+        callers_map = get_file_callers(
+            abs_file_path, Path(index_status.repo_path), call_graph_index
+        )
         if callers_map:
             used_by_lines = ["## Used By", "", "Functions and methods in this file and their callers:", ""]
             for callee in sorted(callers_map.keys()):
@@ -436,6 +443,7 @@ Do NOT include mermaid class diagrams - they will be auto-generated."""
         repo_path=Path(index_status.repo_path),
         file_path=file_info.path,
         chunks=all_file_chunks,
+        git_index=git_index,
     )
     if blame_section:
         content += "\n\n" + blame_section
@@ -474,6 +482,7 @@ async def generate_file_docs(
     full_rebuild: bool = False,
     write_callback: WriteCallback | None = None,
     generation_progress: "GenerationProgress | None" = None,
+    call_graph_index: CallGraphIndex | None = None,
 ) -> tuple[list[WikiPage], int, int]:
     """Generate documentation for individual source files.
 
@@ -493,6 +502,7 @@ async def generate_file_docs(
         full_rebuild: If True, regenerate all pages.
         write_callback: Optional async callback to write pages immediately as they complete.
         generation_progress: Optional live progress tracker for status updates.
+        call_graph_index: Optional call graph index built during indexing.
 
     Returns:
         Tuple of (pages list, generated count, skipped count).
@@ -525,6 +535,9 @@ async def generate_file_docs(
     if not significant_files:
         return [], 0, 0
 
+    # Read git history once for all blame sections
+    git_index = await asyncio.to_thread(get_git_metadata_index, Path(index_status.repo_path))
+
     # Use semaphore to limit concurrent LLM calls
     max_concurrent = config.wiki.max_concurrent_llm_calls
     semaphore = asyncio.Semaphore(max_concurrent)
@@ -553,6 +566,8 @@ async def generate_file_docs(
                 entity_registry=entity_registry,
                 config=config,
                 full_rebuild=full_rebuild,
+                git_index=git_index,
+                call_graph_index=call_graph_index,
             )
             return file_info, page, was_skipped
 
@@ -619,7 +634,9 @@ async def generate_file_docs(
     if generation_progress:
         generation_progress.complete_phase()
 
+    parse_cache = get_parse_cache()
     logger.info(f"File docs complete: {pages_generated} generated, {pages_skipped} skipped")
+    logger.debug(f"Parse cache: {parse_cache.stats}, hit rate {parse_cache.hit_rate:.0%}")
     return pages, pages_generated, pages_skipped
 
 
@@ -627,6 +644,7 @@ def _generate_blame_section(
     repo_path: Path,
     file_path: str,
     chunks: list[CodeChunk],
+    git_index: GitMetadataIndex | None = None,
 ) -> str | None:
     """Generate a "Last Modified" section with git blame info.
 
@@ -634,6 +652,7 @@ def _generate_blame_section(
         repo_path: Path to the repository root.
         file_path: Relative path to the source file.
         chunks: Code chunks from the file.
+        git_index: Optional git metadata index to answer blame from history.
 
     Returns:
         Markdown section or None if no blame info available.
@@ -654,7 +673,7 @@ def _generate_blame_section(
         return None
 
     # Get blame info for all entities
-    blame_infos = get_file_entity_blame(repo_path, file_path, entities)
+    blame_infos = get_file_entity_blame(repo_path, file_path, entities, git_index=git_index)
 
     if not blame_infos:
         return None
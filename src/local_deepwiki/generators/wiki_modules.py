@@ -1,5 +1,6 @@
 """Module documentation generation for wiki."""
 
+import asyncio
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -33,10 +34,6 @@ async def generate_module_docs(
     Returns:
         Tuple of (pages list, generated count, skipped count).
     """
-    pages = []
-    pages_generated = 0
-    pages_skipped = 0
-
     # Group files by top-level directory
     directories: dict[str, list[str]] = {}
     for file_info in index_status.files:
@@ -47,42 +44,92 @@ async def generate_module_docs(
             dir_name = "root"
         directories.setdefault(dir_name, []).append(file_info.path)
 
-    # Generate a page for each significant directory
-    for dir_name, files in directories.items():
-        if len(files) < 2:
-            continue
-
-        page_path = f"modules/{dir_name}.md"
-
-        # Check if page needs regeneration (module pages depend on all files in that module)
-        if not full_rebuild and not status_manager.needs_regeneration(page_path, files):
-            existing_page = await status_manager.load_existing_page(page_path)
-            if existing_page is not None:
-                pages.append(existing_page)
-                status_manager.record_page_status(existing_page, files)
-                pages_skipped += 1
-                continue
-
-        # Get chunks for this directory
-        search_results = await vector_store.search(
-            f"module {dir_name}",
-            limit=15,
+    # Generate a page for each significant directory concurrently; callers
+    # bound LLM requests in flight through the provider (WikiGenerator wraps
+    # it in a ConcurrencyLimitedLLMProvider)
+    results = await asyncio.gather(
+        *(
+            _generate_module_page(
+                dir_name, files, vector_store, llm, system_prompt, status_manager, full_rebuild
+            )
+            for dir_name, files in directories.items()
+            if len(files) >= 2
         )
+    )
 
-        # Filter to chunks from this directory
-        relevant_chunks = [r for r in search_results if r.chunk.file_path.startswith(dir_name)]
-
-        if not relevant_chunks:
-            continue
+    pages = [page for page, _ in results if page is not None]
+    pages_generated = sum(1 for page, skipped in results if page is not None and not skipped)
+    pages_skipped = sum(1 for _, skipped in results if skipped)
 
-        context = "\n\n".join(
-            [
-                f"File: {r.chunk.file_path}\nType: {r.chunk.chunk_type.value}\nName: {r.chunk.name}\n{r.chunk.content[:400]}"
-                for r in relevant_chunks[:10]
-            ]
+    # Create modules index (always regenerate since it depends on module pages)
+    if pages:
+        modules_index = WikiPage(
+            path="modules/index.md",
+            title="Modules",
+            content=_generate_modules_index(pages),
+            generated_at=time.time(),
         )
+        pages.insert(0, modules_index)
+        # Index depends on all files in all modules
+        all_module_files = [f for files in directories.values() for f in files]
+        status_manager.record_page_status(modules_index, all_module_files)
+
+    return pages, pages_generated, pages_skipped
+
+
+async def _generate_module_page(
+    dir_name: str,
+    files: list[str],
+    vector_store: VectorStore,
+    llm: LLMProvider,
+    system_prompt: str,
+    status_manager: "WikiStatusManager",
+    full_rebuild: bool,
+) -> tuple[WikiPage | None, bool]:
+    """Generate (or load the unchanged) documentation page for one module.
+
+    Args:
+        dir_name: Top-level directory of the module.
+        files: Files in the module.
+        vector_store: Vector store with indexed code.
+        llm: LLM provider for generation.
+        system_prompt: System prompt for LLM.
+        status_manager: Wiki status manager for incremental updates.
+        full_rebuild: If True, regenerate the page.
 
-        prompt = f"""Generate documentation for the '{dir_name}' module based ONLY on the code provided.
+    Returns:
+        Tuple of (page, or None if the module has no relevant code; whether
+        the existing page was reused).
+    """
+    page_path = f"modules/{dir_name}.md"
+
+    # Check if page needs regeneration (module pages depend on all files in that module)
+    if not full_rebuild and not status_manager.needs_regeneration(page_path, files):
+        existing_page = await status_manager.load_existing_page(page_path)
+        if existing_page is not None:
+            status_manager.record_page_status(existing_page, files)
+            return existing_page, True
+
+    # Get chunks for this directory; top-level files have no common prefix
+    path_prefix = None if dir_name == "root" else f"{dir_name}/"
+    relevant_chunks = await vector_store.search(
+        f"module {dir_name}",
+        limit=15,
+        path_prefix=path_prefix,
+        file_paths=files if path_prefix is None else None,
+    )
+
+    if not relevant_chunks:
+        return None, False
+
+    context = "\n\n".join(
+        [
+            f"File: {r.chunk.file_path}\nType: {r.chunk.chunk_type.value}\nName: {r.chunk.name}\n{r.chunk.content[:400]}"
+            for r in relevant_chunks[:10]
+        ]
+    )
+
+    prompt = f"""Generate documentation for the '{dir_name}' module based ONLY on the code provided.
 
 Files in module: {', '.join(files[:10])}{'...' if len(files) > 10 else ''}
 
@@ -104,32 +151,16 @@ CRITICAL CONSTRAINTS:
 
 Format as markdown."""
 
-        content = await llm.generate(prompt, system_prompt=system_prompt)
+    content = await llm.generate(prompt, system_prompt=system_prompt)
 
-        page = WikiPage(
-            path=page_path,
-            title=f"Module: {dir_name}",
-            content=content,
-            generated_at=time.time(),
-        )
-        pages.append(page)
-        status_manager.record_page_status(page, files)
-        pages_generated += 1
-
-    # Create modules index (always regenerate since it depends on module pages)
-    if pages:
-        modules_index = WikiPage(
-            path="modules/index.md",
-            title="Modules",
-            content=_generate_modules_index(pages),
-            generated_at=time.time(),
-        )
-        pages.insert(0, modules_index)
-        # Index depends on all files in all modules
-        all_module_files = [f for files in directories.values() for f in files]
-        status_manager.record_page_status(modules_index, all_module_files)
-
-    return pages, pages_generated, pages_skipped
+    page = WikiPage(
+        path=page_path,
+        title=f"Module: {dir_name}",
+        content=content,
+        generated_at=time.time(),
+    )
+    status_manager.record_page_status(page, files)
+    return page, False
 
 
 def _generate_modules_index(module_pages: list[WikiPage]) -> str:
@@ -45,12 +45,8 @@ async def generate_overview_page(
     repo_name = Path(index_status.repo_path).name
 
     # Search for main entry points and key classes for context
-    entry_search = await vector_store.search(
-        "main entry point init server app",
-        limit=10,
-    )
-    key_class_search = await vector_store.search(
-        "class main core primary",
+    entry_search, key_class_search = await vector_store.search_many(
+        ["main entry point init server app", "class main core primary"],
         limit=10,
     )
 
@@ -215,23 +211,17 @@ async def generate_architecture_page(
     """
     # Gather multiple types of context for comprehensive architecture view
 
-    # 1. Search for core/main components
-    core_results = await vector_store.search(
-        "main core primary class module",
+    # 1-3. Core/main components, architectural patterns and data flow, in one batch
+    core_results, pattern_results, flow_results = await vector_store.search_many(
+        [
+            "main core primary class module",
+            "factory provider service handler controller",
+            "process pipeline flow parse index generate",
+        ],
         limit=15,
     )
-
-    # 2. Search for architectural patterns
-    pattern_results = await vector_store.search(
-        "factory provider service handler controller",
-        limit=10,
-    )
-
-    # 3. Search for data flow / pipeline
-    flow_results = await vector_store.search(
-        "process pipeline flow parse index generate",
-        limit=10,
-    )
+    pattern_results = pattern_results[:10]
+    flow_results = flow_results[:10]
 
     # 4. Get all classes for class list
     class_results = await vector_store.search(
@@ -372,13 +362,12 @@ async def generate_dependencies_page(
 
     # 3. Get import chunks for internal dependency analysis
     # Use higher limit to capture more modules for a complete dependency graph
-    search_results = await vector_store.search(
+    import_chunks = await vector_store.search(
         "import require include from",
         limit=500,
+        chunk_type="import",
     )
 
-    import_chunks = [r for r in search_results if r.chunk.chunk_type.value == "import"]
-
     # Collect source files from import chunks, prioritizing non-test files
     seen_files: set[str] = set()
     source_files: list[str] = []
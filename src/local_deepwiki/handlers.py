@@ -2,18 +2,23 @@
 
 import asyncio
 import json
+import time
 from functools import wraps
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, ParamSpec, cast
 
 from mcp.types import TextContent
 
-from local_deepwiki.config import get_config
+from local_deepwiki.config import Config, get_config
+from local_deepwiki.core.context_packer import pack_context
 from local_deepwiki.core.indexer import RepositoryIndexer
+from local_deepwiki.core.registry import get_registry, index_version
 from local_deepwiki.core.vectorstore import VectorStore
 from local_deepwiki.generators.wiki import generate_wiki
 from local_deepwiki.logging import get_logger
+from local_deepwiki.providers.base import EmbeddingProvider, LLMProvider
 from local_deepwiki.providers.embeddings import get_embedding_provider
+from local_deepwiki.providers.metrics import generate_with_metrics
 from local_deepwiki.validation import (
     DEFAULT_DEEP_RESEARCH_CHUNKS,
     MAX_CONTEXT_CHUNKS,
@@ -29,6 +34,7 @@ from local_deepwiki.validation import (
     validate_non_empty_string,
     validate_positive_int,
     validate_provider,
+    validate_search_mode,
 )
 
 logger = get_logger(__name__)
@@ -36,8 +42,157 @@ logger = get_logger(__name__)
 # Type alias for tool handler functions
 ToolHandler = Callable[[dict[str, Any]], Awaitable[list[TextContent]]]
 
+# Parameters of a tool handler wrapped by handle_tool_errors
+_P = ParamSpec("_P")
 
-def handle_tool_errors(func: ToolHandler) -> ToolHandler:
+# Answer pieces streamed sooner than this (seconds) after the previous
+# notification are batched into the next one
+ANSWER_NOTIFY_INTERVAL = 0.05
+
+
+def _get_repo_resources(config: Config, repo_path: Path) -> tuple[EmbeddingProvider, VectorStore]:
+    """Get the shared embedding provider and vector store for a repository.
+
+    Both come from the process-wide registry, so repeated tool calls against
+    the same repository reuse the loaded embedding model and open table.
+
+    Args:
+        config: Active configuration.
+        repo_path: Resolved repository path.
+
+    Returns:
+        Tuple of (embedding provider, vector store).
+    """
+    registry = get_registry()
+    embedding_provider = registry.get_embedding_provider(
+        config.embedding, factory=lambda: get_embedding_provider(config.embedding)
+    )
+    vector_db_path = config.get_vector_db_path(repo_path)
+    vector_store = registry.get_vector_store(
+        vector_db_path,
+        config.embedding,
+        factory=lambda: VectorStore(vector_db_path, embedding_provider),
+        version=index_version(config.get_wiki_path(repo_path)),
+    )
+    return embedding_provider, vector_store
+
+
+def _get_repo_llm(
+    config: Config, repo_path: Path, embedding_provider: EmbeddingProvider
+) -> LLMProvider:
+    """Get the shared cache-wrapped LLM provider for a repository.
+
+    Args:
+        config: Active configuration.
+        repo_path: Resolved repository path.
+        embedding_provider: Embedding provider used for cache similarity lookups.
+
+    Returns:
+        The shared LLM provider.
+    """
+    from local_deepwiki.providers.llm import get_cached_llm_provider
+
+    cache_path = config.get_wiki_path(repo_path) / "llm_cache.lance"
+    return get_registry().get_cached_llm_provider(
+        cache_path,
+        config.embedding,
+        config.llm_cache,
+        config.llm,
+        factory=lambda: get_cached_llm_provider(
+            cache_path=cache_path,
+            embedding_provider=embedding_provider,
+            cache_config=config.llm_cache,
+            llm_config=config.llm,
+        ),
+    )
+
+
+def _get_progress_token(server: Any) -> str | int | None:
+    """Get the progress token the MCP client sent with the current request.
+
+    Args:
+        server: MCP server instance, or None.
+
+    Returns:
+        The progress token, or None if the client did not ask for progress.
+    """
+    if server is None:
+        return None
+    try:
+        ctx = server.request_context
+        if ctx.meta and ctx.meta.progressToken:
+            return cast(str | int, ctx.meta.progressToken)
+    except LookupError:
+        # Not in a request context (e.g., testing)
+        pass
+    return None
+
+
+class _AnswerStream:
+    """Send an answer to the MCP client as it streams, via progress notifications.
+
+    Each notification's message is JSON: {"type": "answer_delta", "content": ...}.
+    The first piece goes out at once, so the client sees the answer begin;
+    later pieces are batched to one notification per ANSWER_NOTIFY_INTERVAL.
+    Progress values approach end without reaching it, keeping them increasing
+    however long the answer runs.
+    """
+
+    def __init__(
+        self,
+        server: Any,
+        progress_token: str | int,
+        start: float = 0.0,
+        end: float = 1.0,
+    ):
+        """Initialize the stream.
+
+        Args:
+            server: MCP server instance.
+            progress_token: Progress token of the request.
+            start: Progress value before the first piece.
+            end: Progress value the notifications approach.
+        """
+        self._server = server
+        self._progress_token = progress_token
+        self._start = start
+        self._end = end
+        self._pending: list[str] = []
+        self._sent = 0
+        self._last_sent = 0.0
+
+    async def send(self, text: str) -> None:
+        """Queue a piece of the answer, notifying if the interval has passed."""
+        self._pending.append(text)
+        if self._sent == 0 or time.monotonic() - self._last_sent >= ANSWER_NOTIFY_INTERVAL:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Notify the client of every queued piece."""
+        if not self._pending:
+            return
+        content = "".join(self._pending)
+        self._pending.clear()
+        self._sent += 1
+        self._last_sent = time.monotonic()
+        try:
+            await self._server.request_context.session.send_progress_notification(
+                progress_token=self._progress_token,
+                progress=self._start + (self._end - self._start) * self._sent / (self._sent + 1),
+                total=self._end,
+                message=json.dumps({"type": "answer_delta", "content": content}),
+            )
+        except (RuntimeError, OSError, AttributeError, LookupError) as e:
+            # RuntimeError: Session or context issues
+            # OSError: Network communication failures
+            # AttributeError: Missing session/context attributes
+            # LookupError: Not in a request context
+            logger.warning(f"Failed to send answer notification: {e}")
+
+
+def handle_tool_errors(
+    func: Callable[_P, Awaitable[list[TextContent]]],
+) -> Callable[_P, Awaitable[list[TextContent]]]:
     """Decorator for consistent error handling in tool handlers.
 
     Catches common exceptions and returns properly formatted error responses:
@@ -52,9 +207,9 @@ def handle_tool_errors(func: ToolHandler) -> ToolHandler:
     """
 
     @wraps(func)
-    async def wrapper(args: dict[str, Any]) -> list[TextContent]:
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> list[TextContent]:
         try:
-            return await func(args)
+            return await func(*args, **kwargs)
         except ValueError as e:
             logger.error(f"Invalid input in {func.__name__}: {e}")
             return [TextContent(type="text", text=f"Error: {e}")]
@@ -135,6 +290,9 @@ async def handle_index_repository(args: dict[str, Any]) -> list[TextContent]:
         full_rebuild=full_rebuild,
     )
 
+    # Stores opened before this run may hold a stale table handle
+    get_registry().invalidate_repository(indexer.vector_db_path)
+
     result = {
         "status": "success",
         "repo_path": str(repo_path),
@@ -153,8 +311,17 @@ async def handle_index_repository(args: dict[str, Any]) -> list[TextContent]:
 
 
 @handle_tool_errors
-async def handle_ask_question(args: dict[str, Any]) -> list[TextContent]:
-    """Handle ask_question tool call."""
+async def handle_ask_question(args: dict[str, Any], server: Any = None) -> list[TextContent]:
+    """Handle ask_question tool call.
+
+    Args:
+        args: Tool arguments.
+        server: Optional MCP server instance. If the client sent a progress
+            token, the answer streams to it as progress notifications.
+
+    Returns:
+        List of TextContent with the answer and its sources.
+    """
     repo_path = Path(args["repo_path"]).resolve()
 
     # Validate inputs
@@ -171,49 +338,32 @@ async def handle_ask_question(args: dict[str, Any]) -> list[TextContent]:
     logger.debug(f"Max context chunks: {max_context}")
 
     config = get_config()
-    wiki_path = config.get_wiki_path(repo_path)
     vector_db_path = config.get_vector_db_path(repo_path)
 
     if not vector_db_path.exists():
         raise ValueError("Repository not indexed. Run index_repository first.")
 
-    # Create vector store
-    embedding_provider = get_embedding_provider(config.embedding)
-    vector_store = VectorStore(vector_db_path, embedding_provider)
+    # Reuse the warm embedding provider and open vector store
+    embedding_provider, vector_store = _get_repo_resources(config, repo_path)
 
     # Search for relevant context
-    search_results = await vector_store.search(question, limit=max_context)
+    search_results = await vector_store.search(question, limit=max_context, mode="hybrid")
 
     if not search_results:
         return [TextContent(type="text", text="No relevant code found for your question.")]
 
-    # Build context from search results
-    context_parts = []
-    for search_result in search_results:
-        chunk = search_result.chunk
-        context_parts.append(
-            f"File: {chunk.file_path} (lines {chunk.start_line}-{chunk.end_line})\n"
-            f"Type: {chunk.chunk_type.value}\n"
-            f"```\n{chunk.content}\n```"
-        )
-
-    context = "\n\n---\n\n".join(context_parts)
-
     # Generate answer using LLM (with caching if enabled)
-    from local_deepwiki.providers.llm import get_cached_llm_provider
+    llm = _get_repo_llm(config, repo_path, embedding_provider)
 
-    cache_path = wiki_path / "llm_cache.lance"
-    llm = get_cached_llm_provider(
-        cache_path=cache_path,
-        embedding_provider=embedding_provider,
-        cache_config=config.llm_cache,
-        llm_config=config.llm,
-    )
+    # Build context from search results, fitted into the context budget
+    context = pack_context(search_results, config.llm.context_token_budget, llm.count_tokens)
+    if not context.blocks:
+        return [TextContent(type="text", text="No relevant code found for your question.")]
 
     prompt = f"""Based on the following code context, answer this question: {question}
 
 Code Context:
-{context}
+{context.text}
 
 Provide a clear, accurate answer based only on the code provided. If the code doesn't contain enough information to answer fully, say so."""
 
@@ -221,7 +371,13 @@ Provide a clear, accurate answer based only on the code provided. If the code do
         "You are a helpful code assistant. Answer questions about code clearly and accurately."
     )
 
-    answer = await llm.generate(prompt, system_prompt=system_prompt)
+    progress_token = _get_progress_token(server)
+    stream = _AnswerStream(server, progress_token) if progress_token is not None else None
+    answer = await generate_with_metrics(
+        llm, prompt, system_prompt=system_prompt, on_text=stream.send if stream else None
+    )
+    if stream:
+        await stream.flush()
 
     result = {
         "question": question,
@@ -233,11 +389,14 @@ Provide a clear, accurate answer based only on the code provided. If the code do
                 "type": r.chunk.chunk_type.value,
                 "score": r.score,
             }
-            for r in search_results
+            for r in context.results
         ],
     }
 
-    logger.info(f"Generated answer with {len(search_results)} sources")
+    logger.info(
+        f"Generated answer with {len(context.results)} sources "
+        f"({context.tokens_used} context tokens)"
+    )
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
 
@@ -297,32 +456,26 @@ async def _handle_deep_research_impl(
     if not vector_db_path.exists():
         raise ValueError("Repository not indexed. Run index_repository first.")
 
-    # Create vector store and LLM provider
-    embedding_provider = get_embedding_provider(config.embedding)
-    vector_store = VectorStore(vector_db_path, embedding_provider)
+    # Reuse the warm embedding provider, vector store and LLM provider
+    embedding_provider, vector_store = _get_repo_resources(config, repo_path)
 
     from local_deepwiki.core.deep_research import DeepResearchPipeline, ResearchCancelledError
     from local_deepwiki.models import ResearchProgress, ResearchProgressType
-    from local_deepwiki.providers.llm import get_cached_llm_provider
 
-    cache_path = config.get_wiki_path(repo_path) / "llm_cache.lance"
-    llm = get_cached_llm_provider(
-        cache_path=cache_path,
-        embedding_provider=embedding_provider,
-        cache_config=config.llm_cache,
-        llm_config=config.llm,
+    llm = _get_repo_llm(config, repo_path, embedding_provider)
+    # Earlier questions' embeddings, retrievals and gap analyses, until re-indexing
+    session = get_registry().get_research_session(
+        vector_db_path, config.embedding, version=index_version(config.get_wiki_path(repo_path))
     )
 
     # Get progress token from MCP request context (if client provided one)
-    progress_token: str | int | None = None
-    if server is not None:
-        try:
-            ctx = server.request_context
-            if ctx.meta and ctx.meta.progressToken:
-                progress_token = ctx.meta.progressToken
-        except LookupError:
-            # Not in a request context (e.g., testing)
-            pass
+    progress_token = _get_progress_token(server)
+    # Synthesis streams the answer between the synthesis (4) and completion (5) steps
+    answer_stream = (
+        _AnswerStream(server, progress_token, start=4.0, end=5.0)
+        if progress_token is not None
+        else None
+    )
 
     # Create cancellation event for cooperative cancellation
     cancellation_event = asyncio.Event()
@@ -345,6 +498,9 @@ async def _handle_deep_research_impl(
     async def progress_callback(progress: ResearchProgress) -> None:
         if progress_token is None or server is None:
             return
+        if answer_stream is not None:
+            # Deliver the rest of the answer before the step that follows it
+            await answer_stream.flush()
         try:
             ctx = server.request_context
             await ctx.session.send_progress_notification(
@@ -403,9 +559,11 @@ async def _handle_deep_research_impl(
         max_follow_up_queries=dr_config.max_follow_up_queries,
         synthesis_temperature=dr_config.synthesis_temperature,
         synthesis_max_tokens=dr_config.synthesis_max_tokens,
+        context_token_budget=dr_config.context_token_budget,
         decomposition_prompt=prompts.research_decomposition,
         gap_analysis_prompt=prompts.research_gap_analysis,
         synthesis_prompt=prompts.research_synthesis,
+        session=session,
     )
 
     try:
@@ -413,6 +571,7 @@ async def _handle_deep_research_impl(
             question,
             progress_callback=progress_callback,
             cancellation_check=is_cancelled,
+            answer_callback=answer_stream.send if answer_stream else None,
         )
 
         # Format the response
@@ -562,9 +721,10 @@ async def handle_search_code(args: dict[str, Any]) -> list[TextContent]:
         default=10,
     )
     language = validate_language(args.get("language"))
+    mode = validate_search_mode(args.get("mode"))
 
     logger.info(f"Code search in {repo_path}: {query[:50]}...")
-    logger.debug(f"Search limit: {limit}, language filter: {language}")
+    logger.debug(f"Search limit: {limit}, language filter: {language}, mode: {mode}")
 
     config = get_config()
     vector_db_path = config.get_vector_db_path(repo_path)
@@ -572,12 +732,11 @@ async def handle_search_code(args: dict[str, Any]) -> list[TextContent]:
     if not vector_db_path.exists():
         raise ValueError("Repository not indexed. Run index_repository first.")
 
-    # Create vector store
-    embedding_provider = get_embedding_provider(config.embedding)
-    vector_store = VectorStore(vector_db_path, embedding_provider)
+    # Reuse the warm embedding provider and open vector store
+    _, vector_store = _get_repo_resources(config, repo_path)
 
     # Search
-    results = await vector_store.search(query, limit=limit, language=language)
+    results = await vector_store.search(query, limit=limit, language=language, mode=mode)
 
     logger.info(f"Search returned {len(results)} results")
     if not results:
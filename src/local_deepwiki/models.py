@@ -114,6 +114,7 @@ class FileInfo(BaseModel):
     language: Language | None = Field(default=None, description="Detected language")
     size_bytes: int = Field(description="File size in bytes")
     last_modified: float = Field(description="Last modification timestamp")
+    inode: int | None = Field(default=None, description="Inode number for stat-based change checks")
     hash: str = Field(description="Content hash for change detection")
     chunk_count: int = Field(default=0, description="Number of chunks extracted")
 
@@ -133,6 +134,18 @@ class IndexStatus(BaseModel):
     languages: dict[str, int] = Field(default_factory=dict, description="Files per language")
     files: list[FileInfo] = Field(default_factory=list, description="Indexed file info")
     schema_version: int = Field(default=1, description="Schema version for migration support")
+    embedding_cache_hits: int = Field(
+        default=0, description="Chunks whose embedding was reused from the cache in the last run"
+    )
+    embedding_cache_misses: int = Field(
+        default=0, description="Chunks that needed a new embedding in the last run"
+    )
+
+    @property
+    def embedding_cache_hit_rate(self) -> float:
+        """Fraction of chunks embedded in the last run that were cache hits."""
+        total = self.embedding_cache_hits + self.embedding_cache_misses
+        return self.embedding_cache_hits / total if total else 0.0
 
     def __repr__(self) -> str:
         """Return a concise representation for debugging."""
@@ -140,6 +140,15 @@ class EmbeddingProvider(ABC):
         """Get the provider name."""
         pass
 
+    @property
+    def batch_size(self) -> int:
+        """Get the preferred number of texts per embed() call.
+
+        The indexing pipeline groups chunks into batches of this size before
+        embedding. Providers override it with a size that suits their backend.
+        """
+        return 64
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -194,3 +203,35 @@ class LLMProvider(ABC):
     def name(self) -> str:
         """Get the provider name."""
         pass
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens text takes in this provider's model.
+
+        Used to fit retrieved code into a prompt's context budget. The default
+        is a tokenizer-free estimate; providers with a local tokenizer
+        override it with an exact count.
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            Token count.
+        """
+        # Imported here: the chunker pulls in tree-sitter
+        from local_deepwiki.core.chunker import approximate_token_count
+
+        return approximate_token_count(text)
+
+    async def flush(self) -> None:
+        """Write out state the provider buffers, such as cache hit counters.
+
+        Call before the event loop the provider was used on goes away. Does
+        nothing by default.
+        """
+
+    def close(self) -> None:
+        """Write out buffered state when the provider is discarded.
+
+        Synchronous, for callers without an event loop. Does nothing by
+        default.
+        """
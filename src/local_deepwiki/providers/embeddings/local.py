@@ -1,5 +1,6 @@
 """Local embedding provider using sentence-transformers."""
 
+import asyncio
 from typing import cast
 
 from sentence_transformers import SentenceTransformer
@@ -37,8 +38,9 @@ class LocalEmbeddingProvider(EmbeddingProvider):
             List of embedding vectors.
         """
         model = self._load_model()
-        # sentence-transformers is synchronous, but we keep async interface for consistency
-        embeddings = model.encode(texts, convert_to_numpy=True)
+        # sentence-transformers is synchronous; encode in a worker thread so the
+        # event loop keeps feeding parse results and writes while the model runs
+        embeddings = await asyncio.to_thread(model.encode, texts, convert_to_numpy=True)
         return cast(list[list[float]], embeddings.tolist())
 
     def get_dimension(self) -> int:
@@ -55,3 +57,8 @@ class LocalEmbeddingProvider(EmbeddingProvider):
     def name(self) -> str:
         """Get the provider name."""
         return f"local:{self._model_name}"
+
+    @property
+    def batch_size(self) -> int:
+        """Get the preferred number of texts per embed() call."""
+        return 256
@@ -55,3 +55,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
     def name(self) -> str:
         """Get the provider name."""
         return f"openai:{self._model}"
+
+    @property
+    def batch_size(self) -> int:
+        """Get the preferred number of texts per embed() call."""
+        return 512
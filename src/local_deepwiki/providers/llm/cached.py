@@ -5,6 +5,7 @@ from collections.abc import AsyncIterator
 from local_deepwiki.core.llm_cache import LLMCache
 from local_deepwiki.logging import get_logger
 from local_deepwiki.providers.base import LLMProvider
+from local_deepwiki.providers.metrics import report_cached_generation
 
 logger = get_logger(__name__)
 
@@ -44,6 +45,18 @@ class CachingLLMProvider(LLMProvider):
         """Get cache statistics."""
         return self._cache.stats
 
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the underlying provider's tokenizer."""
+        return self._provider.count_tokens(text)
+
+    async def flush(self) -> None:
+        """Write out the cache's pending hit counters."""
+        await self._cache.flush()
+
+    def close(self) -> None:
+        """Write out the cache's pending hit counters before it is discarded."""
+        self._cache.close()
+
     async def generate(
         self,
         prompt: str,
@@ -73,6 +86,7 @@ class CachingLLMProvider(LLMProvider):
             model_name=self._provider.name,
         )
 
+        report_cached_generation(self._provider.name, cache_hit=cached is not None)
         if cached is not None:
             logger.debug(f"Cache hit for prompt: {prompt[:50]}...")
             return cached
@@ -126,6 +140,7 @@ class CachingLLMProvider(LLMProvider):
             model_name=self._provider.name,
         )
 
+        report_cached_generation(self._provider.name, cache_hit=cached is not None)
         if cached is not None:
             logger.debug(f"Cache hit (stream) for prompt: {prompt[:50]}...")
             # Simulate streaming for cached response
@@ -1,7 +1,8 @@
 """OpenAI LLM provider."""
 
 import os
-from typing import AsyncIterator
+from functools import lru_cache
+from typing import Any, AsyncIterator
 
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
@@ -12,6 +13,26 @@ from local_deepwiki.providers.base import LLMProvider, with_retry
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _tiktoken_encoding(model: str) -> Any:
+    """Get the tiktoken encoding of a model, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        # Model unknown to this tiktoken version; current models use o200k_base
+        encoding_name = "o200k_base"
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except OSError as e:
+        # Encoding files are downloaded on first use, which fails offline
+        logger.debug(f"tiktoken encoding for {model} unavailable: {e}")
+        return None
+
+
 class OpenAILLMProvider(LLMProvider):
     """LLM provider using OpenAI API."""
 
@@ -96,6 +117,20 @@ class OpenAILLMProvider(LLMProvider):
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the model's tiktoken encoding when tiktoken is installed.
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            Token count.
+        """
+        encoding = _tiktoken_encoding(self._model)
+        if encoding is None:
+            return super().count_tokens(text)
+        return len(encoding.encode(text, disallowed_special=()))
+
     @property
     def name(self) -> str:
         """Get the provider name."""
@@ -0,0 +1,282 @@
+"""Latency and throughput metrics of LLM generations.
+
+Answers that stream can be shown as soon as their first token arrives, so
+for streamed generations the time to first token is what a user waits for;
+tokens per second is how fast the rest follows. Both are recorded per
+provider by the helpers here, which Q&A, chat and deep research synthesis
+generate through.
+
+Generations are recorded under the provider that actually answered: caching
+wrappers report it with report_cached_generation(), and answers they replay
+from their cache are counted as cache hits rather than timed.
+"""
+
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from local_deepwiki.logging import get_logger
+from local_deepwiki.providers.base import LLMProvider
+
+logger = get_logger(__name__)
+
+# Called with each piece of a streamed answer as it arrives
+TextCallback = Callable[[str], Awaitable[None]]
+
+
+@dataclass
+class _ProviderTotals:
+    """Running totals of one provider's generations."""
+
+    generations: int = 0
+    streamed: int = 0
+    seconds: float = 0.0
+    first_token_seconds: float = 0.0
+    tokens: int = 0
+    decode_seconds: float = 0.0
+    cache_hits: int = 0
+
+
+@dataclass
+class _GenerationTrace:
+    """What a caching wrapper reported about the generation in progress."""
+
+    provider: str | None = None
+    cache_hit: bool = False
+
+
+# Trace of the generation the current task is timing. The trace object itself
+# is shared, so reports from tasks spawned with a copy of the context still land
+_current_generation: ContextVar[_GenerationTrace | None] = ContextVar(
+    "current_generation", default=None
+)
+
+
+def report_cached_generation(provider: str, cache_hit: bool) -> None:
+    """Report which provider a caching wrapper forwarded a generation to.
+
+    Called by caching wrappers for every generation; a no-op when the
+    generation is not being timed.
+
+    Args:
+        provider: Name of the wrapped provider.
+        cache_hit: Whether the answer was replayed from the cache.
+    """
+    trace = _current_generation.get()
+    if trace is not None:
+        trace.provider = provider
+        trace.cache_hit = cache_hit
+
+
+class GenerationMetrics:
+    """Thread-safe per-provider record of generation latency and throughput."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._providers: dict[str, _ProviderTotals] = {}
+
+    def record(
+        self,
+        provider: str,
+        duration: float,
+        tokens: int,
+        time_to_first_token: float | None = None,
+    ) -> None:
+        """Record a finished generation.
+
+        Args:
+            provider: Name of the provider that generated.
+            duration: Seconds from request to the last token.
+            tokens: Tokens generated.
+            time_to_first_token: Seconds until the first token arrived, for
+                streamed generations.
+        """
+        # Throughput counts from the first token: the wait before it is latency
+        decode_seconds = duration - (time_to_first_token or 0.0)
+        with self._lock:
+            totals = self._providers.setdefault(provider, _ProviderTotals())
+            totals.generations += 1
+            totals.seconds += duration
+            if time_to_first_token is not None:
+                totals.streamed += 1
+                totals.first_token_seconds += time_to_first_token
+            if decode_seconds > 0:
+                totals.tokens += tokens
+                totals.decode_seconds += decode_seconds
+
+    def record_cache_hit(self, provider: str) -> None:
+        """Record an answer replayed from a cache instead of generated.
+
+        Args:
+            provider: Name of the provider whose answer was replayed.
+        """
+        with self._lock:
+            self._providers.setdefault(provider, _ProviderTotals()).cache_hits += 1
+
+    @property
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Get averages per provider.
+
+        Returns:
+            Mapping of provider name to its generation count, streamed
+            generation count, mean latency and time to first token in
+            milliseconds, tokens per second, and answers replayed from a
+            cache (which the averages leave out).
+        """
+        with self._lock:
+            return {
+                provider: {
+                    "generations": totals.generations,
+                    "streamed": totals.streamed,
+                    "avg_latency_ms": (
+                        round(totals.seconds / totals.generations * 1000, 1)
+                        if totals.generations
+                        else 0.0
+                    ),
+                    "avg_time_to_first_token_ms": (
+                        round(totals.first_token_seconds / totals.streamed * 1000, 1)
+                        if totals.streamed
+                        else 0.0
+                    ),
+                    "tokens_per_second": (
+                        round(totals.tokens / totals.decode_seconds, 1)
+                        if totals.decode_seconds
+                        else 0.0
+                    ),
+                    "cache_hits": totals.cache_hits,
+                }
+                for provider, totals in self._providers.items()
+            }
+
+    def clear(self) -> None:
+        """Forget everything recorded."""
+        with self._lock:
+            self._providers.clear()
+
+
+_metrics = GenerationMetrics()
+
+
+def get_generation_metrics() -> GenerationMetrics:
+    """Get the process-wide generation metrics."""
+    return _metrics
+
+
+async def stream_with_metrics(
+    llm: LLMProvider,
+    prompt: str,
+    system_prompt: str | None = None,
+    max_tokens: int = 4096,
+    temperature: float = 0.7,
+    metrics: GenerationMetrics | None = None,
+) -> AsyncIterator[str]:
+    """Stream a generation, recording its time to first token and throughput.
+
+    Nothing is recorded for a stream that is not read to the end, and a
+    stream replayed from a cache only counts as a cache hit.
+
+    Args:
+        llm: Provider to generate with.
+        prompt: The user prompt.
+        system_prompt: Optional system prompt.
+        max_tokens: Maximum tokens to generate.
+        temperature: Sampling temperature.
+        metrics: Metrics to record to; defaults to the process-wide metrics.
+
+    Yields:
+        Generated text chunks.
+    """
+    trace = _GenerationTrace()
+    previous = _current_generation.get()
+    start = time.monotonic()
+    time_to_first_token: float | None = None
+    parts: list[str] = []
+    try:
+        _current_generation.set(trace)
+        async for chunk in llm.generate_stream(
+            prompt, system_prompt=system_prompt, max_tokens=max_tokens, temperature=temperature
+        ):
+            if time_to_first_token is None and chunk:
+                time_to_first_token = time.monotonic() - start
+            parts.append(chunk)
+            yield chunk
+    finally:
+        # Set rather than reset: a stream may be closed from another context
+        _current_generation.set(previous)
+
+    provider = trace.provider or llm.name
+    if trace.cache_hit:
+        (metrics or _metrics).record_cache_hit(provider)
+        return
+
+    duration = time.monotonic() - start
+    tokens = llm.count_tokens("".join(parts))
+    (metrics or _metrics).record(
+        provider, duration, tokens, time_to_first_token=time_to_first_token or duration
+    )
+    logger.debug(
+        f"{provider}: first token after {(time_to_first_token or duration) * 1000:.0f}ms, "
+        f"{tokens} tokens in {duration:.2f}s"
+    )
+
+
+async def generate_with_metrics(
+    llm: LLMProvider,
+    prompt: str,
+    system_prompt: str | None = None,
+    max_tokens: int = 4096,
+    temperature: float = 0.7,
+    on_text: TextCallback | None = None,
+    metrics: GenerationMetrics | None = None,
+) -> str:
+    """Generate a complete answer, streaming it to on_text when given.
+
+    Without on_text nobody would see partial output, so the provider's
+    non-streaming generate (with its retries) is used instead.
+
+    Args:
+        llm: Provider to generate with.
+        prompt: The user prompt.
+        system_prompt: Optional system prompt.
+        max_tokens: Maximum tokens to generate.
+        temperature: Sampling temperature.
+        on_text: Optional async callback given each chunk as it arrives.
+        metrics: Metrics to record to; defaults to the process-wide metrics.
+
+    Returns:
+        The generated text.
+    """
+    if on_text is None:
+        trace = _GenerationTrace()
+        token = _current_generation.set(trace)
+        start = time.monotonic()
+        try:
+            text = await llm.generate(
+                prompt, system_prompt=system_prompt, max_tokens=max_tokens, temperature=temperature
+            )
+        finally:
+            _current_generation.reset(token)
+        duration = time.monotonic() - start
+
+        provider = trace.provider or llm.name
+        if trace.cache_hit:
+            (metrics or _metrics).record_cache_hit(provider)
+        else:
+            (metrics or _metrics).record(provider, duration, llm.count_tokens(text))
+        return text
+
+    parts: list[str] = []
+    async for chunk in stream_with_metrics(
+        llm,
+        prompt,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        metrics=metrics,
+    ):
+        parts.append(chunk)
+        await on_text(chunk)
+    return "".join(parts)
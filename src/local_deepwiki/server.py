@@ -7,6 +7,7 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from local_deepwiki.core.registry import reset_registry
 from local_deepwiki.handlers import (
     ToolHandler,
     handle_ask_question,
@@ -74,7 +75,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="ask_question",
-            description="Ask a question about an indexed repository using RAG. Returns an answer based on relevant code context.",
+            description="Ask a question about an indexed repository using RAG. Returns an answer based on relevant code context. If the request carries a progress token, the answer also streams as progress notifications while it is generated.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -155,7 +156,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="search_code",
-            description="Semantic search across the indexed codebase. Returns relevant code chunks with similarity scores.",
+            description="Search the indexed codebase by meaning, by keyword, or both. Returns relevant code chunks with relevance scores.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -175,6 +176,13 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Optional language filter",
                     },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["auto", "hybrid", "vector", "keyword"],
+                        "description": "Retrieval mode: 'vector' (semantic), 'keyword' (BM25, "
+                        "best for exact identifiers), 'hybrid' (both, fused by rank) or 'auto' "
+                        "(keyword for bare identifiers, hybrid otherwise). Default: auto",
+                    },
                 },
                 "required": ["repo_path", "query"],
             },
@@ -224,7 +232,8 @@ async def list_tools() -> list[Tool]:
 
 # Tool handler dispatch dictionary
 # Maps tool names to their async handler functions
-# Note: deep_research is handled specially due to server context requirement
+# Note: ask_question and deep_research are handled specially due to server
+# context requirement
 TOOL_HANDLERS: dict[str, ToolHandler] = {
     "index_repository": handle_index_repository,
     "ask_question": handle_ask_question,
@@ -242,9 +251,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     logger.info(f"Tool call received: {name}")
     logger.debug(f"Tool arguments: {arguments}")
 
-    # Special handling for deep_research (needs server context for progress)
+    # Special handling for tools that need server context for progress
     if name == "deep_research":
         return await handle_deep_research(arguments, server=server)
+    if name == "ask_question":
+        return await handle_ask_question(arguments, server=server)
 
     handler = TOOL_HANDLERS.get(name)
     if handler is None:
@@ -266,7 +277,11 @@ def main():
                 server.create_initialization_options(),
             )
 
-    asyncio.run(run())
+    try:
+        asyncio.run(run())
+    finally:
+        # Write out buffered state (such as LLM cache hits) of pooled resources
+        reset_registry()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 """Input validation utilities for MCP tool handlers."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
 from local_deepwiki.models import Language
 
+if TYPE_CHECKING:
+    from local_deepwiki.core.vectorstore import SearchMode
+
 # Input validation constants
 MIN_CONTEXT_CHUNKS = 1
 MAX_CONTEXT_CHUNKS = 50
@@ -12,6 +15,7 @@ MAX_SEARCH_LIMIT = 100
 VALID_LANGUAGES = {lang.value for lang in Language}
 VALID_LLM_PROVIDERS = {"ollama", "anthropic", "openai"}
 VALID_EMBEDDING_PROVIDERS = {"local", "openai"}
+VALID_SEARCH_MODES = {"vector", "keyword", "hybrid", "auto"}
 
 # Deep research validation constants
 MIN_DEEP_RESEARCH_CHUNKS = 10
@@ -83,6 +87,26 @@ def validate_language(language: str | None) -> str | None:
     return language
 
 
+def validate_search_mode(mode: str | None, default: "SearchMode" = "auto") -> "SearchMode":
+    """Validate a code search mode.
+
+    Args:
+        mode: The mode to validate.
+        default: Mode to use when none is given.
+
+    Returns:
+        The validated mode.
+
+    Raises:
+        ValueError: If mode is invalid.
+    """
+    if mode is None:
+        return default
+    if mode not in VALID_SEARCH_MODES:
+        raise ValueError(f"Invalid mode: '{mode}'. Valid options: {sorted(VALID_SEARCH_MODES)}")
+    return cast("SearchMode", mode)
+
+
 def validate_languages_list(languages: list[str] | None) -> list[str] | None:
     """Validate a list of languages.
 
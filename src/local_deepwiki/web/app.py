@@ -9,12 +9,20 @@ import json
 import queue
 import threading
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable, Iterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator
 
 import markdown
 from flask import Flask, Response, abort, jsonify, redirect, render_template, request, url_for
 
 from local_deepwiki.logging import get_logger
+from local_deepwiki.web.wiki_cache import get_wiki_cache
+
+if TYPE_CHECKING:
+    from local_deepwiki.config import Config, LLMConfig
+    from local_deepwiki.core.deep_research import ResearchSession
+    from local_deepwiki.core.vectorstore import VectorStore
+    from local_deepwiki.models import ResearchProgress
+    from local_deepwiki.providers.base import LLMProvider
 
 logger = get_logger(__name__)
 
@@ -70,18 +78,23 @@ def get_wiki_structure(wiki_path: Path) -> tuple[list, dict, list | None]:
 def extract_title(md_file: Path) -> str:
     """Extract title from markdown file."""
     try:
-        content = md_file.read_text()
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("# "):
-                return line[2:].strip()
-            if line.startswith("**") and line.endswith("**"):
-                return line[2:-2].strip()
+        return title_from_markdown(md_file.read_text(), md_file)
     except (OSError, UnicodeDecodeError) as e:
         logger.debug(f"Could not extract title from {md_file}: {e}")
     return md_file.stem.replace("_", " ").replace("-", " ").title()
 
 
+def title_from_markdown(content: str, md_file: Path) -> str:
+    """Extract the title from markdown content, falling back to the file name."""
+    for line in content.split("\n"):
+        line = line.strip()
+        if line.startswith("# "):
+            return line[2:].strip()
+        if line.startswith("**") and line.endswith("**"):
+            return line[2:-2].strip()
+    return md_file.stem.replace("_", " ").replace("-", " ").title()
+
+
 def render_markdown(content: str) -> str:
     """Render markdown to HTML."""
     md = markdown.Markdown(
@@ -152,21 +165,24 @@ def index():
 
 @app.route("/search.json")
 def search_json():
-    """Serve the search index JSON file."""
+    """Serve the search index JSON file.
+
+    The file is served as pre-compressed bytes with an ETag, so unchanged
+    indexes cost browsers a 304.
+    """
     if WIKI_PATH is None:
         abort(500, "Wiki path not configured")
 
-    search_path = WIKI_PATH / "search.json"
-    if not search_path.exists():
-        # Return empty index if not generated yet
-        return jsonify([])
-
     try:
-        data = json.loads(search_path.read_text())
-        return jsonify(data)
-    except (json.JSONDecodeError, OSError) as e:
+        payload = get_wiki_cache(WIKI_PATH).search_index()
+    except (ValueError, OSError) as e:
         abort(500, f"Error reading search index: {e}")
 
+    status, body, headers = payload.select(
+        request.headers.get("Accept-Encoding", ""), request.headers.get("If-None-Match", "")
+    )
+    return Response(body, status=status, mimetype="application/json", headers=headers)
+
 
 @app.route("/wiki/<path:path>")
 def view_page(path: str):
@@ -177,27 +193,24 @@ def view_page(path: str):
         logger.error("Wiki path not configured")
         abort(500, "Wiki path not configured")
 
-    file_path = WIKI_PATH / path
-    if not file_path.exists() or not file_path.is_file():
-        logger.warning(f"Page not found: {path}")
-        abort(404, f"Page not found: {path}")
-
+    wiki_cache = get_wiki_cache(WIKI_PATH)
     try:
-        content = file_path.read_text()
-        html_content = render_markdown(content)
+        page = wiki_cache.render_page(path)
     except (OSError, UnicodeDecodeError) as e:
         abort(500, f"Error reading page: {e}")
+    if page is None:
+        logger.warning(f"Page not found: {path}")
+        abort(404, f"Page not found: {path}")
 
-    pages, sections, toc_entries = get_wiki_structure(WIKI_PATH)
-    title = extract_title(file_path)
+    pages, sections, toc_entries = wiki_cache.navigation()
 
     # Build breadcrumb navigation
     breadcrumb = build_breadcrumb(WIKI_PATH, path)
 
     return render_template(
         "page.html",
-        content=html_content,
-        title=title,
+        content=page.html,
+        title=page.title,
         pages=pages,
         sections=sections,
         toc_entries=toc_entries,
@@ -321,6 +334,265 @@ def chat_page():
     return render_template("chat.html", wiki_path=str(WIKI_PATH))
 
 
+def sse_event(payload: dict[str, Any]) -> str:
+    """Format a payload as a Server-Sent Events message."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def chat_llm_config(config: "Config", purpose: str = "chat") -> "LLMConfig":
+    """Get the LLM configuration for chat and research, honoring chat_llm_provider.
+
+    Args:
+        config: Active configuration.
+        purpose: What the provider is for, used in the log message.
+
+    Returns:
+        The LLM configuration to use.
+    """
+    chat_provider = config.wiki.chat_llm_provider
+    if chat_provider == "default":
+        return config.llm
+    logger.info(f"Using {chat_provider} provider for {purpose}")
+    return config.llm.model_copy(update={"provider": chat_provider})
+
+
+def _build_request_resources(
+    repo_path: Path, purpose: str
+) -> "tuple[VectorStore, LLMProvider] | None":
+    """Build fresh providers and a vector store for one request.
+
+    The Flask server runs each streaming request on its own event loop, so it
+    cannot share async provider clients between requests; the ASGI server
+    (web/asgi.py) keeps them warm instead.
+
+    Returns:
+        Tuple of (vector store, LLM provider), or None if the repository has
+        not been indexed.
+    """
+    from local_deepwiki.config import get_config
+    from local_deepwiki.core.vectorstore import VectorStore
+    from local_deepwiki.providers.embeddings import get_embedding_provider
+    from local_deepwiki.providers.llm import get_cached_llm_provider
+
+    config = get_config()
+    vector_db_path = config.get_vector_db_path(repo_path)
+    if not vector_db_path.exists():
+        return None
+
+    embedding_provider = get_embedding_provider(config.embedding)
+    vector_store = VectorStore(vector_db_path, embedding_provider)
+    llm = get_cached_llm_provider(
+        cache_path=config.get_wiki_path(repo_path) / "llm_cache.lance",
+        embedding_provider=embedding_provider,
+        cache_config=config.llm_cache,
+        llm_config=chat_llm_config(config, purpose),
+    )
+    return vector_store, llm
+
+
+def research_session(repo_path: Path) -> "ResearchSession":
+    """Get the process-wide deep research session for a repository.
+
+    Unlike providers, a session is plain data, so the Flask server's
+    per-request event loops can share it too.
+    """
+    from local_deepwiki.config import get_config
+    from local_deepwiki.core.registry import get_registry, index_version
+
+    config = get_config()
+    return get_registry().get_research_session(
+        config.get_vector_db_path(repo_path),
+        config.embedding,
+        version=index_version(config.get_wiki_path(repo_path)),
+    )
+
+
+async def stream_chat_answer(
+    question: str,
+    history: list[dict[str, str]],
+    vector_store: "VectorStore",
+    llm: "LLMProvider",
+) -> AsyncIterator[str]:
+    """Answer a chat question as a stream of Server-Sent Events.
+
+    Emits a "sources" event, then "token" events as the LLM generates, then
+    "done" (or "error").
+
+    Args:
+        question: The user's question.
+        history: Previous Q&A exchanges.
+        vector_store: Store to retrieve code context from.
+        llm: Provider that generates the answer.
+
+    Yields:
+        SSE-formatted messages.
+    """
+    from local_deepwiki.config import get_config
+    from local_deepwiki.core.context_packer import pack_context
+    from local_deepwiki.providers.metrics import stream_with_metrics
+
+    # Search for relevant context, fitted into the context budget
+    search_results = await vector_store.search(question, limit=5, mode="hybrid")
+    context = pack_context(search_results, get_config().llm.context_token_budget, llm.count_tokens)
+
+    # Send sources first
+    yield sse_event({"type": "sources", "sources": format_sources(context.results)})
+
+    if not context.blocks:
+        yield sse_event({"type": "token", "content": "No relevant code found for your question."})
+        yield sse_event({"type": "done"})
+        return
+
+    # Build prompt with history
+    prompt = build_prompt_with_history(question, history, context.text)
+    system_prompt = (
+        "You are a helpful code assistant. Answer questions about code clearly and accurately. "
+        "Reference specific files and line numbers when relevant."
+    )
+
+    # Stream the response
+    try:
+        async for text_chunk in stream_with_metrics(
+            llm, prompt, system_prompt=system_prompt, temperature=0.3
+        ):
+            yield sse_event({"type": "token", "content": text_chunk})
+    except Exception as e:  # noqa: BLE001 - Report LLM errors to user via SSE
+        logger.exception(f"Error generating response: {e}")
+        yield sse_event({"type": "error", "message": str(e)})
+
+    yield sse_event({"type": "done"})
+
+
+def _progress_event(progress: "ResearchProgress") -> dict[str, Any]:
+    """Convert a research progress update to an SSE payload."""
+    progress_data: dict[str, Any] = {
+        "type": "progress",
+        "step": progress.step,
+        "total_steps": progress.total_steps,
+        "step_type": progress.step_type.value,
+        "message": progress.message,
+    }
+    if progress.sub_questions:
+        progress_data["sub_questions"] = [
+            {"question": sq.question, "category": sq.category} for sq in progress.sub_questions
+        ]
+    if progress.chunks_retrieved is not None:
+        progress_data["chunks_retrieved"] = progress.chunks_retrieved
+    if progress.follow_up_queries:
+        progress_data["follow_up_queries"] = progress.follow_up_queries
+    if progress.duration_ms is not None:
+        progress_data["duration_ms"] = progress.duration_ms
+    return progress_data
+
+
+async def stream_research(
+    question: str,
+    vector_store: "VectorStore",
+    llm: "LLMProvider",
+    session: "ResearchSession | None" = None,
+) -> AsyncIterator[str]:
+    """Run deep research as a stream of Server-Sent Events.
+
+    Emits "progress" events as the pipeline advances, then "result" and
+    "done" (or "error"). If the consumer stops reading (e.g. the client
+    disconnects), the research task is cancelled.
+
+    Args:
+        question: The user's question.
+        vector_store: Store to retrieve code context from.
+        llm: Provider used by the research pipeline.
+        session: Research session of the repository, reused across questions.
+
+    Yields:
+        SSE-formatted messages.
+    """
+    from local_deepwiki.config import get_config
+    from local_deepwiki.core.deep_research import DeepResearchPipeline
+
+    progress_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def on_progress(progress: "ResearchProgress") -> None:
+        progress_queue.put_nowait(_progress_event(progress))
+
+    # Create pipeline with config parameters
+    dr_config = get_config().deep_research
+    pipeline = DeepResearchPipeline(
+        vector_store=vector_store,
+        llm_provider=llm,
+        max_sub_questions=dr_config.max_sub_questions,
+        chunks_per_subquestion=dr_config.chunks_per_subquestion,
+        max_total_chunks=dr_config.max_total_chunks,
+        max_follow_up_queries=dr_config.max_follow_up_queries,
+        synthesis_temperature=dr_config.synthesis_temperature,
+        synthesis_max_tokens=dr_config.synthesis_max_tokens,
+        context_token_budget=dr_config.context_token_budget,
+        session=session,
+    )
+
+    # Run research in background, yielding progress as soon as it arrives
+    research_task = asyncio.create_task(pipeline.research(question, progress_callback=on_progress))
+    try:
+        while not research_task.done() or not progress_queue.empty():
+            next_progress = asyncio.ensure_future(progress_queue.get())
+            done, _ = await asyncio.wait(
+                {next_progress, research_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if next_progress in done:
+                yield sse_event(next_progress.result())
+            else:
+                next_progress.cancel()
+
+        try:
+            result = await research_task
+
+            # Format the result
+            response = {
+                "type": "result",
+                "answer": result.answer,
+                "sub_questions": [
+                    {"question": sq.question, "category": sq.category}
+                    for sq in result.sub_questions
+                ],
+                "sources": [
+                    {
+                        "file": src.file_path,
+                        "lines": f"{src.start_line}-{src.end_line}",
+                        "type": src.chunk_type,
+                        "name": src.name,
+                        "relevance": round(src.relevance_score, 3),
+                    }
+                    for src in result.sources
+                ],
+                "reasoning_trace": [
+                    {
+                        "step": step.step_type.value,
+                        "description": step.description,
+                        "duration_ms": step.duration_ms,
+                    }
+                    for step in result.reasoning_trace
+                ],
+                "stats": {
+                    "chunks_analyzed": result.total_chunks_analyzed,
+                    "llm_calls": result.total_llm_calls,
+                },
+            }
+            yield sse_event(response)
+        except Exception as e:  # noqa: BLE001 - Report research errors to user via SSE
+            logger.exception(f"Error in deep research: {e}")
+            yield sse_event({"type": "error", "message": str(e)})
+
+        yield sse_event({"type": "done"})
+    finally:
+        if not research_task.done():
+            research_task.cancel()
+
+
+NOT_INDEXED_MESSAGE = "Repository not indexed. Please run index_repository first."
+
+# Headers for streaming responses; X-Accel-Buffering stops nginx buffering them
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
 @app.route("/api/chat", methods=["POST"])
 def api_chat():
     """Handle chat Q&A with streaming response.
@@ -344,92 +616,26 @@ def api_chat():
 
     # Determine the repository path from wiki path
     repo_path = WIKI_PATH.parent
-    if WIKI_PATH.name == ".deepwiki":
-        repo_path = WIKI_PATH.parent
 
     async def generate_response() -> AsyncIterator[str]:
         """Async generator that streams the chat response."""
-        from local_deepwiki.config import get_config
-        from local_deepwiki.core.vectorstore import VectorStore
-        from local_deepwiki.providers.embeddings import get_embedding_provider
-        from local_deepwiki.providers.llm import get_cached_llm_provider
-
-        config = get_config()
-        vector_db_path = config.get_vector_db_path(repo_path)
-
-        if not vector_db_path.exists():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Repository not indexed. Please run index_repository first.'})}\n\n"
+        resources = _build_request_resources(repo_path, "chat")
+        if resources is None:
+            yield sse_event({"type": "error", "message": NOT_INDEXED_MESSAGE})
             return
 
-        # Setup providers
-        embedding_provider = get_embedding_provider(config.embedding)
-        vector_store = VectorStore(vector_db_path, embedding_provider)
-        cache_path = config.get_wiki_path(repo_path) / "llm_cache.lance"
-
-        # Determine LLM config for chat - use chat_llm_provider if set
-        llm_config = config.llm
-        chat_provider = config.wiki.chat_llm_provider
-        if chat_provider != "default":
-            # Override provider for chat
-            llm_config = llm_config.model_copy(update={"provider": chat_provider})
-            logger.info(f"Using {chat_provider} provider for chat")
-
-        llm = get_cached_llm_provider(
-            cache_path=cache_path,
-            embedding_provider=embedding_provider,
-            cache_config=config.llm_cache,
-            llm_config=llm_config,
-        )
-
-        # Search for relevant context
-        search_results = await vector_store.search(question, limit=5)
-
-        # Send sources first
-        sources = format_sources(search_results)
-        yield f"data: {json.dumps({'type': 'sources', 'sources': sources})}\n\n"
-
-        if not search_results:
-            yield f"data: {json.dumps({'type': 'token', 'content': 'No relevant code found for your question.'})}\n\n"
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
-            return
-
-        # Build context from search results
-        context_parts = []
-        for result in search_results:
-            chunk = result.chunk
-            context_parts.append(
-                f"File: {chunk.file_path} (lines {chunk.start_line}-{chunk.end_line})\n"
-                f"Type: {chunk.chunk_type.value}\n"
-                f"```\n{chunk.content}\n```"
-            )
-        context = "\n\n---\n\n".join(context_parts)
-
-        # Build prompt with history
-        prompt = build_prompt_with_history(question, history, context)
-        system_prompt = (
-            "You are a helpful code assistant. Answer questions about code clearly and accurately. "
-            "Reference specific files and line numbers when relevant."
-        )
-
-        # Stream the response
+        vector_store, llm = resources
         try:
-            async for text_chunk in llm.generate_stream(
-                prompt, system_prompt=system_prompt, temperature=0.3
-            ):
-                yield f"data: {json.dumps({'type': 'token', 'content': text_chunk})}\n\n"
-        except Exception as e:  # noqa: BLE001 - Report LLM errors to user via SSE
-            logger.exception(f"Error generating response: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-
-        yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            async for event in stream_chat_answer(question, history, vector_store, llm):
+                yield event
+        finally:
+            # The provider dies with this request's event loop; persist its cache hits
+            await llm.flush()
 
     return Response(
         stream_async_generator(generate_response),
         mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -454,153 +660,27 @@ def api_research():
 
     # Determine the repository path from wiki path
     repo_path = WIKI_PATH.parent
-    if WIKI_PATH.name == ".deepwiki":
-        repo_path = WIKI_PATH.parent
-
-    # Queue for progress updates from async callback
-    progress_queue: queue.Queue[dict[str, Any] | None] = queue.Queue()
 
     async def run_research() -> AsyncIterator[str]:
         """Async generator that runs deep research with progress updates."""
-        from local_deepwiki.config import get_config
-        from local_deepwiki.core.deep_research import DeepResearchPipeline
-        from local_deepwiki.core.vectorstore import VectorStore
-        from local_deepwiki.models import ResearchProgress
-        from local_deepwiki.providers.embeddings import get_embedding_provider
-        from local_deepwiki.providers.llm import get_cached_llm_provider
-
-        config = get_config()
-        vector_db_path = config.get_vector_db_path(repo_path)
-
-        if not vector_db_path.exists():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Repository not indexed. Please run index_repository first.'})}\n\n"
+        resources = _build_request_resources(repo_path, "deep research")
+        if resources is None:
+            yield sse_event({"type": "error", "message": NOT_INDEXED_MESSAGE})
             return
 
-        # Setup providers
-        embedding_provider = get_embedding_provider(config.embedding)
-        vector_store = VectorStore(vector_db_path, embedding_provider)
-        cache_path = config.get_wiki_path(repo_path) / "llm_cache.lance"
-
-        # Determine LLM config for research - use chat_llm_provider if set
-        llm_config = config.llm
-        chat_provider = config.wiki.chat_llm_provider
-        if chat_provider != "default":
-            # Override provider for research
-            llm_config = llm_config.model_copy(update={"provider": chat_provider})
-            logger.info(f"Using {chat_provider} provider for deep research")
-
-        llm = get_cached_llm_provider(
-            cache_path=cache_path,
-            embedding_provider=embedding_provider,
-            cache_config=config.llm_cache,
-            llm_config=llm_config,
-        )
-
-        # Progress callback
-        async def on_progress(progress: ResearchProgress) -> None:
-            progress_data = {
-                "type": "progress",
-                "step": progress.step,
-                "total_steps": progress.total_steps,
-                "step_type": progress.step_type.value,
-                "message": progress.message,
-            }
-            if progress.sub_questions:
-                progress_data["sub_questions"] = [
-                    {"question": sq.question, "category": sq.category}
-                    for sq in progress.sub_questions
-                ]
-            if progress.chunks_retrieved is not None:
-                progress_data["chunks_retrieved"] = progress.chunks_retrieved
-            if progress.follow_up_queries:
-                progress_data["follow_up_queries"] = progress.follow_up_queries
-            if progress.duration_ms is not None:
-                progress_data["duration_ms"] = progress.duration_ms
-
-            # Put in queue for the main generator to pick up
-            progress_queue.put(progress_data)
-
-        # Create pipeline with config parameters
-        dr_config = config.deep_research
-        pipeline = DeepResearchPipeline(
-            vector_store=vector_store,
-            llm_provider=llm,
-            max_sub_questions=dr_config.max_sub_questions,
-            chunks_per_subquestion=dr_config.chunks_per_subquestion,
-            max_total_chunks=dr_config.max_total_chunks,
-            max_follow_up_queries=dr_config.max_follow_up_queries,
-            synthesis_temperature=dr_config.synthesis_temperature,
-            synthesis_max_tokens=dr_config.synthesis_max_tokens,
-        )
-
-        # Run research in background, yielding progress as it comes
-        research_task = asyncio.create_task(
-            pipeline.research(question, progress_callback=on_progress)
-        )
-
-        # Yield progress updates as they come in
-        while not research_task.done():
-            try:
-                progress_data = progress_queue.get(timeout=0.1)
-                if progress_data is not None:
-                    yield f"data: {json.dumps(progress_data)}\n\n"
-            except queue.Empty:
-                await asyncio.sleep(0.05)
-
-        # Drain any remaining progress updates
-        while not progress_queue.empty():
-            progress_data = progress_queue.get_nowait()
-            if progress_data is not None:
-                yield f"data: {json.dumps(progress_data)}\n\n"
-
+        vector_store, llm = resources
+        session = research_session(repo_path)
         try:
-            result = await research_task
-
-            # Format the result
-            response = {
-                "type": "result",
-                "answer": result.answer,
-                "sub_questions": [
-                    {"question": sq.question, "category": sq.category}
-                    for sq in result.sub_questions
-                ],
-                "sources": [
-                    {
-                        "file": src.file_path,
-                        "lines": f"{src.start_line}-{src.end_line}",
-                        "type": src.chunk_type,
-                        "name": src.name,
-                        "relevance": round(src.relevance_score, 3),
-                    }
-                    for src in result.sources
-                ],
-                "reasoning_trace": [
-                    {
-                        "step": step.step_type.value,
-                        "description": step.description,
-                        "duration_ms": step.duration_ms,
-                    }
-                    for step in result.reasoning_trace
-                ],
-                "stats": {
-                    "chunks_analyzed": result.total_chunks_analyzed,
-                    "llm_calls": result.total_llm_calls,
-                },
-            }
-            yield f"data: {json.dumps(response)}\n\n"
-        except Exception as e:  # noqa: BLE001 - Report research errors to user via SSE
-            logger.exception(f"Error in deep research: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-
-        yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            async for event in stream_research(question, vector_store, llm, session):
+                yield event
+        finally:
+            # The provider dies with this request's event loop; persist its cache hits
+            await llm.flush()
 
     return Response(
         stream_async_generator(run_research),
         mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -638,9 +718,20 @@ def main():
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", "-p", type=int, default=8080, help="Port to bind to")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument(
+        "--server",
+        choices=["flask", "asgi"],
+        default="flask",
+        help="Server to run: flask, or asgi (uvicorn with warm shared providers)",
+    )
     args = parser.parse_args()
 
     wiki_path = Path(args.wiki_path).resolve()
+    if args.server == "asgi":
+        from local_deepwiki.web.asgi import run_asgi_server
+
+        run_asgi_server(wiki_path, args.host, args.port)
+        return
     run_server(wiki_path, args.host, args.port, args.debug)
 
 
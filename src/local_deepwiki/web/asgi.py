@@ -0,0 +1,277 @@
+"""ASGI serving mode for the DeepWiki web UI.
+
+The Flask app in app.py bridges each chat or research request onto a new
+thread and event loop, and rebuilds the embedding provider, vector store and
+LLM provider for every request. This Starlette app serves the same routes and
+templates from a single event loop: providers and the vector store come from
+the process-wide resource registry, so they are loaded once and stay warm for
+the life of the process, and streaming endpoints return the async generators
+from app.py directly.
+
+Run it with ``deepwiki-serve --server asgi`` (uvicorn).
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.templating import Jinja2Templates
+
+from local_deepwiki.config import get_config
+from local_deepwiki.core.registry import get_registry, index_version, reset_registry
+from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.logging import get_logger
+from local_deepwiki.providers.base import LLMProvider
+from local_deepwiki.web.app import (
+    _MODULE_DIR,
+    NOT_INDEXED_MESSAGE,
+    SSE_HEADERS,
+    build_breadcrumb,
+    chat_llm_config,
+    research_session,
+    sse_event,
+    stream_chat_answer,
+    stream_research,
+)
+from local_deepwiki.web.wiki_cache import WikiCache
+
+logger = get_logger(__name__)
+
+templates = Jinja2Templates(directory=str(_MODULE_DIR / "templates"))
+
+
+def get_shared_resources(repo_path: Path) -> tuple[VectorStore, LLMProvider] | None:
+    """Get the warm vector store and LLM provider for a repository.
+
+    Resources come from the process-wide registry, keyed by configuration,
+    and the vector store is reopened when the repository is re-indexed.
+
+    Args:
+        repo_path: Repository root (parent of the wiki directory).
+
+    Returns:
+        Tuple of (vector store, LLM provider), or None if the repository has
+        not been indexed.
+    """
+    from local_deepwiki.providers.embeddings import get_embedding_provider
+    from local_deepwiki.providers.llm import get_cached_llm_provider
+
+    config = get_config()
+    vector_db_path = config.get_vector_db_path(repo_path)
+    if not vector_db_path.exists():
+        return None
+
+    registry = get_registry()
+    embedding_provider = registry.get_embedding_provider(
+        config.embedding, factory=lambda: get_embedding_provider(config.embedding)
+    )
+    vector_store = registry.get_vector_store(
+        vector_db_path,
+        config.embedding,
+        factory=lambda: VectorStore(vector_db_path, embedding_provider),
+        version=index_version(config.get_wiki_path(repo_path)),
+    )
+
+    llm_config = chat_llm_config(config)
+    cache_path = config.get_wiki_path(repo_path) / "llm_cache.lance"
+    llm = registry.get_cached_llm_provider(
+        cache_path,
+        config.embedding,
+        config.llm_cache,
+        llm_config,
+        factory=lambda: get_cached_llm_provider(
+            cache_path=cache_path,
+            embedding_provider=embedding_provider,
+            cache_config=config.llm_cache,
+            llm_config=llm_config,
+        ),
+    )
+    return vector_store, llm
+
+
+async def _resources_for(request: Request) -> tuple[VectorStore, LLMProvider] | None:
+    """Get shared resources for the app's repository without blocking the loop.
+
+    The first call may load an embedding model; later calls are registry hits.
+    """
+    repo_path = request.app.state.wiki_path.parent
+    return await asyncio.to_thread(get_shared_resources, repo_path)
+
+
+async def _read_question(request: Request) -> dict[str, Any]:
+    """Parse the JSON request body, treating malformed bodies as empty."""
+    try:
+        data = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        # Malformed or non-UTF-8 body
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def _not_indexed() -> AsyncIterator[str]:
+    """Stream the error shown when the repository has no index."""
+    yield sse_event({"type": "error", "message": NOT_INDEXED_MESSAGE})
+
+
+def _event_stream(events: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap SSE messages in a streaming response."""
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+def index(request: Request) -> Response:
+    """Redirect to index.md."""
+    return RedirectResponse(request.url_for("view_page", path="index.md"))
+
+
+def search_json(request: Request) -> Response:
+    """Serve the search index as pre-compressed bytes with ETag support."""
+    try:
+        payload = request.app.state.wiki_cache.search_index()
+    except (ValueError, OSError) as e:
+        raise HTTPException(500, f"Error reading search index: {e}")
+
+    status, body, headers = payload.select(
+        request.headers.get("accept-encoding", ""), request.headers.get("if-none-match", "")
+    )
+    return Response(body, status_code=status, media_type="application/json", headers=headers)
+
+
+def view_page(request: Request) -> Response:
+    """View a wiki page."""
+    wiki_path: Path = request.app.state.wiki_path
+    wiki_cache: WikiCache = request.app.state.wiki_cache
+    path = request.path_params["path"]
+    logger.debug(f"Viewing page: {path}")
+
+    if not (wiki_path / path).resolve().is_relative_to(wiki_path):
+        raise HTTPException(404, f"Page not found: {path}")
+    try:
+        page = wiki_cache.render_page(path)
+    except (OSError, UnicodeDecodeError) as e:
+        raise HTTPException(500, f"Error reading page: {e}")
+    if page is None:
+        logger.warning(f"Page not found: {path}")
+        raise HTTPException(404, f"Page not found: {path}")
+
+    pages, sections, toc_entries = wiki_cache.navigation()
+    return templates.TemplateResponse(
+        request,
+        "page.html",
+        {
+            "content": page.html,
+            "title": page.title,
+            "pages": pages,
+            "sections": sections,
+            "toc_entries": toc_entries,
+            "current_path": path,
+            "breadcrumb": build_breadcrumb(wiki_path, path),
+        },
+    )
+
+
+def chat_page(request: Request) -> Response:
+    """Render the chat interface."""
+    return templates.TemplateResponse(request, "chat.html")
+
+
+async def api_chat(request: Request) -> Response:
+    """Handle chat Q&A with a streaming response.
+
+    Expects a JSON body with ``question`` and optional ``history``.
+    """
+    data = await _read_question(request)
+    question = str(data.get("question", "")).strip()
+    history = data.get("history", [])
+    if not question:
+        return JSONResponse({"error": "Question is required"}, status_code=400)
+
+    resources = await _resources_for(request)
+    if resources is None:
+        return _event_stream(_not_indexed())
+
+    vector_store, llm = resources
+    return _event_stream(stream_chat_answer(question, history, vector_store, llm))
+
+
+async def api_research(request: Request) -> Response:
+    """Handle deep research with streaming progress updates.
+
+    Expects a JSON body with ``question``.
+    """
+    data = await _read_question(request)
+    question = str(data.get("question", "")).strip()
+    if not question:
+        return JSONResponse({"error": "Question is required"}, status_code=400)
+
+    resources = await _resources_for(request)
+    if resources is None:
+        return _event_stream(_not_indexed())
+
+    vector_store, llm = resources
+    session = research_session(request.app.state.wiki_path.parent)
+    return _event_stream(stream_research(question, vector_store, llm, session))
+
+
+def create_asgi_app(wiki_path: str | Path, warm: bool = True) -> Starlette:
+    """Create the ASGI app for a wiki directory.
+
+    Args:
+        wiki_path: Path to the .deepwiki directory.
+        warm: Load the embedding model and open the vector store at startup,
+            so the first question does not pay for it.
+
+    Returns:
+        The Starlette application.
+
+    Raises:
+        ValueError: If the wiki path does not exist.
+    """
+    wiki_path = Path(wiki_path).resolve()
+    if not wiki_path.exists():
+        logger.error(f"Wiki path does not exist: {wiki_path}")
+        raise ValueError(f"Wiki path does not exist: {wiki_path}")
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        if warm:
+            try:
+                if await asyncio.to_thread(get_shared_resources, wiki_path.parent) is not None:
+                    logger.info("Warmed embedding provider and vector store")
+            except Exception as e:  # noqa: BLE001 - A failed warm-up must not stop the server
+                logger.warning(f"Could not warm resources at startup: {e}")
+        yield
+        # Write out buffered state (such as LLM cache hits) of pooled resources
+        await asyncio.to_thread(reset_registry)
+
+    app = Starlette(
+        routes=[
+            Route("/", index),
+            Route("/search.json", search_json),
+            Route("/wiki/{path:path}", view_page, name="view_page"),
+            Route("/chat", chat_page),
+            Route("/api/chat", api_chat, methods=["POST"]),
+            Route("/api/research", api_research, methods=["POST"]),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.wiki_path = wiki_path
+    app.state.wiki_cache = WikiCache(wiki_path)
+    logger.info(f"Configured wiki path: {wiki_path}")
+    return app
+
+
+def run_asgi_server(wiki_path: str | Path, host: str = "127.0.0.1", port: int = 8080) -> None:
+    """Run the wiki web server under uvicorn."""
+    import uvicorn
+
+    app = create_asgi_app(wiki_path)
+    print(f"Starting DeepWiki server (ASGI) at http://{host}:{port}")
+    print(f"Serving wiki from: {wiki_path}")
+    uvicorn.run(app, host=host, port=port, log_level="info")
@@ -0,0 +1,277 @@
+"""In-memory caches for serving a wiki directory.
+
+Building the sidebar reads every page to find its title, and rendering
+markdown is far slower than sending the result, so doing both on every page
+view makes large wikis slow to browse. WikiCache keeps three things in memory,
+all validated against file modification times so regenerated pages are
+picked up without restarting the server:
+
+- the navigation model (pages, sections and toc.json entries), rebuilt when
+  the wiki or section directories, toc.json or search.json change, or when a
+  page is found to have been edited;
+- an LRU cache of rendered page HTML keyed by path, mtime and size;
+- search.json as raw and gzip-compressed bytes with an ETag.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from local_deepwiki.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Files whose rewrite means the wiki was regenerated
+_REGENERATION_MARKERS = ("toc.json", "search.json")
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """A rendered wiki page."""
+
+    title: str
+    html: str
+
+
+@dataclass(frozen=True)
+class SearchIndexPayload:
+    """search.json content ready to send."""
+
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+    def select(self, accept_encoding: str, if_none_match: str) -> tuple[int, bytes, dict[str, str]]:
+        """Choose the response for a request's conditional and encoding headers.
+
+        Args:
+            accept_encoding: The request's Accept-Encoding header ("" if absent).
+            if_none_match: The request's If-None-Match header ("" if absent).
+
+        Returns:
+            Tuple of (status code, body, response headers). The body is empty
+            for 304 responses.
+        """
+        use_gzip = accepts_gzip(accept_encoding)
+        # Each encoding is a different representation, so it gets its own tag
+        etag = f'"{self.etag}-gzip"' if use_gzip else f'"{self.etag}"'
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return 304, b"", headers
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return 200, self.gzipped, headers
+        return 200, self.body, headers
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows gzip."""
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in tags
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Get (mtime_ns, size) for a path, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class WikiCache:
+    """Navigation, rendered-page and search index caches for one wiki directory."""
+
+    def __init__(
+        self,
+        wiki_path: Path,
+        max_pages: int = 512,
+        max_page_bytes: int = 64 * 1024 * 1024,
+    ):
+        """Initialize the cache.
+
+        Args:
+            wiki_path: The wiki directory being served.
+            max_pages: Maximum number of rendered pages kept.
+            max_page_bytes: Maximum total size of cached page HTML.
+        """
+        self.wiki_path = wiki_path
+        self.max_pages = max_pages
+        self.max_page_bytes = max_page_bytes
+        self._lock = threading.Lock()
+        self._navigation: tuple[list, dict, list | None] | None = None
+        self._navigation_signature: tuple | None = None
+        self._pages: OrderedDict[str, tuple[tuple[int, int], RenderedPage]] = OrderedDict()
+        self._page_bytes = 0
+        self._search: tuple[tuple[int, int] | None, SearchIndexPayload] | None = None
+        self._stats = {"page_hits": 0, "page_misses": 0, "navigation_builds": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counts and current size."""
+        with self._lock:
+            return {**self._stats, "pages": len(self._pages), "page_bytes": self._page_bytes}
+
+    def navigation(self) -> tuple[list, dict, list | None]:
+        """Get the wiki's (pages, sections, toc_entries), as get_wiki_structure returns.
+
+        The structure is only rebuilt when a directory listing or a
+        regeneration marker has changed since it was built.
+        """
+        from local_deepwiki.web.app import get_wiki_structure
+
+        signature = self._navigation_signature_now()
+        with self._lock:
+            if self._navigation is not None and signature == self._navigation_signature:
+                return self._navigation
+
+        navigation = get_wiki_structure(self.wiki_path)
+        logger.debug(f"Built wiki navigation for {self.wiki_path}")
+        with self._lock:
+            self._navigation = navigation
+            self._navigation_signature = signature
+            self._stats["navigation_builds"] += 1
+        return navigation
+
+    def invalidate(self) -> None:
+        """Drop everything cached; the next requests rebuild from disk."""
+        with self._lock:
+            self._navigation = None
+            self._pages.clear()
+            self._page_bytes = 0
+            self._search = None
+
+    def render_page(self, path: str) -> RenderedPage | None:
+        """Get the rendered HTML and title of a page.
+
+        Args:
+            path: Page path relative to the wiki directory.
+
+        Returns:
+            The rendered page, or None if the path is not a file.
+
+        Raises:
+            OSError: If the page cannot be read.
+            UnicodeDecodeError: If the page is not valid UTF-8.
+        """
+        from local_deepwiki.web.app import render_markdown, title_from_markdown
+
+        file_path = self.wiki_path / path
+        if not file_path.is_file():
+            return None
+        key = _stat_key(file_path)
+
+        with self._lock:
+            cached = self._pages.get(path)
+            if cached is not None and cached[0] == key:
+                self._pages.move_to_end(path)
+                self._stats["page_hits"] += 1
+                return cached[1]
+            self._stats["page_misses"] += 1
+            if cached is not None:
+                # The page was edited in place, so its sidebar title may be stale
+                self._navigation = None
+
+        content = file_path.read_text()
+        page = RenderedPage(
+            title=title_from_markdown(content, file_path),
+            html=render_markdown(content),
+        )
+        with self._lock:
+            self._store_page(path, key, page)
+        return page
+
+    def search_index(self) -> SearchIndexPayload:
+        """Get search.json as raw and compressed bytes.
+
+        A missing file is served as an empty list.
+
+        Raises:
+            OSError: If search.json exists but cannot be read.
+            ValueError: If search.json is not valid JSON.
+        """
+        search_path = self.wiki_path / "search.json"
+        key = _stat_key(search_path)
+        with self._lock:
+            if self._search is not None and self._search[0] == key:
+                return self._search[1]
+
+        body = search_path.read_bytes() if key is not None else b"[]"
+        json.loads(body)  # Refuse to serve a truncated or corrupt index
+        payload = SearchIndexPayload(
+            body=body,
+            gzipped=gzip.compress(body, compresslevel=9, mtime=0),
+            etag=hashlib.sha256(body).hexdigest()[:32],
+        )
+        with self._lock:
+            self._search = (key, payload)
+        return payload
+
+    def _navigation_signature_now(self) -> tuple:
+        """Modification times that change when pages are added, removed or regenerated."""
+        sections = []
+        try:
+            with os.scandir(self.wiki_path) as it:
+                for entry in it:
+                    if entry.is_dir() and not entry.name.startswith("."):
+                        sections.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            pass
+        markers = tuple(_stat_key(self.wiki_path / name) for name in _REGENERATION_MARKERS)
+        return _stat_key(self.wiki_path), tuple(sorted(sections)), markers
+
+    def _store_page(self, path: str, key: tuple[int, int] | None, page: RenderedPage) -> None:
+        """Insert a page and evict least recently used ones over the limits."""
+        previous = self._pages.pop(path, None)
+        if previous is not None:
+            self._page_bytes -= len(previous[1].html)
+        if key is None or len(page.html) > self.max_page_bytes:
+            return
+
+        self._pages[path] = (key, page)
+        self._page_bytes += len(page.html)
+        while len(self._pages) > self.max_pages or self._page_bytes > self.max_page_bytes:
+            _, (_, evicted) = self._pages.popitem(last=False)
+            self._page_bytes -= len(evicted.html)
+
+
+# One cache per served wiki directory
+_wiki_caches: dict[Path, WikiCache] = {}
+_wiki_caches_lock = threading.Lock()
+
+
+def get_wiki_cache(wiki_path: Path) -> WikiCache:
+    """Get the shared cache for a wiki directory, creating it on first use."""
+    key = wiki_path.resolve()
+    with _wiki_caches_lock:
+        cache = _wiki_caches.get(key)
+        if cache is None:
+            cache = _wiki_caches[key] = WikiCache(key)
+        return cache
+
+
+def reset_wiki_caches() -> None:
+    """Discard all wiki caches.
+
+    Useful for testing.
+    """
+    with _wiki_caches_lock:
+        _wiki_caches.clear()
@@ -8,13 +8,15 @@ import pytest
 from local_deepwiki.core.parser import CodeParser
 from local_deepwiki.generators.callgraph import (
     CallGraphExtractor,
+    CallGraphIndex,
     _is_builtin_or_noise,
     extract_call_name,
     extract_calls_from_function,
     generate_call_graph_diagram,
     get_file_call_graph,
+    get_file_callers,
 )
-from local_deepwiki.models import Language
+from local_deepwiki.models import FileInfo, Language
 
 
 class TestIsBuiltinOrNoise:
@@ -687,3 +689,99 @@ class TestExtractCallNameEdgeCases:
             # The call should have a function - test passes if extraction works
             result = extract_call_name(calls[0], source.encode(), Language.PYTHON)
             assert result == "call"
+
+
+class TestCallGraphIndex:
+    """Test the persisted repository-wide call graph index."""
+
+    @pytest.fixture
+    def index(self):
+        index = CallGraphIndex()
+        index.set_file("app.py", "h1", {"main": ["load_config", "run_server"]})
+        index.set_file("server.py", "h2", {"run_server": ["load_config"]})
+        index.set_file("config.py", "h3", {})
+        return index
+
+    def test_cross_file_callers(self, index):
+        """Test callers in other files are found by callee name."""
+        callers = index.get_cross_file_callers("config.py", ["load_config", "unused_fn"])
+        assert callers == {"load_config": ["app.py", "server.py"]}
+
+    def test_cross_file_callers_exclude_defining_file(self, index):
+        """Test calls from the defining file itself are not reported."""
+        assert index.get_cross_file_callers("server.py", ["run_server"]) == {
+            "run_server": ["app.py"]
+        }
+
+    def test_cross_file_callers_skip_short_names(self):
+        """Test names too short to match reliably are skipped."""
+        index = CallGraphIndex()
+        index.set_file("a.py", "h", {"main": ["run"]})
+        assert index.get_cross_file_callers("b.py", ["run"]) == {}
+
+    def test_cross_file_callers_see_updates(self, index):
+        """Test the reverse lookup is rebuilt after a file changes."""
+        index.get_cross_file_callers("config.py", ["load_config"])
+        index.set_file("server.py", "h4", {"run_server": []})
+        assert index.get_cross_file_callers("config.py", ["load_config"]) == {
+            "load_config": ["app.py"]
+        }
+
+    def test_in_file_callers(self, index):
+        """Test the reverse graph for one file."""
+        assert index.get_callers("app.py") == {"load_config": ["main"], "run_server": ["main"]}
+        assert index.get_callers("missing.py") is None
+
+    def test_save_and_load_round_trip(self, tmp_path, index):
+        """Test the index survives a save/load cycle."""
+        path = tmp_path / "call_graph.json"
+        index.save(path)
+
+        loaded = CallGraphIndex.load(path)
+
+        assert len(loaded) == 3
+        assert loaded.get_call_graph("app.py") == {"main": ["load_config", "run_server"]}
+        assert loaded.is_current("server.py", "h2")
+
+    def test_load_drops_stale_entries(self, tmp_path, index):
+        """Test entries whose hash no longer matches the file records are dropped."""
+        path = tmp_path / "call_graph.json"
+        index.save(path)
+        files = [
+            FileInfo(path="app.py", size_bytes=1, last_modified=0, hash="h1"),
+            FileInfo(path="server.py", size_bytes=1, last_modified=0, hash="changed"),
+        ]
+
+        loaded = CallGraphIndex.load(path, files)
+
+        assert "app.py" in loaded
+        assert "server.py" not in loaded
+        assert "config.py" not in loaded
+
+    def test_load_corrupt_file_returns_empty(self, tmp_path):
+        """Test an unreadable index loads as empty."""
+        path = tmp_path / "call_graph.json"
+        path.write_text("{not json")
+        assert len(CallGraphIndex.load(path)) == 0
+
+    def test_retain(self, index):
+        """Test entries for removed files are dropped."""
+        assert index.retain({"app.py"}) == 2
+        assert len(index) == 1
+
+    def test_file_helpers_use_index_without_parsing(self, tmp_path):
+        """Test the per-file helpers read the index instead of parsing the file."""
+        test_file = tmp_path / "app.py"
+        test_file.write_text("def main():\n    other()\n")
+        index = CallGraphIndex()
+        index.set_file("app.py", "h", {"main": ["from_index"]})
+
+        assert get_file_callers(test_file, tmp_path, index) == {"from_index": ["main"]}
+        assert "from_index" in get_file_call_graph(test_file, tmp_path, index)
+
+    def test_file_helpers_fall_back_to_parsing(self, tmp_path):
+        """Test files missing from the index are parsed."""
+        test_file = tmp_path / "app.py"
+        test_file.write_text("def main():\n    other()\n")
+
+        assert get_file_callers(test_file, tmp_path, CallGraphIndex()) == {"other": ["main"]}
@@ -1,11 +1,12 @@
 """Tests for the code chunker."""
 
+import re
 from pathlib import Path
 
 import pytest
 
 from local_deepwiki.config import ChunkingConfig
-from local_deepwiki.core.chunker import CodeChunker, get_parent_classes
+from local_deepwiki.core.chunker import CodeChunker, approximate_token_count, get_parent_classes
 from local_deepwiki.core.parser import CodeParser
 from local_deepwiki.models import ChunkType, Language
 
@@ -722,6 +723,138 @@ class TestChunkerWithConfig:
         assert len(method_chunks) == 0
 
 
+def _long_function(statements: int) -> str:
+    """Python source for one function with many one-line statements."""
+    body = "\n".join(
+        f"    value_{i} = transform(value_{i - 1}, factor={i})" for i in range(1, statements)
+    )
+    return f'def pipeline(value_0):\n    """Run the pipeline."""\n{body}\n    return value_0\n'
+
+
+class TestTokenBudget:
+    """Tests for splitting chunks over max_chunk_tokens."""
+
+    def test_approximate_token_count_splits_identifiers(self):
+        """Test identifiers count as their sub-words plus separators."""
+        assert approximate_token_count("getUserData") == 3
+        assert approximate_token_count("get_user_data") == 5
+        assert approximate_token_count("x = 42") == 3
+        assert approximate_token_count("") == 0
+
+    def test_small_function_not_split(self, tmp_path):
+        """Test chunks within the budget are unchanged."""
+        test_file = tmp_path / "small.py"
+        test_file.write_text(_long_function(5))
+
+        chunks = list(
+            CodeChunker(ChunkingConfig(max_chunk_tokens=512)).chunk_file(test_file, tmp_path)
+        )
+
+        functions = [c for c in chunks if c.chunk_type == ChunkType.FUNCTION]
+        assert len(functions) == 1
+        assert "part_index" not in functions[0].metadata
+
+    def test_long_function_split_on_statements(self, tmp_path):
+        """Test parts fit the budget, cover every statement and keep the signature."""
+        test_file = tmp_path / "long.py"
+        test_file.write_text(_long_function(120))
+        config = ChunkingConfig(max_chunk_tokens=128, overlap_tokens=20)
+
+        chunks = list(CodeChunker(config).chunk_file(test_file, tmp_path))
+        parts = [c for c in chunks if c.name == "pipeline"]
+
+        assert len(parts) > 1
+        assert all(approximate_token_count(p.content) <= 128 for p in parts)
+        assert all(p.content.startswith("def pipeline(value_0):") for p in parts)
+        # Every part ends on a whole statement
+        statement = re.compile(r"    (value_\d+ = transform\(.*\)|return value_0)")
+        assert all(statement.fullmatch(p.content.splitlines()[-1]) for p in parts)
+        body = "\n".join(p.content for p in parts)
+        assert all(f"value_{i} = " in body for i in range(1, 120))
+
+    def test_parts_link_to_first_part(self, tmp_path):
+        """Test only the first part is a FUNCTION and the rest link back to it."""
+        test_file = tmp_path / "long.py"
+        test_file.write_text(_long_function(120))
+
+        chunks = list(
+            CodeChunker(ChunkingConfig(max_chunk_tokens=128)).chunk_file(test_file, tmp_path)
+        )
+        first, *rest = [c for c in chunks if c.name == "pipeline"]
+
+        assert first.chunk_type == ChunkType.FUNCTION
+        assert first.docstring == "Run the pipeline."
+        assert first.metadata["part_index"] == 1
+        assert first.metadata["part_count"] == len(rest) + 1
+        for index, part in enumerate(rest, start=2):
+            assert part.chunk_type == ChunkType.OTHER
+            assert part.metadata["split_from"] == first.id
+            assert part.metadata["split_chunk_type"] == "function"
+            assert part.metadata["part_index"] == index
+        assert len({c.id for c in chunks}) == len(chunks)
+
+    def test_parts_overlap(self, tmp_path):
+        """Test consecutive parts share trailing statements up to the overlap."""
+        test_file = tmp_path / "long.py"
+        test_file.write_text(_long_function(120))
+        config = ChunkingConfig(max_chunk_tokens=128, overlap_tokens=40)
+
+        chunks = list(CodeChunker(config).chunk_file(test_file, tmp_path))
+        parts = [c for c in chunks if c.name == "pipeline"]
+
+        for previous, part in zip(parts, parts[1:]):
+            assert part.start_line < previous.end_line
+            last_statement = previous.content.splitlines()[-1]
+            assert last_statement in part.content
+
+    def test_oversized_class_split_into_methods(self, tmp_path):
+        """Test a short class over the token budget becomes summary plus methods."""
+        methods = "\n".join(
+            f"    def method_{i}(self, value):\n        return transform(value, {i})\n"
+            for i in range(12)
+        )
+        test_file = tmp_path / "service.py"
+        test_file.write_text(f"class Service:\n{methods}")
+        config = ChunkingConfig(max_chunk_tokens=64, class_split_threshold=1000)
+
+        chunks = list(CodeChunker(config).chunk_file(test_file, tmp_path))
+
+        class_chunks = [c for c in chunks if c.chunk_type == ChunkType.CLASS]
+        assert class_chunks[0].metadata.get("is_summary") is True
+        assert len([c for c in chunks if c.chunk_type == ChunkType.METHOD]) == 12
+
+    def test_minified_line_is_cut(self, tmp_path):
+        """Test a single line over the budget is cut into pieces."""
+        test_file = tmp_path / "bundle.js"
+        test_file.write_text("function f(a) { " + "a = a + 1; " * 400 + "return a; }\n")
+
+        chunks = list(
+            CodeChunker(ChunkingConfig(max_chunk_tokens=100)).chunk_file(test_file, tmp_path)
+        )
+        parts = [c for c in chunks if c.name == "f"]
+
+        assert len(parts) > 1
+        assert all(approximate_token_count(p.content) <= 110 for p in parts)
+
+    def test_custom_token_counter(self, tmp_path):
+        """Test a tokenizer-backed counter can replace the approximation."""
+        test_file = tmp_path / "long.py"
+        test_file.write_text(_long_function(40))
+
+        def count_lines(text: str) -> int:
+            return text.count("\n") + 1
+
+        chunks = list(
+            CodeChunker(ChunkingConfig(max_chunk_tokens=10), token_counter=count_lines).chunk_file(
+                test_file, tmp_path
+            )
+        )
+        parts = [c for c in chunks if c.name == "pipeline"]
+
+        assert all(p.content.count("\n") + 1 <= 10 for p in parts)
+        assert len(parts) >= 5
+
+
 class TestModuleDocstring:
     """Tests for module docstring extraction."""
 
@@ -774,3 +907,162 @@ def func():
 
         module_chunk = [c for c in chunks if c.chunk_type == ChunkType.MODULE][0]
         assert module_chunk.docstring is None
+
+
+class TestSingleTraversal:
+    """Tests for extracting chunk nodes with one compiled query per language."""
+
+    SOURCES = {
+        "sample.py": """
+import os
+from typing import Any
+
+def outer():
+    def inner():
+        pass
+    return inner
+
+class Outer:
+    def method(self):
+        def helper():
+            pass
+
+    class Inner:
+        def inner_method(self):
+            pass
+
+async def fetch():
+    pass
+""",
+        "sample.js": """
+import { a } from './a';
+
+function top() {
+  const arrow = () => 1;
+}
+
+class Widget extends Base {
+  render() {
+    return function () {};
+  }
+}
+""",
+        "sample.go": """
+package main
+
+import "fmt"
+
+type Point struct {
+	X int
+}
+
+func (p *Point) String() string {
+	return fmt.Sprint(p.X)
+}
+
+func main() {}
+""",
+    }
+
+    @staticmethod
+    def _walk_reference(root, language):
+        """Collect nodes the way separate full-tree walks would."""
+        from local_deepwiki.core.chunker import (
+            CLASS_NODE_TYPES,
+            FUNCTION_NODE_TYPES,
+            IMPORT_NODE_TYPES,
+        )
+        from local_deepwiki.core.parser import find_nodes_by_type
+
+        class_types = CLASS_NODE_TYPES[language]
+        function_types = FUNCTION_NODE_TYPES[language]
+
+        def inside_class(node):
+            parent = node.parent
+            while parent is not None:
+                if parent.type in class_types:
+                    return True
+                parent = parent.parent
+            return False
+
+        return (
+            find_nodes_by_type(root, IMPORT_NODE_TYPES[language]),
+            [
+                (c, find_nodes_by_type(c, function_types))
+                for c in find_nodes_by_type(root, class_types)
+            ],
+            [f for f in find_nodes_by_type(root, function_types) if not inside_class(f)],
+        )
+
+    @pytest.mark.parametrize("file_name", sorted(SOURCES))
+    def test_matches_full_tree_walks(self, file_name, tmp_path):
+        """Test one traversal finds the same nodes, in the same order, as full walks."""
+        test_file = tmp_path / file_name
+        test_file.write_text(self.SOURCES[file_name])
+        chunker = CodeChunker()
+        root, language, _ = chunker.parser.parse_file(test_file)
+
+        nodes = chunker._collect_nodes(root, language)
+        imports, classes, functions = self._walk_reference(root, language)
+
+        def spans(found):
+            return [(n.start_byte, n.end_byte) for n in found]
+
+        assert spans(nodes.imports) == spans(imports)
+        assert spans(c for c, _ in nodes.classes) == spans(c for c, _ in classes)
+        for (_, methods), (_, expected) in zip(nodes.classes, classes):
+            assert spans(methods) == spans(expected)
+        assert spans(nodes.functions) == spans(functions)
+
+    def test_nested_functions_stay_top_level(self, tmp_path):
+        """Test functions nested in functions are top-level, those in classes are not."""
+        test_file = tmp_path / "sample.py"
+        test_file.write_text(self.SOURCES["sample.py"])
+
+        chunks = list(CodeChunker().chunk_file(test_file, tmp_path))
+
+        functions = [c.name for c in chunks if c.chunk_type == ChunkType.FUNCTION]
+        classes = [c.name for c in chunks if c.chunk_type == ChunkType.CLASS]
+        assert functions == ["outer", "inner", "fetch"]
+        assert classes == ["Outer", "Inner"]
+
+    def test_ruby_keywords_and_calls_not_extracted(self, tmp_path):
+        """Test Ruby class/module keywords are not classes and only requires are imports."""
+        test_file = tmp_path / "service.rb"
+        test_file.write_text(
+            """
+require 'json'
+require_relative 'helper'
+
+module Tools
+end
+
+class Service < Base
+  def run
+    puts 'running'
+    logger.require 'not an import'
+  end
+end
+"""
+        )
+
+        chunks = list(CodeChunker().chunk_file(test_file, tmp_path))
+
+        classes = [c.name for c in chunks if c.chunk_type == ChunkType.CLASS]
+        assert classes == ["Tools", "Service"]
+        imports = [c for c in chunks if c.chunk_type == ChunkType.IMPORT][0]
+        assert imports.content == "require 'json'\nrequire_relative 'helper'"
+
+    def test_query_compiled_once_per_language(self, tmp_path):
+        """Test the extraction query is reused across files."""
+        chunker = CodeChunker()
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("def f():\n    pass\n")
+            list(chunker.chunk_file(tmp_path / name, tmp_path))
+        query = chunker._get_query(Language.PYTHON)
+
+        (tmp_path / "c.py").write_text("def g():\n    pass\n")
+        list(chunker.chunk_file(tmp_path / "c.py", tmp_path))
+
+        assert chunker._get_query(Language.PYTHON) is query
+        assert list(chunker._queries) == [Language.PYTHON]
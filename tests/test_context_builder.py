@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from local_deepwiki.generators.callgraph import CallGraphIndex
 from local_deepwiki.generators.context_builder import (
     FileContext,
     build_file_context,
@@ -34,6 +35,11 @@ def make_chunk(
     )
 
 
+async def no_results(queries: list[str], **_kwargs) -> list[list]:
+    """Answer a batched search with no hits for every query."""
+    return [[] for _ in queries]
+
+
 class TestExtractImportsFromChunks:
     """Tests for extract_imports_from_chunks function."""
 
@@ -198,7 +204,7 @@ class TestBuildFileContext:
         ]
 
         mock_vector_store = MagicMock()
-        mock_vector_store.search = AsyncMock(return_value=[])
+        mock_vector_store.search_many = AsyncMock(side_effect=no_results)
 
         result = await build_file_context(
             file_path="src/test.py",
@@ -214,7 +220,7 @@ class TestBuildFileContext:
     async def test_builds_context_with_empty_chunks(self, tmp_path: Path) -> None:
         """Test building context with no chunks."""
         mock_vector_store = MagicMock()
-        mock_vector_store.search = AsyncMock(return_value=[])
+        mock_vector_store.search_many = AsyncMock(side_effect=no_results)
 
         result = await build_file_context(
             file_path="src/test.py",
@@ -227,6 +233,127 @@ class TestBuildFileContext:
         assert result.imports == []
         assert result.callers == {}
 
+    async def test_uses_call_graph_index_for_callers(self, tmp_path: Path) -> None:
+        """Test callers come from the call graph index without vector searches."""
+        chunks = [make_chunk(name="my_func", file_path="src/test.py")]
+        index = CallGraphIndex()
+        index.set_file("src/main.py", "h", {"main": ["my_func"]})
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search_many = AsyncMock(side_effect=no_results)
+
+        result = await build_file_context(
+            file_path="src/test.py",
+            chunks=chunks,
+            repo_path=tmp_path,
+            vector_store=mock_vector_store,
+            call_graph_index=index,
+        )
+
+        assert result.callers == {"my_func": ["src/main.py"]}
+        searched = [
+            q for call in mock_vector_store.search_many.await_args_list for q in call.args[0]
+        ]
+        assert "my_func" not in searched
+
+    async def test_batches_lookups_per_kind(self, tmp_path: Path) -> None:
+        """Test callers and type definitions are each looked up in one batched search."""
+        from local_deepwiki.models import SearchResult
+
+        chunks = [
+            make_chunk(name="load_config", content="def load_config(path: Settings): pass"),
+            make_chunk(name="save_config", content="def save_config(): pass"),
+        ]
+        caller = make_chunk(content="load_config(p)\nsave_config()", file_path="src/main.py")
+        settings = make_chunk(
+            chunk_type=ChunkType.CLASS,
+            name="Settings",
+            content="class Settings:",
+            file_path="src/s.py",
+        )
+
+        async def search_many(queries: list[str], **kwargs) -> list[list[SearchResult]]:
+            if kwargs.get("chunk_type") == "class":
+                return [[SearchResult(chunk=settings, score=1.0)] for _ in queries]
+            return [[SearchResult(chunk=caller, score=1.0)] for _ in queries]
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search_many = AsyncMock(side_effect=search_many)
+
+        result = await build_file_context(
+            file_path="src/test.py",
+            chunks=chunks,
+            repo_path=tmp_path,
+            vector_store=mock_vector_store,
+        )
+
+        assert result.callers == {"load_config": ["src/main.py"], "save_config": ["src/main.py"]}
+        assert result.type_definitions == ["Settings: class Settings:"]
+        assert mock_vector_store.search_many.await_count == 2
+
+    async def test_caller_search_failure_only_loses_failing_entity(self) -> None:
+        """Test a failed batch is retried per entity, keeping the callers that succeed."""
+        from local_deepwiki.generators.context_builder import get_callers_from_other_files
+        from local_deepwiki.models import SearchResult
+
+        caller = make_chunk(content="load_config(p)\nsave_config()", file_path="src/main.py")
+
+        async def search(query: str, **kwargs) -> list[SearchResult]:
+            if query == "save_config":
+                raise ValueError("bad query")
+            return [SearchResult(chunk=caller, score=1.0)]
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search_many = AsyncMock(side_effect=ValueError("bad query"))
+        mock_vector_store.search = AsyncMock(side_effect=search)
+
+        callers = await get_callers_from_other_files(
+            "src/test.py", ["load_config", "save_config"], Path("."), mock_vector_store
+        )
+
+        assert callers == {"load_config": ["src/main.py"]}
+        assert mock_vector_store.search.await_count == 2
+
+    async def test_related_file_search_failure_only_loses_failing_module(self) -> None:
+        """Test a failed related-file batch is retried per module."""
+        from local_deepwiki.generators.context_builder import find_related_files
+        from local_deepwiki.models import SearchResult
+
+        async def search(query: str, **kwargs) -> list[SearchResult]:
+            if query == "bad":
+                raise ValueError("bad query")
+            return [SearchResult(chunk=make_chunk(file_path=f"src/{query}.py"), score=1.0)]
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search_many = AsyncMock(side_effect=ValueError("bad query"))
+        mock_vector_store.search = AsyncMock(side_effect=search)
+
+        related = await find_related_files("src/test.py", ["config", "bad"], mock_vector_store)
+
+        assert related == ["src/config.py"]
+
+    async def test_type_search_failure_only_loses_failing_type(self) -> None:
+        """Test a failed type definition batch is retried per type."""
+        from local_deepwiki.generators.context_builder import get_type_definitions_used
+        from local_deepwiki.models import SearchResult
+
+        chunks = [make_chunk(content="def load(path: Settings) -> Broken: pass")]
+        settings = make_chunk(chunk_type=ChunkType.CLASS, content="class Settings:")
+
+        async def search(query: str, **kwargs) -> list[SearchResult]:
+            if query == "Broken":
+                raise ValueError("bad query")
+            assert kwargs["chunk_type"] == "class"
+            return [SearchResult(chunk=settings, score=1.0)]
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search_many = AsyncMock(side_effect=ValueError("bad query"))
+        mock_vector_store.search = AsyncMock(side_effect=search)
+
+        type_defs = await get_type_definitions_used(chunks, mock_vector_store)
+
+        assert type_defs == ["Settings: class Settings:"]
+
 
 class TestFileContextDataclass:
     """Tests for the FileContext dataclass."""
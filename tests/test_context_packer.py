@@ -0,0 +1,204 @@
+"""Tests for token-budget aware context packing."""
+
+from local_deepwiki.core.context_packer import (
+    CONTEXT_SEPARATOR,
+    MIN_TRIMMED_TOKENS,
+    TRUNCATION_MARKER,
+    pack_context,
+)
+from local_deepwiki.models import ChunkType, CodeChunk, Language, SearchResult
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words, a simple stand-in for a tokenizer."""
+    return len(text.split())
+
+
+def make_result(
+    id: str,
+    start_line: int,
+    end_line: int,
+    score: float = 0.5,
+    file_path: str = "src/app.py",
+    content: str | None = None,
+    chunk_type: ChunkType = ChunkType.FUNCTION,
+) -> SearchResult:
+    """Create a search result whose content has one line per line of its range."""
+    if content is None:
+        content = "\n".join(f"line {n}" for n in range(start_line, end_line + 1))
+    chunk = CodeChunk(
+        id=id,
+        file_path=file_path,
+        language=Language.PYTHON,
+        chunk_type=chunk_type,
+        name=id,
+        content=content,
+        start_line=start_line,
+        end_line=end_line,
+    )
+    return SearchResult(chunk=chunk, score=score)
+
+
+class TestPackContext:
+    """Tests for pack_context."""
+
+    def test_empty_results(self):
+        """Test nothing to pack gives an empty context."""
+        context = pack_context([], 1000, count_words)
+
+        assert context.text == ""
+        assert context.blocks == []
+        assert context.tokens_used == 0
+        assert context.chunks_packed == 0
+
+    def test_renders_header_and_code(self):
+        """Test a block cites its file, lines, type and name."""
+        context = pack_context([make_result("handler", 3, 4)], 1000, count_words)
+
+        assert context.text == (
+            "File: src/app.py:3-4 | Type: function | Name: handler\n```\nline 3\nline 4\n```"
+        )
+        assert context.tokens_used == count_words(context.text)
+
+    def test_contained_chunk_is_deduplicated(self):
+        """Test a chunk inside another chunk of the same file is not repeated."""
+        cls = make_result("Service", 1, 20, score=0.4, chunk_type=ChunkType.CLASS)
+        method = make_result("Service.run", 5, 8, score=0.9, chunk_type=ChunkType.METHOD)
+
+        context = pack_context([cls, method], 1000, count_words)
+
+        assert len(context.blocks) == 1
+        block = context.blocks[0]
+        assert (block.start_line, block.end_line) == (1, 20)
+        assert block.score == 0.9
+        assert context.text.count("line 5\n") == 1
+        assert "Type: class, method | Name: Service, Service.run" in context.text
+        assert context.chunks_packed == 2
+
+    def test_overlapping_and_adjacent_chunks_merge(self):
+        """Test chunks that overlap or touch become one contiguous block."""
+        results = [
+            make_result("a", 1, 5),
+            make_result("b", 4, 8),
+            make_result("c", 9, 10),
+            make_result("d", 20, 22),
+        ]
+
+        context = pack_context(results, 1000, count_words)
+
+        ranges = sorted((b.start_line, b.end_line) for b in context.blocks)
+        assert ranges == [(1, 10), (20, 22)]
+        merged = next(b for b in context.blocks if b.start_line == 1)
+        assert merged.lines == [f"line {n}" for n in range(1, 11)]
+
+    def test_chunks_of_different_files_do_not_merge(self):
+        """Test line ranges only merge within a file."""
+        results = [
+            make_result("a", 1, 5, file_path="a.py"),
+            make_result("b", 1, 5, file_path="b.py"),
+        ]
+
+        context = pack_context(results, 1000, count_words)
+
+        assert len(context.blocks) == 2
+
+    def test_content_not_matching_range_is_not_merged(self):
+        """Test summary chunks whose content is not their lines stay separate."""
+        summary = make_result(
+            "module", 1, 100, content="Module summary", chunk_type=ChunkType.MODULE
+        )
+        function = make_result("f", 10, 12)
+
+        context = pack_context([summary, function], 1000, count_words)
+
+        assert len(context.blocks) == 2
+        assert "Module summary" in context.text
+        assert "line 10" in context.text
+
+    def test_duplicate_chunks_keep_best_score(self):
+        """Test the same chunk retrieved twice is packed once with its best score."""
+        results = [make_result("a", 1, 3, score=0.2), make_result("a", 1, 3, score=0.7)]
+
+        context = pack_context(results, 1000, count_words)
+
+        assert len(context.blocks) == 1
+        assert context.blocks[0].score == 0.7
+        assert context.chunks_packed == 1
+
+    def test_most_relevant_blocks_first(self):
+        """Test blocks are ordered by relevance score."""
+        results = [
+            make_result("low", 1, 2, score=0.1, file_path="low.py"),
+            make_result("high", 1, 2, score=0.9, file_path="high.py"),
+        ]
+
+        context = pack_context(results, 1000, count_words)
+
+        assert [b.file_path for b in context.blocks] == ["high.py", "low.py"]
+        assert [r.chunk.id for r in context.results] == ["high", "low"]
+        assert CONTEXT_SEPARATOR in context.text
+
+    def test_stays_within_budget(self):
+        """Test low-relevance blocks are dropped once the budget is spent."""
+        results = [
+            make_result(f"f{n}", 1, 10, score=n / 10, file_path=f"f{n}.py") for n in range(10)
+        ]
+        one_block = count_words(pack_context(results[:1], 1000, count_words).text)
+        budget = one_block * 3 + count_words(CONTEXT_SEPARATOR) * 2
+
+        context = pack_context(results, budget, count_words)
+
+        assert context.tokens_used == budget
+        assert context.tokens_used == count_words(context.text)
+        assert context.chunks_packed == 3
+        assert context.chunks_dropped == 7
+        assert {r.chunk.id for r in context.results} == {"f9", "f8", "f7"}
+
+    def test_trims_block_that_does_not_fit(self):
+        """Test a large block is cut to the lines that fit the remaining budget."""
+        big = make_result("big", 1, 200, score=0.9)
+        budget = MIN_TRIMMED_TOKENS * 2
+
+        context = pack_context([big], budget, count_words)
+
+        assert len(context.blocks) == 1
+        block = context.blocks[0]
+        assert block.truncated
+        assert block.start_line == 1
+        assert 1 <= block.end_line < 200
+        assert len(block.lines) == block.end_line
+        assert TRUNCATION_MARKER in context.text
+        assert f"File: src/app.py:1-{block.end_line} " in context.text
+        assert context.tokens_used <= budget
+
+    def test_trimmed_block_keeps_only_included_chunks(self):
+        """Test chunks cut off by trimming are not reported as packed."""
+        head = make_result("head", 1, 100, score=0.9)
+        tail = make_result("tail", 101, 200, score=0.5)
+
+        context = pack_context([head, tail], MIN_TRIMMED_TOKENS * 2, count_words)
+
+        assert [r.chunk.id for r in context.results] == ["head"]
+        assert context.chunks_dropped == 1
+
+    def test_skips_block_when_too_little_budget_left(self):
+        """Test a block is not trimmed to a sliver of a few tokens."""
+        first = make_result("first", 1, 5, score=0.9, file_path="a.py")
+        second = make_result("second", 1, 100, score=0.5, file_path="b.py")
+        budget = count_words(pack_context([first], 1000, count_words).text) + 10
+
+        context = pack_context([first, second], budget, count_words)
+
+        assert [b.file_path for b in context.blocks] == ["a.py"]
+        assert not context.blocks[0].truncated
+
+    def test_uses_given_token_counter(self):
+        """Test the budget is measured with the caller's counter."""
+        result = make_result("f", 1, 50)
+
+        by_words = pack_context([result], 150, count_words)
+        by_chars = pack_context([result], 150, len)
+
+        assert not by_words.blocks[0].truncated
+        assert by_chars.blocks[0].truncated
+        assert by_chars.tokens_used == len(by_chars.text)
@@ -2,6 +2,7 @@
 
 from local_deepwiki.generators.crosslinks import (
     CrossLinker,
+    EntityMatcher,
     EntityRegistry,
     add_cross_links,
     camel_to_spaced,
@@ -464,6 +465,110 @@ class TestCrossLinker:
         assert "**[Wiki Generator](wiki.md)**" in result.content
 
 
+def _linker_with(*entities: tuple[str, str]) -> CrossLinker:
+    """Create a CrossLinker for (name, wiki_path) class entities."""
+    registry = EntityRegistry()
+    for name, wiki_path in entities:
+        registry.register_entity(
+            name=name,
+            entity_type=ChunkType.CLASS,
+            wiki_path=wiki_path,
+            file_path=wiki_path.replace(".md", ".py"),
+        )
+    return CrossLinker(registry)
+
+
+class TestEntityMatcher:
+    """Tests for the single-pass EntityMatcher."""
+
+    def test_matcher_cached_until_registration(self):
+        """Test the compiled matcher is reused and rebuilt after new entities."""
+        registry = EntityRegistry()
+        registry.register_entity("VectorStore", ChunkType.CLASS, "files/vs.md", "vs.py")
+
+        matcher = registry.get_matcher()
+        assert registry.get_matcher() is matcher
+        assert len(matcher) == 2  # Name plus "Vector Store" alias
+
+        registry.register_entity("WikiGenerator", ChunkType.CLASS, "files/wg.md", "wg.py")
+        assert registry.get_matcher() is not matcher
+
+    def test_empty_registry_returns_text(self):
+        """Test an empty matcher leaves text untouched."""
+        matcher = EntityMatcher({}, {})
+        assert matcher.link_text("Some text", set(), lambda p: p) == "Some text"
+
+    def test_longest_alias_wins(self):
+        """Test overlapping aliases link the longest match."""
+        linker = _linker_with(
+            ("WikiGenerator", "files/wg.md"),
+            ("WikiGeneratorConfig", "files/wgc.md"),
+        )
+        page = WikiPage(
+            path="index.md",
+            title="Index",
+            content="The Wiki Generator Config controls the Wiki Generator.",
+            generated_at=0,
+        )
+
+        result = linker.add_links(page)
+
+        assert "[Wiki Generator Config](files/wgc.md)" in result.content
+        assert "[Wiki Generator](files/wg.md)." in result.content
+
+    def test_falls_back_to_shorter_name_when_longest_is_self(self):
+        """Test a shorter alias still links when the longest is on the current page."""
+        linker = _linker_with(
+            ("WikiGenerator", "files/wg.md"),
+            ("WikiGeneratorConfig", "files/wgc.md"),
+        )
+        page = WikiPage(
+            path="files/wgc.md",
+            title="Config",
+            content="The Wiki Generator Config is read at startup.",
+            generated_at=0,
+        )
+
+        result = linker.add_links(page)
+
+        assert "[Wiki Generator](wg.md) Config" in result.content
+
+    def test_does_not_link_in_headings(self):
+        """Test headings are left untouched."""
+        linker = _linker_with(("VectorStore", "files/vs.md"))
+        page = WikiPage(
+            path="index.md",
+            title="Index",
+            content="## VectorStore usage\n\nVectorStore is fast.",
+            generated_at=0,
+        )
+
+        result = linker.add_links(page)
+
+        assert "## VectorStore usage" in result.content
+        assert "[VectorStore](files/vs.md) is fast." in result.content
+
+    def test_single_pass_does_not_relink_targets(self):
+        """Test names appearing inside generated link targets are not linked again."""
+        linker = _linker_with(
+            ("VectorStore", "files/VectorStoreHelpers.md"),
+            ("VectorStoreHelpers", "files/helpers.md"),
+        )
+        page = WikiPage(
+            path="index.md",
+            title="Index",
+            content="VectorStore and VectorStoreHelpers.",
+            generated_at=0,
+        )
+
+        result = linker.add_links(page)
+
+        assert result.content == (
+            "[VectorStore](files/VectorStoreHelpers.md) and "
+            "[VectorStoreHelpers](files/helpers.md)."
+        )
+
+
 class TestAddCrossLinks:
     """Tests for add_cross_links function."""
 
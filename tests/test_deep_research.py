@@ -77,11 +77,11 @@ class MockLLMProvider(LLMProvider):
         max_tokens: int = 4096,
         temperature: float = 0.7,
     ) -> AsyncIterator[str]:
-        async def _stream() -> AsyncIterator[str]:
-            response = await self.generate(prompt, system_prompt, max_tokens, temperature)
-            yield response
-
-        return _stream()
+        response = await self.generate(prompt, system_prompt, max_tokens, temperature)
+        # Two pieces, like a real stream
+        middle = len(response) // 2
+        yield response[:middle]
+        yield response[middle:]
 
 
 def make_chunk(
@@ -108,6 +108,19 @@ def make_search_result(chunk: CodeChunk, score: float = 0.8) -> SearchResult:
     return SearchResult(chunk=chunk, score=score, highlights=[])
 
 
+def make_vector_store() -> MagicMock:
+    """Create a mock vector store whose search_many runs each query through search."""
+    store = MagicMock()
+    store.search = AsyncMock(return_value=[])
+    store.embedding_provider = MockEmbeddingProvider(8)
+
+    async def search_many(queries, limit=10, **_kwargs):
+        return [await store.search(query, limit=limit) for query in queries]
+
+    store.search_many = AsyncMock(side_effect=search_many)
+    return store
+
+
 class TestSubQuestion:
     """Tests for SubQuestion model."""
 
@@ -149,7 +162,7 @@ class TestDeepResearchPipelineDecomposition:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        store = MagicMock()
+        store = make_vector_store()
         store.search = AsyncMock(return_value=[])
         return store
 
@@ -277,7 +290,7 @@ class TestDeepResearchPipelineRetrieval:
 
     async def test_parallel_retrieval_calls_search(self, mock_llm):
         """Test that parallel retrieval calls search for each sub-question."""
-        mock_store = MagicMock()
+        mock_store = make_vector_store()
         mock_store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1")),
@@ -298,7 +311,7 @@ class TestDeepResearchPipelineRetrieval:
     async def test_retrieval_deduplicates_results(self, mock_llm):
         """Test that duplicate chunks are deduplicated."""
         chunk = make_chunk("same_id")
-        mock_store = MagicMock()
+        mock_store = make_vector_store()
         mock_store.search = AsyncMock(
             return_value=[
                 make_search_result(chunk, score=0.8),
@@ -325,7 +338,7 @@ class TestDeepResearchPipelineGapAnalysis:
     @pytest.fixture
     def mock_vector_store(self):
         """Create mock vector store with results."""
-        store = MagicMock()
+        store = make_vector_store()
         store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1", "auth.py")),
@@ -382,8 +395,8 @@ class TestDeepResearchPipelineGapAnalysis:
         await pipeline.research("Question")
 
         # Follow-up searches should be limited
-        # 1 initial + 3 max follow-ups
-        assert mock_vector_store.search.call_count <= 4
+        # 1 speculative + 1 sub-question + 3 max follow-ups
+        assert mock_vector_store.search.call_count <= 5
 
 
 class TestDeepResearchPipelineSynthesis:
@@ -392,7 +405,7 @@ class TestDeepResearchPipelineSynthesis:
     @pytest.fixture
     def mock_vector_store(self):
         """Create mock vector store."""
-        store = MagicMock()
+        store = make_vector_store()
         store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1", content="def auth(): pass")),
@@ -422,7 +435,7 @@ class TestDeepResearchPipelineSynthesis:
 
     async def test_synthesis_handles_no_results(self):
         """Test synthesis when no code is found."""
-        mock_store = MagicMock()
+        mock_store = make_vector_store()
         mock_store.search = AsyncMock(return_value=[])
 
         llm = MockLLMProvider(
@@ -442,13 +455,62 @@ class TestDeepResearchPipelineSynthesis:
         # Should return a message about no context
         assert "couldn't find" in result.answer.lower() or "no" in result.answer.lower()
 
+    async def test_synthesis_context_fits_token_budget(self):
+        """Test synthesis only sends, and cites, the chunks that fit the budget."""
+        store = make_vector_store()
+        big = "\n".join(f"value_{n} = {n}" for n in range(400))
+        store.search = AsyncMock(
+            return_value=[
+                make_search_result(make_chunk("small", file_path="a.py"), score=0.9),
+                make_search_result(make_chunk("big", file_path="b.py", content=big), score=0.5),
+            ]
+        )
+        llm = MockLLMProvider(
+            responses=[
+                json.dumps({"sub_questions": [{"question": "Q?", "category": "structure"}]}),
+                json.dumps({"gaps": [], "follow_up_queries": []}),
+                "Answer",
+            ]
+        )
+        pipeline = DeepResearchPipeline(
+            vector_store=store, llm_provider=llm, context_token_budget=60
+        )
+
+        result = await pipeline.research("Question")
+
+        assert "File: a.py:1-10" in llm.prompts[-1]
+        assert "value_0" not in llm.prompts[-1]
+        assert [s.file_path for s in result.sources] == ["a.py"]
+        assert result.total_chunks_analyzed == 1
+        assert "context tokens" in result.reasoning_trace[-1].description
+
+    async def test_synthesis_streams_to_answer_callback(self, mock_vector_store):
+        """Test the answer reaches answer_callback in pieces as synthesis streams it."""
+        llm = MockLLMProvider(
+            responses=[
+                json.dumps({"sub_questions": [{"question": "Q?", "category": "structure"}]}),
+                json.dumps({"gaps": [], "follow_up_queries": []}),
+                "Auth lives in auth.py:1-10",
+            ]
+        )
+        pipeline = DeepResearchPipeline(vector_store=mock_vector_store, llm_provider=llm)
+        pieces: list[str] = []
+
+        async def on_answer(text: str) -> None:
+            pieces.append(text)
+
+        result = await pipeline.research("Question", answer_callback=on_answer)
+
+        assert len(pieces) == 2
+        assert "".join(pieces) == result.answer == "Auth lives in auth.py:1-10"
+
 
 class TestDeepResearchPipelineTracing:
     """Tests for reasoning trace."""
 
     @pytest.fixture
     def mock_vector_store(self):
-        store = MagicMock()
+        store = make_vector_store()
         store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1")),
@@ -512,7 +574,7 @@ class TestDeepResearchPipelineIntegration:
     async def test_full_pipeline_flow(self):
         """Test complete pipeline with mocked dependencies."""
         # Mock vector store
-        mock_store = MagicMock()
+        mock_store = make_vector_store()
         mock_store.search = AsyncMock(
             return_value=[
                 make_search_result(
@@ -584,7 +646,7 @@ The login function likely uses the database connection for user verification."""
 
     async def test_pipeline_counts_llm_calls(self):
         """Test that LLM calls are counted correctly."""
-        mock_store = MagicMock()
+        mock_store = make_vector_store()
         mock_store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1")),
@@ -667,7 +729,7 @@ class TestDeepResearchProgress:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        store = MagicMock()
+        store = make_vector_store()
         store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1")),
@@ -893,7 +955,7 @@ class TestResearchCancellation:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        store = MagicMock()
+        store = make_vector_store()
         store.search = AsyncMock(
             return_value=[
                 make_search_result(make_chunk("c1")),
@@ -1119,3 +1181,167 @@ class TestResearchCancellation:
     async def test_cancelled_progress_type_exists(self):
         """Test that CANCELLED progress type exists."""
         assert ResearchProgressType.CANCELLED == "cancelled"
+
+
+class TestResearchSession:
+    """Tests for the per-repository research session cache."""
+
+    def test_queries_normalized(self):
+        """Test case, spacing and trailing punctuation do not split entries."""
+        from local_deepwiki.core.deep_research import ResearchSession
+
+        session = ResearchSession()
+        session.put_embedding("How does  auth work?", [1.0])
+
+        assert session.get_embedding("how does auth work") == [1.0]
+        assert session.get_results("how does auth work", limit=5) is None
+
+    def test_results_keyed_by_limit(self):
+        """Test results retrieved with one limit are not served for another."""
+        from local_deepwiki.core.deep_research import ResearchSession
+
+        session = ResearchSession()
+        results = [make_search_result(make_chunk("c1"))]
+        session.put_results("auth", 5, results)
+
+        assert session.get_results("Auth", 5) == results
+        assert session.get_results("auth", 3) is None
+
+    def test_gap_analysis_keyed_by_chunks(self):
+        """Test gap analyses are reused only for the same retrieved chunks."""
+        from local_deepwiki.core.deep_research import ResearchSession
+
+        session = ResearchSession()
+        session.put_gap_analysis("Question", ["a", "b"], ["follow up"])
+
+        assert session.get_gap_analysis("question?", ["b", "a"]) == ["follow up"]
+        assert session.get_gap_analysis("question", ["a"]) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test each kind of entry is bounded with LRU eviction."""
+        from local_deepwiki.core.deep_research import ResearchSession
+
+        session = ResearchSession(max_embeddings=2)
+        session.put_embedding("a", [1.0])
+        session.put_embedding("b", [2.0])
+        session.get_embedding("a")
+        session.put_embedding("c", [3.0])
+
+        assert session.get_embedding("b") is None
+        assert session.get_embedding("a") == [1.0]
+        assert session.stats["embeddings"] == 2
+
+
+class TestDeepResearchSessionReuse:
+    """Tests for batched, speculative and session-cached retrieval."""
+
+    @staticmethod
+    def responses() -> list[str]:
+        """LLM responses for one research run with a single follow-up query."""
+        return [
+            json.dumps(
+                {
+                    "sub_questions": [
+                        {"question": "Where is auth?", "category": "structure"},
+                        {"question": "How are tokens checked?", "category": "flow"},
+                    ]
+                }
+            ),
+            json.dumps({"gaps": ["sessions"], "follow_up_queries": ["session storage"]}),
+            "Answer",
+        ]
+
+    async def test_sub_questions_embedded_in_one_batch(self):
+        """Test sub-questions share one embedding call and one store call."""
+        store = make_vector_store()
+        store.embedding_provider.embed = AsyncMock(
+            side_effect=lambda texts: [[0.1] * 8 for _ in texts]
+        )
+        pipeline = DeepResearchPipeline(vector_store=store, llm_provider=MockLLMProvider())
+        sub_questions = [SubQuestion(question=q, category="structure") for q in ("a", "b", "c")]
+
+        await pipeline._parallel_retrieve(sub_questions)
+
+        store.embedding_provider.embed.assert_awaited_once_with(["a", "b", "c"])
+        store.search_many.assert_awaited_once()
+        assert len(store.search_many.await_args.kwargs["embeddings"]) == 3
+
+    async def test_failed_batch_searched_per_query(self):
+        """Test a failed batch falls back to one search per query, skipping failures."""
+
+        class ProviderError(Exception):
+            """Stands in for an HTTP client error from the embedding provider."""
+
+        store = make_vector_store()
+        store.embedding_provider.embed = AsyncMock(side_effect=ProviderError("timeout"))
+
+        async def search(query, **_kwargs):
+            if query == "b":
+                raise ProviderError("bad query")
+            return [make_search_result(make_chunk(f"id-{query}"))]
+
+        store.search = AsyncMock(side_effect=search)
+        pipeline = DeepResearchPipeline(vector_store=store, llm_provider=MockLLMProvider())
+
+        results = await pipeline._retrieve(["a", "b", "c"], limit=5)
+
+        assert [[r.chunk.id for r in found] for found in results] == [["id-a"], [], ["id-c"]]
+        assert store.search.await_count == 3
+
+    async def test_question_retrieved_during_decomposition(self):
+        """Test retrieval for the question starts before decomposition finishes."""
+        import asyncio
+
+        searched = asyncio.Event()
+        store = make_vector_store()
+
+        async def search(query, **_kwargs):
+            if query == "How does auth work?":
+                searched.set()
+            return [make_search_result(make_chunk(f"id-{query}"))]
+
+        store.search = AsyncMock(side_effect=search)
+
+        class WaitingLLM(MockLLMProvider):
+            async def generate(self, prompt, **kwargs):
+                if self.call_count == 0:
+                    # Decomposition only finishes once the speculative search ran
+                    await asyncio.wait_for(searched.wait(), timeout=1)
+                return await super().generate(prompt, **kwargs)
+
+        llm = WaitingLLM(responses=self.responses())
+        pipeline = DeepResearchPipeline(vector_store=store, llm_provider=llm)
+
+        result = await pipeline.research("How does auth work?")
+
+        assert result.answer == "Answer"
+        # 2 sub-questions + the question itself + 1 follow-up
+        assert result.total_chunks_analyzed == 4
+
+    async def test_repeat_question_served_from_session(self):
+        """Test a repeated question reuses embeddings, retrievals and gap analysis."""
+        from local_deepwiki.core.deep_research import ResearchSession
+
+        store = make_vector_store()
+        store.search = AsyncMock(return_value=[make_search_result(make_chunk("c1"))])
+        store.embedding_provider.embed = AsyncMock(
+            side_effect=lambda texts: [[0.1] * 8 for _ in texts]
+        )
+        session = ResearchSession()
+
+        first_llm = MockLLMProvider(responses=self.responses())
+        await DeepResearchPipeline(store, first_llm, session=session).research(
+            "How does auth work?"
+        )
+        searches = store.search.await_count
+        embeds = store.embedding_provider.embed.await_count
+
+        second_llm = MockLLMProvider(responses=[self.responses()[0], "Answer again"])
+        result = await DeepResearchPipeline(store, second_llm, session=session).research(
+            "how does auth work"
+        )
+
+        assert result.answer == "Answer again"
+        assert result.total_llm_calls == 2  # Gap analysis came from the session
+        assert store.search.await_count == searches
+        assert store.embedding_provider.embed.await_count == embeds
@@ -0,0 +1,122 @@
+"""Tests for the mermaid diagram cache and parallel rendering."""
+
+import threading
+import time
+
+from local_deepwiki.export.diagram_cache import DiagramCache, diagram_key, render_diagrams
+
+OPTIONS = {"format": "png", "background": "white", "scale": "2"}
+
+
+class TestDiagramKey:
+    """Tests for diagram cache keys."""
+
+    def test_key_depends_on_source_and_options(self):
+        """Test the key changes with the diagram or any render option."""
+        key = diagram_key("graph TD\nA-->B", OPTIONS)
+
+        assert key == diagram_key("graph TD\nA-->B", dict(reversed(OPTIONS.items())))
+        assert key != diagram_key("graph TD\nA-->C", OPTIONS)
+        assert key != diagram_key("graph TD\nA-->B", {**OPTIONS, "scale": "1"})
+
+
+class TestDiagramCache:
+    """Tests for the on-disk diagram cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test stored images are returned and misses are None."""
+        cache = DiagramCache(tmp_path / "cache")
+
+        assert cache.get("abc") is None
+        cache.put("abc", b"png")
+
+        assert cache.get("abc") == b"png"
+        assert cache.stats == {"hits": 1, "misses": 1, "writes": 1}
+        assert [p.name for p in (tmp_path / "cache").iterdir()] == ["abc.png"]
+
+    def test_write_failure_is_ignored(self, tmp_path):
+        """Test an unwritable cache directory does not raise."""
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory")
+        cache = DiagramCache(blocker)
+
+        cache.put("abc", b"png")
+
+        assert cache.get("abc") is None
+        assert cache.stats["writes"] == 0
+
+    def test_prune_keeps_used_keys(self, tmp_path):
+        """Test prune removes only images no longer referenced."""
+        cache = DiagramCache(tmp_path)
+        for key in ("keep", "stale1", "stale2"):
+            cache.put(key, key.encode())
+
+        assert cache.prune({"keep"}) == 2
+        assert cache.get("keep") == b"keep"
+        assert DiagramCache(tmp_path / "missing").prune(set()) == 0
+
+
+class TestRenderDiagrams:
+    """Tests for rendering diagrams through the cache."""
+
+    def test_repeated_diagrams_rendered_once(self):
+        """Test each distinct diagram is rendered a single time."""
+        calls = []
+
+        def render(code):
+            calls.append(code)
+            return code.encode()
+
+        result = render_diagrams(["a", "b", "a", "a"], render, OPTIONS)
+
+        assert sorted(calls) == ["a", "b"]
+        assert result == {"a": b"a", "b": b"b"}
+
+    def test_second_run_served_from_cache(self, tmp_path):
+        """Test unchanged diagrams render nothing the second time."""
+        cache = DiagramCache(tmp_path)
+        calls = []
+
+        def render(code):
+            calls.append(code)
+            return code.encode()
+
+        render_diagrams(["a", "b"], render, OPTIONS, cache)
+        result = render_diagrams(["a", "b", "c"], render, OPTIONS, cache)
+
+        assert sorted(calls) == ["a", "b", "c"]
+        assert result == {"a": b"a", "b": b"b", "c": b"c"}
+
+    def test_failures_are_not_cached(self, tmp_path):
+        """Test a failed render is retried on the next run."""
+        cache = DiagramCache(tmp_path)
+        attempts = []
+
+        def render(code):
+            attempts.append(code)
+            return None if len(attempts) == 1 else b"png"
+
+        assert render_diagrams(["a"], render, OPTIONS, cache) == {"a": None}
+        assert render_diagrams(["a"], render, OPTIONS, cache) == {"a": b"png"}
+        assert attempts == ["a", "a"]
+
+    def test_misses_render_in_parallel_within_limit(self):
+        """Test cache misses render concurrently, bounded by max_workers."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def render(code):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return code.encode()
+
+        result = render_diagrams([str(i) for i in range(8)], render, OPTIONS, max_workers=3)
+
+        assert len(result) == 8
+        assert peak == 3
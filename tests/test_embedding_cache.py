@@ -0,0 +1,177 @@
+"""Tests for the persistent embedding cache."""
+
+from local_deepwiki.core.embedding_cache import EmbeddingCache, embedding_text_hash
+from local_deepwiki.core.vectorstore import VectorStore
+from local_deepwiki.models import ChunkType, CodeChunk, IndexStatus, Language
+from local_deepwiki.providers.base import EmbeddingProvider
+
+
+class CountingEmbeddingProvider(EmbeddingProvider):
+    """Embedding provider that records every text it embeds."""
+
+    def __init__(self, name: str = "mock:model", dimension: int = 8):
+        self._name = name
+        self._dimension = dimension
+        self.embedded: list[str] = []
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return self._name
+
+    def get_dimension(self) -> int:
+        """Return embedding dimension."""
+        return self._dimension
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Return a deterministic embedding derived from text length."""
+        self.embedded.extend(texts)
+        return [[float(len(text) % 7)] * self._dimension for text in texts]
+
+
+def make_chunk(id: str, content: str) -> CodeChunk:
+    """Create a test code chunk."""
+    return CodeChunk(
+        id=id,
+        file_path="src/module.py",
+        language=Language.PYTHON,
+        chunk_type=ChunkType.FUNCTION,
+        name=id,
+        content=content,
+        start_line=1,
+        end_line=2,
+    )
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    async def test_second_run_hits_cache(self, tmp_path):
+        """Test texts embedded once are served from the cache afterwards."""
+        provider = CountingEmbeddingProvider()
+        cache = EmbeddingCache(tmp_path / "cache.lance")
+
+        first = await cache.embed(["alpha", "beta"], provider)
+        second = await cache.embed(["beta", "alpha", "gamma"], provider)
+
+        assert provider.embedded == ["alpha", "beta", "gamma"]
+        assert second[0] == first[1]
+        assert second[1] == first[0]
+        assert cache.stats == {"hits": 2, "misses": 3}
+
+    async def test_duplicate_texts_embedded_once(self, tmp_path):
+        """Test identical texts in one call are sent to the provider once."""
+        provider = CountingEmbeddingProvider()
+        cache = EmbeddingCache(tmp_path / "cache.lance")
+
+        result = await cache.embed(["same", "same", "other"], provider)
+
+        assert provider.embedded == ["same", "other"]
+        assert len(result) == 3
+        assert result[0] == result[1]
+
+    async def test_cache_is_per_provider(self, tmp_path):
+        """Test embeddings from one model are never served for another."""
+        cache = EmbeddingCache(tmp_path / "cache.lance")
+        small = CountingEmbeddingProvider("mock:small", dimension=4)
+        large = CountingEmbeddingProvider("mock:large", dimension=8)
+
+        await cache.embed(["text"], small)
+        result = await cache.embed(["text"], large)
+
+        assert large.embedded == ["text"]
+        assert len(result[0]) == 8
+
+    async def test_persists_across_instances(self, tmp_path):
+        """Test a new cache instance reads embeddings written by an earlier one."""
+        provider = CountingEmbeddingProvider()
+        await EmbeddingCache(tmp_path / "cache.lance").embed(["persisted"], provider)
+
+        reopened = EmbeddingCache(tmp_path / "cache.lance")
+        await reopened.embed(["persisted"], provider)
+
+        assert provider.embedded == ["persisted"]
+        assert reopened.stats["hits"] == 1
+
+    async def test_prune_drops_unused_embeddings(self, tmp_path):
+        """Test prune keeps only embeddings used since the last reset."""
+        provider = CountingEmbeddingProvider()
+        cache = EmbeddingCache(tmp_path / "cache.lance")
+        await cache.embed(["old", "kept"], provider)
+
+        cache.reset_stats()
+        await cache.embed(["kept", "new"], provider)
+        assert cache.prune() == 1
+
+        provider.embedded.clear()
+        await cache.embed(["old", "kept", "new"], provider)
+        assert provider.embedded == ["old"]
+
+    async def test_prune_drops_other_providers(self, tmp_path):
+        """Test prune drops the tables of providers no longer in use."""
+        cache = EmbeddingCache(tmp_path / "cache.lance")
+        previous = CountingEmbeddingProvider("mock:previous", dimension=4)
+        current = CountingEmbeddingProvider("mock:current", dimension=8)
+        await cache.embed(["text"], previous)
+
+        cache.reset_stats()
+        await cache.embed(["text"], current)
+        cache.prune()
+
+        reopened = EmbeddingCache(tmp_path / "cache.lance")
+        assert reopened.lookup(previous.name, [embedding_text_hash("text")]) == {}
+        assert reopened.lookup(current.name, [embedding_text_hash("text")])
+
+    def test_text_hash_is_stable(self):
+        """Test the cache key depends only on the text."""
+        assert embedding_text_hash("abc") == embedding_text_hash("abc")
+        assert embedding_text_hash("abc") != embedding_text_hash("abd")
+
+
+class TestVectorStoreWithEmbeddingCache:
+    """Tests for VectorStore integration with the embedding cache."""
+
+    async def test_rebuild_only_embeds_changed_chunks(self, tmp_path):
+        """Test a full rebuild re-embeds only chunks whose text changed."""
+        provider = CountingEmbeddingProvider()
+        cache = EmbeddingCache(tmp_path / "cache.lance")
+        store = VectorStore(tmp_path / "vectors.lance", provider, cache)
+
+        await store.create_or_update_table(
+            [make_chunk("a", "def a(): pass"), make_chunk("b", "def b(): pass")]
+        )
+        provider.embedded.clear()
+        cache.reset_stats()
+
+        await store.create_or_update_table(
+            [make_chunk("a", "def a(): pass"), make_chunk("b", "def b(): return 1")]
+        )
+
+        assert len(provider.embedded) == 1
+        assert "return 1" in provider.embedded[0]
+        assert cache.stats == {"hits": 1, "misses": 1}
+        assert store.get_stats()["total_chunks"] == 2
+
+
+class TestIndexStatusCacheFields:
+    """Tests for embedding cache statistics on IndexStatus."""
+
+    def test_hit_rate(self):
+        """Test the hit rate is derived from hits and misses."""
+        status = IndexStatus(
+            repo_path="/repo",
+            indexed_at=0,
+            total_files=1,
+            total_chunks=4,
+            embedding_cache_hits=3,
+            embedding_cache_misses=1,
+        )
+        assert status.embedding_cache_hit_rate == 0.75
+
+    def test_defaults_for_old_status_files(self):
+        """Test status files written before the cache existed still load."""
+        status = IndexStatus.model_validate(
+            {"repo_path": "/repo", "indexed_at": 0, "total_files": 0, "total_chunks": 0}
+        )
+        assert status.embedding_cache_hits == 0
+        assert status.embedding_cache_hit_rate == 0.0
@@ -10,13 +10,17 @@ import pytest
 from local_deepwiki.core.git_utils import (
     BlameInfo,
     EntityBlameInfo,
+    GitMetadataIndex,
     GitRepoInfo,
     _parse_all_porcelain_blame,
     _parse_line_blame_map,
     build_source_url,
+    clear_git_metadata_cache,
     format_blame_date,
     get_default_branch,
     get_file_entity_blame,
+    get_files_last_modified,
+    get_git_metadata_index,
     get_git_remote_url,
     get_line_blame,
     get_range_blame,
@@ -728,3 +732,118 @@ class MyClass:
         """Test returns empty list for empty entities input."""
         result = get_file_entity_blame(tmp_path, "test.py", [])
         assert result == []
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command in a test repository."""
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture
+def history_repo(tmp_path: Path) -> Path:
+    """Create a repository with a few commits, a rename and a subdirectory."""
+    _git(tmp_path, "init", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Developer")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "once.py").write_text("def once():\n    pass\n")
+    (tmp_path / "src" / "twice.py").write_text("x = 1\n")
+    (tmp_path / "old.py").write_text("y = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "Initial commit")
+    (tmp_path / "src" / "twice.py").write_text("x = 2\n")
+    _git(tmp_path, "mv", "old.py", "renamed.py")
+    _git(tmp_path, "commit", "-am", "Second commit")
+    clear_git_metadata_cache()
+    return tmp_path
+
+
+class TestGitMetadataIndex:
+    """Tests for GitMetadataIndex."""
+
+    def test_build_maps_paths_to_last_commit(self, history_repo: Path) -> None:
+        """Test every path maps to the newest commit that touched it."""
+        index = GitMetadataIndex.build(history_repo)
+
+        assert index is not None
+        assert len(index.commits) == 2
+        assert index.last_commit("src/once.py").summary == "Initial commit"
+        assert index.last_commit("src/twice.py").summary == "Second commit"
+        assert index.commit_count("src/twice.py") == 2
+        assert "renamed.py" in index
+        assert index.last_modified("missing.py") is None
+
+    def test_build_returns_none_for_non_git_dir(self, tmp_path: Path) -> None:
+        """Test non-repositories produce no index."""
+        assert GitMetadataIndex.build(tmp_path) is None
+
+    def test_paths_relative_to_subdirectory(self, history_repo: Path) -> None:
+        """Test indexing a subdirectory reports paths relative to it."""
+        index = GitMetadataIndex.build(history_repo / "src")
+
+        assert index is not None
+        assert "once.py" in index
+        assert "renamed.py" not in index
+
+    def test_entity_blame_from_history(self, history_repo: Path) -> None:
+        """Test single-commit files are blamed without running git blame."""
+        index = GitMetadataIndex.build(history_repo)
+        entities = [("once", "function", 1, 2)]
+
+        result = index.entity_blame("src/once.py", entities)
+
+        assert result is not None
+        assert result[0].last_modified_by == "Developer"
+        assert result[0].commit_summary == "Initial commit"
+        # Multi-commit and renamed files need a real blame
+        assert index.entity_blame("src/twice.py", entities) is None
+        assert index.entity_blame("renamed.py", entities) is None
+        # Files without history have nothing to blame
+        assert index.entity_blame("untracked.py", entities) == []
+
+    def test_entity_blame_skips_dirty_files(self, history_repo: Path) -> None:
+        """Test locally modified files fall back to git blame."""
+        (history_repo / "src" / "once.py").write_text("def once():\n    return 1\n")
+        index = GitMetadataIndex.build(history_repo)
+
+        assert "src/once.py" in index.dirty_files
+        assert index.entity_blame("src/once.py", [("once", "function", 1, 2)]) is None
+
+    def test_get_file_entity_blame_uses_index(self, history_repo: Path) -> None:
+        """Test get_file_entity_blame answers from the index without a subprocess."""
+        index = GitMetadataIndex.build(history_repo)
+
+        with patch("local_deepwiki.core.git_utils.subprocess.run") as mock_run:
+            result = get_file_entity_blame(
+                history_repo, "src/once.py", [("once", "function", 1, 2)], git_index=index
+            )
+
+        mock_run.assert_not_called()
+        assert result[0].entity_name == "once"
+
+
+class TestGetGitMetadataIndex:
+    """Tests for the HEAD-validated index cache."""
+
+    def test_cached_until_head_moves(self, history_repo: Path) -> None:
+        """Test the index is reused for the same HEAD and rebuilt after a commit."""
+        first = get_git_metadata_index(history_repo)
+        assert get_git_metadata_index(history_repo) is first
+
+        (history_repo / "src" / "once.py").write_text("def once():\n    return 2\n")
+        _git(history_repo, "commit", "-am", "Third commit")
+
+        second = get_git_metadata_index(history_repo)
+        assert second is not first
+        assert second.last_commit("src/once.py").summary == "Third commit"
+
+    def test_files_last_modified_single_history_walk(self, history_repo: Path) -> None:
+        """Test dates for many files come from one git log walk."""
+        with patch.object(GitMetadataIndex, "build", wraps=GitMetadataIndex.build) as mock_build:
+            result = get_files_last_modified(
+                history_repo, ["src/once.py", "src/twice.py", "renamed.py", "nope.py"]
+            )
+            get_files_last_modified(history_repo, ["src/once.py"])
+
+        assert set(result) == {"src/once.py", "src/twice.py", "renamed.py"}
+        assert mock_build.call_count == 1
@@ -341,6 +341,7 @@ class TestHandleAskQuestionExtended:
             config.embedding = MagicMock()
             config.llm_cache = MagicMock()
             config.llm = MagicMock()
+            config.llm.context_token_budget = 6000
             mock_config.return_value = config
 
             vector_path = tmp_path / ".deepwiki" / "vectors"
@@ -348,6 +349,8 @@ class TestHandleAskQuestionExtended:
 
             # Create mock search result
             mock_chunk = MagicMock()
+            mock_chunk.id = "chunk-1"
+            mock_chunk.name = "hello"
             mock_chunk.file_path = "test.py"
             mock_chunk.start_line = 1
             mock_chunk.end_line = 10
@@ -367,6 +370,7 @@ class TestHandleAskQuestionExtended:
                     with patch("local_deepwiki.providers.llm.get_cached_llm_provider") as mock_llm:
                         mock_provider = MagicMock()
                         mock_provider.generate = AsyncMock(return_value="This is a test function.")
+                        mock_provider.count_tokens = len
                         mock_llm.return_value = mock_provider
 
                         result = await handle_ask_question(
@@ -384,6 +388,67 @@ class TestHandleAskQuestionExtended:
                         assert len(data["sources"]) == 1
                         assert data["sources"][0]["file"] == "test.py"
 
+    async def test_streams_answer_with_progress_token(self, tmp_path):
+        """Test the answer streams as progress notifications when a token is given."""
+        mock_server = MagicMock()
+        mock_ctx = MagicMock()
+        mock_ctx.meta.progressToken = "test-token"
+        mock_ctx.session.send_progress_notification = AsyncMock()
+        mock_server.request_context = mock_ctx
+
+        with patch("local_deepwiki.handlers.get_config") as mock_config:
+            config = MagicMock()
+            config.get_wiki_path.return_value = tmp_path / ".deepwiki"
+            config.get_vector_db_path.return_value = tmp_path / ".deepwiki" / "vectors"
+            config.llm.context_token_budget = 6000
+            mock_config.return_value = config
+            (tmp_path / ".deepwiki" / "vectors").mkdir(parents=True)
+
+            mock_chunk = MagicMock()
+            mock_chunk.id = "chunk-1"
+            mock_chunk.name = "hello"
+            mock_chunk.file_path = "test.py"
+            mock_chunk.start_line = 1
+            mock_chunk.end_line = 1
+            mock_chunk.chunk_type.value = "function"
+            mock_chunk.content = "def hello(): pass"
+            mock_result = MagicMock(chunk=mock_chunk, score=0.9)
+
+            async def generate_stream(prompt, **kwargs):
+                for piece in ("It ", "says ", "hello."):
+                    yield piece
+
+            with patch("local_deepwiki.handlers.get_embedding_provider"):
+                with patch("local_deepwiki.handlers.VectorStore") as mock_vs:
+                    mock_store = MagicMock()
+                    mock_store.search = AsyncMock(return_value=[mock_result])
+                    mock_vs.return_value = mock_store
+
+                    with patch("local_deepwiki.providers.llm.get_cached_llm_provider") as mock_llm:
+                        mock_provider = MagicMock()
+                        mock_provider.name = "mock"
+                        mock_provider.generate = AsyncMock()
+                        mock_provider.generate_stream = generate_stream
+                        mock_provider.count_tokens = len
+                        mock_llm.return_value = mock_provider
+
+                        result = await handle_ask_question(
+                            {"repo_path": str(tmp_path), "question": "What does hello do?"},
+                            server=mock_server,
+                        )
+
+        assert json.loads(result[0].text)["answer"] == "It says hello."
+        mock_provider.generate.assert_not_called()
+        calls = mock_ctx.session.send_progress_notification.await_args_list
+        deltas = [json.loads(c.kwargs["message"]) for c in calls]
+        assert all(d["type"] == "answer_delta" for d in deltas)
+        # The first piece is sent at once; the rest may be batched
+        assert deltas[0]["content"] == "It "
+        assert "".join(d["content"] for d in deltas) == "It says hello."
+        progress = [c.kwargs["progress"] for c in calls]
+        assert progress == sorted(set(progress))
+        assert all(0 < p < 1 for p in progress)
+
 
 class TestHandleReadWikiStructureToc:
     """Tests for handle_read_wiki_structure with toc.json."""
@@ -496,6 +561,32 @@ class TestHandleSearchCodeWithResults:
                     assert data[0]["name"] == "test_function"
                     assert data[0]["score"] == 0.95
 
+    async def test_passes_search_mode(self, tmp_path):
+        """Test the mode argument is validated and passed to the store, defaulting to auto."""
+        with patch("local_deepwiki.handlers.get_config") as mock_config:
+            config = MagicMock()
+            config.get_vector_db_path.return_value = tmp_path / ".deepwiki" / "vectors"
+            mock_config.return_value = config
+            (tmp_path / ".deepwiki" / "vectors").mkdir(parents=True)
+
+            with patch("local_deepwiki.handlers.get_embedding_provider"):
+                with patch("local_deepwiki.handlers.VectorStore") as mock_vs:
+                    mock_store = MagicMock()
+                    mock_store.search = AsyncMock(return_value=[])
+                    mock_vs.return_value = mock_store
+
+                    await handle_search_code({"repo_path": str(tmp_path), "query": "Foo"})
+                    await handle_search_code(
+                        {"repo_path": str(tmp_path), "query": "Foo", "mode": "keyword"}
+                    )
+                    result = await handle_search_code(
+                        {"repo_path": str(tmp_path), "query": "Foo", "mode": "fuzzy"}
+                    )
+
+                    modes = [call.kwargs["mode"] for call in mock_store.search.await_args_list]
+                    assert modes == ["auto", "keyword"]
+                    assert "Invalid mode" in result[0].text
+
     async def test_returns_no_results_message(self, tmp_path):
         """Test returns no results message when search is empty."""
         with patch("local_deepwiki.handlers.get_config") as mock_config:
@@ -941,7 +1032,10 @@ class TestHandleDeepResearchImpl:
                             mock_result.total_llm_calls = 2
 
                             async def mock_research(
-                                question, progress_callback=None, cancellation_check=None
+                                question,
+                                progress_callback=None,
+                                cancellation_check=None,
+                                answer_callback=None,
                             ):
                                 # Call progress callback to test notification sending
                                 if progress_callback:
@@ -1016,7 +1110,10 @@ class TestHandleDeepResearchImpl:
                             mock_result.total_llm_calls = 2
 
                             async def mock_research(
-                                question, progress_callback=None, cancellation_check=None
+                                question,
+                                progress_callback=None,
+                                cancellation_check=None,
+                                answer_callback=None,
                             ):
                                 if progress_callback:
                                     from local_deepwiki.models import (
@@ -236,3 +236,117 @@ class TestExportToHtml:
         assert "Exported" in result
         assert "pages" in result
         assert str(output_path) in result
+
+
+class TestIncrementalExport:
+    """Tests for incremental, parallel export and the shared TOC."""
+
+    @pytest.fixture
+    def wiki(self, tmp_path: Path) -> Path:
+        """Create a wiki with root and nested pages."""
+        wiki_path = tmp_path / ".deepwiki"
+        (wiki_path / "modules").mkdir(parents=True)
+        (wiki_path / "index.md").write_text("# Overview\n\nWelcome.")
+        (wiki_path / "modules" / "index.md").write_text("# Modules\n")
+        (wiki_path / "modules" / "core.md").write_text("# Core\n\nCore module.")
+        toc = {
+            "entries": [
+                {"number": "1", "title": "Overview", "path": "index.md"},
+                {
+                    "number": "2",
+                    "title": "Modules",
+                    "path": "modules/index.md",
+                    "children": [{"number": "2.1", "title": "Core", "path": "modules/core.md"}],
+                },
+            ]
+        }
+        (wiki_path / "toc.json").write_text(json.dumps(toc))
+        return wiki_path
+
+    def test_unchanged_pages_are_skipped(self, wiki: Path, tmp_path: Path):
+        """Test a re-export renders only pages whose markdown changed."""
+        output_path = tmp_path / "html"
+        first = HtmlExporter(wiki, output_path)
+        assert first.export() == 3
+        assert first.rendered_pages == 3
+
+        (wiki / "modules" / "core.md").write_text("# Core\n\nEdited.")
+        second = HtmlExporter(wiki, output_path)
+
+        assert second.export() == 3
+        assert second.rendered_pages == 1
+        assert "Edited." in (output_path / "modules" / "core.html").read_text()
+
+    def test_toc_change_rerenders_everything(self, wiki: Path, tmp_path: Path):
+        """Test editing toc.json invalidates every page."""
+        output_path = tmp_path / "html"
+        HtmlExporter(wiki, output_path).export()
+
+        toc = json.loads((wiki / "toc.json").read_text())
+        toc["entries"][0]["title"] = "Home"
+        (wiki / "toc.json").write_text(json.dumps(toc))
+        exporter = HtmlExporter(wiki, output_path)
+        exporter.export()
+
+        assert exporter.rendered_pages == 3
+        assert "Home" in (output_path / "modules" / "core.html").read_text()
+
+    def test_missing_output_and_full_export_rerender(self, wiki: Path, tmp_path: Path):
+        """Test a deleted output file is rebuilt, and incremental=False renders all."""
+        output_path = tmp_path / "html"
+        HtmlExporter(wiki, output_path).export()
+
+        (output_path / "index.html").unlink()
+        exporter = HtmlExporter(wiki, output_path)
+        exporter.export()
+        assert exporter.rendered_pages == 1
+
+        exporter = HtmlExporter(wiki, output_path, incremental=False)
+        exporter.export()
+        assert exporter.rendered_pages == 3
+
+    def test_deleted_page_output_removed(self, wiki: Path, tmp_path: Path):
+        """Test pages removed from the wiki are removed from the export."""
+        output_path = tmp_path / "html"
+        HtmlExporter(wiki, output_path).export()
+
+        (wiki / "modules" / "core.md").unlink()
+
+        assert HtmlExporter(wiki, output_path).export() == 2
+        assert not (output_path / "modules" / "core.html").exists()
+
+    def test_active_link_matches_per_page_render(self, wiki: Path, tmp_path: Path):
+        """Test each page marks only its own TOC link active."""
+        output_path = tmp_path / "html"
+        HtmlExporter(wiki, output_path).export()
+
+        html = (output_path / "modules" / "core.html").read_text()
+        assert '<a href="../modules/core.html" class="active">' in html
+        assert '<a href="../index.html" class="">' in html
+
+    def test_large_toc_uses_shared_script(self, wiki: Path, tmp_path: Path, monkeypatch):
+        """Test a large TOC is written once per depth instead of into every page."""
+        monkeypatch.setattr("local_deepwiki.export.html.TOC_INLINE_MAX_ENTRIES", 2)
+        output_path = tmp_path / "html"
+        HtmlExporter(wiki, output_path).export()
+
+        html = (output_path / "modules" / "core.html").read_text()
+        assert 'src="../_toc/toc-1.js" data-active="../modules/core.html"' in html
+        assert 'class="toc-number"' not in html
+        assert 'href=\\"../modules/core.html\\"' in (output_path / "_toc" / "toc-1.js").read_text()
+        assert (output_path / "_toc" / "toc-0.js").exists()
+
+        monkeypatch.setattr("local_deepwiki.export.html.TOC_INLINE_MAX_ENTRIES", 300)
+        HtmlExporter(wiki, output_path).export()
+        assert not (output_path / "_toc").exists()
+        assert 'class="toc-number"' in (output_path / "modules" / "core.html").read_text()
+
+    def test_process_pool_output_matches_serial(self, wiki: Path, tmp_path: Path, monkeypatch):
+        """Test pages rendered in worker processes are identical to serial renders."""
+        HtmlExporter(wiki, tmp_path / "serial", workers=1).export()
+        monkeypatch.setattr("local_deepwiki.export.html._PROCESS_POOL_MIN_PAGES", 1)
+        HtmlExporter(wiki, tmp_path / "parallel", workers=2).export()
+
+        for page in ("index.html", "modules/index.html", "modules/core.html"):
+            serial = (tmp_path / "serial" / page).read_text()
+            assert (tmp_path / "parallel" / page).read_text() == serial
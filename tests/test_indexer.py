@@ -1,7 +1,10 @@
 """Tests for repository indexer with batched processing."""
 
+import asyncio
 import json
+import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +17,7 @@ from local_deepwiki.core.indexer import (
     _migrate_status,
     _needs_migration,
 )
+from local_deepwiki.generators.callgraph import CALL_GRAPH_INDEX_FILE, CallGraphIndex
 from local_deepwiki.models import ChunkType, CodeChunk, IndexStatus, Language
 
 
@@ -67,11 +71,11 @@ def function_{i}_c():
         create_calls = []
         add_calls = []
 
-        async def mock_create_or_update_table(chunks):
+        async def mock_create_or_update_table(chunks, embeddings=None):
             create_calls.append(len(chunks))
             return len(chunks)
 
-        async def mock_add_chunks(chunks):
+        async def mock_add_chunks(chunks, embeddings=None):
             add_calls.append(len(chunks))
             return len(chunks)
 
@@ -82,6 +86,7 @@ def function_{i}_c():
         with patch("local_deepwiki.core.indexer.VectorStore") as MockVectorStore:
             mock_store = MagicMock()
             mock_store.create_or_update_table = AsyncMock(side_effect=mock_create_or_update_table)
+            mock_store.embed_chunks = AsyncMock(side_effect=lambda c: [[0.0]] * len(c))
             mock_store.add_chunks = AsyncMock(side_effect=mock_add_chunks)
             mock_store.delete_chunks_by_file = AsyncMock(side_effect=mock_delete_chunks_by_file)
             MockVectorStore.return_value = mock_store
@@ -130,7 +135,7 @@ def function_b():
         delete_calls = []
         add_calls = []
 
-        async def mock_add_chunks(chunks):
+        async def mock_add_chunks(chunks, embeddings=None):
             add_calls.append(len(chunks))
             return len(chunks)
 
@@ -138,12 +143,13 @@ def function_b():
             delete_calls.append(file_path)
             return 1
 
-        async def mock_create_or_update_table(chunks):
+        async def mock_create_or_update_table(chunks, embeddings=None):
             return len(chunks)
 
         with patch("local_deepwiki.core.indexer.VectorStore") as MockVectorStore:
             mock_store = MagicMock()
             mock_store.create_or_update_table = AsyncMock(side_effect=mock_create_or_update_table)
+            mock_store.embed_chunks = AsyncMock(side_effect=lambda c: [[0.0]] * len(c))
             mock_store.add_chunks = AsyncMock(side_effect=mock_add_chunks)
             mock_store.delete_chunks_by_file = AsyncMock(side_effect=mock_delete_chunks_by_file)
             MockVectorStore.return_value = mock_store
@@ -185,6 +191,7 @@ def function_c():
         with patch("local_deepwiki.core.indexer.VectorStore") as MockVectorStore:
             mock_store = MagicMock()
             mock_store.create_or_update_table = AsyncMock(return_value=0)
+            mock_store.embed_chunks = AsyncMock(side_effect=lambda c: [[0.0]] * len(c))
             mock_store.add_chunks = AsyncMock(return_value=0)
             MockVectorStore.return_value = mock_store
 
@@ -323,6 +330,7 @@ class TestSchemaMigration:
         with patch("local_deepwiki.core.indexer.VectorStore") as MockVectorStore:
             mock_store = MagicMock()
             mock_store.create_or_update_table = AsyncMock(return_value=1)
+            mock_store.embed_chunks = AsyncMock(side_effect=lambda c: [[0.0]] * len(c))
             mock_store.add_chunks = AsyncMock(return_value=0)
             MockVectorStore.return_value = mock_store
 
@@ -385,3 +393,378 @@ class TestSchemaMigration:
                 with open(status_path) as f:
                     saved_data = json.load(f)
                 assert saved_data["schema_version"] == CURRENT_SCHEMA_VERSION
+
+
+class TestChangeDetection:
+    """Tests for indexed change detection and single-pass hashing."""
+
+    @pytest.fixture
+    def indexer(self, tmp_path):
+        """Create an indexer over a small repo with a mocked vector store."""
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        for i in range(3):
+            (repo_path / f"mod{i}.py").write_text(f"def f{i}():\n    return {i}\n")
+
+        config = Config()
+        config.parsing.languages = ["python"]
+
+        with patch("local_deepwiki.core.indexer.VectorStore") as MockVectorStore:
+            mock_store = MagicMock()
+            mock_store.create_or_update_table = AsyncMock(side_effect=lambda c, **kw: len(c))
+            mock_store.embed_chunks = AsyncMock(side_effect=lambda c: [[0.0]] * len(c))
+            mock_store.add_chunks = AsyncMock(side_effect=lambda c, **kw: len(c))
+            mock_store.delete_chunks_by_file = AsyncMock(return_value=0)
+            MockVectorStore.return_value = mock_store
+            indexer = RepositoryIndexer(repo_path, config)
+            indexer.vector_store = mock_store
+            yield indexer
+
+    async def test_noop_reindex_reads_no_files(self, indexer):
+        """Test an unchanged repo is detected purely from stat results."""
+        await indexer.index(full_rebuild=True)
+
+        with patch("local_deepwiki.core.indexer._read_file_content") as mock_read:
+            with patch.object(indexer.chunker, "chunk_file") as mock_chunk:
+                status = await indexer.index()
+
+        mock_read.assert_not_called()
+        mock_chunk.assert_not_called()
+        assert status.total_files == 3
+
+    async def test_touched_file_hashed_but_not_reparsed(self, indexer):
+        """Test a file with new mtime but identical content is not re-parsed."""
+        await indexer.index(full_rebuild=True)
+        target = indexer.repo_path / "mod1.py"
+        st = target.stat()
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        with patch.object(indexer.chunker, "chunk_file") as mock_chunk:
+            status = await indexer.index()
+
+        mock_chunk.assert_not_called()
+        record = next(f for f in status.files if f.path == "mod1.py")
+        assert record.last_modified == target.stat().st_mtime
+
+    async def test_changed_file_read_once(self, indexer):
+        """Test a modified file is read once and its bytes reused for parsing."""
+        from local_deepwiki.core import indexer as indexer_module
+
+        await indexer.index(full_rebuild=True)
+        (indexer.repo_path / "mod2.py").write_text("def changed():\n    return 'x'\n")
+
+        with patch.object(
+            indexer_module, "_read_file_content", wraps=indexer_module._read_file_content
+        ) as mock_read:
+            with patch(
+                "local_deepwiki.core.parser._read_file_content",
+                side_effect=AssertionError("parser must not re-read the file"),
+            ):
+                status = await indexer.index()
+
+        assert mock_read.call_count == 1
+        record = next(f for f in status.files if f.path == "mod2.py")
+        assert record.chunk_count > 0
+        indexer.vector_store.delete_chunks_by_file.assert_awaited_once_with("mod2.py")
+
+    async def test_full_rebuild_reads_each_file_once(self, indexer):
+        """Test a full rebuild reads and hashes each file exactly once."""
+        from local_deepwiki.core import parse_worker
+
+        with patch.object(
+            parse_worker, "_read_file_content", wraps=parse_worker._read_file_content
+        ) as mock_read:
+            with patch("local_deepwiki.core.parser._compute_file_hash") as mock_hash:
+                status = await indexer.index(full_rebuild=True)
+
+        assert mock_read.call_count == 3
+        mock_hash.assert_not_called()
+        assert all(f.inode is not None for f in status.files)
+
+    def test_detect_changes_uses_path_map(self, indexer):
+        """Test legacy records without an inode still match on size and mtime."""
+        from local_deepwiki.models import FileInfo
+
+        files = indexer._find_source_files()
+        previous = IndexStatus(
+            repo_path=str(indexer.repo_path),
+            indexed_at=1.0,
+            total_files=len(files),
+            total_chunks=0,
+            files=[
+                FileInfo(
+                    path=str(p.relative_to(indexer.repo_path)),
+                    size_bytes=p.stat().st_size,
+                    last_modified=p.stat().st_mtime,
+                    hash="stale",
+                )
+                for p in files
+            ],
+        )
+
+        to_process, unchanged = indexer._detect_changes(files, previous)
+
+        assert to_process == []
+        assert len(unchanged) == 3
+
+
+class TestIndexPipeline:
+    """Tests for the bounded parse/embed/write indexing pipeline."""
+
+    @pytest.fixture
+    def repo_path(self, tmp_path):
+        """Create a repo with several small Python files."""
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        for i in range(6):
+            (repo_path / f"mod{i}.py").write_text(
+                f"def a{i}():\n    return 1\n\n\ndef b{i}():\n    return 2\n"
+            )
+        return repo_path
+
+    def _make_indexer(self, repo_path, calls, **chunking):
+        """Create an indexer whose mocked store records calls in order."""
+        config = Config()
+        config.parsing.languages = ["python"]
+        for key, value in chunking.items():
+            setattr(config.chunking, key, value)
+
+        async def embed_chunks(chunks):
+            calls.append(("embed", len(chunks)))
+            return [[float(i)] for i in range(len(chunks))]
+
+        async def store(chunks, embeddings=None):
+            assert embeddings is not None and len(embeddings) == len(chunks)
+            calls.append(("write", len(chunks)))
+            return len(chunks)
+
+        async def delete(file_path):
+            calls.append(("delete", file_path))
+            return 0
+
+        with patch("local_deepwiki.core.indexer.VectorStore"):
+            indexer = RepositoryIndexer(repo_path, config)
+        indexer.vector_store = MagicMock()
+        indexer.vector_store.embed_chunks = AsyncMock(side_effect=embed_chunks)
+        indexer.vector_store.create_or_update_table = AsyncMock(side_effect=store)
+        indexer.vector_store.add_chunks = AsyncMock(side_effect=store)
+        indexer.vector_store.delete_chunks_by_file = AsyncMock(side_effect=delete)
+        return indexer
+
+    async def test_embeds_in_configured_batches(self, repo_path):
+        """Test chunks are embedded in batches of embedding_batch_size."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls, embedding_batch_size=5, batch_size=4)
+
+        status = await indexer.index(full_rebuild=True)
+
+        embed_sizes = [n for kind, n in calls if kind == "embed"]
+        write_sizes = [n for kind, n in calls if kind == "write"]
+        assert sum(embed_sizes) == sum(write_sizes) == status.total_chunks
+        assert all(n == 5 for n in embed_sizes[:-1]) and 0 < embed_sizes[-1] <= 5
+        assert all(n == 4 for n in write_sizes[:-1]) and 0 < write_sizes[-1] <= 4
+        indexer.vector_store.create_or_update_table.assert_awaited_once()
+
+    async def test_maintains_vector_index_after_writes(self, repo_path):
+        """Test the vector index is updated after writes, and skipped when nothing changed."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls)
+        indexer.vector_store.ensure_vector_index = MagicMock(
+            side_effect=lambda: calls.append(("vector_index", 0)) or "skipped"
+        )
+
+        await indexer.index(full_rebuild=True)
+        assert calls[-1] == ("vector_index", 0)
+
+        calls.clear()
+        await indexer.index()
+        assert ("vector_index", 0) not in calls
+
+    async def test_uses_provider_batch_size_by_default(self, repo_path):
+        """Test the provider's preferred batch size is used when not configured."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls)
+        indexer.embedding_provider = MagicMock(batch_size=3)
+
+        await indexer.index(full_rebuild=True)
+
+        embed_sizes = [n for kind, n in calls if kind == "embed"]
+        assert len(embed_sizes) > 1
+        assert all(n == 3 for n in embed_sizes[:-1]) and embed_sizes[-1] <= 3
+
+    async def test_incremental_deletes_before_writes(self, repo_path):
+        """Test a re-parsed file's old chunks are deleted before new ones are written."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls, embedding_batch_size=1, batch_size=1)
+        await indexer.index(full_rebuild=True)
+        (repo_path / "mod3.py").write_text("def changed():\n    return 3\n")
+        calls.clear()
+
+        status = await indexer.index()
+
+        kinds = [kind for kind, _ in calls]
+        assert calls.count(("delete", "mod3.py")) == 1
+        assert kinds.index("delete") < kinds.index("write")
+        assert status.total_files == 6
+
+    async def test_queues_are_bounded(self, repo_path):
+        """Test a slow writer holds back the upstream stages."""
+        calls = []
+        indexer = self._make_indexer(
+            repo_path,
+            calls,
+            embedding_batch_size=1,
+            batch_size=1,
+            parse_queue_depth=1,
+            write_queue_depth=1,
+            parallel_workers=1,
+        )
+        max_sizes: dict[int, int] = {}
+        original_put = asyncio.Queue.put
+
+        async def tracking_put(queue, item):
+            await original_put(queue, item)
+            max_sizes[id(queue)] = max(max_sizes.get(id(queue), 0), queue.qsize())
+
+        async def slow_store(chunks, embeddings=None):
+            await asyncio.sleep(0.01)
+            return len(chunks)
+
+        indexer.vector_store.create_or_update_table.side_effect = slow_store
+        indexer.vector_store.add_chunks.side_effect = slow_store
+
+        with patch.object(asyncio.Queue, "put", tracking_put):
+            status = await indexer.index(full_rebuild=True)
+
+        assert status.total_chunks == indexer.pipeline_stats["write"].items
+        assert len(max_sizes) == 2
+        assert all(size <= 1 for size in max_sizes.values())
+
+    async def test_reports_stage_throughput(self, repo_path):
+        """Test per-stage item counts are recorded for the run."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls, embedding_batch_size=4)
+
+        status = await indexer.index(full_rebuild=True)
+
+        stats = indexer.pipeline_stats
+        assert stats["parse"].items == 6
+        assert stats["embed"].items == status.total_chunks
+        assert stats["write"].items == status.total_chunks
+        assert all(s.throughput > 0 for s in stats.values())
+
+    async def test_stage_failure_propagates(self, repo_path):
+        """Test an error in the writer surfaces instead of stalling the pipeline."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls, embedding_batch_size=1, batch_size=1)
+        indexer.vector_store.create_or_update_table.side_effect = RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            await asyncio.wait_for(indexer.index(full_rebuild=True), timeout=10)
+
+    async def test_process_backend_matches_thread_backend(self, repo_path):
+        """Test parsing in worker processes yields the same chunks as threads."""
+        thread_calls, process_calls = [], []
+        thread_indexer = self._make_indexer(repo_path, thread_calls)
+        process_indexer = self._make_indexer(
+            repo_path, process_calls, parse_backend="process", parallel_workers=2
+        )
+
+        thread_status = await thread_indexer.index(full_rebuild=True)
+        with patch("local_deepwiki.core.indexer.MIN_FILES_PER_PROCESS_WORKER", 1):
+            with patch(
+                "local_deepwiki.core.indexer.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+            ) as mock_pool:
+                process_status = await process_indexer.index(full_rebuild=True)
+
+        def stored_ids(indexer):
+            calls = indexer.vector_store.create_or_update_table.await_args_list
+            calls += indexer.vector_store.add_chunks.await_args_list
+            return sorted(chunk.id for call in calls for chunk in call.args[0])
+
+        mock_pool.assert_called_once()
+        assert process_status.total_chunks == thread_status.total_chunks
+        assert stored_ids(process_indexer) == stored_ids(thread_indexer)
+        assert sorted(f.hash for f in process_status.files) == sorted(
+            f.hash for f in thread_status.files
+        )
+
+    async def test_process_backend_small_runs_use_threads(self, repo_path):
+        """Test runs too small to amortize process startup parse on threads."""
+        calls = []
+        indexer = self._make_indexer(repo_path, calls, parse_backend="process")
+
+        with patch("local_deepwiki.core.indexer.ProcessPoolExecutor") as mock_pool:
+            status = await indexer.index(full_rebuild=True)
+
+        mock_pool.assert_not_called()
+        assert status.total_files == 6
+
+
+class TestCallGraphIndexing:
+    """Tests for call graph extraction during indexing."""
+
+    @pytest.fixture
+    def indexer(self, tmp_path):
+        """Create an indexer over a two-file repo with a mocked vector store."""
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        (repo_path / "lib.py").write_text("def compute_total(x):\n    return x\n")
+        (repo_path / "app.py").write_text("def main():\n    compute_total(1)\n")
+
+        config = Config()
+        config.parsing.languages = ["python"]
+
+        with patch("local_deepwiki.core.indexer.VectorStore"):
+            indexer = RepositoryIndexer(repo_path, config)
+        indexer.vector_store = MagicMock()
+        indexer.vector_store.embed_chunks = AsyncMock(side_effect=lambda c: [[0.0]] * len(c))
+        indexer.vector_store.create_or_update_table = AsyncMock(side_effect=lambda c, **kw: len(c))
+        indexer.vector_store.add_chunks = AsyncMock(side_effect=lambda c, **kw: len(c))
+        indexer.vector_store.delete_chunks_by_file = AsyncMock(return_value=0)
+        return indexer
+
+    def _load(self, indexer):
+        return CallGraphIndex.load(indexer.wiki_path / CALL_GRAPH_INDEX_FILE)
+
+    async def test_index_writes_call_graph(self, indexer):
+        """Test a full index persists call edges for every file."""
+        await indexer.index(full_rebuild=True)
+
+        call_graph_index = self._load(indexer)
+        assert call_graph_index.get_call_graph("app.py") == {"main": ["compute_total"]}
+        assert call_graph_index.get_cross_file_callers("lib.py", ["compute_total"]) == {
+            "compute_total": ["app.py"]
+        }
+
+    async def test_incremental_updates_changed_and_deleted_files(self, indexer):
+        """Test changed files are re-extracted and deleted files dropped."""
+        await indexer.index(full_rebuild=True)
+        (indexer.repo_path / "app.py").write_text("def main():\n    other_helper()\n")
+        (indexer.repo_path / "lib.py").unlink()
+
+        await indexer.index()
+
+        call_graph_index = self._load(indexer)
+        assert call_graph_index.get_call_graph("app.py") == {"main": ["other_helper"]}
+        assert "lib.py" not in call_graph_index
+
+    async def test_backfills_unchanged_files(self, indexer):
+        """Test files indexed before the call graph index existed are extracted once."""
+        await indexer.index(full_rebuild=True)
+        (indexer.wiki_path / CALL_GRAPH_INDEX_FILE).unlink()
+
+        with patch.object(indexer.chunker, "chunk_file") as mock_chunk:
+            await indexer.index()
+
+        mock_chunk.assert_not_called()
+        assert self._load(indexer).get_call_graph("app.py") == {"main": ["compute_total"]}
+
+    async def test_noop_reindex_does_not_extract(self, indexer):
+        """Test an unchanged repo needs no call graph extraction."""
+        await indexer.index(full_rebuild=True)
+
+        with patch.object(indexer.call_graph_extractor, "extract_from_file") as mock_extract:
+            await indexer.index()
+
+        mock_extract.assert_not_called()
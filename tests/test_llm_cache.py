@@ -1,6 +1,8 @@
 """Tests for LLM response caching."""
 
+import asyncio
 import hashlib
+import threading
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -8,7 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from local_deepwiki.config import LLMCacheConfig
-from local_deepwiki.core.llm_cache import LLMCache
+from local_deepwiki.core.llm_cache import LLMCache, exact_lookups_only
 from local_deepwiki.providers.base import LLMProvider
 from local_deepwiki.providers.llm.cached import CachingLLMProvider
 
@@ -675,8 +677,9 @@ class TestLLMCacheEdgeCases:
         # Create an entry
         await cache.set(prompt="test", response="response", temperature=0.1, model_name="m")
 
-        # _record_hit currently does nothing (pass) so this just tests it doesn't raise
+        # Hits for unknown entries are dropped when flushed
         await cache._record_hit("non-existent-id")
+        await cache.flush()
 
     @pytest.mark.asyncio
     async def test_maybe_evict_when_table_none(self, cache: LLMCache):
@@ -932,38 +935,41 @@ class TestLLMCacheEdgeCases:
 
     @pytest.mark.asyncio
     async def test_eviction_deletes_expired_entries(self, cache_path: Path):
-        """Test that eviction actually deletes expired entries."""
+        """Test that eviction deletes expired entries with one predicate delete."""
         config = LLMCacheConfig(
             enabled=True,
             ttl_seconds=60,
-            max_entries=100,  # Low to trigger eviction check
+            max_entries=100,
             similarity_threshold=0.95,
             max_cacheable_temperature=0.5,
         )
         embedding_provider = MockEmbeddingProvider()
         cache = LLMCache(cache_path, embedding_provider, config)
 
-        # Mock the table with many entries including expired ones
+        # Mock the table with a mix of expired and valid entries
         with patch.object(cache, "_get_table") as mock_get_table:
             mock_table = MagicMock()
-            mock_table.count_rows.return_value = 150  # Over limit
+            mock_table.count_rows.return_value = 3
 
-            # Return mix of expired and valid entries
-            mock_table.search.return_value.limit.return_value.to_list.return_value = [
-                {"id": "expired-1", "created_at": time.time() - 10000, "ttl_seconds": 60},
-                {"id": "valid-1", "created_at": time.time(), "ttl_seconds": 3600},
-                {"id": "expired-2", "created_at": time.time() - 5000, "ttl_seconds": 60},
+            now = time.time()
+            mock_table.search.return_value.select.return_value.limit.return_value.to_list.return_value = [
+                {"id": "expired-1", "created_at": now - 10000, "ttl_seconds": 60, "size": 10},
+                {"id": "valid-1", "created_at": now, "ttl_seconds": 3600, "size": 10},
+                {"id": "expired-2", "created_at": now - 5000, "ttl_seconds": 60, "size": 10},
             ]
             mock_get_table.return_value = mock_table
 
             await cache._maybe_evict()
 
-            # Verify delete was called for expired entries
-            assert mock_table.delete.call_count >= 1
+            mock_table.delete.assert_called_once_with("id IN ('expired-1', 'expired-2')")
+            # Bookkeeping columns only, never the vectors
+            selected = mock_table.search.return_value.select.call_args.args[0]
+            assert "vector" not in selected
+            assert cache.stats["evicted"] == 2
 
     @pytest.mark.asyncio
-    async def test_eviction_delete_individual_failure(self, cache_path: Path):
-        """Test that eviction continues even if individual deletes fail."""
+    async def test_eviction_delete_failure(self, cache_path: Path):
+        """Test that a failing eviction delete is logged, not raised."""
         config = LLMCacheConfig(
             enabled=True,
             ttl_seconds=60,
@@ -976,19 +982,18 @@ class TestLLMCacheEdgeCases:
 
         with patch.object(cache, "_get_table") as mock_get_table:
             mock_table = MagicMock()
-            mock_table.count_rows.return_value = 150
+            mock_table.count_rows.return_value = 2
 
-            mock_table.search.return_value.limit.return_value.to_list.return_value = [
+            mock_table.search.return_value.select.return_value.limit.return_value.to_list.return_value = [
                 {"id": "expired-1", "created_at": time.time() - 10000, "ttl_seconds": 60},
                 {"id": "expired-2", "created_at": time.time() - 5000, "ttl_seconds": 60},
             ]
-
-            # First delete succeeds, second fails
-            mock_table.delete.side_effect = [None, RuntimeError("Delete failed")]
+            mock_table.delete.side_effect = RuntimeError("Delete failed")
             mock_get_table.return_value = mock_table
 
-            # Should not raise even when some deletes fail
+            # Should not raise when the delete fails
             await cache._maybe_evict()
+            assert cache.stats["evicted"] == 0
 
     @pytest.mark.asyncio
     async def test_similarity_search_hit_returns_response(
@@ -1078,3 +1083,268 @@ class TestLLMCacheEdgeCases:
 
             # Verify create_scalar_index was called (even though it failed)
             mock_table.create_scalar_index.assert_called_once_with("exact_hash")
+
+
+class TestLLMCacheEviction:
+    """Tests for hit tracking and size/count bounded eviction."""
+
+    @staticmethod
+    def _fill(cache: LLMCache, count: int, response_size: int = 10) -> None:
+        """Write entries directly; entry i was last hit at time i and hit i % 3 times."""
+        now = time.time()
+        records = [
+            {
+                "id": f"entry-{i:03d}",
+                "exact_hash": f"hash-{i}",
+                "vector": [0.0] * 8,
+                "system_prompt": "",
+                "prompt": f"prompt {i}",
+                "response": "x" * response_size,
+                "temperature": 0.1,
+                "model_name": "m",
+                "created_at": now,
+                "hit_count": i % 3,
+                "last_hit_at": float(i),
+                "ttl_seconds": 3600,
+            }
+            for i in range(count)
+        ]
+        cache._table = cache._connect().create_table(LLMCache.TABLE_NAME, records)
+
+    @staticmethod
+    def _ids(cache: LLMCache) -> set[str]:
+        table = cache._get_table()
+        return {row["id"] for row in table.search().select(["id"]).limit(1000).to_list()}
+
+    def _cache(self, tmp_path: Path, **overrides) -> LLMCache:
+        config = LLMCacheConfig(max_cacheable_temperature=0.5, **overrides)
+        return LLMCache(tmp_path / "cache.lance", MockEmbeddingProvider(dimension=8), config)
+
+    async def test_lru_eviction_by_entry_count(self, tmp_path: Path):
+        """Test least recently hit entries go first, down to 90% of max_entries."""
+        cache = self._cache(tmp_path, max_entries=100)
+        self._fill(cache, 120)
+
+        await cache._maybe_evict()
+
+        ids = self._ids(cache)
+        assert len(ids) == 90
+        assert ids == {f"entry-{i:03d}" for i in range(30, 120)}
+        assert cache.stats["evicted"] == 30
+
+    async def test_lfu_eviction_by_entry_count(self, tmp_path: Path):
+        """Test the LFU policy evicts the least hit entries first."""
+        cache = self._cache(tmp_path, max_entries=100, eviction_policy="lfu")
+        self._fill(cache, 120)
+
+        await cache._maybe_evict()
+
+        ids = self._ids(cache)
+        assert len(ids) == 90
+        # The 30 oldest of the 40 never-hit entries go; every hit entry stays
+        evicted = {f"entry-{i:03d}" for i in range(0, 90, 3)}
+        assert ids == {f"entry-{i:03d}" for i in range(120)} - evicted
+
+    async def test_eviction_by_size(self, tmp_path: Path):
+        """Test entries are evicted when their text exceeds max_size_mb."""
+        cache = self._cache(tmp_path, max_size_mb=1)
+        self._fill(cache, 15, response_size=100 * 1024)
+
+        await cache._maybe_evict()
+
+        # 90% of 1 MB holds 9 entries of just over 100 KB
+        assert self._ids(cache) == {f"entry-{i:03d}" for i in range(6, 15)}
+
+    async def test_under_limits_nothing_evicted(self, tmp_path: Path):
+        """Test a sweep within both limits deletes nothing."""
+        cache = self._cache(tmp_path, max_entries=100)
+        self._fill(cache, 50)
+
+        await cache._maybe_evict()
+
+        assert len(self._ids(cache)) == 50
+        assert cache.stats["evicted"] == 0
+
+    async def test_hits_are_batched_until_flush(self, tmp_path: Path):
+        """Test hit counters stay in memory until flushed in one merge."""
+        cache = self._cache(tmp_path)
+        await cache.set(prompt="question", response="answer", temperature=0.1, model_name="m")
+        await cache.flush()
+
+        for _ in range(3):
+            assert await cache.get("question", temperature=0.1, model_name="m") == "answer"
+
+        table = cache._get_table()
+        assert table.search().limit(1).to_list()[0]["hit_count"] == 0
+
+        await cache.flush()
+
+        entry = table.search().limit(1).to_list()[0]
+        assert entry["hit_count"] == 3
+        assert entry["last_hit_at"] > entry["created_at"]
+
+    async def test_many_hits_flush_in_background(self, tmp_path: Path):
+        """Test reaching HIT_FLUSH_THRESHOLD starts a background flush."""
+        cache = self._cache(tmp_path)
+        self._fill(cache, 5)
+
+        with patch.object(LLMCache, "HIT_FLUSH_THRESHOLD", 5):
+            for i in range(5):
+                await cache._record_hit(f"entry-{i:03d}")
+
+        assert cache._maintenance_task is not None
+        await cache._maintenance_task
+
+        rows = cache._get_table().search().select(["id", "hit_count"]).limit(10).to_list()
+        assert {row["id"]: row["hit_count"] for row in rows} == {
+            f"entry-{i:03d}": i % 3 + 1 for i in range(5)
+        }
+
+    async def test_few_hits_flush_after_interval(self, tmp_path: Path):
+        """Test hits on a few hot entries reach the table without an explicit flush."""
+        cache = self._cache(tmp_path)
+        self._fill(cache, 3)
+
+        with patch.object(LLMCache, "HIT_FLUSH_INTERVAL_SECONDS", 0.05):
+            for _ in range(4):
+                await cache._record_hit("entry-000")
+            await asyncio.sleep(0.1)
+            assert cache._maintenance_task is not None
+            await cache._maintenance_task
+
+        reopened = self._cache(tmp_path)
+        rows = reopened._get_table().search().where("id = 'entry-000'").limit(1).to_list()
+        assert rows[0]["hit_count"] == 4
+
+    async def test_close_writes_pending_hits(self, tmp_path: Path):
+        """Test close() persists hits when the cache is discarded."""
+        cache = self._cache(tmp_path)
+        self._fill(cache, 2)
+        await cache._record_hit("entry-001")
+
+        cache.close()
+
+        rows = self._cache(tmp_path)._get_table().search().where("id = 'entry-001'").to_list()
+        assert rows[0]["hit_count"] == 2
+
+    async def test_set_does_not_sweep_inline(self, tmp_path: Path):
+        """Test set() returns while the sweep it triggered is still running."""
+        cache = self._cache(tmp_path)
+        release = threading.Event()
+        swept = []
+
+        def blocking_sweep(table):
+            release.wait(timeout=5)
+            swept.append(table)
+
+        with patch.object(cache, "_sweep", side_effect=blocking_sweep):
+            await cache.set(prompt="p", response="r", temperature=0.1, model_name="m")
+            assert swept == []
+            assert cache._maintenance_task is not None
+
+            release.set()
+            await cache.flush()
+
+        assert len(swept) == 1
+
+    async def test_clear_drops_pending_hits(self, tmp_path: Path):
+        """Test clearing the cache forgets unflushed hits."""
+        cache = self._cache(tmp_path)
+        self._fill(cache, 2)
+        await cache._record_hit("entry-000")
+
+        assert await cache.clear() == 2
+        assert cache._pending_hits == {}
+
+
+class CountingEmbeddingProvider(MockEmbeddingProvider):
+    """Mock embedding provider that counts embedded texts."""
+
+    def __init__(self, dimension: int = 8):
+        super().__init__(dimension)
+        self.embedded: list[str] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return await super().embed(texts)
+
+
+class TestExactFrontCache:
+    """Tests for the in-memory exact-hash cache in front of LanceDB."""
+
+    @pytest.fixture
+    def provider(self) -> CountingEmbeddingProvider:
+        return CountingEmbeddingProvider()
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path, provider: CountingEmbeddingProvider) -> LLMCache:
+        config = LLMCacheConfig(max_cacheable_temperature=0.5)
+        return LLMCache(tmp_path / "cache.lance", provider, config)
+
+    async def test_repeat_hit_served_from_memory(self, cache: LLMCache):
+        """Test an exact hit is answered from memory after the first table read."""
+        await cache.set(prompt="question", response="answer", temperature=0.1, model_name="m")
+        assert await cache.get("question", temperature=0.1, model_name="m") == "answer"
+
+        with patch.object(cache._table, "search", side_effect=RuntimeError("no queries")):
+            assert await cache.get("question", temperature=0.1, model_name="m") == "answer"
+
+        assert cache.stats["hits"] == 2
+
+    async def test_unknown_hash_skips_table_query(self, cache: LLMCache):
+        """Test exact misses are answered from the loaded hash set."""
+        await cache.set(prompt="question", response="answer", temperature=0.1, model_name="m")
+        # First lookup loads the hash column
+        assert await cache.get("other", temperature=0.1, semantic=False) is None
+
+        with patch.object(cache._table, "search", side_effect=RuntimeError("no queries")):
+            assert await cache.get("another", temperature=0.1, semantic=False) is None
+
+        # Hashes written after loading are known without reloading
+        await cache.set(prompt="late", response="late answer", temperature=0.1, model_name="m")
+        assert await cache.get("late", temperature=0.1, semantic=False) == "late answer"
+
+    async def test_exact_only_lookups_never_embed(
+        self, cache: LLMCache, provider: CountingEmbeddingProvider
+    ):
+        """Test exact-only misses skip the embedding and similarity search."""
+        await cache.set(prompt="question", response="answer", temperature=0.1, model_name="m")
+        provider.embedded.clear()
+
+        assert await cache.get("other", temperature=0.1, semantic=False) is None
+        with exact_lookups_only():
+            assert await cache.get("other", temperature=0.1) is None
+            # An explicit argument overrides the context
+            await cache.get("other", temperature=0.1, semantic=True)
+
+        assert provider.embedded == ["other"]
+
+    async def test_prompt_embedded_once_per_get_and_set(
+        self, cache: LLMCache, provider: CountingEmbeddingProvider
+    ):
+        """Test set() reuses the embedding computed by the get() that missed."""
+        await cache.set(prompt="seed", response="r", temperature=0.1, model_name="m")
+        provider.embedded.clear()
+
+        assert await cache.get("question", temperature=0.1, model_name="m") is None
+        await cache.set(prompt="question", response="answer", temperature=0.1, model_name="m")
+
+        assert provider.embedded == ["question"]
+        assert cache._embedding_memo == {}
+
+    async def test_eviction_drops_memory_entries(self, tmp_path: Path):
+        """Test evicted entries are no longer served from memory."""
+        config = LLMCacheConfig(max_entries=100, max_cacheable_temperature=0.5)
+        cache = LLMCache(tmp_path / "cache.lance", MockEmbeddingProvider(dimension=8), config)
+        TestLLMCacheEviction._fill(cache, 120)
+        # entry-000 was hit least recently; hash-0 is its exact hash
+        with patch.object(cache, "_compute_hash", return_value="hash-0"):
+            assert await cache.get("p", temperature=0.1, semantic=False) == "x" * 10
+            assert "hash-0" in cache._front
+
+            cache._pending_hits.clear()
+            await cache._maybe_evict()
+
+            assert "hash-0" not in cache._front
+            assert "hash-0" not in cache._known_hashes
+            assert await cache.get("p", temperature=0.1, semantic=False) is None
@@ -295,3 +295,29 @@ class TestOpenAILLMProvider:
         call_kwargs = provider._client.chat.completions.create.call_args.kwargs
         assert call_kwargs["messages"][0] == {"role": "system", "content": "System"}
         assert call_kwargs["stream"] is True
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    def test_count_tokens_uses_tiktoken_encoding(self):
+        """Test tokens are counted with the model's tiktoken encoding when available."""
+        from local_deepwiki.providers.llm.openai import OpenAILLMProvider
+
+        provider = OpenAILLMProvider(model="gpt-4o")
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2, 3]
+
+        with patch("local_deepwiki.providers.llm.openai._tiktoken_encoding", return_value=encoding):
+            assert provider.count_tokens("def f(): pass") == 3
+        encoding.encode.assert_called_once_with("def f(): pass", disallowed_special=())
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    def test_count_tokens_falls_back_without_tiktoken(self):
+        """Test tokens are estimated when tiktoken is not installed."""
+        from local_deepwiki.core.chunker import approximate_token_count
+        from local_deepwiki.providers.llm.openai import OpenAILLMProvider
+
+        provider = OpenAILLMProvider(model="gpt-4o")
+
+        with patch("local_deepwiki.providers.llm.openai._tiktoken_encoding", return_value=None):
+            assert provider.count_tokens("def fetchUser(): pass") == approximate_token_count(
+                "def fetchUser(): pass"
+            )
@@ -0,0 +1,200 @@
+"""Tests for LLM generation latency and throughput metrics."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+from local_deepwiki.providers.base import LLMProvider
+from local_deepwiki.providers.llm.cached import CachingLLMProvider
+from local_deepwiki.providers.metrics import (
+    GenerationMetrics,
+    generate_with_metrics,
+    get_generation_metrics,
+    stream_with_metrics,
+)
+
+
+class StreamingLLM(LLMProvider):
+    """LLM that streams fixed pieces, the first after a delay."""
+
+    def __init__(self, pieces: list[str], first_token_delay: float = 0.0):
+        self.pieces = pieces
+        self.first_token_delay = first_token_delay
+        self.generate_calls = 0
+        self.stream_calls = 0
+
+    @property
+    def name(self) -> str:
+        return "streaming"
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> str:
+        self.generate_calls += 1
+        return "".join(self.pieces)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        self.stream_calls += 1
+        await asyncio.sleep(self.first_token_delay)
+        for piece in self.pieces:
+            yield piece
+
+    def count_tokens(self, text: str) -> int:
+        return len(text.split())
+
+
+class TestGenerationMetrics:
+    """Tests for GenerationMetrics."""
+
+    def test_empty(self):
+        """Test nothing recorded gives no providers."""
+        assert GenerationMetrics().stats == {}
+
+    def test_averages_per_provider(self):
+        """Test latency, first token time and throughput are averaged per provider."""
+        metrics = GenerationMetrics()
+        metrics.record("a", duration=2.0, tokens=100, time_to_first_token=1.0)
+        metrics.record("a", duration=4.0, tokens=300, time_to_first_token=2.0)
+        metrics.record("b", duration=1.0, tokens=50)
+
+        stats = metrics.stats
+
+        assert stats["a"]["generations"] == 2
+        assert stats["a"]["streamed"] == 2
+        assert stats["a"]["avg_latency_ms"] == 3000.0
+        assert stats["a"]["avg_time_to_first_token_ms"] == 1500.0
+        # 400 tokens over 3 seconds after the first tokens
+        assert stats["a"]["tokens_per_second"] == 133.3
+        assert stats["b"]["streamed"] == 0
+        assert stats["b"]["avg_time_to_first_token_ms"] == 0.0
+        assert stats["b"]["tokens_per_second"] == 50.0
+
+    def test_clear(self):
+        """Test clear forgets recorded generations."""
+        metrics = GenerationMetrics()
+        metrics.record("a", duration=1.0, tokens=10)
+
+        metrics.clear()
+
+        assert metrics.stats == {}
+
+    def test_process_wide_instance(self):
+        """Test the process-wide metrics are shared."""
+        assert get_generation_metrics() is get_generation_metrics()
+
+
+class TestStreamWithMetrics:
+    """Tests for stream_with_metrics."""
+
+    async def test_yields_pieces_and_records_first_token(self):
+        """Test pieces pass through and the first token time is recorded."""
+        llm = StreamingLLM(["one two ", "three"], first_token_delay=0.05)
+        metrics = GenerationMetrics()
+
+        pieces = [p async for p in stream_with_metrics(llm, "prompt", metrics=metrics)]
+
+        assert pieces == ["one two ", "three"]
+        stats = metrics.stats["streaming"]
+        assert stats["streamed"] == 1
+        assert stats["avg_time_to_first_token_ms"] >= 50
+
+    async def test_abandoned_stream_not_recorded(self):
+        """Test a stream closed before its end records nothing."""
+        llm = StreamingLLM(["a", "b", "c"])
+        metrics = GenerationMetrics()
+
+        stream = stream_with_metrics(llm, "prompt", metrics=metrics)
+        assert await anext(stream) == "a"
+        await stream.aclose()
+
+        assert metrics.stats == {}
+
+
+class TestGenerateWithMetrics:
+    """Tests for generate_with_metrics."""
+
+    async def test_without_callback_uses_generate(self):
+        """Test nobody listening means a plain, non-streamed generation."""
+        llm = StreamingLLM(["hello ", "world"])
+        metrics = GenerationMetrics()
+
+        text = await generate_with_metrics(llm, "prompt", metrics=metrics)
+
+        assert text == "hello world"
+        assert (llm.generate_calls, llm.stream_calls) == (1, 0)
+        assert metrics.stats["streaming"]["streamed"] == 0
+
+    async def test_with_callback_streams(self):
+        """Test pieces reach the callback as they arrive and the full text is returned."""
+        llm = StreamingLLM(["hello ", "world"])
+        metrics = GenerationMetrics()
+        received: list[str] = []
+
+        async def on_text(text: str) -> None:
+            received.append(text)
+
+        text = await generate_with_metrics(llm, "prompt", on_text=on_text, metrics=metrics)
+
+        assert text == "hello world"
+        assert received == ["hello ", "world"]
+        assert (llm.generate_calls, llm.stream_calls) == (0, 1)
+        assert metrics.stats["streaming"]["streamed"] == 1
+
+
+def make_cached(llm: LLMProvider, cached: str | None) -> CachingLLMProvider:
+    """Wrap an LLM in a caching provider whose cache answers with cached."""
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=cached)
+    cache.set = AsyncMock()
+    return CachingLLMProvider(llm, cache)
+
+
+class TestCachedGenerations:
+    """Tests for generations through a caching provider."""
+
+    async def test_miss_recorded_under_underlying_provider(self):
+        """Test a cache miss is timed under the wrapped provider's name."""
+        llm = make_cached(StreamingLLM(["hello"]), cached=None)
+        metrics = GenerationMetrics()
+
+        await generate_with_metrics(llm, "prompt", metrics=metrics)
+
+        assert list(metrics.stats) == ["streaming"]
+        assert metrics.stats["streaming"]["generations"] == 1
+        assert metrics.stats["streaming"]["cache_hits"] == 0
+
+    async def test_hit_counted_separately(self):
+        """Test a replayed answer is a cache hit, not a timed generation."""
+        inner = StreamingLLM(["hello"])
+        llm = make_cached(inner, cached="cached answer")
+        metrics = GenerationMetrics()
+
+        text = await generate_with_metrics(llm, "prompt", metrics=metrics)
+
+        assert text == "cached answer"
+        assert inner.generate_calls == 0
+        stats = metrics.stats["streaming"]
+        assert stats["generations"] == 0
+        assert stats["cache_hits"] == 1
+        assert stats["avg_latency_ms"] == 0.0
+
+    async def test_streamed_hit_counted_separately(self):
+        """Test a stream replayed from the cache is not timed either."""
+        llm = make_cached(StreamingLLM(["hello"]), cached="cached answer")
+        metrics = GenerationMetrics()
+
+        pieces = [p async for p in stream_with_metrics(llm, "prompt", metrics=metrics)]
+
+        assert "".join(pieces) == "cached answer"
+        assert metrics.stats["streaming"]["streamed"] == 0
+        assert metrics.stats["streaming"]["cache_hits"] == 1
@@ -0,0 +1,154 @@
+"""Tests for the shared parsed-file cache."""
+
+from local_deepwiki.core.chunker import CLASS_NODE_TYPES, FUNCTION_NODE_TYPES
+from local_deepwiki.core.parse_cache import ParsedFileCache, get_parse_cache, reset_parse_cache
+from local_deepwiki.core.parser import find_nodes_by_type
+from local_deepwiki.models import Language
+
+SAMPLE = b"""
+def top():
+    return helper()
+
+
+class Service:
+    def run(self):
+        def inner():
+            pass
+        return inner()
+
+
+def helper():
+    pass
+"""
+
+
+class TestParsedFileCache:
+    """Tests for ParsedFileCache."""
+
+    def test_second_lookup_hits(self, tmp_path):
+        """Test a file is parsed once and then served from the cache."""
+        path = tmp_path / "mod.py"
+        path.write_bytes(SAMPLE)
+        cache = ParsedFileCache()
+
+        first = cache.get(path)
+        second = cache.get(path)
+
+        assert first is second
+        assert first.language == Language.PYTHON
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.hit_rate == 0.5
+
+    def test_changed_content_is_reparsed(self, tmp_path):
+        """Test an edited file is never served from its old tree."""
+        path = tmp_path / "mod.py"
+        path.write_bytes(SAMPLE)
+        cache = ParsedFileCache()
+        first = cache.get(path)
+
+        path.write_bytes(b"def other():\n    pass\n")
+        second = cache.get(path)
+
+        assert second is not first
+        assert second.source == b"def other():\n    pass\n"
+        assert cache.stats["misses"] == 2
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used_by_count(self, tmp_path):
+        """Test the oldest untouched entry is evicted over the entry limit."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.py"
+            path.write_bytes(f"def {name}():\n    pass\n".encode())
+            paths.append(path)
+        cache = ParsedFileCache(max_entries=2)
+
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+
+        assert cache.stats["evictions"] == 1
+        cache.get(paths[0])
+        assert cache.stats["hits"] == 2
+        cache.get(paths[1])
+        assert cache.stats["misses"] == 4
+
+    def test_evicts_by_total_bytes(self, tmp_path):
+        """Test the byte budget bounds the cache regardless of entry count."""
+        big = tmp_path / "big.py"
+        big.write_bytes(SAMPLE * 4)
+        small = tmp_path / "small.py"
+        small.write_bytes(SAMPLE)
+        cache = ParsedFileCache(max_bytes=len(SAMPLE) * 4)
+
+        cache.get(big)
+        cache.get(small)
+
+        assert len(cache) == 1
+        assert cache.stats["bytes"] == len(SAMPLE)
+
+    def test_oversized_file_not_cached(self, tmp_path):
+        """Test a file larger than the whole budget is parsed but not kept."""
+        path = tmp_path / "huge.py"
+        path.write_bytes(SAMPLE)
+        cache = ParsedFileCache(max_bytes=10)
+
+        parsed = cache.get(path)
+
+        assert parsed is not None
+        assert len(cache) == 0
+
+    def test_unsupported_or_missing_file(self, tmp_path):
+        """Test unsupported and unreadable files return None."""
+        text = tmp_path / "notes.txt"
+        text.write_text("hello")
+        cache = ParsedFileCache()
+
+        assert cache.get(text) is None
+        assert cache.get(tmp_path / "missing.py") is None
+
+    def test_find_nodes_matches_tree_walk(self, tmp_path):
+        """Test indexed node lookup returns the same nodes in the same order."""
+        path = tmp_path / "mod.py"
+        path.write_bytes(SAMPLE)
+        parsed = ParsedFileCache().get(path)
+        node_types = FUNCTION_NODE_TYPES[Language.PYTHON] | CLASS_NODE_TYPES[Language.PYTHON]
+
+        expected = find_nodes_by_type(parsed.root, node_types)
+        actual = parsed.find_nodes(node_types)
+
+        assert [n.start_byte for n in actual] == [n.start_byte for n in expected]
+        assert len(actual) == 5
+
+    def test_global_cache_reset(self):
+        """Test the global cache is shared until reset."""
+        reset_parse_cache()
+        cache = get_parse_cache()
+        assert get_parse_cache() is cache
+        reset_parse_cache()
+        assert get_parse_cache() is not cache
+
+
+class TestExtractorsShareCache:
+    """Tests that the file-doc extractors parse each file once."""
+
+    def test_api_docs_and_call_graph_share_parse(self, tmp_path):
+        """Test API docs, call graph and callers reuse one parsed tree."""
+        from local_deepwiki.generators.api_docs import get_file_api_docs
+        from local_deepwiki.generators.callgraph import get_file_call_graph, get_file_callers
+
+        path = tmp_path / "mod.py"
+        path.write_bytes(SAMPLE)
+        reset_parse_cache()
+
+        get_file_api_docs(path)
+        get_file_call_graph(path, tmp_path)
+        callers = get_file_callers(path, tmp_path)
+
+        stats = get_parse_cache().stats
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert "helper" in callers
+        reset_parse_cache()
@@ -0,0 +1,87 @@
+"""Tests for process-pool parse workers."""
+
+import pickle
+
+import pytest
+
+from local_deepwiki.config import ChunkingConfig
+from local_deepwiki.core import parse_worker
+from local_deepwiki.core.parse_worker import (
+    ParsedFile,
+    init_worker,
+    pack_chunk,
+    parse_in_worker,
+    unpack_chunk,
+)
+from local_deepwiki.models import ChunkType, CodeChunk, Language
+
+
+class TestChunkPacking:
+    """Tests for the compact chunk payload."""
+
+    def test_round_trip(self):
+        """Test a packed chunk unpacks to an equal model."""
+        chunk = CodeChunk(
+            id="abc",
+            file_path="pkg/mod.py",
+            language=Language.PYTHON,
+            chunk_type=ChunkType.METHOD,
+            name="run",
+            content="def run(self):\n    pass",
+            start_line=3,
+            end_line=4,
+            docstring="Run it.",
+            parent_name="Runner",
+            metadata={"parameter_types": {"self": None}},
+        )
+
+        restored = unpack_chunk(pickle.loads(pickle.dumps(pack_chunk(chunk))))
+
+        assert restored == chunk
+        assert restored.language is Language.PYTHON
+        assert restored.chunk_type is ChunkType.METHOD
+
+    def test_payload_smaller_than_model(self):
+        """Test the packed tuple pickles smaller than the pydantic model."""
+        chunk = CodeChunk(
+            id="abc",
+            file_path="pkg/mod.py",
+            language=Language.PYTHON,
+            chunk_type=ChunkType.FUNCTION,
+            name="f",
+            content="def f(): pass",
+            start_line=1,
+            end_line=1,
+        )
+        assert len(pickle.dumps(pack_chunk(chunk))) < len(pickle.dumps(chunk))
+
+
+class TestParseInWorker:
+    """Tests for parsing inside a worker process."""
+
+    @pytest.fixture(autouse=True)
+    def reset_worker_state(self):
+        """Restore the module-level worker state after each test."""
+        yield
+        parse_worker._worker_state = None
+
+    def test_requires_initialization(self, tmp_path):
+        """Test using a worker before init_worker() fails loudly."""
+        parse_worker._worker_state = None
+        with pytest.raises(RuntimeError, match="before init_worker"):
+            parse_in_worker(tmp_path / "mod.py")
+
+    def test_parses_file(self, tmp_path):
+        """Test an initialized worker returns file info and packed chunks."""
+        source = tmp_path / "mod.py"
+        source.write_text("def greet(name):\n    return name\n")
+        init_worker(ChunkingConfig(), str(tmp_path))
+
+        parsed = parse_in_worker(source)
+
+        assert isinstance(parsed, ParsedFile)
+        assert parsed.error is None
+        assert parsed.file_info.path == "mod.py"
+        chunks = parsed.to_chunks()
+        assert parsed.file_info.chunk_count == len(chunks)
+        assert any(c.name == "greet" for c in chunks)
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from local_deepwiki.export.diagram_cache import DIAGRAM_CACHE_DIR
 from local_deepwiki.export.pdf import (
     PDF_HTML_TEMPLATE,
     PRINT_CSS,
@@ -699,6 +700,67 @@ sequenceDiagram
         assert mock_render.call_count == 2
 
 
+class TestDiagramCaching:
+    """Tests for rendering each export's diagrams once, through the diagram cache."""
+
+    @pytest.fixture
+    def diagram_wiki(self, tmp_path: Path) -> Path:
+        """Create a wiki whose pages share a diagram."""
+        wiki_path = tmp_path / ".deepwiki"
+        wiki_path.mkdir()
+        shared = "```mermaid\ngraph TD\n    A-->B\n```\n"
+        (wiki_path / "index.md").write_text(f"# Home\n\n{shared}")
+        (wiki_path / "other.md").write_text(
+            f"# Other\n\n{shared}\n```mermaid\nsequenceDiagram\n    A->>B: Hi\n```\n"
+        )
+        return wiki_path
+
+    @patch("local_deepwiki.export.pdf.HTML")
+    @patch("local_deepwiki.export.pdf.render_mermaid_to_png")
+    @patch("local_deepwiki.export.pdf.is_mmdc_available", return_value=True)
+    def test_reexport_renders_nothing(
+        self, mock_available, mock_render, mock_html_class, diagram_wiki: Path, tmp_path: Path
+    ):
+        """Test shared diagrams render once and an unchanged re-export renders none."""
+        mock_render.side_effect = lambda code: b"\x89PNG" + code.encode()
+
+        PdfExporter(diagram_wiki, tmp_path / "first.pdf").export_single()
+        assert mock_render.call_count == 2
+
+        PdfExporter(diagram_wiki, tmp_path / "second.pdf").export_separate()
+        assert mock_render.call_count == 2
+        assert len(list((diagram_wiki / DIAGRAM_CACHE_DIR).glob("*.png"))) == 2
+
+        html = mock_html_class.call_args.kwargs["string"]
+        assert "data:image/png;base64," in html
+
+    @patch("local_deepwiki.export.pdf.HTML")
+    @patch("local_deepwiki.export.pdf.render_mermaid_to_png", return_value=b"\x89PNG")
+    @patch("local_deepwiki.export.pdf.is_mmdc_available", return_value=True)
+    def test_removed_diagrams_pruned(
+        self, mock_available, mock_render, mock_html_class, diagram_wiki: Path, tmp_path: Path
+    ):
+        """Test images of diagrams no page uses any more are deleted."""
+        PdfExporter(diagram_wiki, tmp_path / "out.pdf").export_single()
+        (diagram_wiki / "other.md").write_text("# Other\n")
+
+        PdfExporter(diagram_wiki, tmp_path / "out.pdf").export_single()
+
+        assert len(list((diagram_wiki / DIAGRAM_CACHE_DIR).glob("*.png"))) == 1
+
+    @patch("local_deepwiki.export.pdf.HTML")
+    @patch("local_deepwiki.export.pdf.render_mermaid_to_png", return_value=b"\x89PNG")
+    @patch("local_deepwiki.export.pdf.is_mmdc_available", return_value=True)
+    def test_cache_can_be_disabled(
+        self, mock_available, mock_render, mock_html_class, diagram_wiki: Path, tmp_path: Path
+    ):
+        """Test cache_diagrams=False writes nothing to the wiki directory."""
+        PdfExporter(diagram_wiki, tmp_path / "out.pdf", cache_diagrams=False).export_single()
+
+        assert mock_render.call_count == 2
+        assert not (diagram_wiki / DIAGRAM_CACHE_DIR).exists()
+
+
 class TestMainCli:
     """Tests for the main() CLI entry point."""
 
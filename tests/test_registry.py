@@ -0,0 +1,302 @@
+"""Tests for the process-wide resource registry."""
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from local_deepwiki.config import Config, EmbeddingConfig, LLMCacheConfig, LLMConfig, RegistryConfig
+from local_deepwiki.core.registry import (
+    ResourcePool,
+    ResourceRegistry,
+    get_registry,
+    index_version,
+    reset_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Ensure each test starts with an empty global registry."""
+    reset_registry()
+    yield
+    reset_registry()
+
+
+class TestResourcePool:
+    """Tests for ResourcePool."""
+
+    def test_creates_once_and_reuses(self):
+        """Test the factory runs only on the first lookup."""
+        pool: ResourcePool[object] = ResourcePool("test", max_entries=4)
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = pool.get_or_create("a", factory)
+        second = pool.get_or_create("a", factory)
+
+        assert first is second
+        assert factory.call_count == 1
+        assert pool.stats["hits"] == 1
+        assert pool.stats["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted beyond max_entries."""
+        pool: ResourcePool[str] = ResourcePool("test", max_entries=2)
+        pool.get_or_create("a", lambda: "A")
+        pool.get_or_create("b", lambda: "B")
+        # Touch "a" so "b" becomes least recently used
+        pool.get_or_create("a", lambda: "A2")
+        pool.get_or_create("c", lambda: "C")
+
+        assert "a" in pool
+        assert "b" not in pool
+        assert "c" in pool
+        assert pool.stats["evictions"] == 1
+
+    def test_idle_timeout_expires_entries(self):
+        """Test entries idle longer than the timeout are recreated."""
+        pool: ResourcePool[str] = ResourcePool("test", max_entries=4, idle_timeout=10)
+        with patch("local_deepwiki.core.registry.time.monotonic", return_value=100.0):
+            pool.get_or_create("a", lambda: "old")
+        with patch("local_deepwiki.core.registry.time.monotonic", return_value=200.0):
+            value = pool.get_or_create("a", lambda: "new")
+
+        assert value == "new"
+        assert pool.stats["expirations"] == 1
+
+    def test_version_mismatch_recreates(self):
+        """Test a changed version token forces recreation."""
+        pool: ResourcePool[str] = ResourcePool("test", max_entries=4)
+        pool.get_or_create("a", lambda: "v1", version=1)
+
+        assert pool.get_or_create("a", lambda: "v1-again", version=1) == "v1"
+        assert pool.get_or_create("a", lambda: "v2", version=2) == "v2"
+
+    def test_put_replaces_entry(self):
+        """Test put inserts a prebuilt resource."""
+        pool: ResourcePool[str] = ResourcePool("test", max_entries=4)
+        pool.get_or_create("a", lambda: "built")
+        pool.put("a", "published")
+
+        assert pool.get_or_create("a", lambda: "unused") == "published"
+
+    def test_invalidate_with_predicate(self):
+        """Test invalidate drops only matching keys."""
+        pool: ResourcePool[str] = ResourcePool("test", max_entries=4)
+        pool.get_or_create(("x", 1), lambda: "x1")
+        pool.get_or_create(("y", 1), lambda: "y1")
+
+        dropped = pool.invalidate(lambda key: key[0] == "x")
+
+        assert dropped == 1
+        assert ("x", 1) not in pool
+        assert ("y", 1) in pool
+
+    def test_dropped_resources_released(self):
+        """Test on_release gets every resource the pool drops."""
+        released: list[str] = []
+        pool: ResourcePool[str] = ResourcePool("test", max_entries=1, on_release=released.append)
+        pool.get_or_create("a", lambda: "A", version=1)
+        pool.get_or_create("a", lambda: "A2", version=2)
+        pool.get_or_create("b", lambda: "B")
+        pool.invalidate()
+
+        assert released == ["A", "A2", "B"]
+
+
+class TestResourceRegistry:
+    """Tests for ResourceRegistry."""
+
+    def test_embedding_provider_shared_by_config_value(self):
+        """Test equal embedding configs share one provider instance."""
+        registry = ResourceRegistry()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        first = registry.get_embedding_provider(EmbeddingConfig(), factory=factory)
+        second = registry.get_embedding_provider(EmbeddingConfig(), factory=factory)
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_different_embedding_configs_are_separate(self):
+        """Test different models get different providers."""
+        registry = ResourceRegistry()
+        other = EmbeddingConfig()
+        other.local.model = "another-model"
+
+        first = registry.get_embedding_provider(EmbeddingConfig(), factory=MagicMock)
+        second = registry.get_embedding_provider(other, factory=MagicMock)
+
+        assert first is not second
+
+    def test_vector_store_keyed_by_db_path(self, tmp_path):
+        """Test each repository gets its own vector store."""
+        registry = ResourceRegistry()
+        provider = MagicMock()
+        config = EmbeddingConfig()
+
+        store_a = registry.get_vector_store(tmp_path / "a", config, embedding_provider=provider)
+        store_a2 = registry.get_vector_store(tmp_path / "a", config, embedding_provider=provider)
+        store_b = registry.get_vector_store(tmp_path / "b", config, embedding_provider=provider)
+
+        assert store_a is store_a2
+        assert store_a is not store_b
+        assert store_a.embedding_provider is provider
+
+    def test_invalidate_repository(self, tmp_path):
+        """Test invalidating a repository drops only its stores."""
+        registry = ResourceRegistry()
+        provider = MagicMock()
+        config = EmbeddingConfig()
+        registry.get_vector_store(tmp_path / "a", config, embedding_provider=provider)
+        registry.get_vector_store(tmp_path / "b", config, embedding_provider=provider)
+
+        assert registry.invalidate_repository(tmp_path / "a") == 1
+        assert registry.stats()["vector_stores"]["size"] == 1
+
+    def test_research_session_per_repository_and_version(self, tmp_path):
+        """Test research sessions are shared per repository until it is re-indexed."""
+        registry = ResourceRegistry()
+        config = EmbeddingConfig()
+
+        first = registry.get_research_session(tmp_path / "a", config, version=1)
+
+        assert registry.get_research_session(tmp_path / "a", config, version=1) is first
+        assert registry.get_research_session(tmp_path / "b", config, version=1) is not first
+        assert registry.get_research_session(tmp_path / "a", config, version=2) is not first
+        assert registry.invalidate_repository(tmp_path / "a") == 1
+
+    def test_llm_provider_cached(self, tmp_path):
+        """Test cached LLM providers are reused for identical configs."""
+        registry = ResourceRegistry()
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        args = (tmp_path / "cache.lance", EmbeddingConfig(), LLMCacheConfig(), LLMConfig())
+
+        first = registry.get_cached_llm_provider(*args, factory=factory)
+        second = registry.get_cached_llm_provider(*args, factory=factory)
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_clear_closes_llm_providers(self, tmp_path):
+        """Test dropped LLM providers write out their buffered state."""
+        registry = ResourceRegistry()
+        provider = MagicMock()
+        args = (tmp_path / "cache.lance", EmbeddingConfig(), LLMCacheConfig(), LLMConfig())
+        registry.get_cached_llm_provider(*args, factory=lambda: provider)
+
+        registry.clear()
+
+        provider.close.assert_called_once()
+
+    def test_pool_sizes_from_config(self):
+        """Test registry pools honour the configured limits."""
+        registry = ResourceRegistry(
+            RegistryConfig(max_embedding_providers=1, max_vector_stores=3, idle_timeout_seconds=0)
+        )
+
+        assert registry.embedding_providers.max_entries == 1
+        assert registry.vector_stores.max_entries == 3
+        assert registry.vector_stores.idle_timeout == 0
+
+    def test_clear_and_stats(self):
+        """Test clear empties every pool."""
+        registry = ResourceRegistry()
+        registry.get_embedding_provider(EmbeddingConfig(), factory=MagicMock)
+        registry.clear()
+
+        stats = registry.stats()
+        assert set(stats) == {
+            "embedding_providers",
+            "vector_stores",
+            "llm_providers",
+            "research_sessions",
+        }
+        assert stats["embedding_providers"]["size"] == 0
+        assert stats["embedding_providers"]["misses"] == 1
+
+
+class TestIndexVersion:
+    """Tests for index_version."""
+
+    def test_missing_status_file(self, tmp_path):
+        """Test a missing status file yields None."""
+        assert index_version(tmp_path) is None
+
+    def test_changes_when_status_rewritten(self, tmp_path):
+        """Test the version token tracks the status file mtime."""
+        status = tmp_path / "index_status.json"
+        status.write_text("{}")
+        first = index_version(tmp_path)
+        status.write_text("{}")
+        os.utime(status, ns=(first + 1_000_000, first + 1_000_000))
+
+        assert index_version(tmp_path) != first
+
+
+class TestGlobalRegistry:
+    """Tests for the global registry singleton."""
+
+    def test_singleton(self):
+        """Test get_registry returns the same instance until reset."""
+        first = get_registry()
+        assert get_registry() is first
+        reset_registry()
+        assert get_registry() is not first
+
+
+class TestHandlersUseRegistry:
+    """Tests that tool handlers reuse registry resources across calls."""
+
+    async def test_second_search_reuses_provider_and_store(self, tmp_path):
+        """Test repeated search_code calls load the embedding provider once."""
+        from local_deepwiki.handlers import handle_search_code
+
+        config = Config()
+        (tmp_path / ".deepwiki" / "vectors.lance").mkdir(parents=True)
+
+        with patch("local_deepwiki.handlers.get_config", return_value=config):
+            with patch("local_deepwiki.handlers.get_embedding_provider") as mock_get_provider:
+                with patch("local_deepwiki.handlers.VectorStore") as mock_vs:
+                    mock_store = MagicMock()
+                    mock_store.search = AsyncMock(return_value=[])
+                    mock_vs.return_value = mock_store
+
+                    for _ in range(2):
+                        await handle_search_code({"repo_path": str(tmp_path), "query": "foo"})
+
+        assert mock_get_provider.call_count == 1
+        assert mock_vs.call_count == 1
+        assert mock_store.search.await_count == 2
+
+    async def test_reindex_invalidates_store(self, tmp_path):
+        """Test a rewritten index status opens a fresh vector store."""
+        from local_deepwiki.handlers import handle_search_code
+
+        config = Config()
+        wiki_path = tmp_path / ".deepwiki"
+        (wiki_path / "vectors.lance").mkdir(parents=True)
+        status = wiki_path / "index_status.json"
+        status.write_text("{}")
+
+        with patch("local_deepwiki.handlers.get_config", return_value=config):
+            with patch("local_deepwiki.handlers.get_embedding_provider"):
+                with patch("local_deepwiki.handlers.VectorStore") as mock_vs:
+                    mock_vs.return_value.search = AsyncMock(return_value=[])
+
+                    await handle_search_code({"repo_path": str(tmp_path), "query": "foo"})
+                    mtime = status.stat().st_mtime_ns
+                    os.utime(status, ns=(mtime + 1_000_000, mtime + 1_000_000))
+                    await handle_search_code({"repo_path": str(tmp_path), "query": "foo"})
+
+        assert mock_vs.call_count == 2
+
+
+def test_registry_path_type(tmp_path):
+    """Test registry keys accept Path objects and strings consistently."""
+    registry = ResourceRegistry()
+    provider = MagicMock()
+    config = EmbeddingConfig()
+    store = registry.get_vector_store(Path(str(tmp_path)), config, embedding_provider=provider)
+    assert registry.get_vector_store(tmp_path, config, embedding_provider=provider) is store
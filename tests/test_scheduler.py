@@ -0,0 +1,165 @@
+"""Tests for the wiki generation task scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from local_deepwiki.generators.scheduler import (
+    ConcurrencyLimitedLLMProvider,
+    PageScheduler,
+    PageTask,
+)
+from local_deepwiki.providers.base import LLMProvider
+
+
+def sleeper(seconds: float, result: object = None):
+    """Make a task body that sleeps and then returns result."""
+
+    async def run():
+        await asyncio.sleep(seconds)
+        return result
+
+    return run
+
+
+class TestPageScheduler:
+    """Tests for PageScheduler."""
+
+    async def test_independent_tasks_overlap(self):
+        """Test tasks without dependencies run at the same time."""
+        scheduler = PageScheduler([PageTask(f"page{i}", sleeper(0.1, i)) for i in range(5)])
+
+        start = time.perf_counter()
+        results = await scheduler.run()
+
+        assert time.perf_counter() - start < 0.3
+        assert results == {f"page{i}": i for i in range(5)}
+
+    async def test_dependents_wait_and_see_results(self):
+        """Test a task starts after its dependencies and can read their results."""
+        scheduler: PageScheduler
+
+        async def combine():
+            return scheduler.results["a"] + scheduler.results["b"]
+
+        scheduler = PageScheduler(
+            [
+                PageTask("total", combine, depends_on=("a", "b")),
+                PageTask("a", sleeper(0.05, 1)),
+                PageTask("b", sleeper(0.1, 2)),
+            ]
+        )
+        results = await scheduler.run()
+
+        assert results["total"] == 3
+        timings = scheduler.timings
+        assert timings["total"].started_at >= timings["b"].finished_at
+        assert timings["b"].duration_seconds >= 0.1
+        assert scheduler.critical_path() == ["b", "total"]
+
+    async def test_progress_reported_for_described_tasks(self):
+        """Test the progress callback fires as each described task starts."""
+        calls = []
+        scheduler = PageScheduler(
+            [
+                PageTask("first", sleeper(0), description="Doing first"),
+                PageTask("quiet", sleeper(0)),
+                PageTask("second", sleeper(0), depends_on=("first",), description="Then second"),
+            ],
+            progress_callback=lambda msg, current, total: calls.append((msg, current, total)),
+        )
+        await scheduler.run()
+
+        assert calls[0] == ("Doing first", 0, 3)
+        assert calls[1][0] == "Then second"
+        assert calls[1][1] >= 1
+
+    async def test_failure_cancels_running_tasks(self):
+        """Test the first failure is raised and unfinished tasks are cancelled."""
+        cancelled = asyncio.Event()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("page failed")
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        scheduler = PageScheduler(
+            [
+                PageTask("fail", fail),
+                PageTask("slow", slow),
+                PageTask("after", sleeper(0), depends_on=("fail",)),
+            ]
+        )
+        with pytest.raises(RuntimeError, match="page failed"):
+            await scheduler.run()
+
+        assert cancelled.is_set()
+        assert "after" not in scheduler.results
+
+    def test_invalid_graphs_rejected(self):
+        """Test duplicate names, unknown dependencies and cycles are errors."""
+        with pytest.raises(ValueError, match="unique"):
+            PageScheduler([PageTask("a", sleeper(0)), PageTask("a", sleeper(0))])
+        with pytest.raises(ValueError, match="unknown"):
+            PageScheduler([PageTask("a", sleeper(0), depends_on=("missing",))])
+        with pytest.raises(ValueError, match="cycle"):
+            PageScheduler(
+                [
+                    PageTask("a", sleeper(0), depends_on=("b",)),
+                    PageTask("b", sleeper(0), depends_on=("a",)),
+                ]
+            )
+
+
+class SlowLLM(LLMProvider):
+    """LLM provider that records how many calls overlap."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def _enter(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+
+    async def generate(self, prompt, system_prompt=None, max_tokens=4096, temperature=0.7):
+        await self._enter()
+        return f"answer to {prompt}"
+
+    async def generate_stream(self, prompt, system_prompt=None, max_tokens=4096, temperature=0.7):
+        await self._enter()
+        yield prompt
+
+    @property
+    def name(self) -> str:
+        return "slow"
+
+
+class TestConcurrencyLimitedLLMProvider:
+    """Tests for the shared LLM concurrency budget."""
+
+    async def test_caps_concurrent_calls(self):
+        """Test calls beyond the budget wait for a free slot."""
+        provider = SlowLLM()
+        llm = ConcurrencyLimitedLLMProvider(provider, max_concurrent=2)
+
+        async def stream(prompt):
+            return [chunk async for chunk in llm.generate_stream(prompt)]
+
+        results = await asyncio.gather(
+            *(llm.generate(f"p{i}") for i in range(4)), *(stream(f"s{i}") for i in range(2))
+        )
+
+        assert provider.peak == 2
+        assert results[0] == "answer to p0"
+        assert results[4] == ["s0"]
+        assert llm.name == "slow"
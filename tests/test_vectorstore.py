@@ -125,7 +125,7 @@ class TestVectorStoreIndexes:
         assert len(chunks) == 1
 
     async def test_ensure_indexes_on_existing_table(self, vector_store, tmp_path):
-        """Test that opening an existing table ensures indexes exist."""
+        """Test that an existing table can be reopened for indexed lookups."""
         # Create table with data
         chunks = [make_chunk("test_1")]
         await vector_store.create_or_update_table(chunks)
@@ -135,7 +135,7 @@ class TestVectorStoreIndexes:
 
         new_store = VectorStore(tmp_path / "test.lance", MockEmbeddingProvider())
 
-        # Get table (should ensure indexes)
+        # Get table (opens it without building indexes)
         table = new_store._get_table()
         assert table is not None
 
@@ -144,6 +144,101 @@ class TestVectorStoreIndexes:
         assert chunk is not None
 
 
+class TestVectorStoreAnnIndex:
+    """Tests for the ANN vector index lifecycle."""
+
+    @pytest.fixture
+    def vector_store(self, tmp_path):
+        """Create a vector store that indexes small tables."""
+        from local_deepwiki.config import VectorIndexConfig
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        config = VectorIndexConfig(
+            min_rows=300, num_partitions=2, num_sub_vectors=4, rebuild_churn_fraction=0.5
+        )
+        return VectorStore(tmp_path / "test.lance", MockEmbeddingProvider(16), index_config=config)
+
+    @staticmethod
+    def _chunks(start: int, count: int) -> tuple[list[CodeChunk], list[list[float]]]:
+        """Create chunks spread over ten files with distinct embeddings."""
+        chunks = [make_chunk(f"c{i}", f"src/f{i % 10}.py") for i in range(start, start + count)]
+        embeddings = [[float((i * (d + 1)) % 13) for d in range(16)] for i in range(count)]
+        return chunks, embeddings
+
+    async def test_small_table_uses_flat_search(self, vector_store):
+        """Test no index is built below the row threshold."""
+        await vector_store.create_or_update_table(*self._chunks(0, 100))
+
+        assert vector_store.ensure_vector_index() == "skipped"
+        assert not vector_store._has_vector_index
+
+    async def test_index_created_over_threshold(self, vector_store):
+        """Test the index is built once the table crosses the threshold."""
+        await vector_store.create_or_update_table(*self._chunks(0, 400))
+
+        assert vector_store.ensure_vector_index() == "created"
+        assert vector_store.ensure_vector_index() == "current"
+        results = await vector_store.search("query", limit=5)
+        assert len(results) == 5
+
+    async def test_small_churn_merged_incrementally(self, vector_store):
+        """Test a few added rows are merged without retraining."""
+        await vector_store.create_or_update_table(*self._chunks(0, 400))
+        vector_store.ensure_vector_index()
+
+        await vector_store.add_chunks(*self._chunks(400, 20))
+
+        assert vector_store.ensure_vector_index() == "optimized"
+        assert vector_store.ensure_vector_index() == "current"
+
+    async def test_large_churn_retrains(self, vector_store):
+        """Test deletes count towards churn and trigger a retrain."""
+        # Enough rows survive the deletes to train PQ (256 with 8-bit codes)
+        await vector_store.create_or_update_table(*self._chunks(0, 600))
+        vector_store.ensure_vector_index()
+
+        for i in range(5):
+            await vector_store.delete_chunks_by_file(f"src/f{i}.py")
+
+        assert vector_store.ensure_vector_index() == "retrained"
+
+    async def test_existing_index_detected_on_open(self, vector_store, tmp_path):
+        """Test a reopened store applies query knobs to an existing index."""
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        await vector_store.create_or_update_table(*self._chunks(0, 400))
+        vector_store.ensure_vector_index()
+
+        reopened = VectorStore(tmp_path / "test.lance", MockEmbeddingProvider(16))
+        reopened._get_table()
+        assert reopened._has_vector_index
+
+    async def test_rebuilding_table_drops_index_state(self, vector_store):
+        """Test a full rebuild starts from flat search again."""
+        await vector_store.create_or_update_table(*self._chunks(0, 400))
+        vector_store.ensure_vector_index()
+
+        await vector_store.create_or_update_table(*self._chunks(0, 100))
+
+        assert not vector_store._has_vector_index
+        assert vector_store.ensure_vector_index() == "skipped"
+
+    async def test_invalid_parameters_do_not_raise(self, vector_store):
+        """Test a failed index build is reported instead of raised."""
+        vector_store.index_config.num_sub_vectors = 5
+        await vector_store.create_or_update_table(*self._chunks(0, 400))
+
+        assert vector_store.ensure_vector_index() == "failed"
+        assert len(await vector_store.search("query", limit=3)) == 3
+
+    async def test_disabled(self, vector_store):
+        """Test indexing can be turned off."""
+        vector_store.index_config.enabled = False
+        await vector_store.create_or_update_table(*self._chunks(0, 400))
+
+        assert vector_store.ensure_vector_index() == "disabled"
+
+
 class TestVectorStoreSearch:
     """Tests for vector store search functionality."""
 
@@ -213,6 +308,268 @@ class TestVectorStoreSearch:
             await vector_store.search("test", chunk_type="invalid_type")
 
 
+class TestIdentifierQuery:
+    """Tests for identifier query detection."""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("VectorStore", "VectorStore"),
+            ("class Foo", "Foo"),
+            ("def get_chunks", "get_chunks"),
+            ("build_context(", "build_context"),
+            ("run()", "run"),
+            ("config.get_wiki_path", "config.get_wiki_path"),
+            ("how does indexing work", None),
+            ("Foo(bar)", None),
+        ],
+    )
+    def test_identifier_query(self, query, expected):
+        """Test bare identifiers are recognized in their common spellings."""
+        from local_deepwiki.core.vectorstore import identifier_query
+
+        assert identifier_query(query) == expected
+
+
+class TestVectorStoreHybridSearch:
+    """Tests for keyword, hybrid and auto search modes."""
+
+    @pytest.fixture
+    async def store(self, tmp_path):
+        """Create a store with a few distinguishable chunks."""
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        store = VectorStore(tmp_path / "test.lance", MockEmbeddingProvider(8))
+        chunks = [
+            make_chunk("a", "src/store.py", "class VectorStore:\n    def search(self): pass"),
+            make_chunk("b", "src/index.py", "def build_index(store):\n    store.search()"),
+            make_chunk("c", "src/util.py", "def get_file_docs(path):\n    return path"),
+            make_chunk("d", "lib/other.js", "function search() {}", language=Language.JAVASCRIPT),
+        ]
+        chunks[0].name = "VectorStore"
+        chunks[2].name = "get_file_docs"
+        await store.create_or_update_table(chunks)
+        store.embedding_provider.embed_calls.clear()
+        return store
+
+    async def test_keyword_search_skips_embedding(self, store):
+        """Test identifier lookups are served by the keyword index alone."""
+        results = await store.search("VectorStore", limit=3, mode="keyword")
+
+        assert results[0].chunk.id == "a"
+        assert results[0].score == 1.0
+        assert store.embedding_provider.embed_calls == []
+
+    async def test_identifier_tokens_must_all_match(self, store):
+        """Test identifier queries do not match on a single shared token."""
+        results = await store.search("get_file_docs(", mode="keyword")
+
+        assert [r.chunk.id for r in results] == ["c"]
+
+    async def test_keyword_search_applies_filters(self, store):
+        """Test language filters apply to keyword search."""
+        results = await store.search("search", mode="keyword", language="javascript")
+
+        assert [r.chunk.id for r in results] == ["d"]
+
+    async def test_auto_uses_keyword_for_identifiers(self, store):
+        """Test auto mode answers identifier queries without an embedding."""
+        results = await store.search("class VectorStore", mode="auto")
+
+        assert results[0].chunk.id == "a"
+        assert store.embedding_provider.embed_calls == []
+
+    async def test_auto_falls_back_to_hybrid(self, store):
+        """Test auto mode embeds free text and unmatched identifiers."""
+        await store.search("how are chunks stored", mode="auto")
+        await store.search("NoSuchSymbol", mode="auto")
+
+        assert len(store.embedding_provider.embed_calls) == 2
+
+    async def test_hybrid_fuses_rankings(self, store):
+        """Test hybrid results combine both retrievers and rank shared hits first."""
+        results = await store.search("build_index", limit=4, mode="hybrid")
+
+        assert results[0].chunk.id == "b"
+        assert len(results) == 4
+        assert all(0 < r.score <= 1.0 for r in results)
+        assert store.embedding_provider.embed_calls == [["build_index"]]
+
+    async def test_invalid_mode_raises(self, store):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid search mode"):
+            await store.search("x", mode="fuzzy")
+
+    async def test_added_chunks_searchable_before_merge(self, store):
+        """Test new rows are found by keyword search and merged by ensure_fts_index."""
+        chunk = make_chunk("e", "src/new.py", "def freshly_added(): pass")
+        chunk.name = "freshly_added"
+        await store.add_chunks([chunk])
+
+        results = await store.search("freshly_added", mode="keyword")
+        assert [r.chunk.id for r in results] == ["e"]
+
+        assert store.ensure_fts_index() == 1
+        assert store.ensure_fts_index() == 0
+
+    async def test_existing_table_without_fts_indexes(self, tmp_path):
+        """Test searches fall back to vector search until ensure_fts_index builds the indexes."""
+        import lancedb
+
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        chunk = make_chunk("x", "src/old.py", "def legacy(): pass")
+        lancedb.connect(str(tmp_path / "old.lance")).create_table(
+            VectorStore.TABLE_NAME, [chunk.to_vector_record(vector=[0.1] * 8)]
+        )
+
+        store = VectorStore(tmp_path / "old.lance", MockEmbeddingProvider(8))
+        results = await store.search("legacy", mode="keyword")
+
+        # Opening the table for a search does not build indexes
+        assert [r.chunk.id for r in results] == ["x"]
+        assert store.embedding_provider.embed_calls == [["legacy"]]
+        assert store._get_table().list_indices() == []
+
+        assert store.ensure_fts_index() == 1
+        names = {idx.name for idx in store._get_table().list_indices()}
+        assert {"id_idx", "file_path_idx", "name_idx", "content_idx", "docstring_idx"} <= names
+
+        store.embedding_provider.embed_calls.clear()
+        results = await store.search("legacy", mode="keyword")
+        assert [r.chunk.id for r in results] == ["x"]
+        assert store.embedding_provider.embed_calls == []
+
+
+class TestVectorStoreSearchMany:
+    """Tests for pushed-down path filters and batched searches."""
+
+    @pytest.fixture
+    async def store(self, tmp_path):
+        """Create a store with chunks spread over a few directories."""
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        store = VectorStore(tmp_path / "test.lance", MockEmbeddingProvider(8))
+        chunks = [
+            make_chunk("a", "src/store.py", "class VectorStore:\n    def search(self): pass"),
+            make_chunk("b", "src/index.py", "def build_index(store):\n    store.search()"),
+            make_chunk("c", "lib/util.py", "def get_file_docs(path):\n    return path"),
+            make_chunk("d", "lib/it's.py", "def quoted(): pass"),
+            make_chunk("e", "srcx/extra.py", "def extra(): pass"),
+        ]
+        chunks[0].name = "VectorStore"
+        chunks[2].name = "get_file_docs"
+        await store.create_or_update_table(chunks)
+        store.embedding_provider.embed_calls.clear()
+        return store
+
+    @pytest.mark.parametrize("mode", ["vector", "keyword", "hybrid"])
+    async def test_path_prefix_filter(self, store, mode):
+        """Test a path prefix restricts every mode to matching files."""
+        results = await store.search("search", limit=10, mode=mode, path_prefix="src/")
+
+        assert {r.chunk.file_path for r in results} <= {"src/store.py", "src/index.py"}
+        assert results
+
+    async def test_file_paths_filter(self, store):
+        """Test a file set selects its chunks before the limit is applied."""
+        results = await store.search("code", limit=1, file_paths=["lib/it's.py"])
+
+        assert [r.chunk.id for r in results] == ["d"]
+
+    async def test_empty_file_paths_matches_nothing(self, store):
+        """Test an empty file set short-circuits without embedding."""
+        assert await store.search("code", file_paths=[]) == []
+        assert store.embedding_provider.embed_calls == []
+
+    async def test_vector_queries_share_one_embedding_call(self, store):
+        """Test a batch embeds all queries at once and keeps per-query limits."""
+        results = await store.search_many(["store", "index", "docs"], limit=2)
+
+        assert len(results) == 3
+        assert all(len(query_results) == 2 for query_results in results)
+        assert store.embedding_provider.embed_calls == [["store", "index", "docs"]]
+
+    async def test_batch_matches_individual_searches(self, store):
+        """Test batched keyword results equal the one-at-a-time results."""
+        queries = ["VectorStore", "get_file_docs", "search"]
+
+        batched = await store.search_many(queries, mode="keyword", path_prefix="src/")
+        single = [await store.search(q, mode="keyword", path_prefix="src/") for q in queries]
+
+        assert [[r.chunk.id for r in rs] for rs in batched] == [
+            [r.chunk.id for r in rs] for rs in single
+        ]
+
+    async def test_auto_embeds_only_unmatched_queries(self, store):
+        """Test auto mode answers identifiers by keyword and embeds the rest together."""
+        results = await store.search_many(
+            ["VectorStore", "how is the index built", "NoSuchSymbol"], mode="auto"
+        )
+
+        assert results[0][0].chunk.id == "a"
+        assert all(results)
+        assert store.embedding_provider.embed_calls == [["how is the index built", "NoSuchSymbol"]]
+
+
+class TestVectorStoreBulkScan:
+    """Tests for iter_chunks and snapshot."""
+
+    @pytest.fixture
+    async def populated_store(self, tmp_path):
+        """Create a vector store with chunks across several files."""
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        store = VectorStore(tmp_path / "test.lance", MockEmbeddingProvider())
+        chunks = [
+            make_chunk("chunk_1", "src/main.py", chunk_type=ChunkType.CLASS),
+            make_chunk("chunk_2", "src/main.py"),
+            make_chunk("chunk_3", "src/utils.py"),
+        ]
+        await store.create_or_update_table(chunks)
+        return store
+
+    def test_iter_chunks_empty_store(self, tmp_path):
+        """Test iterating a store without a table yields nothing."""
+        from local_deepwiki.core.vectorstore import VectorStore
+
+        store = VectorStore(tmp_path / "empty.lance", MockEmbeddingProvider())
+        assert list(store.iter_chunks()) == []
+        assert len(store.snapshot()) == 0
+
+    async def test_iter_chunks_selects_columns(self, populated_store):
+        """Test only the requested columns are returned."""
+        batches = list(populated_store.iter_chunks(columns=["id", "file_path"]))
+
+        rows = [row for batch in batches for row in batch.to_pylist()]
+        assert len(rows) == 3
+        assert set(rows[0]) == {"id", "file_path"}
+
+    async def test_iter_chunks_filters_chunk_types(self, populated_store):
+        """Test chunk type filtering is pushed into the scan."""
+        batches = list(populated_store.iter_chunks(columns=["id"], chunk_types=["class"]))
+
+        ids = [row["id"] for batch in batches for row in batch.to_pylist()]
+        assert ids == ["chunk_1"]
+
+    async def test_iter_chunks_rejects_unknown_column(self, populated_store):
+        """Test the vector column and unknown columns are rejected."""
+        with pytest.raises(ValueError, match="Invalid columns for chunk scan"):
+            list(populated_store.iter_chunks(columns=["vector"]))
+
+    async def test_snapshot_groups_by_file(self, populated_store):
+        """Test the snapshot answers per-file lookups without the store."""
+        snapshot = populated_store.snapshot()
+
+        assert len(snapshot) == 3
+        assert snapshot.files == ["src/main.py", "src/utils.py"]
+        assert [c.id for c in snapshot.get_chunks_by_file("src/main.py")] == [
+            "chunk_1",
+            "chunk_2",
+        ]
+        assert snapshot.get_chunks_by_file("missing.py") == []
+
+
 class TestVectorStoreStats:
     """Tests for vector store statistics."""
 
@@ -4,7 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -291,6 +291,22 @@ class TestChatEndpoints:
         # We check content type for valid responses
         assert response.content_type.startswith("text/event-stream") or response.status_code == 500
 
+    def test_api_chat_flushes_request_provider(self, wiki_dir):
+        """Test the per-request LLM provider writes out its cache hits when the stream ends."""
+        store = MagicMock()
+        store.search = AsyncMock(return_value=[])
+        llm = MagicMock()
+        llm.count_tokens = len
+        llm.flush = AsyncMock()
+        app = create_app(wiki_dir)
+        client = app.test_client()
+
+        with patch("local_deepwiki.web.app._build_request_resources", return_value=(store, llm)):
+            response = client.post("/api/chat", json={"question": "test question"})
+            assert b"No relevant code found" in response.data
+
+        llm.flush.assert_awaited_once()
+
     def test_api_research_returns_sse(self, wiki_dir):
         """Test that /api/research returns Server-Sent Events content type."""
         app = create_app(wiki_dir)
@@ -0,0 +1,240 @@
+"""Tests for the ASGI serving mode of the web UI."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.testclient import TestClient
+
+from local_deepwiki.core.registry import reset_registry
+from local_deepwiki.models import ChunkType, CodeChunk, Language, SearchResult
+from local_deepwiki.web.asgi import create_asgi_app
+
+
+@pytest.fixture
+def wiki_dir(tmp_path):
+    """Create a wiki directory inside a repository."""
+    wiki_path = tmp_path / ".deepwiki"
+    (wiki_path / "modules").mkdir(parents=True)
+    (wiki_path / "index.md").write_text("# Home\n\nWelcome.\n")
+    (wiki_path / "modules" / "core.md").write_text("# Core\n")
+    return wiki_path
+
+
+@pytest.fixture
+def client(wiki_dir):
+    """Test client for an app that skips start-up warming."""
+    with TestClient(create_asgi_app(wiki_dir, warm=False)) as test_client:
+        yield test_client
+
+
+def _events(response) -> list[dict]:
+    """Decode the SSE messages in a response body."""
+    return [
+        json.loads(line[len("data: ") :])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def _search_result() -> SearchResult:
+    chunk = CodeChunk(
+        id="c1",
+        file_path="src/app.py",
+        language=Language.PYTHON,
+        chunk_type=ChunkType.FUNCTION,
+        name="handler",
+        content="def handler(): pass",
+        start_line=1,
+        end_line=1,
+    )
+    return SearchResult(chunk=chunk, score=0.9)
+
+
+def _streaming_llm(*tokens: str) -> MagicMock:
+    async def generate_stream(prompt, **kwargs):
+        for token in tokens:
+            yield token
+
+    llm = MagicMock()
+    llm.generate_stream = generate_stream
+    llm.count_tokens = len
+    return llm
+
+
+class TestPages:
+    """Tests for the page routes."""
+
+    def test_root_redirects_to_index(self, client):
+        """Test / redirects to the index page."""
+        response = client.get("/", follow_redirects=False)
+        assert response.status_code in (302, 307)
+        assert response.headers["location"].endswith("/wiki/index.md")
+
+    def test_view_page_renders_markdown_and_nav(self, client):
+        """Test a wiki page renders with navigation links."""
+        response = client.get("/wiki/index.md")
+        assert response.status_code == 200
+        assert "Welcome." in response.text
+        assert "/wiki/modules/core.md" in response.text
+
+    def test_missing_page_is_404(self, client):
+        """Test an unknown page returns 404."""
+        assert client.get("/wiki/missing.md").status_code == 404
+
+    def test_path_outside_wiki_is_404(self, client, wiki_dir):
+        """Test encoded traversal cannot read files outside the wiki."""
+        (wiki_dir.parent / "secret.md").write_text("# Secret\n")
+        assert client.get("/wiki/%2e%2e/secret.md").status_code == 404
+
+    def test_search_json(self, client, wiki_dir):
+        """Test search.json serves the index, or an empty list before generation."""
+        assert client.get("/search.json").json() == []
+        (wiki_dir / "search.json").write_text('[{"title": "Home"}]')
+        assert client.get("/search.json").json() == [{"title": "Home"}]
+
+    def test_search_json_conditional(self, client, wiki_dir):
+        """Test search.json revalidates with a 304."""
+        (wiki_dir / "search.json").write_text("[]")
+        etag = client.get("/search.json").headers["etag"]
+        assert client.get("/search.json", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_chat_page(self, client):
+        """Test the chat page renders."""
+        response = client.get("/chat")
+        assert response.status_code == 200
+        assert "<textarea" in response.text or "<input" in response.text
+
+    def test_missing_wiki_path_raises(self, tmp_path):
+        """Test the app refuses a non-existent wiki directory."""
+        with pytest.raises(ValueError):
+            create_asgi_app(tmp_path / "nope")
+
+
+class TestApiChat:
+    """Tests for /api/chat."""
+
+    def test_requires_question(self, client):
+        """Test an empty question is rejected."""
+        assert client.post("/api/chat", json={"question": " "}).status_code == 400
+        assert client.post("/api/chat", content=b"not json").status_code == 400
+
+    def test_not_indexed(self, client):
+        """Test an unindexed repository reports an error event."""
+        response = client.post("/api/chat", json={"question": "what?"})
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert _events(response)[0]["type"] == "error"
+
+    def test_streams_sources_and_tokens(self, client):
+        """Test the answer streams as sources, tokens, then done."""
+        store = MagicMock()
+        store.search = AsyncMock(return_value=[_search_result()])
+        llm = _streaming_llm("Hello", " world")
+
+        with patch("local_deepwiki.web.asgi.get_shared_resources", return_value=(store, llm)):
+            response = client.post("/api/chat", json={"question": "what?", "history": []})
+
+        events = _events(response)
+        assert [e["type"] for e in events] == ["sources", "token", "token", "done"]
+        assert events[0]["sources"][0]["file"] == "src/app.py"
+        assert "".join(e["content"] for e in events if e["type"] == "token") == "Hello world"
+        store.search.assert_awaited_once_with("what?", limit=5, mode="hybrid")
+
+    def test_resources_are_shared_across_requests(self, client, wiki_dir):
+        """Test providers and the vector store are built once per process."""
+        (wiki_dir / "vectors.lance").mkdir()
+        reset_registry()
+        store = MagicMock()
+        store.search = AsyncMock(return_value=[])
+
+        try:
+            with (
+                patch(
+                    "local_deepwiki.providers.embeddings.get_embedding_provider"
+                ) as get_embedding,
+                patch("local_deepwiki.web.asgi.VectorStore", return_value=store) as store_cls,
+                patch(
+                    "local_deepwiki.providers.llm.get_cached_llm_provider",
+                    return_value=_streaming_llm(),
+                ) as get_llm,
+            ):
+                for _ in range(3):
+                    response = client.post("/api/chat", json={"question": "what?"})
+                    assert _events(response)[-1]["type"] == "done"
+
+            assert get_embedding.call_count == 1
+            assert store_cls.call_count == 1
+            assert get_llm.call_count == 1
+            assert store.search.await_count == 3
+        finally:
+            reset_registry()
+
+
+class TestApiResearch:
+    """Tests for /api/research."""
+
+    def test_requires_question(self, client):
+        """Test an empty question is rejected."""
+        assert client.post("/api/research", json={}).status_code == 400
+
+    def test_streams_progress_then_result(self, client):
+        """Test progress events arrive before the final result."""
+        progress = SimpleNamespace(
+            step=1,
+            total_steps=2,
+            step_type=SimpleNamespace(value="decomposition"),
+            message="Breaking down question",
+            sub_questions=None,
+            chunks_retrieved=None,
+            follow_up_queries=None,
+            duration_ms=5,
+        )
+        result = SimpleNamespace(
+            answer="Because.",
+            sub_questions=[],
+            sources=[],
+            reasoning_trace=[],
+            total_chunks_analyzed=0,
+            total_llm_calls=2,
+        )
+
+        async def research(question, progress_callback=None):
+            await progress_callback(progress)
+            return result
+
+        pipeline = MagicMock()
+        pipeline.research = research
+
+        with (
+            patch(
+                "local_deepwiki.web.asgi.get_shared_resources",
+                return_value=(MagicMock(), MagicMock()),
+            ),
+            patch("local_deepwiki.core.deep_research.DeepResearchPipeline", return_value=pipeline),
+        ):
+            response = client.post("/api/research", json={"question": "why?"})
+
+        events = _events(response)
+        assert [e["type"] for e in events] == ["progress", "result", "done"]
+        assert events[0]["duration_ms"] == 5
+        assert events[1]["answer"] == "Because."
+        assert events[1]["stats"]["llm_calls"] == 2
+
+    def test_research_error_is_reported(self, client):
+        """Test a failing pipeline ends with an error and done event."""
+        pipeline = MagicMock()
+        pipeline.research = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with (
+            patch(
+                "local_deepwiki.web.asgi.get_shared_resources",
+                return_value=(MagicMock(), MagicMock()),
+            ),
+            patch("local_deepwiki.core.deep_research.DeepResearchPipeline", return_value=pipeline),
+        ):
+            response = client.post("/api/research", json={"question": "why?"})
+
+        events = _events(response)
+        assert [e["type"] for e in events] == ["error", "done"]
+        assert events[0]["message"] == "boom"
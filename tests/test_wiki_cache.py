@@ -0,0 +1,238 @@
+"""Tests for the web UI's in-memory wiki caches."""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from local_deepwiki.web.app import create_app
+from local_deepwiki.web.wiki_cache import (
+    WikiCache,
+    accepts_gzip,
+    etag_matches,
+    get_wiki_cache,
+    reset_wiki_caches,
+)
+
+
+@pytest.fixture
+def wiki_dir(tmp_path):
+    """Create a small wiki directory."""
+    (tmp_path / "index.md").write_text("# Home\n\nWelcome.\n")
+    (tmp_path / "modules").mkdir()
+    (tmp_path / "modules" / "core.md").write_text("# Core\n")
+    return tmp_path
+
+
+def _touch_later(path, seconds: int = 10) -> None:
+    """Move a path's mtime forward so changes are visible at any timestamp resolution."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestNavigation:
+    """Tests for the cached navigation model."""
+
+    def test_built_once_while_unchanged(self, wiki_dir):
+        """Test repeated lookups reuse one build."""
+        cache = WikiCache(wiki_dir)
+
+        first = cache.navigation()
+        second = cache.navigation()
+
+        assert first is second
+        assert cache.stats["navigation_builds"] == 1
+        pages, sections, _ = first
+        assert [p["title"] for p in pages] == ["Home"]
+        assert sections["Modules"][0]["title"] == "Core"
+
+    def test_rebuilt_when_page_added(self, wiki_dir):
+        """Test a new section page shows up in the sidebar."""
+        cache = WikiCache(wiki_dir)
+        cache.navigation()
+
+        (wiki_dir / "modules" / "extra.md").write_text("# Extra\n")
+        _touch_later(wiki_dir / "modules")
+
+        _, sections, _ = cache.navigation()
+        assert [p["title"] for p in sections["Modules"]] == ["Core", "Extra"]
+        assert cache.stats["navigation_builds"] == 2
+
+    def test_rebuilt_when_toc_written(self, wiki_dir):
+        """Test regenerating toc.json refreshes the TOC entries."""
+        cache = WikiCache(wiki_dir)
+        assert cache.navigation()[2] is None
+
+        (wiki_dir / "toc.json").write_text(json.dumps({"entries": [{"title": "Home"}]}))
+
+        assert cache.navigation()[2] == [{"title": "Home"}]
+
+    def test_rebuilt_after_rendering_edited_page(self, wiki_dir):
+        """Test an in-place title edit reaches the sidebar once the page is viewed."""
+        cache = WikiCache(wiki_dir)
+        cache.render_page("index.md")
+        cache.navigation()
+
+        (wiki_dir / "index.md").write_text("# Start\n")
+        _touch_later(wiki_dir / "index.md")
+        assert cache.render_page("index.md").title == "Start"
+
+        pages, _, _ = cache.navigation()
+        assert pages[0]["title"] == "Start"
+
+
+class TestRenderedPages:
+    """Tests for the rendered page cache."""
+
+    def test_second_render_hits(self, wiki_dir):
+        """Test an unchanged page is rendered once."""
+        cache = WikiCache(wiki_dir)
+
+        first = cache.render_page("index.md")
+        second = cache.render_page("index.md")
+
+        assert first is second
+        assert first.title == "Home"
+        assert "<p>Welcome.</p>" in first.html
+        assert cache.stats["page_hits"] == 1
+
+    def test_edited_page_rerendered(self, wiki_dir):
+        """Test a changed page is never served stale."""
+        cache = WikiCache(wiki_dir)
+        cache.render_page("index.md")
+
+        (wiki_dir / "index.md").write_text("# Home\n\nUpdated.\n")
+        _touch_later(wiki_dir / "index.md")
+
+        assert "Updated." in cache.render_page("index.md").html
+        assert cache.stats["page_misses"] == 2
+
+    def test_missing_page(self, wiki_dir):
+        """Test missing pages and directories return None."""
+        cache = WikiCache(wiki_dir)
+        assert cache.render_page("nope.md") is None
+        assert cache.render_page("modules") is None
+
+    def test_lru_eviction(self, wiki_dir):
+        """Test the least recently viewed page is evicted over the limit."""
+        (wiki_dir / "other.md").write_text("# Other\n")
+        cache = WikiCache(wiki_dir, max_pages=2)
+
+        cache.render_page("index.md")
+        cache.render_page("modules/core.md")
+        cache.render_page("index.md")
+        cache.render_page("other.md")
+
+        assert cache.stats["pages"] == 2
+        cache.render_page("index.md")
+        assert cache.stats["page_hits"] == 2
+        cache.render_page("modules/core.md")
+        assert cache.stats["page_misses"] == 4
+
+    def test_undecodable_page_raises(self, wiki_dir):
+        """Test read errors propagate to the caller."""
+        (wiki_dir / "binary.md").write_bytes(b"\xff\xfe\x00\x01" * 10)
+        with pytest.raises(UnicodeDecodeError):
+            WikiCache(wiki_dir).render_page("binary.md")
+
+
+class TestSearchIndex:
+    """Tests for the cached search index payload."""
+
+    def test_missing_index_is_empty_list(self, wiki_dir):
+        """Test a wiki without search.json serves an empty list."""
+        assert WikiCache(wiki_dir).search_index().body == b"[]"
+
+    def test_payload_cached_until_file_changes(self, wiki_dir):
+        """Test the payload is reused, then replaced with a new ETag on change."""
+        search_path = wiki_dir / "search.json"
+        search_path.write_text('[{"title": "Home"}]')
+        cache = WikiCache(wiki_dir)
+
+        first = cache.search_index()
+        assert cache.search_index() is first
+        assert json.loads(gzip.decompress(first.gzipped)) == [{"title": "Home"}]
+
+        search_path.write_text('[{"title": "Home"}, {"title": "Core"}]')
+        _touch_later(search_path)
+        second = cache.search_index()
+        assert second.etag != first.etag
+
+    def test_invalid_json_raises(self, wiki_dir):
+        """Test a corrupt index is refused."""
+        (wiki_dir / "search.json").write_text("{{{")
+        with pytest.raises(ValueError):
+            WikiCache(wiki_dir).search_index()
+
+    def test_select_conditional_and_encoding(self, wiki_dir):
+        """Test 304 on a matching ETag and gzip only when accepted."""
+        (wiki_dir / "search.json").write_text("[]")
+        payload = WikiCache(wiki_dir).search_index()
+
+        status, body, headers = payload.select("", "")
+        assert (status, body) == (200, b"[]")
+        assert "Content-Encoding" not in headers
+
+        status, body, gz_headers = payload.select("gzip, deflate", "")
+        assert status == 200
+        assert gz_headers["Content-Encoding"] == "gzip"
+        assert gz_headers["ETag"] != headers["ETag"]
+
+        status, body, _ = payload.select("", headers["ETag"])
+        assert (status, body) == (304, b"")
+        assert payload.select("gzip", headers["ETag"])[0] == 200
+
+
+class TestHeaderHelpers:
+    """Tests for Accept-Encoding and If-None-Match parsing."""
+
+    def test_accepts_gzip(self):
+        """Test gzip negotiation including q=0 refusals."""
+        assert accepts_gzip("gzip")
+        assert accepts_gzip("br, gzip;q=0.8")
+        assert accepts_gzip("*")
+        assert not accepts_gzip("")
+        assert not accepts_gzip("deflate")
+        assert not accepts_gzip("gzip;q=0")
+
+    def test_etag_matches(self):
+        """Test list, wildcard and weak validators."""
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert not etag_matches("", '"b"')
+        assert not etag_matches('"a"', '"b"')
+
+
+class TestFlaskEndpoints:
+    """Tests for the Flask routes served from the cache."""
+
+    def test_search_json_etag_and_gzip(self, wiki_dir):
+        """Test /search.json supports 304 and pre-compressed responses."""
+        reset_wiki_caches()
+        (wiki_dir / "search.json").write_text('[{"title": "Home"}]')
+        client = create_app(wiki_dir).test_client()
+
+        response = client.get("/search.json")
+        assert response.get_json() == [{"title": "Home"}]
+        etag = response.headers["ETag"]
+
+        assert client.get("/search.json", headers={"If-None-Match": etag}).status_code == 304
+
+        response = client.get("/search.json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.data)) == [{"title": "Home"}]
+
+    def test_page_views_share_cache(self, wiki_dir):
+        """Test repeated page views render and build navigation once."""
+        reset_wiki_caches()
+        client = create_app(wiki_dir).test_client()
+
+        for _ in range(3):
+            assert client.get("/wiki/index.md").status_code == 200
+
+        stats = get_wiki_cache(wiki_dir).stats
+        assert stats["page_misses"] == 1
+        assert stats["page_hits"] == 2
+        assert stats["navigation_builds"] == 1
@@ -1,12 +1,17 @@
 """Tests for wiki.py to improve coverage."""
 
+import asyncio
 import time
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from local_deepwiki.core.vectorstore import ChunkSnapshot
 from local_deepwiki.models import (
+    ChunkType,
+    CodeChunk,
     FileInfo,
     IndexStatus,
     Language,
@@ -120,11 +125,24 @@ class TestWikiGeneratorInit:
                 assert config.llm.provider == "anthropic"
 
 
+def _chunk(file_path: str, chunk_type: ChunkType, start: int, end: int) -> CodeChunk:
+    """Helper to create a minimal CodeChunk."""
+    return CodeChunk(
+        id=f"{file_path}:{start}",
+        file_path=file_path,
+        language=Language.PYTHON,
+        chunk_type=chunk_type,
+        content="",
+        start_line=start,
+        end_line=end,
+    )
+
+
 class TestGetMainDefinitionLines:
     """Tests for _get_main_definition_lines method."""
 
-    def test_returns_empty_when_no_table(self, tmp_path):
-        """Test returns empty dict when vector store has no table."""
+    async def test_returns_empty_when_no_table(self, tmp_path):
+        """Test returns empty dict when vector store has no chunks."""
         with patch("local_deepwiki.generators.wiki.get_config") as mock_config:
             config = MagicMock()
             config.llm = MagicMock()
@@ -137,20 +155,18 @@ class TestGetMainDefinitionLines:
                 from local_deepwiki.generators.wiki import WikiGenerator
 
                 mock_vector_store = MagicMock()
-                mock_vector_store._get_table.return_value = None
+                mock_vector_store.snapshot.return_value = ChunkSnapshot()
 
                 generator = WikiGenerator(
                     wiki_path=tmp_path,
                     vector_store=mock_vector_store,
                 )
 
-                result = generator._get_main_definition_lines()
+                result = await generator._get_main_definition_lines()
                 assert result == {}
 
-    def test_returns_class_lines(self, tmp_path):
+    async def test_returns_class_lines(self, tmp_path):
         """Test returns lines for class definitions."""
-        import pandas as pd
-
         with patch("local_deepwiki.generators.wiki.get_config") as mock_config:
             config = MagicMock()
             config.llm = MagicMock()
@@ -162,36 +178,26 @@ class TestGetMainDefinitionLines:
 
                 from local_deepwiki.generators.wiki import WikiGenerator
 
-                # Create mock table with pandas DataFrame
-                mock_df = pd.DataFrame(
-                    {
-                        "file_path": ["src/test.py", "src/test.py"],
-                        "chunk_type": ["class", "function"],
-                        "start_line": [10, 50],
-                        "end_line": [40, 60],
-                    }
-                )
-
-                mock_table = MagicMock()
-                mock_table.to_pandas.return_value = mock_df
-
                 mock_vector_store = MagicMock()
-                mock_vector_store._get_table.return_value = mock_table
+                mock_vector_store.snapshot.return_value = ChunkSnapshot(
+                    [
+                        _chunk("src/test.py", ChunkType.FUNCTION, 50, 60),
+                        _chunk("src/test.py", ChunkType.CLASS, 10, 40),
+                    ]
+                )
 
                 generator = WikiGenerator(
                     wiki_path=tmp_path,
                     vector_store=mock_vector_store,
                 )
 
-                result = generator._get_main_definition_lines()
+                result = await generator._get_main_definition_lines()
                 # Should return class lines (first definition)
                 assert "src/test.py" in result
                 assert result["src/test.py"] == (10, 40)
 
-    def test_returns_function_lines_when_no_class(self, tmp_path):
+    async def test_returns_function_lines_when_no_class(self, tmp_path):
         """Test returns function lines when no class exists."""
-        import pandas as pd
-
         with patch("local_deepwiki.generators.wiki.get_config") as mock_config:
             config = MagicMock()
             config.llm = MagicMock()
@@ -203,32 +209,56 @@ class TestGetMainDefinitionLines:
 
                 from local_deepwiki.generators.wiki import WikiGenerator
 
-                # Create mock table with only functions
-                mock_df = pd.DataFrame(
-                    {
-                        "file_path": ["src/utils.py", "src/utils.py"],
-                        "chunk_type": ["function", "function"],
-                        "start_line": [5, 20],
-                        "end_line": [15, 30],
-                    }
-                )
-
-                mock_table = MagicMock()
-                mock_table.to_pandas.return_value = mock_df
-
+                # Snapshot with only functions
                 mock_vector_store = MagicMock()
-                mock_vector_store._get_table.return_value = mock_table
+                mock_vector_store.snapshot.return_value = ChunkSnapshot(
+                    [
+                        _chunk("src/utils.py", ChunkType.FUNCTION, 20, 30),
+                        _chunk("src/utils.py", ChunkType.FUNCTION, 5, 15),
+                    ]
+                )
 
                 generator = WikiGenerator(
                     wiki_path=tmp_path,
                     vector_store=mock_vector_store,
                 )
 
-                result = generator._get_main_definition_lines()
+                result = await generator._get_main_definition_lines()
                 # Should return first function lines
                 assert "src/utils.py" in result
                 assert result["src/utils.py"] == (5, 15)
 
+    async def test_snapshot_scanned_once_off_the_event_loop(self, tmp_path):
+        """Test concurrent callers share one snapshot scan run in a worker thread."""
+        import asyncio
+        import threading
+
+        with patch("local_deepwiki.generators.wiki.get_config") as mock_config:
+            config = MagicMock()
+            config.get_prompts.return_value = MagicMock(wiki_system="System prompt")
+            mock_config.return_value = config
+
+            with patch("local_deepwiki.generators.wiki.get_llm_provider"):
+                from local_deepwiki.generators.wiki import WikiGenerator
+
+                scan_threads = []
+
+                def snapshot() -> ChunkSnapshot:
+                    scan_threads.append(threading.current_thread())
+                    return ChunkSnapshot()
+
+                mock_vector_store = MagicMock()
+                mock_vector_store.snapshot.side_effect = snapshot
+                generator = WikiGenerator(wiki_path=tmp_path, vector_store=mock_vector_store)
+
+                first, second = await asyncio.gather(
+                    generator._get_chunk_snapshot(), generator._get_chunk_snapshot()
+                )
+
+                assert first is second
+                assert len(scan_threads) == 1
+                assert scan_threads[0] is not threading.main_thread()
+
 
 class TestWritePage:
     """Tests for _write_page method."""
@@ -447,6 +477,7 @@ class TestWikiGeneratorGenerate:
             config.llm = MagicMock()
             config.wiki = MagicMock()
             config.wiki.import_search_limit = 100
+            config.wiki.max_concurrent_llm_calls = 4
             config.get_prompts.return_value = MagicMock(wiki_system="System prompt")
             mock_config.return_value = config
 
@@ -671,3 +702,49 @@ class TestWikiGeneratorGenerate:
                                                                             "overview"
                                                                             in progress_calls[0][0].lower()
                                                                         )
+
+    async def test_generate_overlaps_independent_pages(self, mock_generator, tmp_path):
+        """Test LLM pages run concurrently and the page order stays fixed."""
+        index_status = make_index_status(repo_path=str(tmp_path))
+
+        def slow_page(path, result=None):
+            async def generate(**_kwargs):
+                await asyncio.sleep(0.2)
+                page = WikiPage(path=path, title=path, content=f"# {path}", generated_at=0)
+                return page if result is None else (page, result)
+
+            return generate
+
+        patches = {
+            "generate_overview_page": slow_page("index.md"),
+            "generate_architecture_page": slow_page("architecture.md"),
+            "generate_dependencies_page": slow_page("dependencies.md", []),
+            "generate_module_docs": AsyncMock(return_value=([], 0, 0)),
+            "generate_file_docs": AsyncMock(return_value=([], 0, 0)),
+            "generate_changelog_page": AsyncMock(return_value=None),
+            "generate_inheritance_page": AsyncMock(return_value=None),
+            "generate_glossary_page": AsyncMock(return_value=None),
+            "generate_coverage_page": AsyncMock(return_value=None),
+            "write_full_search_index": AsyncMock(),
+            "write_toc": MagicMock(),
+            "get_cached_manifest": MagicMock(),
+        }
+        with ExitStack() as stack:
+            for name, replacement in patches.items():
+                stack.enter_context(
+                    patch(f"local_deepwiki.generators.wiki.{name}", side_effect=replacement)
+                )
+            start = time.perf_counter()
+            result = await mock_generator.generate(index_status=index_status, full_rebuild=True)
+            elapsed = time.perf_counter() - start
+
+        # Three 0.2s pages in parallel, not 0.6s in sequence
+        assert elapsed < 0.5
+        assert [p.path for p in result.pages][:3] == [
+            "index.md",
+            "architecture.md",
+            "dependencies.md",
+        ]
+        timings = mock_generator.task_timings
+        assert timings["links"].started_at >= timings["dependencies"].finished_at
+        assert timings["overview"].started_at < timings["architecture"].finished_at
@@ -137,7 +137,6 @@ class TestGenerateSingleFileDoc:
         mock = MagicMock()
         mock.wiki = MagicMock()
         mock.wiki.context_search_limit = 20
-        mock.wiki.fallback_search_limit = 10
         return mock
 
     async def test_returns_none_for_no_chunks(
@@ -310,7 +309,7 @@ class TestGenerateSingleFileDoc:
         assert was_skipped is False
         mock_llm.generate.assert_called()
 
-    async def test_fallback_search_by_filename(
+    async def test_search_restricted_to_file(
         self,
         mock_llm,
         mock_vector_store,
@@ -319,16 +318,9 @@ class TestGenerateSingleFileDoc:
         mock_config,
         tmp_path,
     ):
-        """Test falls back to searching by filename when no direct matches."""
+        """Test the file's chunks are selected by a filter pushed into the search."""
         chunk = make_code_chunk(file_path="src/main.py", name="main")
-
-        # First search returns no matching chunks, second returns match
-        async def search_side_effect(query, **_kwargs):
-            if "file:" in query:
-                return []  # No direct matches
-            return [make_search_result(chunk)]  # Fallback matches
-
-        mock_vector_store.search = AsyncMock(side_effect=search_side_effect)
+        mock_vector_store.search = AsyncMock(return_value=[make_search_result(chunk)])
         mock_vector_store.get_chunks_by_file = AsyncMock(return_value=[chunk])
 
         file_info = make_file_info(path="src/main.py")
@@ -347,9 +339,9 @@ class TestGenerateSingleFileDoc:
         )
 
         assert page is not None
-        # Should have called search at least twice (direct + fallback)
-        # Context builder may add additional searches for callers/related files
-        assert mock_vector_store.search.call_count >= 2
+        first_call = mock_vector_store.search.call_args_list[0]
+        assert first_call.args[0] == "file:src/main.py"
+        assert first_call.kwargs["file_paths"] == ["src/main.py"]
 
     async def test_registers_entities_for_crosslinking(
         self,
@@ -639,7 +631,6 @@ class TestGenerateFileDocs:
         mock = MagicMock()
         mock.wiki = MagicMock()
         mock.wiki.context_search_limit = 20
-        mock.wiki.fallback_search_limit = 10
         mock.wiki.max_file_docs = 50
         mock.wiki.max_concurrent_llm_calls = 3
         return mock
@@ -1,5 +1,6 @@
 """Tests for wiki_modules.py to improve coverage."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock
 
@@ -190,12 +191,7 @@ class TestGenerateModuleDocs:
     async def test_handles_root_level_files(
         self, mock_llm, mock_vector_store, mock_status_manager, tmp_path
     ):
-        """Test root-level files grouped under 'root' but no page generated without matching chunks.
-
-        Root-level files are grouped under 'root' directory name, but since the chunk
-        file_path filter checks startswith('root'), files with paths like 'main.py'
-        won't match, so no module page is generated for root files.
-        """
+        """Test root-level files are grouped under 'root' and searched by file set."""
         chunk1 = make_code_chunk(file_path="main.py", name="main")
         chunk2 = make_code_chunk(file_path="config.py", name="config")
         mock_vector_store.search = AsyncMock(
@@ -219,9 +215,11 @@ class TestGenerateModuleDocs:
             full_rebuild=True,
         )
 
-        # Root files get grouped but no page generated since chunk filter doesn't match
-        assert pages == []
-        assert generated == 0
+        assert generated == 1
+        assert any(p.path == "modules/root.md" for p in pages)
+        kwargs = mock_vector_store.search.call_args.kwargs
+        assert kwargs["file_paths"] == ["main.py", "config.py"]
+        assert kwargs["path_prefix"] is None
 
     async def test_generates_modules_index(
         self, mock_llm, mock_vector_store, mock_status_manager, tmp_path
@@ -320,13 +318,9 @@ class TestGenerateModuleDocs:
     async def test_filters_chunks_by_directory(
         self, mock_llm, mock_vector_store, mock_status_manager, tmp_path
     ):
-        """Test filters search results to chunks from relevant directory."""
-        # Return chunks from different directories
+        """Test the directory filter is pushed down into the vector store search."""
         src_chunk = make_code_chunk(file_path="src/main.py", name="main")
-        other_chunk = make_code_chunk(file_path="other/util.py", name="util")
-        mock_vector_store.search = AsyncMock(
-            return_value=[make_search_result(src_chunk), make_search_result(other_chunk)]
-        )
+        mock_vector_store.search = AsyncMock(return_value=[make_search_result(src_chunk)])
 
         index_status = make_index_status(
             repo_path=str(tmp_path),
@@ -345,7 +339,9 @@ class TestGenerateModuleDocs:
             full_rebuild=True,
         )
 
-        # LLM should have been called with only src directory chunks
+        kwargs = mock_vector_store.search.call_args.kwargs
+        assert kwargs["path_prefix"] == "src/"
+        assert kwargs["file_paths"] is None
         call_args = mock_llm.generate.call_args
         prompt = call_args.args[0] if call_args.args else call_args.kwargs.get("prompt", "")
         assert "src/main.py" in prompt
@@ -421,6 +417,51 @@ class TestGenerateModuleDocs:
         assert "modules/src.md" in module_paths
         assert "modules/tests.md" in module_paths
 
+    async def test_modules_generated_concurrently_in_directory_order(
+        self, mock_llm, mock_vector_store, mock_status_manager, tmp_path
+    ):
+        """Test module LLM calls overlap while pages keep directory order."""
+        active = 0
+        peak = 0
+
+        async def slow_generate(prompt, **_kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return "## Module Purpose"
+
+        async def search_side_effect(query, **_kwargs):
+            dir_name = query.removeprefix("module ")
+            return [make_search_result(make_code_chunk(file_path=f"{dir_name}/a.py"))]
+
+        mock_llm.generate = AsyncMock(side_effect=slow_generate)
+        mock_vector_store.search = AsyncMock(side_effect=search_side_effect)
+        dirs = ["c", "a", "b"]
+        index_status = make_index_status(
+            repo_path=str(tmp_path),
+            files=[make_file_info(path=f"{d}/{name}.py") for d in dirs for name in ("x", "y")],
+        )
+
+        pages, generated, _ = await generate_module_docs(
+            index_status=index_status,
+            vector_store=mock_vector_store,
+            llm=mock_llm,
+            system_prompt="System prompt",
+            status_manager=mock_status_manager,
+            full_rebuild=True,
+        )
+
+        assert peak == 3
+        assert generated == 3
+        assert [p.path for p in pages] == [
+            "modules/index.md",
+            "modules/c.md",
+            "modules/a.md",
+            "modules/b.md",
+        ]
+
     async def test_records_page_status(
         self, mock_llm, mock_vector_store, mock_status_manager, tmp_path
     ):
@@ -55,6 +55,18 @@ def make_file_info(
     )
 
 
+def make_vector_store() -> MagicMock:
+    """Create a mock vector store whose search_many runs each query through search."""
+    mock = MagicMock()
+    mock.search = AsyncMock(return_value=[])
+
+    async def search_many(queries, **kwargs):
+        return [await mock.search(query, **kwargs) for query in queries]
+
+    mock.search_many = AsyncMock(side_effect=search_many)
+    return mock
+
+
 def make_code_chunk(
     file_path: str = "src/test.py",
     name: str = "TestClass",
@@ -104,9 +116,7 @@ class TestGenerateOverviewPage:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
+        return make_vector_store()
 
     async def test_generates_basic_overview(self, mock_llm, mock_vector_store, tmp_path):
         """Test generates basic overview page."""
@@ -285,9 +295,7 @@ class TestGenerateArchitecturePage:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
+        return make_vector_store()
 
     async def test_generates_basic_architecture(self, mock_llm, mock_vector_store, tmp_path):
         """Test generates basic architecture page."""
@@ -440,9 +448,7 @@ class TestGenerateDependenciesPage:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
+        return make_vector_store()
 
     async def test_generates_basic_dependencies(self, mock_llm, mock_vector_store, tmp_path):
         """Test generates basic dependencies page."""
@@ -676,9 +682,7 @@ class TestOverviewPageEdgeCases:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
+        return make_vector_store()
 
     async def test_handles_none_repo_path(self, mock_llm, mock_vector_store, tmp_path):
         """Test handles None repo_path gracefully."""
@@ -759,9 +763,7 @@ class TestArchitecturePageEdgeCases:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
+        return make_vector_store()
 
     async def test_handles_none_repo_path(self, mock_llm, mock_vector_store, tmp_path):
         """Test handles None repo_path gracefully."""
@@ -818,9 +820,7 @@ class TestDependenciesPageEdgeCases:
     @pytest.fixture
     def mock_vector_store(self):
         """Create a mock vector store."""
-        mock = MagicMock()
-        mock.search = AsyncMock(return_value=[])
-        return mock
+        return make_vector_store()
 
     async def test_handles_no_dependencies(self, mock_llm, mock_vector_store, tmp_path):
         """Test handles project with no dependencies."""
@@ -865,18 +865,12 @@ class TestDependenciesPageEdgeCases:
             # Should have been called - truncation handled internally
             mock_llm.generate.assert_called_once()
 
-    async def test_filters_non_import_chunks(self, mock_llm, mock_vector_store, tmp_path):
-        """Test filters out non-import chunks from import search."""
+    async def test_searches_only_import_chunks(self, mock_llm, mock_vector_store, tmp_path):
+        """Test the import search is restricted to import chunks by the store."""
         import_chunk = make_code_chunk(
             name="imports", chunk_type=ChunkType.IMPORT, file_path="src/main.py"
         )
-        func_chunk = make_code_chunk(
-            name="process", chunk_type=ChunkType.FUNCTION, file_path="src/utils.py"
-        )
-
-        mock_vector_store.search = AsyncMock(
-            return_value=[make_search_result(import_chunk), make_search_result(func_chunk)]
-        )
+        mock_vector_store.search = AsyncMock(return_value=[make_search_result(import_chunk)])
 
         index_status = make_index_status(repo_path=str(tmp_path / "project"))
 
@@ -892,6 +886,5 @@ class TestDependenciesPageEdgeCases:
                 import_search_limit=100,
             )
 
-            # Only import chunk's file should be in source files
             assert "src/main.py" in source_files
-            assert "src/utils.py" not in source_files
+            assert mock_vector_store.search.call_args.kwargs["chunk_type"] == "import"